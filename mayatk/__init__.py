@@ -41,8 +41,10 @@ DEFAULT_INCLUDE = {
     "anim_utils.scale_keys": "*",
     "anim_utils.stagger_keys": "*",
     "anim_utils.segment_keys": "SegmentKeys",
+    "anim_utils.retime_keys": "KeyRetimer",
     "anim_utils.smart_bake._smart_bake": "SmartBake",
     "anim_utils.smart_bake.bake_session": "RestoreResult",
+    "anim_utils.smart_bake.distributed_bake": ["DistributedBake", "BakeChunk"],
     "anim_utils.shots.shot_sequencer._shot_sequencer": ["ShotSequencer", "ShotBlock"],
     "anim_utils.shots._shots": "ShotStore",
     "anim_utils.blendshape_animator._blendshape_animator": "BlendshapeAnimator",
@@ -54,12 +56,14 @@ DEFAULT_INCLUDE = {
         "ExportTarget",
         "CaptureResult",
         "ExportResult",
+        "StreamStats",
     ],
     # Attribute utils
     "node_utils.attributes._attributes": ["Attributes"],
     "audio_utils.audio_clips._audio_clips": "AudioClips",
     # Audio utils
     "audio_utils._audio_utils": "AudioUtils",
+    "audio_utils.waveform_cache": "WaveformCache",
     # Core utils - specific classes
     "core_utils.components": "Components",
     "core_utils.auto_instancer._auto_instancer": "AutoInstancer",
@@ -69,6 +73,8 @@ DEFAULT_INCLUDE = {
     "core_utils.diagnostics->Diagnostics": "*",
     "core_utils.diagnostics.scene_diag": "SceneDiagnostics",
     "core_utils.diagnostics.scene_audit": "SceneAnalyzer",
+    "core_utils.diagnostics.uv_metrics": "UvSetAnalyzer",
+    "core_utils.diagnostics.transform_scan": ["WorldMatrixScan", "MatrixScanResult"],
     "core_utils.diagnostics.audit_records": [
         "SceneInfoSection",
         "SceneReport",
@@ -119,10 +125,14 @@ DEFAULT_INCLUDE = {
     # The entry that named a nonexistent ``Mirror`` here made ``mtk.Mirror`` raise
     # AttributeError; blendertk's twin correctly registers nothing.
     "edit_utils.mesh_graph": "MeshGraph",
+    "edit_utils.overlap": ["MeshOverlaps", "SpatialHash"],
+    "edit_utils.mesh_metrics": "MeshMetricIndex",
+    "edit_utils.mesh_reduce": ["MeshReducer", "ReduceResult"],
     # Environment utilities
     "env_utils.devtools": "*",
     "env_utils.maya_connection": "MayaConnection",
     "env_utils.workspace_manager": "WorkspaceManager",
+    "env_utils.workspace_index": "WorkspaceIndex",
     "env_utils.workspace_map": "WorkspaceMap",
     "env_utils.namespace_sandbox": "NamespaceSandbox",
     "env_utils.reference_manager": "ReferenceManager",
@@ -165,6 +175,9 @@ DEFAULT_INCLUDE = {
     "mat_utils.mat_updater": "MatUpdater",
     # ``texture_path_editor`` likewise defines only its ``*Slots`` panel, which the
     # handler discovers — nothing to register here.
+    # ...but the stem index behind its Resolve Missing is usable on its own.
+    "mat_utils.texture_index": ["TextureStemIndex", "TrigramIndex"],
+    "mat_utils.path_status": ["PathStatusCache", "PathStatus"],
     # ``shader_templates`` is a PACKAGE whose ``__init__`` is docstring-only, so the
     # class has to be named through its inner module, exactly as its
     # ``render_opacity`` / ``image_to_plane`` siblings above do.
@@ -194,6 +207,7 @@ DEFAULT_INCLUDE = {
     "ui_utils.node_icons": "NodeIcons",
     "ui_utils.style_setter._style_setter": "StyleSetter",
     # Transform utils
+    "xform_utils.bounds": "BulkBounds",
     "xform_utils.matrices": "Matrices",
     "xform_utils.pivot_watcher": "PivotWatcher",
     # NURBS utils
@@ -208,6 +222,7 @@ DEFAULT_INCLUDE = {
     # Scene exporter
     "env_utils.scene_exporter._scene_exporter": "SceneExporter",
     "env_utils.scene_exporter.task_manager": "TaskManager",
+    "env_utils.scene_exporter.batch_export": ["BatchExporter", "ExportJob"],
 }
 
 bootstrap_package(
@@ -15,6 +15,10 @@ Everything reduces to four primitives plus one orchestrator:
 - ``export`` — plans the requested :data:`~PlayblastExporter.TARGETS` so the
   viewport is captured **once** and every encoded output (mp4/mov/...) is
   derived from that same lossless sequence via ffmpeg.
+- ``stream_encode`` — the pipelined alternative to capture-then-encode: the
+  range is captured in short chunks whose frames are piped into a running
+  ffmpeg while the next chunk captures, so the two stages overlap and only a
+  bounded window of frames is ever on disk (``export(stream=True)``).
 
 Extend by registering a new :class:`ExportTarget` in
 ``PlayblastExporter.TARGETS`` — UIs build their pickers from
@@ -33,6 +37,11 @@ except ImportError:
 
 import os
 import re
+import time
+import queue
+import shutil
+import tempfile
+import threading
 import subprocess
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -100,12 +109,46 @@ class ExportResult:
     kind: str
     output: Optional[Union[str, List[str]]] = None
     error: Optional[str] = None
+    #: Wall-clock seconds spent producing this target (an encode counts the
+    #: shared capture it rode on).
+    elapsed: Optional[float] = None
+    #: Peak bytes of intermediate frames held on disk for this target
+    #: (None when it has none).
+    peak_temp_bytes: Optional[int] = None
 
     @property
     def ok(self) -> bool:
         return self.error is None
 
 
+@dataclass
+class StreamStats:
+    """Timing and disk footprint of one :meth:`PlayblastExporter.stream_encode` run."""
+
+    frames: int = 0
+    chunks: int = 0
+    elapsed: float = 0.0
+    #: Seconds inside ``cmds.playblast``.
+    capture_time: float = 0.0
+    #: Seconds the capture waited for the encoder to drain the frame buffer.
+    stall_time: float = 0.0
+    #: Seconds between the last captured frame and every encoder exiting.
+    drain_time: float = 0.0
+    peak_temp_bytes: int = 0
+    peak_temp_frames: int = 0
+
+
+@dataclass
+class _StreamEncoder:
+    """One ffmpeg process fed by :meth:`PlayblastExporter._stream_encode`."""
+
+    filepath: str
+    process: subprocess.Popen
+    log: Any  # TemporaryFile catching ffmpeg's stderr (a pipe could fill and stall it)
+    error: Optional[str] = None
+    stderr: str = ""
+
+
 class PlayblastExporter(ptk.LoggingMixin):
     """Viewport capture and preview-render exports.
 
@@ -191,6 +234,13 @@ class PlayblastExporter(ptk.LoggingMixin):
     #: Frame-range modes accepted by :meth:`resolve_frame_range`.
     RANGE_MODES: Tuple[str, ...] = ("playback", "animation", "current", "custom")
 
+    #: Frames per ``cmds.playblast`` call in :meth:`stream_encode`. Each call
+    #: pays the playblast setup once, so very small chunks cost throughput.
+    STREAM_CHUNK_FRAMES: int = 8
+    #: Captured frames allowed to wait for the encoder before capture blocks.
+    #: Frames on disk never exceed this plus one chunk plus the frame in flight.
+    STREAM_BUFFER_FRAMES: int = 16
+
     def __init__(
         self,
         camera: Optional[str] = None,
@@ -214,6 +264,12 @@ class PlayblastExporter(ptk.LoggingMixin):
         self.show_ornaments = bool(show_ornaments)
         self.frame_padding = int(frame_padding)
         self.include_audio = bool(include_audio)
+        #: Stats of the most recent :meth:`stream_encode` run.
+        self.last_stream_stats: Optional[StreamStats] = None
+        #: Summary of the most recent :meth:`export` — ``mode`` (``"stream"``
+        #: or ``"two_pass"`` when encodes ran, else None), ``elapsed``,
+        #: ``frames`` and ``peak_temp_bytes``.
+        self.last_export_stats: Dict[str, Any] = {}
 
     # ------------------------------------------------------------------
     # Queries
@@ -509,17 +565,51 @@ class PlayblastExporter(ptk.LoggingMixin):
                 f"ffmpeg encode failed for {pattern!r} -> {output_filepath!r}."
             )
         if audio_filepath:
-            peak = self._audio_peak_db(encoded)
-            if peak is not None and peak < self._SILENT_PEAK_DB:
-                self.logger.warning(
-                    f"Encoded audio track is effectively silent (peak "
-                    f"{peak:.1f} dB): {audio_filepath!r} has no audible "
-                    "content over the encoded frame range — check the "
-                    "timeline's active sound node."
-                )
+            self._warn_if_silent(encoded, audio_filepath)
         om.MGlobal.displayInfo(f"Encoded movie created: {encoded}")
         return encoded
 
+    def stream_encode(
+        self,
+        output_filepath: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        camera: Optional[str] = None,
+        fps: Optional[float] = None,
+        audio: Optional[Union[bool, str]] = None,
+        quality: Optional[int] = None,
+        directory: Optional[str] = None,
+        **ffmpeg_options: Any,
+    ) -> str:
+        """Capture and encode in one pipelined pass (no full-length sequence on disk).
+
+        The range is captured :attr:`STREAM_CHUNK_FRAMES` frames per
+        ``cmds.playblast`` call; each finished frame goes through a bounded
+        queue to a feeder thread that writes it into ffmpeg's stdin
+        (``image2pipe``) and deletes it. ffmpeg encodes while Maya captures the
+        next chunk, and a full queue blocks the capture, so at most
+        :attr:`STREAM_BUFFER_FRAMES` + one chunk of PNGs exist at once.
+        Timing and the peak footprint land on :attr:`last_stream_stats`.
+
+        Parameters mirror :meth:`capture_sequence` + :meth:`encode_sequence`;
+        ``directory`` holds the transient frames (default: a temp dir). Raises
+        RuntimeError when the capture or the encoder fails.
+        """
+        outputs, _stats = self._stream_encode(
+            [(output_filepath, ffmpeg_options)],
+            start=start,
+            end=end,
+            camera=camera,
+            fps=fps,
+            audio=audio,
+            quality=quality,
+            directory=directory,
+        )
+        encoded, error = outputs[0]
+        if error:
+            raise RuntimeError(error)
+        return encoded
+
     # ------------------------------------------------------------------
     # Orchestrator
     # ------------------------------------------------------------------
@@ -534,6 +624,7 @@ class PlayblastExporter(ptk.LoggingMixin):
         camera: Optional[str] = None,
         keep_frames: bool = False,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        stream: bool = False,
         **overrides: Any,
     ) -> List[ExportResult]:
         """Produce one or more registered targets from a single plan.
@@ -548,6 +639,14 @@ class PlayblastExporter(ptk.LoggingMixin):
         ``<dir>/<name>_<fmt>/`` for sequences; ``<dir>/<name>_arnold/`` for
         Arnold. Per-target failures are captured on the returned
         :class:`ExportResult`\\ s rather than raised.
+
+        ``stream=True`` produces the encode targets through
+        :meth:`stream_encode` instead — capture and encode overlap and no
+        full-length intermediate sequence is written. It applies when the
+        PNG frames are intermediate only (no ``png_sequence`` target, no
+        ``keep_frames``); otherwise the two-pass path runs. Either way each
+        result carries ``elapsed`` / ``peak_temp_bytes``, and the export's
+        totals land on :attr:`last_export_stats`.
         """
         if isinstance(targets, str):
             targets = [targets]
@@ -565,6 +664,7 @@ class PlayblastExporter(ptk.LoggingMixin):
                       "fmt", "compression", "filepath", "directory"):
             overrides.pop(owned, None)
 
+        export_start = time.perf_counter()
         output_dir = ptk.format_path(os.path.abspath(output_dir))
         os.makedirs(output_dir, exist_ok=True)
         name = name or self.scene_name()
@@ -580,10 +680,21 @@ class PlayblastExporter(ptk.LoggingMixin):
         # capture — shared with a requested png_sequence when present.
         capture_formats = {s.image_format for s in sequence_specs}
         needs_tmp_png = bool(encode_specs) and "png" not in capture_formats
+        # Streaming replaces the intermediate capture; frames someone asked to
+        # keep must exist as a whole sequence, so those exports stay two-pass.
+        streaming = bool(stream and needs_tmp_png and not keep_frames)
+        if stream and encode_specs and not streaming:
+            self.logger.debug(
+                "export: stream=True ignored — the PNG frames are a deliverable here."
+            )
+        if streaming:
+            needs_tmp_png = False
         plan_formats = sorted(capture_formats | ({"png"} if needs_tmp_png else set()))
 
-        total_steps = len(plan_formats) + sum(
-            1 for s in specs if s.kind in ("encode", "native", "still", "arnold")
+        total_steps = (
+            len(plan_formats)
+            + (1 if streaming else len(encode_specs))
+            + sum(1 for s in specs if s.kind in ("native", "still", "arnold"))
         )
         step = 0
 
@@ -597,7 +708,10 @@ class PlayblastExporter(ptk.LoggingMixin):
             s.name: ExportResult(target=s.name, kind=s.kind) for s in specs
         }
         captures: Dict[str, CaptureResult] = {}
+        capture_times: Dict[str, float] = {}
         tmp_png_dir = ptk.format_path(os.path.join(output_dir, f"{name}_png_tmp"))
+        stream_stats: Optional[StreamStats] = None
+        tmp_png_bytes: Optional[int] = None
 
         try:
             for fmt in plan_formats:
@@ -608,6 +722,7 @@ class PlayblastExporter(ptk.LoggingMixin):
                     if is_tmp
                     else ptk.format_path(os.path.join(output_dir, f"{name}_{fmt}"))
                 )
+                capture_start = time.perf_counter()
                 try:
                     captures[fmt] = self.capture_sequence(
                         directory=seq_dir,
@@ -625,11 +740,57 @@ class PlayblastExporter(ptk.LoggingMixin):
                         dependents += encode_specs
                     for spec in dependents:
                         results[spec.name].error = str(exc)
+                capture_times[fmt] = time.perf_counter() - capture_start
+                for spec in sequence_specs:
+                    if spec.image_format == fmt:
+                        results[spec.name].elapsed = capture_times[fmt]
+
+            if streaming:
+                progress("Capturing and encoding (streamed)")
+                stream_start = time.perf_counter()
+                try:
+                    outputs, stream_stats = self._stream_encode(
+                        [
+                            (
+                                os.path.join(output_dir, f"{name}.{spec.extension}"),
+                                dict(spec.encoder_options),
+                            )
+                            for spec in encode_specs
+                        ],
+                        start=start,
+                        end=end,
+                        camera=camera,
+                        audio=bool(sound_node),
+                        directory=ptk.format_path(
+                            os.path.join(output_dir, f"{name}_stream_tmp")
+                        ),
+                        prefix=name,
+                        **overrides,
+                    )
+                except Exception as exc:  # noqa: BLE001 - isolate per plan step
+                    self.logger.warning(f"Streamed capture failed: {exc}")
+                    outputs = [(None, str(exc))] * len(encode_specs)
+                for spec, (encoded, error) in zip(encode_specs, outputs):
+                    result = results[spec.name]
+                    result.output, result.error = encoded, error
+                    result.elapsed = time.perf_counter() - stream_start
+                    if stream_stats is not None:
+                        result.peak_temp_bytes = stream_stats.peak_temp_bytes
+
+            png_capture = captures.get("png")
+            tmp_png_bytes = (
+                self._frames_size(png_capture.frames)
+                if png_capture is not None and needs_tmp_png
+                else None
+            )
 
             for spec in specs:
                 result = results[spec.name]
                 if result.error is not None:
                     continue
+                if spec.kind == "encode" and streaming:
+                    continue
+                target_start = time.perf_counter()
                 try:
                     if spec.kind == "sequence":
                         capture = captures.get(spec.image_format)
@@ -643,6 +804,7 @@ class PlayblastExporter(ptk.LoggingMixin):
                         if capture is None:
                             raise RuntimeError("Shared PNG capture unavailable.")
                         progress(f"Encoding {spec.label}")
+                        result.peak_temp_bytes = tmp_png_bytes
                         result.output = self.encode_sequence(
                             capture,
                             os.path.join(output_dir, f"{name}.{spec.extension}"),
@@ -681,14 +843,50 @@ class PlayblastExporter(ptk.LoggingMixin):
                 except Exception as exc:  # noqa: BLE001 - isolate per target
                     result.error = str(exc)
                     cmds.warning(f"Playblast target '{spec.name}' failed: {exc}")
+                finally:
+                    if spec.kind != "sequence":
+                        result.elapsed = time.perf_counter() - target_start
+                        if spec.kind == "encode":
+                            result.elapsed += capture_times.get("png", 0.0)
         finally:
             if not keep_frames and needs_tmp_png:
                 self._remove_capture(captures.get("png"), tmp_png_dir)
 
+        self._record_export_stats(
+            name,
+            start,
+            end,
+            time.perf_counter() - export_start,
+            ("stream" if streaming else "two_pass") if encode_specs else None,
+            stream_stats.peak_temp_bytes if stream_stats else tmp_png_bytes or 0,
+        )
         if progress_callback:
             progress_callback(total_steps, total_steps, "Done")
         return [results[s.name] for s in specs]
 
+    def _record_export_stats(
+        self,
+        name: str,
+        start: int,
+        end: int,
+        elapsed: float,
+        mode: Optional[str],
+        peak_temp_bytes: int,
+    ) -> None:
+        """Store and log one export's totals (:attr:`last_export_stats`)."""
+        self.last_export_stats = {
+            "name": name,
+            "mode": mode,
+            "frames": end - start + 1,
+            "elapsed": elapsed,
+            "peak_temp_bytes": int(peak_temp_bytes),
+        }
+        if mode:
+            self.logger.info(
+                f"Playblast export {name!r} ({mode}): {end - start + 1} frame(s) in "
+                f"{elapsed:.2f}s, peak temp {peak_temp_bytes / (1024 * 1024):.1f} MB"
+            )
+
     # ------------------------------------------------------------------
     # Arnold
     # ------------------------------------------------------------------
@@ -777,6 +975,293 @@ class PlayblastExporter(ptk.LoggingMixin):
         )
         return rendered
 
+    # ------------------------------------------------------------------
+    # Streamed capture + encode
+    # ------------------------------------------------------------------
+    def _stream_encode(
+        self,
+        outputs: Sequence[Tuple[str, Dict[str, Any]]],
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        camera: Optional[str] = None,
+        fps: Optional[float] = None,
+        audio: Optional[Union[bool, str]] = None,
+        quality: Optional[int] = None,
+        directory: Optional[str] = None,
+        prefix: Optional[str] = None,
+        **overrides: Any,
+    ) -> Tuple[List[Tuple[Optional[str], Optional[str]]], StreamStats]:
+        """Engine behind :meth:`stream_encode` and ``export(stream=True)``.
+
+        One ffmpeg process per ``(filepath, ffmpeg_options)`` output, all fed
+        the same frames. Capture failures raise (every encoder is killed and
+        its partial file removed); encoder failures come back per output as
+        ``(None, error)`` next to successes' ``(filepath, None)``.
+        """
+        stats = StreamStats()
+        self.last_stream_stats = stats
+        run_start = time.perf_counter()
+        start, end = self.resolve_frame_range("playback", start, end)
+        fps = fps if fps is not None else self.scene_fps()
+        audio_filepath, audio_offset = None, 0.0
+        if audio:
+            audio_filepath, audio_offset = self._resolve_audio(audio, start, fps)
+        quality = self.quality if quality is None else int(quality)
+        ffmpeg = ptk.VidUtils.resolve_ffmpeg()
+
+        owns_directory = directory is None
+        directory = ptk.format_path(
+            os.path.abspath(directory or tempfile.mkdtemp(prefix="mtk_stream_"))
+        )
+        os.makedirs(directory, exist_ok=True)
+        prefix = prefix or self.scene_name()
+        for stale in self._collect_frames(directory, prefix, "png"):
+            try:
+                os.remove(stale)
+            except OSError as exc:
+                self.logger.warning(f"Could not remove stale frame {stale!r}: {exc}")
+
+        kwargs = self._playblast_kwargs(overrides)
+        kwargs.update(
+            format="image",
+            compression="png",
+            framePadding=overrides.get("framePadding", self.frame_padding),
+        )
+
+        encoders: List[_StreamEncoder] = []
+        frame_queue: "queue.Queue[Optional[Tuple[str, int]]]" = queue.Queue(
+            maxsize=max(1, int(self.STREAM_BUFFER_FRAMES))
+        )
+        footprint_lock = threading.Lock()
+        on_disk = [0, 0]  # bytes, frames
+
+        def feed() -> None:
+            while True:
+                item = frame_queue.get()
+                if item is None:
+                    return
+                path, size = item
+                try:
+                    with open(path, "rb") as handle:
+                        data = handle.read()
+                except OSError as exc:
+                    data = None
+                    for encoder in encoders:
+                        encoder.error = encoder.error or f"Frame unreadable: {exc}"
+                for encoder in encoders:
+                    if data is None or encoder.error:
+                        continue
+                    try:
+                        encoder.process.stdin.write(data)
+                    except (OSError, ValueError) as exc:  # ffmpeg exited early
+                        encoder.error = f"ffmpeg stopped accepting frames: {exc}"
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                with footprint_lock:
+                    on_disk[0] -= size
+                    on_disk[1] -= 1
+
+        feeder = threading.Thread(
+            target=feed, daemon=True, name="PlayblastStreamFeeder"
+        )
+        aborted = False
+        try:
+            for filepath, options in outputs:
+                filepath = ptk.format_path(os.path.abspath(filepath))
+                output_dir = os.path.dirname(filepath)
+                if output_dir:
+                    os.makedirs(output_dir, exist_ok=True)
+                options = dict(options)
+                options.setdefault("crf", self._quality_to_crf(quality))
+                command = self._stream_command(
+                    ffmpeg, filepath, fps, audio_filepath, audio_offset, options
+                )
+                self.logger.debug(f"stream_encode: {' '.join(command)}")
+                log = tempfile.TemporaryFile()
+                encoders.append(
+                    _StreamEncoder(
+                        filepath=filepath,
+                        log=log,
+                        process=subprocess.Popen(
+                            command,
+                            stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL,
+                            stderr=log,
+                            creationflags=(
+                                subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+                            ),
+                        ),
+                    )
+                )
+            feeder.start()
+
+            chunk = max(1, int(self.STREAM_CHUNK_FRAMES))
+            with self._camera_view(camera) as panel:
+                if panel:
+                    kwargs.setdefault("editorPanelName", panel)
+                for chunk_start in range(start, end + 1, chunk):
+                    for encoder in encoders:
+                        code = encoder.process.poll()
+                        if code is not None and not encoder.error:
+                            encoder.error = f"ffmpeg exited early with code {code}"
+                    if all(encoder.error for encoder in encoders):
+                        break  # nobody left to feed
+                    chunk_end = min(chunk_start + chunk - 1, end)
+                    tick = time.perf_counter()
+                    frames = self._capture_chunk(
+                        directory, prefix, chunk_start, chunk_end, kwargs
+                    )
+                    stats.capture_time += time.perf_counter() - tick
+                    stats.chunks += 1
+                    sizes = [os.path.getsize(frame) for frame in frames]
+                    with footprint_lock:
+                        on_disk[0] += sum(sizes)
+                        on_disk[1] += len(frames)
+                        stats.peak_temp_bytes = max(stats.peak_temp_bytes, on_disk[0])
+                        stats.peak_temp_frames = max(
+                            stats.peak_temp_frames, on_disk[1]
+                        )
+                    tick = time.perf_counter()
+                    for frame, size in zip(frames, sizes):
+                        frame_queue.put((frame, size))  # blocks while the buffer is full
+                    stats.stall_time += time.perf_counter() - tick
+                    stats.frames += len(frames)
+        except BaseException:
+            aborted = True
+            raise
+        finally:
+            if aborted:  # let the feeder drain the queue without encoding
+                for encoder in encoders:
+                    encoder.error = encoder.error or "aborted"
+            if feeder.is_alive():
+                frame_queue.put(None)
+                feeder.join()
+            drain_start = time.perf_counter()
+            for encoder in encoders:
+                if aborted:
+                    encoder.process.kill()
+                try:
+                    encoder.process.stdin.close()
+                except OSError:
+                    pass
+                encoder.process.wait()
+                if aborted and os.path.exists(encoder.filepath):
+                    os.remove(encoder.filepath)
+            stats.drain_time = time.perf_counter() - drain_start
+            for leftover in self._collect_frames(directory, prefix, "png"):
+                try:
+                    os.remove(leftover)
+                except OSError:
+                    pass
+            if owns_directory:
+                shutil.rmtree(directory, ignore_errors=True)
+            else:
+                self._remove_capture(None, directory)
+            stats.elapsed = time.perf_counter() - run_start
+            for encoder in encoders:
+                encoder.log.seek(0)
+                encoder.stderr = encoder.log.read().decode("utf-8", "replace")
+                encoder.log.close()
+
+        results: List[Tuple[Optional[str], Optional[str]]] = []
+        for encoder in encoders:
+            tail = " | ".join(encoder.stderr.strip().splitlines()[-3:])
+            error = encoder.error
+            if not error and encoder.process.returncode != 0:
+                error = f"ffmpeg exited with code {encoder.process.returncode}"
+            if not error and not self._is_valid_file(encoder.filepath):
+                error = "ffmpeg produced no output"
+            if not error and stats.frames < end - start + 1:
+                error = f"Stream stopped after {stats.frames} frame(s)"
+            if error:
+                detail = f"{error} ({encoder.filepath})"
+                results.append((None, f"{detail}: {tail}" if tail else detail))
+                continue
+            if audio_filepath:
+                self._warn_if_silent(encoder.filepath, audio_filepath)
+            om.MGlobal.displayInfo(f"Encoded movie created: {encoder.filepath}")
+            results.append((encoder.filepath, None))
+
+        self.logger.info(
+            f"stream_encode: {stats.frames} frame(s) in {stats.elapsed:.2f}s "
+            f"(capture {stats.capture_time:.2f}s, stalled {stats.stall_time:.2f}s, "
+            f"drain {stats.drain_time:.2f}s), peak temp "
+            f"{stats.peak_temp_bytes / (1024 * 1024):.1f} MB / "
+            f"{stats.peak_temp_frames} frame(s)"
+        )
+        return results, stats
+
+    def _capture_chunk(
+        self,
+        directory: str,
+        prefix: str,
+        start: int,
+        end: int,
+        kwargs: Dict[str, Any],
+    ) -> List[str]:
+        """One ``cmds.playblast`` of ``start``-``end`` into *directory*; the frames written."""
+        cmds.playblast(
+            filename=os.path.join(directory, prefix),
+            startTime=start,
+            endTime=end,
+            **kwargs,
+        )
+        frames = self._collect_frames(directory, prefix, "png", start, end)
+        expected = end - start + 1
+        if len(frames) < expected:
+            raise RuntimeError(
+                f"Playblast wrote {len(frames)}/{expected} frames for [{start}-{end}] "
+                f"under {directory!r} (prefix {prefix!r})."
+            )
+        return frames
+
+    @staticmethod
+    def _stream_command(
+        ffmpeg: str,
+        output_filepath: str,
+        fps: float,
+        audio_filepath: Optional[str],
+        audio_offset: float,
+        options: Dict[str, Any],
+    ) -> List[str]:
+        """ffmpeg argv reading PNG frames from stdin.
+
+        Output options follow ``VidUtils.compress_video`` so a streamed movie
+        encodes exactly like a two-pass one. pythontk builds that argv inline
+        and has no stdin input, so ``test_playblast_stream.TestEncoderCommand``
+        checks this output side against the argv ``compress_video`` runs.
+        """
+        command = [
+            ffmpeg, "-y", "-hide_banner", "-loglevel", "error",
+            "-f", "image2pipe", "-c:v", "png", "-framerate", str(fps), "-i", "-",
+        ]
+        if audio_filepath:
+            if audio_offset > 0:
+                command.extend(["-itsoffset", str(audio_offset)])
+            elif audio_offset < 0:
+                command.extend(["-ss", str(-audio_offset)])
+            command.extend(["-i", audio_filepath])
+        command.extend(
+            [
+                "-c:v", options.get("codec", "libx264"),
+                "-crf", str(options.get("crf", 18)),
+                "-preset", options.get("preset", "slow"),
+                "-pix_fmt", options.get("pixel_format", "yuv420p"),
+            ]
+        )
+        if audio_filepath:
+            command.extend(
+                ["-map", "0:v:0", "-map", "1:a:0", "-c:a", "aac", "-af", "apad", "-shortest"]
+            )
+        command.extend(["-r", str(fps)])
+        for option, value in options.items():
+            if option not in {"codec", "crf", "preset", "pixel_format"}:
+                command.extend([f"-{option}", str(value)])
+        command.append(output_filepath)
+        return command
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -824,6 +1309,28 @@ class PlayblastExporter(ptk.LoggingMixin):
         match = re.search(r"max_volume:\s*(-?[\d.]+)\s*dB", result.stderr)
         return float(match.group(1)) if match else None
 
+    def _warn_if_silent(self, encoded: str, audio_filepath: str) -> None:
+        """Log when a muxed audio track measures as effectively silent."""
+        peak = self._audio_peak_db(encoded)
+        if peak is not None and peak < self._SILENT_PEAK_DB:
+            self.logger.warning(
+                f"Encoded audio track is effectively silent (peak "
+                f"{peak:.1f} dB): {audio_filepath!r} has no audible "
+                "content over the encoded frame range — check the "
+                "timeline's active sound node."
+            )
+
+    @staticmethod
+    def _frames_size(frames: Sequence[str]) -> int:
+        """Total bytes of the frames still on disk."""
+        total = 0
+        for frame in frames:
+            try:
+                total += os.path.getsize(frame)
+            except OSError:
+                pass
+        return total
+
     @staticmethod
     def _is_valid_file(path: Optional[str]) -> bool:
         return bool(path) and os.path.exists(path) and os.path.getsize(path) > 0
@@ -0,0 +1,288 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Bulk key retiming: read key times once, retime them in arrays, write once.
+
+``ScaleKeys`` and ``SegmentKeys`` used to retime curve by curve and segment
+by segment: a ``keyframe`` query and edit per curve for every stagger step,
+a query, tangent read, cut and ``setKeyframe`` per key for every snapped
+scale. Overlap prevention then re-read the ranges from the scene after each
+change. A 40-character crowd shot took tens of seconds and left thousands of
+entries in the undo queue.
+
+:class:`KeyRetimer` reads the key times of every affected curve with
+``MFnAnimCurve`` once. :meth:`~KeyRetimer.shift`, :meth:`~KeyRetimer.scale`
+and :meth:`~KeyRetimer.move` edit those arrays only, each matching keys by
+their *current* array times. A chain of steps therefore behaves as if each
+one had been applied to the scene before the next, like the old
+command-by-command path. :meth:`~KeyRetimer.commit` writes every changed
+curve inside one undo chunk: one ``getAttr``/``setAttr`` of the changed
+``keyTimeValue`` span per curve. Values and tangent settings stay on their
+key indices.
+
+A span can only be rewritten in place while the keys keep their order. A
+curve whose keys would pass or land on each other (a snap merging two keys,
+a shift onto held keys) goes through ``AnimUtils._move_curve_keys`` instead,
+with the same original-to-final time pairs. Unitless (set-driven-key)
+curves are never read, so no step can move them.
+"""
+
+import contextlib
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+    import maya.api.OpenMayaAnim as oma
+except ImportError as error:  # pragma: no cover - Maya environment required
+    cmds = None
+    om = None
+    oma = None
+    print(__file__, error)
+
+from mayatk.core_utils._core_utils import CoreUtils
+
+
+class KeyRetimer:
+    """Key times for many curves, retimed in arrays and written back in one chunk.
+
+    Parameters:
+        chunk_name: Name of the undo chunk :meth:`commit` opens.
+    """
+
+    #: Padding for time ranges and key matching, as ``shift_curves`` uses.
+    EPSILON = 1e-3
+    #: A time change at or below this is not a move (``_move_curve_keys``).
+    TOLERANCE = 1e-4
+
+    def __init__(self, chunk_name: str = "Retime Keys"):
+        self.chunk_name = chunk_name
+        self._original: Dict[str, np.ndarray] = {}
+        self._times: Dict[str, np.ndarray] = {}
+        self._skipped: Set[str] = set()
+        self.stats: Dict[str, float] = dict.fromkeys(("read", "compute", "write"), 0.0)
+        self.stats.update(curves=0, keys=0, moved=0, fallback=0, failed=0)
+
+    @contextlib.contextmanager
+    def _timed(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stats[stage] += time.perf_counter() - start
+
+    def read(self, curves: Iterable[str]) -> int:
+        """Load the key times of *curves* not read yet.
+
+        Parameters:
+            curves: Anim curve names. Missing nodes, non-curves and unitless
+                curves are skipped and stay empty.
+
+        Returns:
+            (int) The number of curves read.
+        """
+        pending = [str(c) for c in curves]
+        pending = [c for c in dict.fromkeys(pending) if not self._known(c)]
+        if not pending:
+            return 0
+        with self._timed("read"):
+            unit = om.MTime.uiUnit()
+            sel = om.MSelectionList()
+            read = 0
+            for curve in pending:
+                sel.clear()
+                try:
+                    sel.add(curve)
+                    fn = oma.MFnAnimCurve(sel.getDependNode(0))
+                except (RuntimeError, TypeError):
+                    self._skipped.add(curve)
+                    continue
+                if fn.isUnitlessInput:
+                    self._skipped.add(curve)
+                    continue
+                count = fn.numKeys
+                times = np.fromiter(
+                    (fn.input(i).asUnits(unit) for i in range(count)), float, count
+                )
+                self._original[curve] = times
+                self._times[curve] = times.copy()
+                read += 1
+                self.stats["keys"] += count
+            self.stats["curves"] += read
+        return read
+
+    def _known(self, curve: str) -> bool:
+        return curve in self._times or curve in self._skipped
+
+    def times(self, curve: str) -> np.ndarray:
+        """Current key times of *curve* (read on first use); empty when skipped."""
+        curve = str(curve)
+        if not self._known(curve):
+            self.read([curve])
+        return self._times.get(curve, np.empty(0))
+
+    def key_range(self, curves: Iterable[str]) -> Optional[Tuple[float, float]]:
+        """``(first, last)`` current key time over *curves*, or None without keys."""
+        arrays = [t for t in (self.times(c) for c in curves) if t.size]
+        if not arrays:
+            return None
+        return (
+            float(min(t.min() for t in arrays)),
+            float(max(t.max() for t in arrays)),
+        )
+
+    def _mask(
+        self, times: np.ndarray, time_range: Optional[Tuple[float, float]]
+    ) -> np.ndarray:
+        if not time_range:
+            return np.ones(times.shape, dtype=bool)
+        start, end = float(time_range[0]), float(time_range[1])
+        return (times >= start - self.EPSILON) & (times <= end + self.EPSILON)
+
+    def shift(
+        self,
+        curves: Iterable[str],
+        offset: float,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> int:
+        """Move the keys of *curves* in *time_range* (all keys when None) by *offset*.
+
+        Returns:
+            (int) The number of keys matched.
+        """
+        return self._retime(curves, time_range, lambda t: t + offset)
+
+    def scale(
+        self,
+        curves: Iterable[str],
+        pivot: float,
+        factor: float,
+        time_range: Optional[Tuple[float, float]] = None,
+    ) -> int:
+        """Scale the keys of *curves* in *time_range* about *pivot* by *factor*.
+
+        Returns:
+            (int) The number of keys matched.
+        """
+        return self._retime(curves, time_range, lambda t: pivot + (t - pivot) * factor)
+
+    def _retime(self, curves, time_range, remap) -> int:
+        curves = list(curves)
+        self.read(curves)
+        matched = 0
+        with self._timed("compute"):
+            for curve in dict.fromkeys(str(c) for c in curves):
+                times = self._times.get(curve)
+                if times is None or not times.size:
+                    continue
+                mask = self._mask(times, time_range)
+                times[mask] = remap(times[mask])
+                matched += int(mask.sum())
+        return matched
+
+    def move(self, curve: str, time_pairs: Sequence[Tuple[float, float]]) -> int:
+        """Move individual keys of *curve*: each ``(old, new)`` pair retimes the key
+        found within :attr:`EPSILON` of ``old``.
+
+        Returns:
+            (int) The number of keys that move by more than :attr:`TOLERANCE`.
+        """
+        times = self.times(curve)
+        if not times.size or not time_pairs:
+            return 0
+        with self._timed("compute"):
+            pairs = np.asarray(time_pairs, dtype=float).reshape(-1, 2)
+            old, new = pairs[:, 0], pairs[:, 1]
+            order = np.argsort(times, kind="stable")
+            sorted_times = times[order]
+            right = np.clip(np.searchsorted(sorted_times, old), 0, times.size - 1)
+            left = np.clip(right - 1, 0, times.size - 1)
+            nearer = np.where(
+                np.abs(sorted_times[left] - old) <= np.abs(sorted_times[right] - old),
+                left,
+                right,
+            )
+            index = order[nearer]
+            found = np.abs(times[index] - old) <= self.EPSILON
+            moving = found & (np.abs(new - old) > self.TOLERANCE)
+            times[index[moving]] = new[moving]
+        return int(moving.sum())
+
+    def pending(self) -> List[str]:
+        """Curves with at least one key whose time has changed."""
+        return [
+            curve
+            for curve, times in self._times.items()
+            if times.size
+            and np.any(np.abs(times - self._original[curve]) > self.TOLERANCE)
+        ]
+
+    def commit(self, allow_merge: bool = False) -> int:
+        """Write every changed curve in one undo chunk, then forget all times.
+
+        Parameters:
+            allow_merge: Passed to ``_move_curve_keys`` for curves whose keys
+                would change order: True lets keys landing on the same time
+                replace each other, False nudges them apart.
+
+        Returns:
+            (int) The number of keys moved.
+        """
+        curves = self.pending()
+        moved = 0
+        if curves:
+            with self._timed("write"), CoreUtils.undo_chunk(self.chunk_name):
+                for curve in curves:
+                    moved += self._commit_curve(curve, allow_merge)
+            self.stats["moved"] += moved
+        self._original.clear()
+        self._times.clear()
+        self._skipped.clear()
+        return moved
+
+    def _commit_curve(self, curve: str, allow_merge: bool) -> int:
+        old, new = self._original[curve], self._times[curve]
+        changed = np.flatnonzero(np.abs(new - old) > self.TOLERANCE)
+        try:
+            if np.all(np.diff(new) > self.TOLERANCE) and self._write_span(
+                curve, new, int(changed[0]), int(changed[-1])
+            ):
+                return int(changed.size)
+            from mayatk.anim_utils._anim_utils import AnimUtils
+
+            self.stats["fallback"] += 1
+            pairs = list(zip(old[changed].tolist(), new[changed].tolist()))
+            return AnimUtils._move_curve_keys(curve, pairs, allow_merge=allow_merge)
+        except RuntimeError as error:
+            self.stats["failed"] += 1
+            cmds.warning(f"Failed to move keys for {curve}: {error}")
+            return 0
+
+    @staticmethod
+    def _write_span(curve: str, times: np.ndarray, first: int, last: int) -> bool:
+        """Rewrite keys *first* to *last* with *times*, keeping their values.
+
+        Both ``keyTimeValue`` calls work in UI units, like the times read.
+        Returns False when the span no longer matches the keys read.
+        """
+        span = f"{curve}.ktv[{first}:{last}]"
+        current = cmds.getAttr(span) or []
+        if len(current) != last - first + 1:
+            return False
+        flat = []
+        for (_time, value), new_time in zip(current, times[first : last + 1]):
+            flat.extend((float(new_time), value))
+        cmds.setAttr(span, *flat)
+        return True
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -15,6 +15,7 @@ import pythontk as ptk
 # Import CoreUtils using internal path to avoid circular imports
 from mayatk.core_utils._core_utils import CoreUtils
 from mayatk.anim_utils.segment_keys import SegmentKeys
+from mayatk.anim_utils.retime_keys import KeyRetimer
 
 
 class ScaleKeys:
@@ -167,6 +168,8 @@ class ScaleKeys:
         self.segments: List[Dict[str, Any]] = []
         self.diagnostics: Dict[str, Any] = {}
         self._last_global_pivot: Optional[float] = None
+        # Every scale, move and stagger lands here first; execute() commits.
+        self.retimer = KeyRetimer(chunk_name="Scale Keys")
 
     # Input normalization helpers
     @staticmethod
@@ -328,47 +331,29 @@ class ScaleKeys:
             else None
         )
 
-    @staticmethod
     def _execute_scale_operation(
+        self,
         curves: List[Any],
         pivot: float,
         factor: float,
         time_range: Optional[Tuple[float, float]] = None,
     ) -> int:
-        """Execute a scale operation directly."""
-        keys_scaled = 0
-        for curve in curves:
-            if not cmds.objExists(curve):
-                continue
-
-            kwargs = {
-                "timeScale": factor,
-                "timePivot": pivot,
-            }
-            if time_range:
-                kwargs["time"] = time_range
-                # Verify keys exist in range before scaling to avoid warnings/errors
-                if not cmds.keyframe(curve, query=True, time=time_range):
-                    continue
-                keys_scaled += cmds.keyframe(
-                    curve, query=True, keyframeCount=True, time=time_range
-                )
-            else:
-                keys_scaled += cmds.keyframe(curve, query=True, keyframeCount=True)
-
-            cmds.scaleKey(curve, **kwargs)
-        return keys_scaled
+        """Scale the keys of *curves* in the retimer; returns the keys matched."""
+        return self.retimer.scale(curves, pivot, factor, time_range)
 
     def _execute_move_operation(
         self,
         curve: Any,
         time_pairs: List[Tuple[float, float]],
-        allow_merge: bool = False,
     ) -> int:
-        """Execute a move operation directly."""
-        if not cmds.objExists(curve):
-            return 0
-        return self.utils._move_curve_keys(curve, time_pairs, allow_merge=allow_merge)
+        """Move individual keys of *curve* in the retimer; returns the keys moved."""
+        return self.retimer.move(curve, time_pairs)
+
+    def _commit_retime(self) -> int:
+        """Write everything retimed so far; snapped scales may merge keys."""
+        return self.retimer.commit(
+            allow_merge=bool(self.snap_mode and self.snap_mode != "none")
+        )
 
     # Processing helpers
 
@@ -521,6 +506,10 @@ class ScaleKeys:
 
                     processed_objects += len(group_objects)
 
+            # The next group measures its motion from the scene; write this
+            # group's retiming first.
+            self._commit_retime()
+
         self._execute_overlap_prevention(overlap_groups_data)
 
         return keys_scaled, processed_objects
@@ -697,14 +686,16 @@ class ScaleKeys:
                 if self.selected_keys_only or (self.snap_mode is not None):
                     curve_times_map = {}
                     for curve in curves_to_scale:
-                        kwargs = {"query": True, "tc": True}
                         if self.selected_keys_only:
-                            kwargs["selected"] = True
-                        # Manual filtering for large frame numbers where Maya's time query fails
-                        # if query_time_arg:
-                        #     kwargs["time"] = query_time_arg
+                            # Selection state is only known to the scene.
+                            times = cmds.keyframe(
+                                curve, query=True, tc=True, selected=True
+                            )
+                        else:
+                            times = self.retimer.times(curve).tolist()
 
-                        times = cmds.keyframe(curve, **kwargs)
+                        # Filter manually: Maya's time query misses keys at
+                        # large frame numbers.
 
                         if query_time_arg and times:
                             start, end = query_time_arg
@@ -738,19 +729,17 @@ class ScaleKeys:
                         aggregated_moves[curve].extend(time_pairs)
                 else:
                     # Bulk scale
+                    # The retimer pads the range by the same epsilon.
                     keys_scaled += self._execute_scale_operation(
                         curves_to_scale,
                         pivot_time,
                         effective_factor,
-                        query_time_arg,
+                        time_arg,
                     )
 
         # Execute aggregated moves
-        allow_merge = bool(self.snap_mode and self.snap_mode != "none")
         for curve, pairs in aggregated_moves.items():
-            keys_scaled += self._execute_move_operation(
-                curve, pairs, allow_merge=allow_merge
-            )
+            keys_scaled += self._execute_move_operation(curve, pairs)
 
         if overlap_groups_data:
             self._execute_overlap_prevention(overlap_groups_data)
@@ -762,10 +751,9 @@ class ScaleKeys:
     ) -> None:
         """Execute overlap prevention directly."""
         if self.prevent_overlap and overlap_groups_data:
+            # Ranges come from the retimer, so they include the pending scale.
             for data in overlap_groups_data:
-                times = self.utils.get_keyframe_times(
-                    data.get("curves", []), from_curves=True, as_range=True
-                )
+                times = self.retimer.key_range(data.get("curves", []))
                 if times:
                     data["start"], data["end"] = times
                     data["duration"] = times[1] - times[0]
@@ -780,6 +768,7 @@ class ScaleKeys:
                 use_intervals=False,
                 avoid_overlap=False,
                 preserve_gaps=True,
+                retimer=self.retimer,
             )
 
     def _stagger_scaled_segments(
@@ -1049,11 +1038,9 @@ class ScaleKeys:
         pos_ops.sort(key=get_start_time, reverse=True)
         neg_ops.sort(key=get_start_time)
 
-        for op in pos_ops:
-            SegmentKeys.shift_curves(op["curves"], op["shift"], op["time"])
-
-        for op in neg_ops:
-            SegmentKeys.shift_curves(op["curves"], op["shift"], op["time"])
+        for op in pos_ops + neg_ops:
+            self.retimer.shift(op["curves"], op["shift"], op["time"])
+        self._commit_retime()
 
     def _report_speed(
         self,
@@ -1324,6 +1311,12 @@ class ScaleKeys:
 
         # Convert segments to object_info format for compatibility
         self.object_info = self._segments_to_object_info(self.segments)
+        # One API read of every key time the scale can touch.
+        self.retimer.read(
+            curve
+            for info in self.object_info
+            for curve in info.get("curves_to_scale", [])
+        )
 
         # Use SegmentKeys for grouping (maps group_mode to segment mode)
         segment_mode_map = {
@@ -1375,6 +1368,23 @@ class ScaleKeys:
                 processing_groups, overlap_groups_data_for_scale
             )
 
+        # Scaling and overlap prevention have only edited the retimer's
+        # arrays; write them before anything reads the scene again.
+        self._commit_retime()
+        self.diagnostics["retime"] = self.retimer.stats
+        if self.verbose:
+            stats = self.retimer.stats
+            print(
+                "[ScaleKeys] retime: {c} curves, {m} keys moved; read {r:.3f}s "
+                "compute {p:.3f}s write {w:.3f}s".format(
+                    c=stats["curves"],
+                    m=stats["moved"],
+                    r=stats["read"],
+                    p=stats["compute"],
+                    w=stats["write"],
+                )
+            )
+
         # After scaling, stagger segments only when prevent_overlap is enabled
         if self.split_static and self.prevent_overlap and keys_scaled > 0:
             # Calculate gap scale
@@ -10,6 +10,8 @@ except ImportError as error:
     cmds = None
     print(__file__, error)
 
+from mayatk.anim_utils.retime_keys import KeyRetimer
+
 # Module-level loggers — avoid per-call getLogger. Named only: a library must
 # not attach handlers or set levels at import (it double-prints once the host
 # configures logging, and overrides the verbosity the caller asked for). Records
@@ -1413,39 +1415,17 @@ class SegmentKeys(SegmentKeysInfo):
                 except Exception:
                     continue
 
-        for curve in curves:
-            try:
-                curve = str(curve)
-                kw_range = {}
-                if time_range:
-                    start, end = float(time_range[0]), float(time_range[1])
-                    kw_range["time"] = (start - eps, end + eps)
-                else:
-                    pass
-
-                # Skip if no keys match
-                matched_keys = cmds.keyframe(curve, q=True, **kw_range)
-                if not matched_keys:
-                    _log.debug("[SHIFT] %s: no keys in range — skipping", curve)
-                    continue
-
-                _log.debug(
-                    "[SHIFT] %s: matched=%s",
-                    curve,
-                    matched_keys,
-                )
-
-                # Single-pass: move keys directly to the destination
-                cmds.keyframe(
-                    curve,
-                    edit=True,
-                    relative=True,
-                    timeChange=offset,
-                    **kw_range,
-                )
-            except RuntimeError as e:
-                _log.error("[SHIFT] Exception for %s: %s", curve, e)
-                cmds.warning(f"Failed to move keys for {curve}: {e}")
+        # One read, one array shift and one write per curve, in one undo chunk.
+        retimer = KeyRetimer(chunk_name="Shift Keys")
+        retimer.read(curves)
+        for curve in dict.fromkeys(str(c) for c in curves):
+            matched = retimer.shift([curve], offset, time_range)
+            if not matched:
+                _log.debug("[SHIFT] %s: no keys in range — skipping", curve)
+                continue
+            _log.debug("[SHIFT] %s: matched=%s", curve, matched)
+        retimer.commit()
+        _log.debug("[SHIFT] stats=%s", retimer.stats)
 
     @classmethod
     def execute_stagger(
@@ -1456,6 +1436,7 @@ class SegmentKeys(SegmentKeysInfo):
         use_intervals: bool = False,
         avoid_overlap: bool = False,
         preserve_gaps: bool = False,
+        retimer: Optional[KeyRetimer] = None,
     ):
         """Calculate and execute staggering on groups of segments.
 
@@ -1466,6 +1447,9 @@ class SegmentKeys(SegmentKeysInfo):
             use_intervals: If True, use fixed intervals.
             avoid_overlap: If True (and use_intervals=True), skip intervals to avoid overlap.
             preserve_gaps: If True (and use_intervals=False), ensure we don't pull back.
+            retimer: A KeyRetimer to apply the shifts to and leave uncommitted,
+                so a caller can batch them with its own retiming. By default
+                the shifts are written when staggering finishes.
         """
         operations = []
 
@@ -1571,8 +1555,16 @@ class SegmentKeys(SegmentKeysInfo):
         pos_ops.sort(key=get_start_time, reverse=True)
         neg_ops.sort(key=get_start_time)
 
-        for op in pos_ops:
-            cls.shift_curves(op["curves"], op["shift"], op["time"])
+        # Each shift matches keys at their already-shifted times, exactly as
+        # if the one before had been written; nothing touches the scene until
+        # the commit.
+        owned = retimer is None
+        if owned:
+            retimer = KeyRetimer(chunk_name="Stagger Keys")
+            retimer.read(c for op in operations for c in op["curves"])
+
+        for op in pos_ops + neg_ops:
+            retimer.shift(op["curves"], op["shift"], op["time"])
 
-        for op in neg_ops:
-            cls.shift_curves(op["curves"], op["shift"], op["time"])
+        if owned:
+            retimer.commit()
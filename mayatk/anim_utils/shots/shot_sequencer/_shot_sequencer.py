@@ -266,6 +266,7 @@ class ShotSequencer:
         ignore: Optional[str] = None,
         motion_rate: float = 1e-3,
         ignore_holds: bool = True,
+        cache=None,
     ) -> List[Dict[str, Any]]:
         """Collect per-object animation segments within a shot's range.
 
@@ -282,6 +283,11 @@ class ShotSequencer:
                 trailing holds are absorbed into adjacent motion
                 segments (wider clips) and hold-only objects (flat keys,
                 no motion) produce a single segment spanning all keys.
+            cache: Optional ``CurveSegmentCache`` (see
+                :mod:`mayatk.anim_utils.shots.shot_sequencer.segment_cache`).
+                Objects with cached segments for the same range and
+                arguments are reused; only the rest are collected (in one
+                ``SegmentKeys`` pass) and stored back.
 
         Returns:
             A list of segment dicts grouped by object.
@@ -301,22 +307,68 @@ class ShotSequencer:
             if not nodes:
                 return []
 
+        args = (shot.start, shot.end, ignore, motion_rate, ignore_holds)
+        by_obj: Dict[str, List[Dict[str, Any]]] = {}
+        missing = []
+        for n in nodes:
+            cached = cache.get_segments(n, args) if cache is not None else None
+            if cached is None:
+                missing.append(n)
+            else:
+                by_obj[n] = [dict(seg) for seg in cached]
+        if missing:
+            fresh = self._collect_node_segments(
+                missing, shot.start, shot.end, ignore, motion_rate, ignore_holds
+            )
+            # A segment filed under a name outside ``missing`` can't be
+            # attributed to one object, so that pass is not cached.
+            cacheable = cache is not None and set(fresh) <= set(missing)
+            for n in missing:
+                segs = fresh.pop(n, [])
+                by_obj[n] = segs
+                if cacheable:
+                    cache.put_segments(n, args, [dict(seg) for seg in segs])
+            for n, segs in fresh.items():
+                by_obj.setdefault(n, []).extend(segs)
+        segments = [seg for n in nodes for seg in by_obj.pop(n, [])]
+        # Segments SegmentKeys reported under a name outside ``nodes``.
+        for segs in by_obj.values():
+            segments.extend(segs)
+        return segments
+
+    @staticmethod
+    def _collect_node_segments(
+        nodes: List[str],
+        start: float,
+        end: float,
+        ignore: Optional[str],
+        motion_rate: float,
+        ignore_holds: bool,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Segments of *nodes* in ``[start, end]``, keyed by object name.
+
+        One ``SegmentKeys.collect_segments`` pass plus the hold backfill of
+        :meth:`collect_object_segments`.  Every object's result depends on
+        its own curves alone, which is what lets the cache reuse it.
+        """
         from mayatk.anim_utils.segment_keys import SegmentKeys
 
         segments = SegmentKeys.collect_segments(
             nodes,
             split_static=True,
             ignore=ignore,
-            time_range=(shot.start, shot.end),
+            time_range=(start, end),
             ignore_holds=ignore_holds,
             ignore_visibility_holds=True,
             motion_only=True,
             motion_rate=motion_rate,
         )
+        by_obj: Dict[str, List[Dict[str, Any]]] = {}
         # Normalise obj to str — defensive; values are already strings
         # post-cmds migration, but callers historically passed nodes.
         for seg in segments:
             seg["obj"] = str(seg["obj"])
+            by_obj.setdefault(seg["obj"], []).append(seg)
 
         # Sequencer GUI invariant: every keyed object on the shot deserves
         # a track marker even when its keys are static-value only or its
@@ -324,15 +376,14 @@ class ShotSequencer:
         # filters those out under ignore_holds=True; backfill a single
         # span-of-keys segment for any node that has keys in range but
         # produced no segment.
-        if ignore_holds and nodes:
-            covered = {s["obj"] for s in segments}
+        if ignore_holds:
             for n in nodes:
-                if n in covered:
+                if n in by_obj:
                     continue
-                kt = cmds.keyframe(n, q=True, time=(shot.start, shot.end)) or []
+                kt = cmds.keyframe(n, q=True, time=(start, end)) or []
                 if not kt:
                     continue
-                segments.append(
+                by_obj[n] = [
                     {
                         "obj": n,
                         "curves": [],
@@ -342,8 +393,8 @@ class ShotSequencer:
                         "duration": max(kt) - min(kt),
                         "segment_range": (min(kt), max(kt)),
                     }
-                )
-        return segments
+                ]
+        return by_obj
 
     # ---- unified sequence model (anim + audio) ---------------------------
 
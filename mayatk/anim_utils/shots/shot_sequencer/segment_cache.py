@@ -0,0 +1,289 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Dirty-tracked cache of per-object segments and per-curve preview data.
+
+A sequencer rebuild used to re-run ``SegmentKeys.collect_segments`` for every
+object of the active shot and re-read every expanded curve (six key/tangent
+queries each), so editing one key re-collected hundreds of rigs.
+:class:`CurveSegmentCache` keeps both results until the anim curves behind
+them change:
+
+* **Segments** are stored per object and per collection arguments (shot
+  range, ignore pattern, motion rate, holds) together with the names of the
+  curves that drive the object.
+* **Curve data** -- the raw key times, values, angles, tangent types and
+  weights that :meth:`SegmentCollector.build_curve_preview` clips -- is
+  stored per curve.
+
+:meth:`CurveSegmentCache.watch` hooks ``MAnimMessage`` curve edits and
+``animCurve`` deletion through :class:`ScriptJobManager`; an edited curve
+drops its own data and the segments of every object it drives, nothing
+else. Whatever cannot be traced to a curve (undo/redo, scene swaps, DAG
+renames) is the owner's cue to call :meth:`CurveSegmentCache.clear`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om2
+    import maya.api.OpenMayaAnim as oma
+except ImportError:
+    cmds = None
+    om2 = None
+    oma = None
+
+import pythontk as ptk
+
+__all__ = [
+    "CurveSegmentCache",
+]
+
+
+def _leaf(name: str) -> str:
+    """``|grp|ns:obj`` -> ``ns:obj`` -- the part every spelling of a node shares."""
+    return name.rsplit("|", 1)[-1]
+
+
+class CurveSegmentCache(ptk.LoggingMixin):
+    """Segments per object and preview data per curve, until a curve changes.
+
+    Parameters:
+        max_entries: Upper bound on cached object entries. Resized shots
+            leave entries for ranges that are never asked for again; the
+            least recently used ones are dropped past this size.
+    """
+
+    def __init__(self, max_entries: int = 20000):
+        super().__init__()
+        self.max_entries = max_entries
+        # (obj, args) -> segment list; args = (start, end, ignore, rate, holds)
+        self._segments: "OrderedDict[Tuple[str, tuple], List[dict]]" = OrderedDict()
+        self._keys_by_obj: Dict[str, Set[tuple]] = {}
+        self._objs_by_leaf: Dict[str, Set[str]] = {}
+        self._objs_by_curve: Dict[str, Set[str]] = {}
+        self._curves_by_obj: Dict[str, Set[str]] = {}
+        self._curve_data: Dict[str, Optional[dict]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._owner = None
+
+    # ---- segments ---------------------------------------------------------
+
+    def get_segments(self, obj: str, args: tuple) -> Optional[List[dict]]:
+        """Cached segments of *obj* for *args*, or None on a miss.
+
+        The list is shared with the cache; callers copy before mutating.
+        """
+        entry = self._segments.get((obj, args))
+        if entry is None:
+            self.misses += 1
+            return None
+        self._segments.move_to_end((obj, args))
+        self.hits += 1
+        return entry
+
+    def put_segments(
+        self,
+        obj: str,
+        args: tuple,
+        segments: List[dict],
+        curves: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Store *segments* for *obj* and index the curves that drive it.
+
+        Parameters:
+            obj: The node name as the caller passes it around.
+            args: Hashable collection arguments the segments depend on.
+            segments: The object's segment dicts.
+            curves: Anim curves driving *obj*. Defaults to the curves named
+                in the segments; pass the full set when known so a key
+                added on a so-far static curve still finds the object.
+        """
+        if curves is None:
+            curves = {str(c) for seg in segments for c in seg.get("curves", ())}
+        self._segments[(obj, args)] = segments
+        self._segments.move_to_end((obj, args))
+        self._keys_by_obj.setdefault(obj, set()).add(args)
+        self._objs_by_leaf.setdefault(_leaf(obj), set()).add(obj)
+        for crv in curves:
+            self._objs_by_curve.setdefault(crv, set()).add(obj)
+            self._curves_by_obj.setdefault(obj, set()).add(crv)
+        while len(self._segments) > self.max_entries:
+            (old, old_args), _ = self._segments.popitem(last=False)
+            keys = self._keys_by_obj.get(old)
+            if keys is not None:
+                keys.discard(old_args)
+                if not keys:
+                    self._forget_object(old)
+
+    def curves_of(self, obj: str) -> Set[str]:
+        """Curves recorded as driving *obj* (empty when unknown)."""
+        return set(self._curves_by_obj.get(obj, ()))
+
+    # ---- curve data -------------------------------------------------------
+
+    def get_curve_data(self, crv: str, read) -> Optional[dict]:
+        """Cached raw data of *crv*, calling ``read(crv)`` on a miss.
+
+        ``None`` results (unreadable curves) are cached too; they are
+        retried once the curve is edited or the cache cleared.
+        """
+        if crv in self._curve_data:
+            self.hits += 1
+            return self._curve_data[crv]
+        self.misses += 1
+        data = read(crv)
+        self._curve_data[crv] = data
+        return data
+
+    # ---- invalidation -----------------------------------------------------
+
+    def invalidate_curves(
+        self, curves: Iterable[str], resolve: bool = True
+    ) -> Set[str]:
+        """Drop *curves*' data and the segments of every object they drive.
+
+        Parameters:
+            curves: Edited or deleted anim curve names.
+            resolve: Also look up each curve's destination nodes in the
+                scene. This catches curves the cache has not seen yet --
+                the first key on a new attribute -- at one
+                ``listConnections`` per unknown curve.
+
+        Returns:
+            (set) The objects whose segments were dropped.
+        """
+        dropped: Set[str] = set()
+        for crv in curves:
+            crv = str(crv)
+            self._curve_data.pop(crv, None)
+            objs = self._objs_by_curve.get(crv)
+            if objs:
+                dropped.update(objs)
+            elif resolve and cmds is not None:
+                try:
+                    dests = (
+                        cmds.listConnections(crv, d=True, s=False, scn=True) or []
+                    )
+                except (RuntimeError, ValueError):
+                    dests = []  # already deleted: its objects were indexed
+                for dest in dests:
+                    dropped.update(self._objs_by_leaf.get(_leaf(dest), ()))
+        for obj in dropped:
+            self._forget_object(obj)
+        if dropped:
+            self.logger.debug("invalidated %d object(s): %s", len(dropped), dropped)
+        return dropped
+
+    def invalidate_objects(self, objects: Iterable[str]) -> None:
+        """Drop every cached segment list of *objects*."""
+        for obj in objects:
+            for name in list(self._objs_by_leaf.get(_leaf(str(obj)), ())):
+                self._forget_object(name)
+
+    def clear(self) -> None:
+        """Drop everything (undo/redo, scene change, stale DAG paths)."""
+        self._segments.clear()
+        self._keys_by_obj.clear()
+        self._objs_by_leaf.clear()
+        self._objs_by_curve.clear()
+        self._curves_by_obj.clear()
+        self._curve_data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and sizes, for profiling and tests."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "objects": len(self._keys_by_obj),
+            "entries": len(self._segments),
+            "curves": len(self._curve_data),
+        }
+
+    def _forget_object(self, obj: str) -> None:
+        for args in self._keys_by_obj.pop(obj, ()):
+            self._segments.pop((obj, args), None)
+        leaf = self._objs_by_leaf.get(_leaf(obj))
+        if leaf is not None:
+            leaf.discard(obj)
+            if not leaf:
+                del self._objs_by_leaf[_leaf(obj)]
+        for crv in self._curves_by_obj.pop(obj, ()):
+            objs = self._objs_by_curve.get(crv)
+            if objs is not None:
+                objs.discard(obj)
+                if not objs:
+                    del self._objs_by_curve[crv]
+
+    # ---- Maya callbacks ---------------------------------------------------
+
+    def watch(self, owner=None) -> bool:
+        """Invalidate on anim curve edits and deletions until :meth:`unwatch`.
+
+        Parameters:
+            owner: The ``ScriptJobManager`` owner to register under; the
+                callbacks tear down with the owner's ``unsubscribe_all``.
+                Defaults to the cache itself.
+
+        Returns:
+            (bool) False when OpenMaya is unavailable.
+        """
+        if om2 is None or oma is None:
+            return False
+        if self._owner is not None:
+            return True
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        self._owner = self if owner is None else owner
+        mgr.add_om_callback(
+            oma.MAnimMessage.addAnimCurveEditedCallback,
+            self._on_curves_edited,
+            owner=self._owner,
+        )
+        mgr.add_om_callback(
+            om2.MDGMessage.addNodeRemovedCallback,
+            self._on_curve_removed,
+            "animCurve",
+            owner=self._owner,
+        )
+        return True
+
+    def unwatch(self) -> None:
+        """Remove the callbacks registered by :meth:`watch` (owned by the cache)."""
+        if self._owner is self:
+            from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+            ScriptJobManager.instance().unsubscribe_all(self)
+        self._owner = None
+
+    def _on_curves_edited(self, curves, *_args) -> None:
+        names = []
+        for i in range(len(curves)):
+            try:
+                names.append(om2.MFnDependencyNode(curves[i]).name())
+            except RuntimeError:
+                continue
+        self.invalidate_curves(names)
+
+    def _on_curve_removed(self, node, *_args) -> None:
+        try:
+            name = om2.MFnDependencyNode(node).name()
+        except RuntimeError:
+            return
+        # Mid-deletion the connections are unreliable; the index suffices.
+        self.invalidate_curves([name], resolve=False)
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
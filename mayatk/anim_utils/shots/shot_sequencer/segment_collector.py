@@ -35,6 +35,7 @@ class SegmentCollector:
         segment_cache,
         shifted_out_keys,
         logger,
+        curve_cache=None,
     ):
         """Collect animation segments for visible shots.
 
@@ -55,6 +56,10 @@ class SegmentCollector:
             ``{obj_name: {time, …}}`` — keys shift-moved out of their shot.
         logger
             A logging-compatible logger.
+        curve_cache : CurveSegmentCache, optional
+            Per-object segment cache.  The active shot is still re-collected
+            on every call, but only its objects whose curves changed since
+            the last call are actually queried.
         """
         segments_by_shot: dict = {}
         all_objects: set = set()
@@ -64,7 +69,14 @@ class SegmentCollector:
         for vs in visible_shots:
             is_active_shot = vs.shot_id == shot.shot_id
             if is_active_shot or vs.shot_id not in segment_cache:
-                segs = sequencer.collect_object_segments(vs.shot_id, ignore_holds=True)
+                if curve_cache is None:
+                    segs = sequencer.collect_object_segments(
+                        vs.shot_id, ignore_holds=True
+                    )
+                else:
+                    segs = sequencer.collect_object_segments(
+                        vs.shot_id, ignore_holds=True, cache=curve_cache
+                    )
                 segment_cache[vs.shot_id] = segs
             else:
                 segs = segment_cache[vs.shot_id]
@@ -198,37 +210,21 @@ class SegmentCollector:
         return sorted(attrs)
 
     @staticmethod
-    def build_curve_preview(crv, t_start, t_end):
-        """Extract Bézier curve shape data for a single anim curve.
+    def read_curve_data(crv):
+        """Read the key and tangent data :meth:`build_curve_preview` clips.
 
-        Returns a DCC-agnostic dict that the widget painter can render
-        directly using ``QPainterPath.cubicTo`` / ``lineTo``.
-
-        Parameters
-        ----------
-        crv : str
-            Maya animCurve node name.
-        t_start, t_end : float
-            Visible time range to clip to.
+        Six to eight queries per curve, which is why
+        :class:`~mayatk.anim_utils.shots.shot_sequencer.segment_cache.CurveSegmentCache`
+        keeps the result until the curve is edited.
 
         Returns
         -------
-        dict
-            ``{keys, segments, val_min, val_max}`` or *None* if the
-            curve has no usable data in the range.
-
-            *keys*: ``[(t, v), ...]`` — keyframe dot positions.
-
-            *segments*: list of dicts, one per consecutive key pair::
-
-                {t0, v0, t1, v1, out_type,
-                 cp1: (x, y) | None, cp2: (x, y) | None}
-
-            *val_min*, *val_max*: value range for Y normalisation.
+        dict or None
+            ``{times, values, out_angles, in_angles, out_types,
+            out_weights, in_weights}`` (weights are *None* unless the
+            curve has weighted tangents), or *None* when the curve can't
+            be read or its lists disagree in length.
         """
-        if cmds is None:
-            return None
-
         try:
             crv = str(crv)
             times = cmds.keyframe(crv, q=True, timeChange=True) or []
@@ -257,6 +253,68 @@ class SegmentCollector:
             check_lists.extend([out_weights, in_weights])
         if any(len(lst) != n for lst in check_lists):
             return None
+        return {
+            "times": times,
+            "values": values,
+            "out_angles": out_angles,
+            "in_angles": in_angles,
+            "out_types": out_types,
+            "out_weights": out_weights,
+            "in_weights": in_weights,
+        }
+
+    @staticmethod
+    def build_curve_preview(crv, t_start, t_end, cache=None):
+        """Extract Bézier curve shape data for a single anim curve.
+
+        Returns a DCC-agnostic dict that the widget painter can render
+        directly using ``QPainterPath.cubicTo`` / ``lineTo``.
+
+        Parameters
+        ----------
+        crv : str
+            Maya animCurve node name.
+        t_start, t_end : float
+            Visible time range to clip to.
+        cache : CurveSegmentCache, optional
+            Reuse the curve's key data from an earlier preview until the
+            curve is edited; only the clipping below is redone.
+
+        Returns
+        -------
+        dict
+            ``{keys, segments, val_min, val_max}`` or *None* if the
+            curve has no usable data in the range.
+
+            *keys*: ``[(t, v), ...]`` — keyframe dot positions.
+
+            *segments*: list of dicts, one per consecutive key pair::
+
+                {t0, v0, t1, v1, out_type,
+                 cp1: (x, y) | None, cp2: (x, y) | None}
+
+            *val_min*, *val_max*: value range for Y normalisation.
+        """
+        if cmds is None:
+            return None
+
+        crv = str(crv)
+        if cache is not None:
+            data = cache.get_curve_data(crv, SegmentCollector.read_curve_data)
+        else:
+            data = SegmentCollector.read_curve_data(crv)
+        if data is None:
+            return None
+
+        times = data["times"]
+        values = data["values"]
+        out_angles = data["out_angles"]
+        in_angles = data["in_angles"]
+        out_types = data["out_types"]
+        out_weights = data["out_weights"]
+        in_weights = data["in_weights"]
+        is_weighted = out_weights is not None
+        n = len(times)
 
         # --- Determine visible key indices (plus one bounding key each side) ---
         first_vis = None
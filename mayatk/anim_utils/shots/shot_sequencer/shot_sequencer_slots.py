@@ -45,6 +45,7 @@ from mayatk.audio_utils.segments import AudioSegment
 from mayatk.anim_utils.shots.shot_sequencer.gap_manager import GapManagerMixin
 from mayatk.anim_utils.shots.shot_sequencer.clip_motion import ClipMotionMixin
 from mayatk.anim_utils.shots.shot_sequencer.segment_collector import SegmentCollector
+from mayatk.anim_utils.shots.shot_sequencer.segment_cache import CurveSegmentCache
 from mayatk.anim_utils.shots.shot_sequencer.shot_nav import ShotNavMixin
 from mayatk.anim_utils.shots.shot_sequencer.marker_manager import MarkerManagerMixin
 from mayatk.anim_utils.shots._shots import StoreEvent
@@ -77,6 +78,7 @@ class ShotSequencerController(
         self._shot_display_mode: str = "current"  # "current" | "adjacent" | "all"
         self._segment_cache: dict = {}  # shot_id → segments list
         self._sub_row_cache: dict = {}  # (shot_id, track_name) → sub-row data
+        self._curve_cache = CurveSegmentCache()  # per-object segs, per-curve keys
         self._color_map_cache: Optional[dict] = None  # persisted attribute color map
         self._audio_segments_cache: Optional[tuple] = None  # (range_key, segments)
         self._last_visible_key: Optional[tuple] = None  # fast-path gating key
@@ -228,6 +230,7 @@ class ShotSequencerController(
         self._sequencer = None
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._audio_segments_cache = None
         self._last_visible_key = None
         self._reconcile_needed = True
@@ -308,6 +311,7 @@ class ShotSequencerController(
         self._undo_callback_ids.clear()
         self._time_change_cb = None
         self._keyframe_cb = None
+        self._curve_cache.unwatch()
         if self._keyframe_debounce is not None:
             try:
                 self._keyframe_debounce.stop()
@@ -329,6 +333,7 @@ class ShotSequencerController(
             self._syncing = False
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
 
     def _on_maya_redo(self, *_args) -> None:
@@ -342,6 +347,7 @@ class ShotSequencerController(
             return
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
 
     # ---- Maya keyframe-edited callback ------------------------------------
@@ -350,8 +356,13 @@ class ShotSequencerController(
         """Listen for keyframe edits so new keys appear in the sequencer.
 
         Uses ``MAnimMessage.addAnimKeyframeEditedCallback`` which fires
-        once per anim-curve change.  A debounce timer coalesces rapid
-        bursts (e.g. keying 10 attributes at once) into a single refresh.
+        once per anim-curve change.  The ``"idle"`` policy folds a burst
+        (e.g. keying 10 attributes at once) into one handler call, and the
+        debounce timer then coalesces successive bursts into one refresh.
+
+        The curve cache watches curve edits under the same owner, so by
+        the time the debounced refresh runs only the objects driven by
+        the edited curves are missing from it.
         """
         if oma is None or self._keyframe_cb is not None:
             return
@@ -361,7 +372,9 @@ class ShotSequencerController(
             oma.MAnimMessage.addAnimKeyframeEditedCallback,
             self._on_keyframe_edited,
             owner=self,
+            policy="idle",
         )
+        self._curve_cache.watch(owner=self)
 
     def _on_keyframe_edited(self, *_args) -> None:
         """Schedule a debounced refresh when keyframes change.
@@ -387,18 +400,16 @@ class ShotSequencerController(
     def _on_keyframe_debounce_fire(self) -> None:
         """Perform the actual refresh after the debounce window.
 
-        Only evicts the active shot from the segment cache so that
-        non-active shots (adjacent/all view modes) keep their cached
-        segments.  The active shot is always re-queried by
-        ``collect_segments`` anyway.
+        Evicts every shot from the shot-level segment cache: the curve
+        cache was already invalidated per edited curve, so re-collecting a
+        shot only queries the objects those curves drive, and an edit to
+        an object shown in an adjacent shot is no longer masked.
 
         If the keyframe was set on an object not yet in the active shot,
         the object is auto-added to the shot's object list.
         """
         if self._syncing:
             return
-        # Only invalidate the active shot — collect_segments always
-        # re-queries it, and non-active shots don't need re-collection.
         active_id = self.active_shot_id
         # Audio keys can be edited (e.g. dragging an audio clip) — the
         # cached segments must drop so the next rebuild re-discovers.
@@ -406,14 +417,13 @@ class ShotSequencerController(
         # DAG-path reconciliation on the next rebuild.
         self._audio_segments_cache = None
         self._reconcile_needed = True
+        self._segment_cache.clear()
         if active_id is not None:
-            self._segment_cache.pop(active_id, None)
             self._sub_row_cache = {
                 k: v for k, v in self._sub_row_cache.items() if k[0] != active_id
             }
             added = self._auto_add_keyed_objects(active_id)
         else:
-            self._segment_cache.clear()
             self._sub_row_cache.clear()
             added = False
         if not added:
@@ -474,7 +484,9 @@ class ShotSequencerController(
 
         Unlike scriptJob(event='timeChanged'), MDGMessage.addTimeChangeCallback
         fires on every DG time change including during playback in all
-        evaluation modes (DG, Serial, Parallel).
+        evaluation modes (DG, Serial, Parallel).  Throttled to the
+        playhead's repaint rate; the trailing call carries the latest time,
+        so the playhead still lands on the final frame of a scrub.
         """
         if om2 is None or self._time_change_cb is not None:
             return
@@ -484,6 +496,8 @@ class ShotSequencerController(
             om2.MDGMessage.addTimeChangeCallback,
             self._on_time_changed,
             owner=self,
+            policy="throttle",
+            interval=1 / 60,
         )
 
     def _on_time_changed(self, time_msg, _client_data=None) -> None:
@@ -567,6 +581,7 @@ class ShotSequencerController(
             self.sequencer.trim_shot_to_content(shot_id)
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
         self._sync_combobox()
 
@@ -713,6 +728,7 @@ class ShotSequencerController(
             self._syncing = False
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
 
     def on_redo(self) -> None:
@@ -728,6 +744,7 @@ class ShotSequencerController(
             self._syncing = False
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
 
     # -- item menu extensibility hooks -------------------------------------
@@ -848,6 +865,7 @@ class ShotSequencerController(
             self.sequencer.move_sequences_to_shot(sequences, dest_shot_id)
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._sync_to_widget()
 
     # -- lock helpers -------------------------------------------------------
@@ -1051,6 +1069,7 @@ class ShotSequencerController(
         """Clear cached segments and rebuild the sequencer widget."""
         self._segment_cache.clear()
         self._sub_row_cache.clear()
+        self._curve_cache.clear()
         self._audio_segments_cache = None
         self._last_visible_key = None
         self._reconcile_needed = True
@@ -1105,6 +1124,7 @@ class ShotSequencerController(
             if self._reconcile_needed:
                 if self.sequencer.reconcile_all_shots():
                     self._segment_cache.clear()
+                    self._curve_cache.clear()
                 self._reconcile_needed = False
 
             segments_by_shot, all_objects = SegmentCollector.collect_segments(
@@ -1114,6 +1134,7 @@ class ShotSequencerController(
                 self._segment_cache,
                 self._shifted_out_keys,
                 self.logger,
+                curve_cache=self._curve_cache,
             )
 
             # When "global" scope is active, expand the object set to include
@@ -1849,6 +1870,7 @@ class ShotSequencerController(
             self._save_shot_state()
             self._segment_cache.clear()
             self._sub_row_cache.clear()
+            self._curve_cache.clear()
             self._sync_to_widget()
             n = len(clip_ids)
             self._set_footer(f"Deleted {n} clip{'s' if n != 1 else ''}")
@@ -1921,6 +1943,7 @@ class ShotSequencerController(
                 shot_id = self.active_shot_id
                 self._segment_cache.clear()
                 self._sub_row_cache.clear()
+                self._curve_cache.clear()
                 self._sync_to_widget(shot_id=shot_id)
                 self._set_footer(f"Deleted {deleted} key{'s' if deleted != 1 else ''}")
             return
@@ -2094,7 +2117,9 @@ class ShotSequencerController(
                 # Build curve preview from the segment's own curves
                 preview = None
                 for crv in seg.get("curves", []):
-                    preview = SegmentCollector.build_curve_preview(crv, s, e)
+                    preview = SegmentCollector.build_curve_preview(
+                        crv, s, e, cache=self._curve_cache
+                    )
                     if preview:
                         break
                 extra = {
@@ -2122,7 +2147,7 @@ class ShotSequencerController(
                 if crv is None:
                     continue
                 bg_preview = SegmentCollector.build_curve_preview(
-                    crv, curve_range_start, curve_range_end
+                    crv, curve_range_start, curve_range_end, cache=self._curve_cache
                 )
                 hex_color = color_map.get(attr_name, "#CCCCCC")
                 widget.set_bg_curve_preview(
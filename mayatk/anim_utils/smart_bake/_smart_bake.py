@@ -1009,6 +1009,69 @@ class SmartBake:
                         pass
         return muted
 
+    def _bake_channel_groups(
+        self,
+        grouped_by_channels: Dict[Tuple[str, ...], List[str]],
+        start: int,
+        end: int,
+        override_layer: Optional[str],
+        result: BakeResult,
+    ) -> None:
+        """Phase 2 of ``bake()``: sample every channel group over the range.
+
+        The one seam between the analysis/manifest bookkeeping and the
+        evaluation itself — ``DistributedBake`` overrides it to sample the
+        groups in headless workers instead of in-session ``bakeResults``.
+
+        Parameters:
+            grouped_by_channels: ``{tuple(channels): [objects]}``.
+            start: First frame of the bake range.
+            end: Last frame of the bake range (inclusive).
+            override_layer: Destination layer, or None for the base layer.
+            result: Live ``BakeResult``; ``baked``/``skipped`` are updated.
+        """
+        from mayatk.anim_utils._anim_utils import AnimUtils
+
+        for channels, objects in grouped_by_channels.items():
+            try:
+                dest_layer = None
+                if self.use_override_layer and override_layer:
+                    dest_layer = override_layer
+
+                # Using the unified bake command
+                baked = AnimUtils.bake(
+                    objects,
+                    attributes=list(channels),
+                    time_range=(start, end),
+                    sample_by=self.sample_by,
+                    preserve_outside_keys=self.preserve_outside_keys,
+                    simulation=False,
+                    destination_layer=dest_layer,
+                    remove_baked_attr_from_layer=False,
+                    bake_on_override_layer=False,
+                    sparse_anim_curve_bake=False,
+                    minimize_rotation=True,
+                    disable_implicit_control=True,
+                    control_points=False,
+                    shape=False,
+                    only_keyed=False,  # SmartBake analysis already determined driven channels
+                )
+
+                if baked:
+                    for obj in objects:
+                        # Merge, don't assign: the inherited-visibility pass
+                        # may already have recorded ["v"] for this object.
+                        prior = result.baked.get(obj, [])
+                        result.baked[obj] = sorted(set(prior) | set(channels))
+                else:
+                    for obj in objects:
+                        result.skipped.append(obj)
+
+            except Exception as e:
+                for obj in objects:
+                    result.skipped.append(obj)
+                cmds.warning(f"SmartBake: Failed to batch bake {channels}: {e}")
+
     @CoreUtils.undoable
     def bake(
         self,
@@ -1229,45 +1292,9 @@ class SmartBake:
                                 bake_session.BakeSessionStore.stash_curve(curve)
                             )
 
-        for channels, objects in grouped_by_channels.items():
-            try:
-                dest_layer = None
-                if self.use_override_layer and override_layer:
-                    dest_layer = override_layer
-
-                # Using the unified bake command
-                baked = AnimUtils.bake(
-                    objects,
-                    attributes=list(channels),
-                    time_range=(start, end),
-                    sample_by=self.sample_by,
-                    preserve_outside_keys=self.preserve_outside_keys,
-                    simulation=False,
-                    destination_layer=dest_layer,
-                    remove_baked_attr_from_layer=False,
-                    bake_on_override_layer=False,
-                    sparse_anim_curve_bake=False,
-                    minimize_rotation=True,
-                    disable_implicit_control=True,
-                    control_points=False,
-                    shape=False,
-                    only_keyed=False,  # SmartBake analysis already determined driven channels
-                )
-
-                if baked:
-                    for obj in objects:
-                        # Merge, don't assign: the inherited-visibility pass
-                        # may already have recorded ["v"] for this object.
-                        prior = result.baked.get(obj, [])
-                        result.baked[obj] = sorted(set(prior) | set(channels))
-                else:
-                    for obj in objects:
-                        result.skipped.append(obj)
-
-            except Exception as e:
-                for obj in objects:
-                    result.skipped.append(obj)
-                cmds.warning(f"SmartBake: Failed to batch bake {channels}: {e}")
+        self._bake_channel_groups(
+            grouped_by_channels, start, end, override_layer, result
+        )
 
         # Handle driver node cleanup after all baking is complete
         if result.baked:
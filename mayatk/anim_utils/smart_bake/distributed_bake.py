@@ -0,0 +1,605 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Distributed sampling for SmartBake: evaluate frame chunks in headless workers.
+
+Evaluation is serial per frame inside one Maya session, but a ``simulation=False``
+bake is frame-independent — frame 900 does not need frames 1-899 evaluated first.
+``DistributedBake`` uses that: the analysis, restore manifest, override layer,
+driver muting and key optimization all run exactly as in ``SmartBake.bake()``; only
+phase 2 (the per-frame sampling ``bakeResults`` does) is swapped out:
+
+1. The scene is exported as-is to a scratch ``.mb`` (the current scene's name and
+   modified state are untouched) unless ``scene_path`` names a saved one.
+2. The bake frames are split into chunks — evenly across ``workers``, or at
+   ``ShotStore`` shot boundaries with ``by_shots=True``.
+3. One job per chunk is handed to the *launcher*. The default launches a headless
+   ``mayapy`` running ``templates/_sample_chunk.py``, which opens the scene, samples
+   every driven plug for its frames and writes a raw ``frames x plugs`` float64
+   array (internal units). Any callable ``launcher(job) -> None`` that produces
+   ``job["output"]`` works — tests use an in-process fake.
+4. The arrays are merged back as keys, one ``MFnAnimCurve.addKeys`` per plug.
+
+A chunk that fails (worker crash, timeout, short array) falls the whole phase back
+to the in-session ``bakeResults`` path — a distributed bake never yields a
+partially keyed range. The key writes go through the API and are not in Maya's
+undo queue; reverse a distributed bake with ``SmartBake.restore()``, which the
+manifest keeps working exactly as for an in-session bake.
+"""
+
+import os
+import sys
+import json
+import time
+import array
+import shutil
+import logging
+import tempfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from maya import cmds
+except ImportError as error:
+    print(__file__, error)
+
+import pythontk as ptk
+from pythontk.core_utils import script_template as _templates
+from mayatk.anim_utils.smart_bake._smart_bake import SmartBake, BakeResult
+
+logger = logging.getLogger(__name__)
+
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+_SAMPLE_TEMPLATE = _TEMPLATE_DIR / "_sample_chunk.py"
+
+# Same start-up trims the Blender bridge's mayapy bake uses: a worker only opens a
+# scene and reads plugs, so userSetup and the telemetry services are pure overhead.
+_FAST_MAYA_ENV = {
+    "MAYA_SKIP_USERSETUP_PY": "1",
+    "MAYA_DISABLE_CIP": "1",
+    "MAYA_DISABLE_CER": "1",
+    "MAYA_DISABLE_CLIC_IPM": "1",
+}
+
+
+@dataclass
+class BakeChunk:
+    """One worker's share of a distributed bake."""
+
+    index: int
+    """Position of the chunk in the bake range (merge order)."""
+
+    frames: List[float] = field(default_factory=list)
+    """The bake frames this chunk samples, ascending."""
+
+    duration: float = 0.0
+    """Wall-clock seconds the launcher took for this chunk."""
+
+    error: Optional[str] = None
+    """Why the chunk failed, or None on success."""
+
+    @property
+    def start(self) -> float:
+        return self.frames[0] if self.frames else 0.0
+
+    @property
+    def end(self) -> float:
+        return self.frames[-1] if self.frames else 0.0
+
+
+def write_samples(path: str, values: Sequence[float]) -> None:
+    """Write *values* as raw little-endian float64 — the worker's output format."""
+    samples = array.array("d", values)
+    if sys.byteorder != "little":
+        samples.byteswap()
+    with open(path, "wb") as f:
+        samples.tofile(f)
+
+
+def read_samples(path: str, frame_count: int, plug_count: int) -> array.array:
+    """Read a worker's ``frames x plugs`` array back; raise if it is short.
+
+    Returns:
+        A flat frame-major ``array('d')``: plug *p* at frame *f* is
+        ``samples[f * plug_count + p]``.
+    """
+    expected = frame_count * plug_count
+    samples = array.array("d")
+    with open(path, "rb") as f:
+        try:
+            samples.fromfile(f, expected)
+        except EOFError:
+            raise ValueError(
+                f"{os.path.basename(path)}: expected {expected} sample(s), "
+                f"got {len(samples)}."
+            )
+    if sys.byteorder != "little":
+        samples.byteswap()
+    return samples
+
+
+class MayapyLauncher:
+    """Default chunk launcher: one blocking headless ``mayapy`` per job.
+
+    The worker script is :attr:`template`, rendered with the job file's path;
+    subclasses point it at another worker (see ``BatchExporter``).
+
+    Parameters:
+        mayapy: Interpreter to run. None resolves this host's own ``mayapy`` —
+            beside ``sys.executable``, else ``MAYA_LOCATION/bin``, else PATH.
+        timeout: Seconds before a worker is killed (its chunk then fails).
+    """
+
+    template: Path = _SAMPLE_TEMPLATE
+    script_prefix: str = "smartbake_chunk"
+
+    def __init__(self, mayapy: Optional[str] = None, timeout: float = 600):
+        self.mayapy = mayapy
+        self.timeout = timeout
+
+    def resolve_mayapy(self) -> str:
+        """Return the worker interpreter or raise naming what is missing."""
+        if self.mayapy:
+            return self.mayapy
+        name = "mayapy.exe" if os.name == "nt" else "mayapy"
+        candidates = [os.path.dirname(sys.executable)] if sys.executable else []
+        location = os.environ.get("MAYA_LOCATION")
+        if location:
+            candidates.append(os.path.join(location, "bin"))
+        for directory in candidates:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate):
+                self.mayapy = candidate
+                return candidate
+        found = shutil.which("mayapy")
+        if not found:
+            raise FileNotFoundError(
+                "No mayapy interpreter found for the worker (not beside "
+                "sys.executable, not under MAYA_LOCATION/bin, not on PATH). Pass "
+                "MayapyLauncher(mayapy=...)."
+            )
+        self.mayapy = found
+        return found
+
+    def __call__(self, job: dict) -> None:
+        script = _templates.ScriptTemplate.render_template(
+            self.template, {"JOB_FILE": job["job_file"].replace("\\", "/")}
+        )
+        env = dict(os.environ)
+        env.update(_FAST_MAYA_ENV)
+        ptk.ScriptRunner.run_script_to_artifact(
+            self.resolve_mayapy(),
+            script,
+            artifact=job["output"],
+            timeout=self.timeout,
+            env=env,
+            script_prefix=self.script_prefix,
+        )
+
+
+class DistributedBake(SmartBake):
+    """SmartBake whose sampling phase runs in parallel headless workers.
+
+    Everything but the sampling is inherited — analysis, restore manifest,
+    override layer, muting, optimization — so ``restore()`` and ``session()``
+    work unchanged on a distributed result.
+
+    Example:
+        >>> result = DistributedBake(workers=8).execute()
+        >>> # One worker per ShotStore shot, with a local fake worker:
+        >>> DistributedBake(by_shots=True, launcher=my_fake).execute()
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        by_shots: bool = False,
+        launcher: Optional[Callable[[dict], None]] = None,
+        scene_path: Optional[str] = None,
+        min_chunk_frames: int = 24,
+        keep_temp: bool = False,
+        **kwargs,
+    ):
+        """Initialize the distributed bake.
+
+        Parameters:
+            workers: Concurrent workers. 0 (default) uses one per CPU core but
+                one, leaving the interactive session a core.
+            by_shots: Split the range at the active ``ShotStore``'s shot
+                boundaries (frames between shots form their own chunks)
+                instead of evenly.
+            launcher: Callable run once per chunk job (a dict with ``scene``,
+                ``plugs``, ``frames``, ``output`` and ``job_file``); it must
+                write ``output`` in the ``read_samples`` format or raise.
+                None uses ``MayapyLauncher()``.
+            scene_path: A saved scene the workers open. None exports the live
+                scene to a scratch file first (the open scene is untouched).
+            min_chunk_frames: Even splitting never makes chunks shorter than
+                this — a worker's scene load must stay small against its share.
+            keep_temp: Keep the scratch folder (scene, jobs, arrays) for
+                debugging instead of removing it after the merge.
+            **kwargs: Forwarded to ``SmartBake.__init__``.
+        """
+        super().__init__(**kwargs)
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.by_shots = by_shots
+        self.launcher = launcher or MayapyLauncher()
+        self.scene_path = scene_path
+        self.min_chunk_frames = max(1, int(min_chunk_frames))
+        self.keep_temp = keep_temp
+        self.chunks: List[BakeChunk] = []
+        """Chunks of the last bake, with per-chunk duration and error."""
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def bake_frames(self, start: float, end: float) -> List[float]:
+        """The frames ``bakeResults`` would key for *start*-*end* at ``sample_by``."""
+        step = float(self.sample_by) or 1.0
+        count = int((end - start) / step + 1e-6) + 1
+        return [start + i * step for i in range(max(count, 0))]
+
+    def shot_boundaries(self) -> List[float]:
+        """Start frames of the active ``ShotStore`` shots (empty when none)."""
+        from mayatk.anim_utils.shots._shots import ShotStore
+
+        try:
+            shots = ShotStore.active().sorted_shots()
+        except Exception as e:  # no store / unreadable store: plain even split
+            logger.debug(f"DistributedBake: no shots for chunking ({e}).")
+            return []
+        bounds = set()
+        for shot in shots:
+            bounds.add(float(shot.start))
+            bounds.add(float(shot.end) + 1e-6)  # the frame after a shot opens a gap chunk
+        return sorted(bounds)
+
+    def plan_chunks(
+        self, frames: List[float], boundaries: Optional[List[float]] = None
+    ) -> List[BakeChunk]:
+        """Split *frames* into ordered, non-overlapping chunks.
+
+        Parameters:
+            frames: Ascending bake frames.
+            boundaries: Frames that must start a new chunk (shot starts, and
+                the first frame after each shot). None splits evenly across
+                ``workers``, no chunk shorter than ``min_chunk_frames``.
+        """
+        if not frames:
+            return []
+        groups: List[List[float]] = []
+        if boundaries:
+            cuts = sorted(b for b in boundaries if frames[0] < b <= frames[-1])
+            current: List[float] = []
+            for frame in frames:
+                while cuts and frame >= cuts[0]:
+                    cuts.pop(0)
+                    if current:
+                        groups.append(current)
+                        current = []
+                current.append(frame)
+            if current:
+                groups.append(current)
+        else:
+            count = max(1, min(self.workers, len(frames) // self.min_chunk_frames))
+            size, extra = divmod(len(frames), count)
+            i = 0
+            for n in range(count):
+                take = size + (1 if n < extra else 0)
+                groups.append(frames[i : i + take])
+                i += take
+        return [BakeChunk(index=i, frames=g) for i, g in enumerate(groups)]
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    def _snapshot_scene(self, folder: str) -> str:
+        """Export the live scene for the workers, leaving the open scene as is."""
+        if self.scene_path:
+            return self.scene_path
+        path = os.path.join(folder, "scene.mb").replace("\\", "/")
+        cmds.file(
+            path,
+            exportAll=True,
+            type="mayaBinary",
+            force=True,
+            preserveReferences=True,
+        )
+        return path
+
+    def _run_chunk(self, chunk: BakeChunk, job: dict) -> None:
+        """Run one job through the launcher, recording its timing and failure."""
+        t0 = time.perf_counter()
+        try:
+            self.launcher(job)
+            if not os.path.isfile(job["output"]):
+                raise RuntimeError("worker exited without writing its samples")
+        except Exception as e:  # one bad worker fails its chunk, not the pool
+            chunk.error = str(e) or type(e).__name__
+        chunk.duration = time.perf_counter() - t0
+
+    def sample(
+        self, plugs: List[str], frames: List[float]
+    ) -> Optional[Dict[str, List[float]]]:
+        """Sample *plugs* over *frames* across the worker pool.
+
+        Returns:
+            ``{plug: [value per frame]}`` in internal units, or None when any
+            chunk failed (see ``self.chunks`` for which and why).
+        """
+        boundaries = self.shot_boundaries() if self.by_shots else None
+        self.chunks = self.plan_chunks(frames, boundaries)
+        folder = tempfile.mkdtemp(prefix="smartbake_")
+        try:
+            scene = self._snapshot_scene(folder)
+            jobs = []
+            for chunk in self.chunks:
+                job = {
+                    "scene": scene,
+                    "plugs": plugs,
+                    "frames": chunk.frames,
+                    "output": os.path.join(folder, f"chunk_{chunk.index:04d}.bin"),
+                    "job_file": os.path.join(folder, f"chunk_{chunk.index:04d}.json"),
+                }
+                with open(job["job_file"], "w") as f:
+                    json.dump(job, f)
+                jobs.append(job)
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(self._run_chunk, self.chunks, jobs))
+
+            values: Dict[str, List[float]] = {plug: [] for plug in plugs}
+            for chunk, job in zip(self.chunks, jobs):
+                if chunk.error is None:
+                    try:
+                        samples = read_samples(
+                            job["output"], len(chunk.frames), len(plugs)
+                        )
+                    except (OSError, ValueError) as e:
+                        chunk.error = str(e)
+                if chunk.error is not None:
+                    continue
+                for p, plug in enumerate(plugs):
+                    values[plug].extend(samples[p :: len(plugs)])
+            if any(chunk.error for chunk in self.chunks):
+                return None
+            return values
+        finally:
+            if self.keep_temp:
+                logger.info(f"DistributedBake: scratch kept at {folder}")
+            else:
+                shutil.rmtree(folder, ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    # Merge
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _free_plug(plug: str) -> None:
+        """Disconnect *plug*'s (and its parent compound's) non-curve drivers.
+
+        The base-layer equivalent of what ``bakeResults`` does to a driven
+        channel before keying it. The manifest has already recorded the
+        connections and stashed any SDK curves, so ``restore()`` rebuilds them.
+        The channel's own time curve is kept, so ``_key_plug`` replaces only the
+        keys inside the bake range and ``preserve_outside_keys`` holds. A curve
+        feeding a ``pairBlend`` (keys plus a constraint) is wired straight back
+        to *plug* once the blend is gone.
+        """
+        node, _, attr = plug.partition(".")
+        curves = [
+            c
+            for c in cmds.keyframe(plug, query=True, name=True) or []
+            if cmds.nodeType(c).startswith("animCurveT")
+        ]
+        candidates = [plug]
+        try:
+            parents = cmds.attributeQuery(attr, node=node, listParent=True) or []
+        except RuntimeError:
+            parents = []  # alias attrs (blendShape weights) have no parent
+        if parents:
+            candidates.append(f"{node}.{parents[0]}")
+        for p in candidates:
+            conns = (
+                cmds.listConnections(
+                    p, source=True, destination=False, plugs=True, connections=True
+                )
+                or []
+            )
+            for i in range(0, len(conns), 2):
+                source = conns[i + 1]
+                if source.partition(".")[0] in curves:
+                    continue
+                try:
+                    cmds.disconnectAttr(source, conns[i])
+                except RuntimeError:
+                    pass
+        if curves and not cmds.listConnections(
+            plug, source=True, destination=False
+        ):
+            cmds.connectAttr(f"{curves[0]}.output", plug, force=True)
+
+    def _key_plug(
+        self,
+        plug: str,
+        frames: List[float],
+        values: List[float],
+        layer: Optional[str],
+    ) -> Optional[str]:
+        """Key *values* at *frames* on *plug* with one ``addKeys``; return the curve."""
+        import maya.api.OpenMaya as om2
+        import maya.api.OpenMayaAnim as oma2
+
+        node, _, attr = plug.partition(".")
+        if layer is None:
+            self._free_plug(plug)
+        # One cmds key creates a curve of the right type (TL/TA/TU) wired
+        # the right way (direct, or into the layer's blend node) ...
+        kwargs = {"animLayer": layer} if layer else {}
+        cmds.setKeyframe(node, attribute=attr, time=frames[0], **kwargs)
+        if layer:
+            curves = cmds.animLayer(layer, query=True, findCurveForPlug=plug) or []
+        else:
+            curves = (
+                cmds.listConnections(
+                    plug, source=True, destination=False, type="animCurve"
+                )
+                or []
+            )
+        if not curves:
+            return None
+        # ... and the API replaces the range with every sample in one call.
+        # Samples are internal units, which is what addKeys takes.
+        sel = om2.MSelectionList()
+        sel.add(curves[0])
+        fn = oma2.MFnAnimCurve(sel.getDependNode(0))
+        unit = om2.MTime.uiUnit()
+        self._clear_range(fn, min(frames), max(frames), unit)
+        times = om2.MTimeArray([om2.MTime(f, unit) for f in frames])
+        fn.addKeys(
+            times,
+            om2.MDoubleArray(values),
+            oma2.MFnAnimCurve.kTangentGlobal,
+            oma2.MFnAnimCurve.kTangentGlobal,
+            True,  # keepExistingKeys: the range is clear, the rest stays
+        )
+        return curves[0]
+
+    @staticmethod
+    def _clear_range(fn, first: float, last: float, unit) -> int:
+        """Remove the keys of curve *fn* from frame *first* to *last*.
+
+        ``addKeys`` with ``keepExistingKeys=False`` would drop every key on
+        the curve, including those ``preserve_outside_keys`` keeps, so the
+        range is cleared by index first.
+
+        Returns:
+            (int) The number of keys removed.
+        """
+        inside = [
+            i
+            for i in range(fn.numKeys)
+            if first - 1e-6 <= fn.input(i).asUnits(unit) <= last + 1e-6
+        ]
+        for i in reversed(inside):
+            fn.remove(i)
+        return len(inside)
+
+    def _bake_channel_groups(
+        self,
+        grouped_by_channels: Dict[Tuple[str, ...], List[str]],
+        start: int,
+        end: int,
+        override_layer: Optional[str],
+        result: BakeResult,
+    ) -> None:
+        """Distributed replacement for ``SmartBake._bake_channel_groups``."""
+        plugs: List[str] = []
+        owners: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        for channels, objects in grouped_by_channels.items():
+            for obj in objects:
+                if not cmds.objExists(obj):
+                    result.skipped.append(obj)
+                    continue
+                for ch in channels:
+                    plug = f"{obj}.{ch}"
+                    plugs.append(plug)
+                    owners[plug] = (obj, channels)
+        frames = self.bake_frames(start, end)
+        if not plugs or not frames:
+            return
+
+        t0 = time.perf_counter()
+        sampled = self.sample(plugs, frames)
+        if sampled is None:
+            failed = [c for c in self.chunks if c.error]
+            cmds.warning(
+                f"DistributedBake: {len(failed)} of {len(self.chunks)} chunk(s) "
+                f"failed (first: frames {failed[0].start:g}-{failed[0].end:g}: "
+                f"{failed[0].error}). Falling back to the in-session bake."
+            )
+            super()._bake_channel_groups(
+                grouped_by_channels, start, end, override_layer, result
+            )
+            return
+        sample_time = time.perf_counter() - t0
+
+        layer = override_layer if self.use_override_layer else None
+        if layer:
+            # Unlike bakeResults (see _create_override_layer), plain keys with
+            # explicit values are safe to write onto a pre-registered layer.
+            cmds.animLayer(layer, edit=True, attribute=plugs)
+
+        rotation_curves: List[str] = []
+        failed_objects = set()
+        for plug in plugs:
+            obj, channels = owners[plug]
+            try:
+                curve = self._key_plug(plug, frames, sampled[plug], layer)
+            except Exception as e:
+                cmds.warning(f"DistributedBake: Failed to key {plug}: {e}")
+                curve = None
+            if curve is None:
+                failed_objects.add(obj)
+            elif cmds.nodeType(curve) == "animCurveTA":
+                rotation_curves.append(curve)
+
+        # bakeResults(minimizeRotation=True) equivalent.
+        if rotation_curves:
+            cmds.filterCurve(rotation_curves, filter="euler")
+        if not self.preserve_outside_keys and not layer:
+            # A layer curve only ever holds the keys written above.
+            for plug in plugs:
+                times = cmds.keyframe(plug, query=True, timeChange=True) or []
+                for t in times:
+                    if t < start or t > end:
+                        cmds.cutKey(plug, time=(t, t), clear=True)
+        self._disable_ik(grouped_by_channels)
+
+        for channels, objects in grouped_by_channels.items():
+            for obj in objects:
+                if obj in failed_objects or not cmds.objExists(obj):
+                    result.skipped.append(obj)
+                    continue
+                prior = result.baked.get(obj, [])
+                result.baked[obj] = sorted(set(prior) | set(channels))
+
+        total = sum(c.duration for c in self.chunks)
+        logger.info(
+            f"DistributedBake: {len(plugs)} plug(s) x {len(frames)} frame(s) in "
+            f"{len(self.chunks)} chunk(s): sampled in {sample_time:.2f}s wall "
+            f"({total:.2f}s worker time), merged in "
+            f"{time.perf_counter() - t0 - sample_time:.2f}s."
+        )
+
+    def _disable_ik(self, grouped_by_channels) -> None:
+        """Zero ``ikBlend`` on the handles driving baked joints.
+
+        Mirrors ``bakeResults(disableImplicitControl=True)``, which the
+        in-session path relies on; ``bake()`` has already recorded the prior
+        values in the manifest so ``restore()`` re-enables IK.
+        """
+        from mayatk.rig_utils._rig_utils import RigUtils
+
+        handles = set()
+        for channels, objects in grouped_by_channels.items():
+            if not {"rx", "ry", "rz"} & set(channels):
+                continue
+            for obj in objects:
+                if cmds.objExists(obj) and cmds.nodeType(obj) == "joint":
+                    handles.update(RigUtils.get_ik_handles_for_joint(obj))
+        for handle in handles:
+            if cmds.attributeQuery("ikBlend", node=handle, exists=True):
+                try:
+                    cmds.setAttr(f"{handle}.ikBlend", 0)
+                except RuntimeError:
+                    pass  # locked/connected ikBlend: leave it as bakeResults would
+
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
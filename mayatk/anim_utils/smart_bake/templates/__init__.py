@@ -0,0 +1,8 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Headless worker scripts for SmartBake's distributed mode.
+
+Each ``*.py`` here is an executable ``mayapy`` script with ``__KEY__`` placeholders that
+:class:`DistributedBake` substitutes before launching a worker. They import nothing from
+mayatk — a worker only needs Maya's own modules and the job file it is pointed at.
+"""
@@ -0,0 +1,95 @@
+# SmartBake chunk sampler. Generated by DistributedBake -- do not edit by hand.
+
+"""Open a saved scene headlessly (mayapy), sample driven plugs over ONE frame chunk, and
+write the values as a compact binary array.
+
+The job file (JSON) names the scene, the plugs, the frames and the output path. Values are
+written frame-major -- ``frames x plugs`` little-endian float64, no header; the job file is
+the header -- in Maya's INTERNAL units (radians, centimeters), exactly what
+``MFnAnimCurve.addKeys`` takes on the merge side, so no unit round trip happens anywhere.
+
+Sampling moves the current time through ``MAnimControl`` and reads each plug through the
+API: the same per-frame DG evaluation ``bakeResults`` performs, without one ``getAttr``
+command per value. ``simulation=False`` bakes are frame-independent, which is what makes
+a chunk safe to evaluate in its own process.
+
+Runs under ``mayapy`` via ``pythontk.run_script_to_artifact``, which judges success by the
+output file's existence -- NOT the exit code (standalone teardown is a known crasher, hence
+the ``os._exit`` below). The array is written to a ``.part`` file and renamed, so a worker
+killed mid-write never leaves a plausible-looking artifact behind.
+
+Underscore-prefixed: internal to the distributed bake, not a user-pickable recipe.
+"""
+
+# Dependency-free Maya Python: no mayatk imports (the job carries everything).
+import os
+import sys
+import json
+import array
+import traceback
+
+JOB_FILE = r"__JOB_FILE__"
+
+
+def sample(job):
+    """Return the job's samples as a flat ``array('d')`` (frame-major)."""
+    import maya.api.OpenMaya as om2
+    import maya.api.OpenMayaAnim as oma2
+
+    selection = om2.MSelectionList()
+    for plug in job["plugs"]:
+        selection.add(plug)
+    plugs = [selection.getPlug(i) for i in range(selection.length())]
+
+    unit = om2.MTime.uiUnit()
+    samples = array.array("d")
+    for frame in job["frames"]:
+        oma2.MAnimControl.setCurrentTime(om2.MTime(frame, unit))
+        for plug in plugs:
+            try:
+                samples.append(plug.asDouble())
+            except RuntimeError:  # bool plugs (visibility) refuse asDouble
+                samples.append(1.0 if plug.asBool() else 0.0)
+    return samples
+
+
+def main():
+    with open(JOB_FILE, "r") as f:
+        job = json.load(f)
+
+    import maya.standalone
+
+    maya.standalone.initialize(name="python")
+    import maya.cmds as cmds
+
+    cmds.file(job["scene"], open=True, force=True, prompt=False)
+    samples = sample(job)
+
+    expected = len(job["frames"]) * len(job["plugs"])
+    if len(samples) != expected:
+        raise RuntimeError(
+            "Sampled {} value(s), expected {}.".format(len(samples), expected)
+        )
+    if sys.byteorder != "little":
+        samples.byteswap()
+    part = job["output"] + ".part"
+    with open(part, "wb") as f:
+        samples.tofile(f)
+    os.replace(part, job["output"])
+    print(
+        "Sampled {} plug(s) x {} frame(s) into {}".format(
+            len(job["plugs"]), len(job["frames"]), job["output"]
+        )
+    )
+
+
+try:
+    main()
+except Exception:
+    traceback.print_exc()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(1)
+# Success is judged by the artifact; skip standalone teardown (known access violations).
+sys.stdout.flush()
+os._exit(0)
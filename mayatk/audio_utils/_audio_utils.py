@@ -13,6 +13,7 @@ Companion modules provide orthogonal concerns:
 - :mod:`.batch`        — undo-chunk + compositor-sync orchestration
 - :mod:`.migrate`      — legacy schema migration
 - :mod:`.segments` — segment discovery for sequencer / manifest
+- :mod:`.waveform_cache` — bounded, persistent waveform envelope cache
 """
 
 import maya.mel as mel
@@ -28,6 +29,7 @@ import pythontk as ptk
 from pythontk.audio_utils._audio_utils import AudioUtils as _PtkAudioUtils
 
 from mayatk.node_utils.data_nodes import DataNodes
+from mayatk.audio_utils.waveform_cache import WaveformCache
 
 
 @dataclass
@@ -76,7 +78,6 @@ RESERVED_TRACK_IDS: FrozenSet[str] = frozenset({"off", "none", ""})
 
 _TRACK_ID_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 _DEFAULT_FPS: float = 24.0
-_WAVEFORM_CACHE: Dict[str, List[Tuple[float, float]]] = {}
 
 _SNAP_FRAMES: bool = True
 """Global default for whole-frame snapping on audio key writes."""
@@ -300,18 +301,27 @@ class AudioUtils(ptk.HelpMixin):
     """Re-export: ``(wav_path) -> List[(min, max)]``."""
 
     @staticmethod
-    def cached_waveform(wav_path: str) -> List[Tuple[float, float]]:
-        """Return the waveform envelope for *wav_path*, computing once per path."""
-        if wav_path not in _WAVEFORM_CACHE:
-            _WAVEFORM_CACHE[wav_path] = _PtkAudioUtils.compute_waveform_envelope(
-                wav_path
-            )
-        return _WAVEFORM_CACHE[wav_path]
+    def cached_waveform(
+        wav_path: str, num_bins: int = 512
+    ) -> List[Tuple[float, float]]:
+        """Return the waveform envelope for *wav_path*, decoding at most once.
+
+        Served by the shared :class:`.waveform_cache.WaveformCache`: a
+        byte-bounded in-memory LRU in front of an on-disk store keyed by
+        file content, so a clip seen in an earlier session is not decoded
+        again.
+        """
+        return WaveformCache.shared().get(wav_path, num_bins)
+
+    @staticmethod
+    def clear_waveform_cache(disk: bool = False) -> None:
+        """Drop all cached waveform envelopes (with *disk*, the persisted ones too)."""
+        WaveformCache.shared().clear(disk=disk)
 
     @staticmethod
-    def clear_waveform_cache() -> None:
-        """Drop all cached waveform envelopes."""
-        _WAVEFORM_CACHE.clear()
+    def waveform_cache_stats() -> Dict[str, int]:
+        """Hit / miss / eviction counters and occupancy of the waveform cache."""
+        return WaveformCache.shared().stats()
 
     @staticmethod
     def audio_duration_frames(file_path: str, fps: float) -> Tuple[float, str]:
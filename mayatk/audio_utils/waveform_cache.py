@@ -0,0 +1,455 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Bounded, persistent cache of waveform envelopes.
+
+:meth:`AudioUtils.cached_waveform` used to keep every decoded envelope in a
+module-level dict: unbounded over a long session, keyed by path alone (so a
+re-rendered clip kept its stale picture), and empty again after every Maya
+restart, when each clip was decoded from scratch by a pure-Python loop.
+
+:class:`WaveformCache` replaces it with two tiers:
+
+- **Memory** — an LRU bounded by an estimate of the bytes the envelopes
+  occupy (not by entry count: one 8k-bin envelope weighs as much as sixteen
+  512-bin ones). Entries are keyed by path, size, mtime and bin count, so an
+  edited file misses by construction.
+- **Disk** — one ``.npz`` per file *content* hash holding several
+  resolutions at once (:attr:`WaveformCache.LEVELS` plus whatever was asked
+  for), stamped with the WAV header parameters and a format version. A clip
+  seen in any earlier session — under any path — opens without decoding; a
+  zoomed-in view asks for a finer level that is usually already there.
+  A small stat index (path, size, mtime -> digest) spares re-hashing
+  unchanged files across sessions.
+
+Decoding is NumPy-vectorized and bin-for-bin identical to
+``pythontk``'s ``compute_waveform_envelope``; every level of a file comes
+out of a single read.
+"""
+import hashlib
+import json
+import os
+import threading
+import wave
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pythontk as ptk
+
+
+Envelope = List[Tuple[float, float]]
+
+
+class WaveformCache(ptk.LoggingMixin):
+    """Byte-bounded in-memory LRU over an on-disk, content-addressed envelope store.
+
+    Parameters:
+        max_bytes (int): Memory budget for cached envelopes (estimated
+            Python object size). The least recently used envelopes are
+            evicted past it.
+        cache_dir (str): Directory of the disk tier. Default:
+            :meth:`default_cache_dir`. Pass ``persist=False`` for a
+            memory-only cache.
+        persist (bool): Read and write the disk tier.
+        max_disk_bytes (int): Disk budget; the oldest envelope files are
+            pruned past it.
+    """
+
+    FORMAT_VERSION = 1
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_MAX_DISK_BYTES = 512 * 1024 * 1024
+    LEVELS: Tuple[int, ...] = (512, 2048, 8192)
+    """Resolutions written alongside any requested one on a decode."""
+
+    _INDEX_LIMIT = 4096
+    _PRUNE_EVERY = 32
+
+    _shared: Optional["WaveformCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[str] = None,
+        persist: bool = True,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.max_bytes = int(max_bytes)
+        self.max_disk_bytes = int(max_disk_bytes)
+        self.cache_dir = cache_dir or self.default_cache_dir()
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, Tuple[Envelope, int]]" = OrderedDict()
+        self._bytes = 0
+        self._index: Optional[Dict[str, list]] = None
+        self._writes = 0
+        self._stats = dict.fromkeys(
+            ("hits", "disk_hits", "misses", "evictions", "disk_writes"), 0
+        )
+        if self.persist:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            except OSError as e:
+                self.logger.warning(f"Waveform disk cache disabled: {e}")
+                self.persist = False
+
+    @classmethod
+    def shared(cls) -> "WaveformCache":
+        """The process-wide cache behind :meth:`AudioUtils.cached_waveform`."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        """``$MAYATK_WAVEFORM_CACHE_DIR``, else ``<maya user app dir>/mayatk/waveform_cache``.
+
+        Falls back to ``~/.mayatk/waveform_cache`` outside Maya.
+        """
+        env = os.environ.get("MAYATK_WAVEFORM_CACHE_DIR")
+        if env:
+            return env
+        try:
+            import maya.cmds as cmds
+
+            base = cmds.internalVar(userAppDir=True)
+            if isinstance(base, str) and base:
+                return os.path.join(base, "mayatk", "waveform_cache")
+        except Exception:  # noqa: BLE001 - no Maya (headless tooling / mock tests)
+            pass
+        return os.path.join(os.path.expanduser("~"), ".mayatk", "waveform_cache")
+
+    # ------------------------------------------------------------------ public
+
+    def get(self, wav_path: str, num_bins: int = 512) -> Envelope:
+        """The ``(min, max)`` envelope of *wav_path* at *num_bins* resolution.
+
+        Same contract as ``compute_waveform_envelope``: values normalised to
+        [-1, 1], an empty list when the file cannot be read.
+        """
+        try:
+            st = os.stat(wav_path)
+        except OSError:
+            return []
+        path = os.path.normcase(os.path.abspath(wav_path))
+        key = (path, st.st_size, st.st_mtime_ns, int(num_bins))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+
+        envelope = self._from_disk(wav_path, path, st, num_bins)
+        if envelope is None:
+            envelope = self._decode_and_store(wav_path, path, st, num_bins)
+        self._remember(key, envelope)
+        return envelope
+
+    def stats(self) -> Dict[str, int]:
+        """Counters since creation (or :meth:`clear`) plus current occupancy.
+
+        ``hits`` are memory hits, ``disk_hits`` envelopes loaded from the disk
+        tier, ``misses`` full decodes; ``evictions`` counts LRU drops.
+        """
+        with self._lock:
+            return dict(
+                self._stats,
+                entries=len(self._entries),
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+            )
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop the memory tier and reset counters; with *disk*, the files too."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for k in self._stats:
+                self._stats[k] = 0
+        if disk and self.persist:
+            for name, full in self._disk_files():
+                try:
+                    os.remove(full)
+                except OSError:
+                    pass
+            try:
+                os.remove(self._index_path())
+            except OSError:
+                pass
+            self._index = {}
+
+    # ------------------------------------------------------------------ memory
+
+    @staticmethod
+    def _envelope_nbytes(envelope: Envelope) -> int:
+        """Approximate footprint of an envelope list (list + tuples + floats)."""
+        # 56-byte tuple of two 24-byte floats, one 8-byte slot in the list.
+        return 56 + len(envelope) * (8 + 56 + 2 * 24)
+
+    def _remember(self, key: tuple, envelope: Envelope) -> None:
+        size = self._envelope_nbytes(envelope)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:  # never displace everything for one clip
+                return
+            self._entries[key] = (envelope, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, dropped) = self._entries.popitem(last=False)
+                self._bytes -= dropped
+                self._stats["evictions"] += 1
+
+    # ------------------------------------------------------------------ disk
+
+    def _index_path(self) -> str:
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _envelope_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.npz")
+
+    def _disk_files(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".npz"):
+                    yield name, os.path.join(root, name)
+
+    def _load_index(self) -> Dict[str, list]:
+        if self._index is None:
+            try:
+                with open(self._index_path(), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._index = data if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _digest(self, wav_path: str, path: str, st) -> Optional[str]:
+        """Content hash of *wav_path*, re-hashed only when its stat changed."""
+        with self._lock:
+            index = self._load_index()
+            known = index.get(path)
+            if known and known[:2] == [st.st_size, st.st_mtime_ns]:
+                return known[2]
+        h = hashlib.blake2b(digest_size=16)
+        try:
+            with open(wav_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    h.update(chunk)
+        except OSError:
+            return None
+        digest = h.hexdigest()
+        with self._lock:
+            index.pop(path, None)  # re-insert last: oldest entries trim first
+            index[path] = [st.st_size, st.st_mtime_ns, digest]
+            while len(index) > self._INDEX_LIMIT:
+                index.pop(next(iter(index)))
+            self._atomic_write_json(self._index_path(), index)
+        return digest
+
+    @staticmethod
+    def _read_header(wav_path: str) -> Optional[Tuple[int, int, int, int]]:
+        try:
+            with wave.open(wav_path, "rb") as wf:
+                return (
+                    wf.getnchannels(),
+                    wf.getsampwidth(),
+                    wf.getframerate(),
+                    wf.getnframes(),
+                )
+        except Exception:  # noqa: BLE001 - wave raises several unrelated types
+            return None
+
+    def _params(self, header) -> np.ndarray:
+        return np.array((self.FORMAT_VERSION,) + tuple(header), dtype=np.int64)
+
+    def _load_levels(self, digest: str, header) -> Dict[int, np.ndarray]:
+        try:
+            with np.load(self._envelope_path(digest), allow_pickle=False) as data:
+                if not np.array_equal(data["params"], self._params(header)):
+                    return {}
+                return {
+                    int(name[1:]): data[name]
+                    for name in data.files
+                    if name.startswith("b")
+                }
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _from_disk(self, wav_path, path, st, num_bins) -> Optional[Envelope]:
+        if not self.persist:
+            return None
+        header = self._read_header(wav_path)
+        digest = self._digest(wav_path, path, st) if header else None
+        if digest is None:
+            return None
+        level = self._load_levels(digest, header).get(int(num_bins))
+        if level is None:
+            return None
+        with self._lock:
+            self._stats["disk_hits"] += 1
+        return self._as_envelope(level)
+
+    def _decode_and_store(self, wav_path, path, st, num_bins) -> Envelope:
+        levels = sorted(set(self.LEVELS) | {int(num_bins)})
+        header, decoded = self.decode_levels(wav_path, levels)
+        with self._lock:
+            self._stats["misses"] += 1
+        if self.persist and header and decoded:
+            digest = self._digest(wav_path, path, st)
+            if digest:
+                self._write_levels(digest, header, decoded)
+        return self._as_envelope(decoded.get(int(num_bins)))
+
+    def _write_levels(self, digest, header, decoded) -> None:
+        stored = self._load_levels(digest, header)
+        stored.update(decoded)
+        target = self._envelope_path(digest)
+        tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    params=self._params(header),
+                    **{f"b{bins}": arr for bins, arr in stored.items()},
+                )
+            os.replace(tmp, target)
+        except OSError as e:
+            self.logger.debug(f"Waveform cache write failed for {target}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._stats["disk_writes"] += 1
+            self._writes += 1
+            prune = self._writes % self._PRUNE_EVERY == 0
+        if prune:
+            self.prune_disk()
+
+    def prune_disk(self, max_disk_bytes: Optional[int] = None) -> int:
+        """Delete the least recently written envelope files past the disk budget.
+
+        Returns:
+            (int) The number of files removed.
+        """
+        budget = self.max_disk_bytes if max_disk_bytes is None else max_disk_bytes
+        files = []
+        for _, full in self._disk_files():
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, full))
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        for _, size, full in sorted(files):
+            if total <= budget:
+                break
+            try:
+                os.remove(full)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+    @staticmethod
+    def _atomic_write_json(target: str, data) -> None:
+        tmp = f"{target}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, target)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------ decode
+
+    @staticmethod
+    def _as_envelope(level: Optional[np.ndarray]) -> Envelope:
+        if level is None or not len(level):
+            return []
+        return list(zip(level[:, 0].tolist(), level[:, 1].tolist()))
+
+    @staticmethod
+    def decode_levels(
+        wav_path: str, levels: Sequence[int]
+    ) -> Tuple[Optional[Tuple[int, int, int, int]], Dict[int, np.ndarray]]:
+        """Decode *wav_path* once and bin it at every resolution in *levels*.
+
+        Mirrors ``compute_waveform_envelope`` exactly: PCM 8/16/24-bit,
+        channels mono-mixed by mean, ``n // bins`` samples per bin, at most
+        *bins* rows.
+
+        Returns:
+            (tuple) ``(header, {bins: (k, 2) float array})`` where *header* is
+            ``(channels, sample width, rate, frames)``, or ``None`` with an
+            empty dict when the file cannot be read.
+        """
+        try:
+            with wave.open(wav_path, "rb") as wf:
+                header = (
+                    wf.getnchannels(),
+                    wf.getsampwidth(),
+                    wf.getframerate(),
+                    wf.getnframes(),
+                )
+                n_channels, sampwidth, _, n_frames = header
+                if sampwidth not in (1, 2, 3) or n_frames == 0:
+                    return header, {}
+                raw = wf.readframes(n_frames)
+        except Exception:  # noqa: BLE001 - wave raises several unrelated types
+            return None, {}
+
+        if sampwidth == 2:
+            samples = np.frombuffer(raw, dtype="<i2", count=len(raw) // 2)
+            scale = 1.0 / 32768.0
+        elif sampwidth == 3:
+            b = np.frombuffer(raw, dtype=np.uint8, count=len(raw) // 3 * 3)
+            b = b.reshape(-1, 3).astype(np.int32)
+            samples = b[:, 0] | (b[:, 1] << 8) | (b[:, 2] << 16)
+            samples = np.where(samples >= 0x800000, samples - 0x1000000, samples)
+            scale = 1.0 / 8388608.0
+        else:
+            samples = np.frombuffer(raw, dtype=np.uint8).astype(np.int16) - 128
+            scale = 1.0 / 128.0
+
+        samples = samples.astype(np.float64)
+        if n_channels > 1:
+            whole = len(samples) // n_channels * n_channels
+            samples = samples[:whole].reshape(-1, n_channels).mean(axis=1)
+        n = len(samples)
+        if n == 0:
+            return header, {}
+
+        out = {}
+        for bins in levels:
+            bins = int(bins)
+            if bins < 1:
+                continue
+            step = max(1, n // bins)
+            # One extra start bounds the last kept bin, exactly like the slice.
+            starts = np.arange(0, n, step)[: bins + 1]
+            lo = np.minimum.reduceat(samples, starts)[:bins] * scale
+            hi = np.maximum.reduceat(samples, starts)[:bins] * scale
+            out[bins] = np.stack([lo, hi], axis=1)
+        return header, out
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
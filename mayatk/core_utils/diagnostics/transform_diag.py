@@ -32,7 +32,7 @@ except ImportError as error:  # pragma: no cover - Maya runtime specific
 import pythontk as ptk
 
 from mayatk.xform_utils._xform_utils import XformUtils
-from mayatk.xform_utils.matrices import Matrices
+from mayatk.core_utils.diagnostics.transform_scan import WorldMatrixScan
 from mayatk.node_utils._node_utils import NodeUtils
 
 # Type aliases keep Maya stubs optional during static analysis
@@ -116,6 +116,16 @@ class TransformDiagnostics(_TransformDiagnosticsInternal):
     # treated as orthogonal.
     SHEAR_TOLERANCE = 1e-6
 
+    # Shared by every caller; see :meth:`matrix_scan`.
+    _matrix_scan = None
+
+    @classmethod
+    def matrix_scan(cls) -> WorldMatrixScan:
+        """The shared :class:`WorldMatrixScan` the world-space checks read through."""
+        if cls._matrix_scan is None:
+            cls._matrix_scan = WorldMatrixScan()
+        return cls._matrix_scan
+
     @classmethod
     def get_sheared(
         cls, objects: Optional[NodeSeq] = None, tolerance: Optional[float] = None
@@ -201,13 +211,14 @@ class TransformDiagnostics(_TransformDiagnosticsInternal):
             objects = cmds.ls(selection=True) or []
         tolerance = cls.SHEAR_TOLERANCE if tolerance is None else tolerance
 
+        # One API pass reads every world matrix; see WorldMatrixScan.
+        scan = cls.matrix_scan().measure(cmds.ls(objects, transforms=True) or [])
         found: Dict[str, dict] = {}
-        for obj in cmds.ls(objects, transforms=True) or []:
-            skew = cls._matrix_skew(Matrices.get_matrix(obj, "worldMatrix"))
-            shear = cls._local_shear(obj)
+        for i in scan.flagged(tolerance):
+            obj = scan.nodes[i]
+            skew = float(scan.skew[i])
+            shear = scan.shear[i].tolist()
             own_shear = any(abs(s) > tolerance for s in shear)
-            if not (skew > tolerance or own_shear):
-                continue
             if not detailed:
                 # The flat return is keys only. The bake lookup and the
                 # connection scan below are pure diagnosis payload, and
@@ -0,0 +1,186 @@
+# !/usr/bin/python
+# coding=utf-8
+"""World-matrix reads for many transforms at once, with a per-node shear cache.
+
+:meth:`TransformDiagnostics.get_non_orthogonal` used to issue a
+``getAttr worldMatrix`` and a ``getAttr shear`` per transform, then measure
+the skew in Python -- the slowest check in a whole-scene export validation.
+
+:class:`WorldMatrixScan` walks the requested transforms once through the API
+(one ``MSelectionList``) and fills two N x 16 arrays: each node's world matrix (``inclusiveMatrix``) and its
+parent's (``exclusiveMatrix``). The axis skew is measured for every row in
+one NumPy pass, with the same rule as ``ptk.MathUtils.max_axis_skew``.
+
+The local shear is the only value still read per node, and it is cached.
+A node's entry stays valid while both of its rows match the previous
+scan: the world row covers the node's own transform, the parent row covers
+every ancestor, and together they fix the local matrix the shear is part
+of. Only nodes whose transform or ancestors moved are read again.
+Validating by comparison keeps the cache free of per-node
+``MDagMessage`` callbacks, which would fire on every frame of playback for
+each animated node in the scene. Entries of deleted nodes are swept by
+:meth:`WorldMatrixScan.prune`, which :meth:`~WorldMatrixScan.measure` runs
+whenever the cache has doubled since the last sweep.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import maya.api.OpenMaya as om
+except ImportError as error:  # pragma: no cover - Maya runtime specific
+    print(__file__, error)
+
+
+class MatrixScanResult(NamedTuple):
+    """One scan: ``nodes[i]`` owns row ``i`` of every array."""
+
+    nodes: List[str]
+    world: np.ndarray  # (N, 16) world matrices, row-major
+    skew: np.ndarray  # (N,) max abs cosine between the world axes
+    shear: np.ndarray  # (N, 3) local shear xy, xz, yz
+
+    def flagged(self, tolerance: float) -> np.ndarray:
+        """Row indices whose skew or any shear component exceeds *tolerance*."""
+        own = (np.abs(self.shear) > tolerance).any(axis=1)
+        return np.flatnonzero((self.skew > tolerance) | own)
+
+
+class WorldMatrixScan:
+    """Batched world-matrix reads with shear cached until the transform moves."""
+
+    #: Axes shorter than this are zero-scale; their skew reads 0.0.
+    DEGENERATE_LENGTH = 1e-9
+    #: Cache size below which :meth:`measure` never sweeps for deleted nodes.
+    PRUNE_MIN = 256
+
+    def __init__(self):
+        # handle hash -> (MObjectHandle, world + parent row (32,), shear (3,))
+        self._cache: Dict[int, Tuple[object, np.ndarray, np.ndarray]] = {}
+        self._prune_at = self.PRUNE_MIN
+        self.stats: Dict[str, float] = {}
+
+    @classmethod
+    def axis_skew(cls, world: np.ndarray) -> np.ndarray:
+        """Max abs cosine between the axis rows of each flat 16-float matrix.
+
+        Parameters:
+            world: ``(N, 16)`` row-major matrices.
+
+        Returns:
+            (np.ndarray) ``(N,)`` skew in 0.0-1.0; 0.0 where any axis is
+            degenerate.
+        """
+        world = np.asarray(world, dtype=float).reshape(-1, 16)
+        axes = world[:, :12].reshape(-1, 3, 4)[:, :, :3]
+        lengths = np.sqrt(np.einsum("nij,nij->ni", axes, axes))
+        degenerate = (lengths < cls.DEGENERATE_LENGTH).any(axis=1)
+        lengths[lengths < cls.DEGENERATE_LENGTH] = 1.0
+        x, y, z = (axes[:, i] / lengths[:, i, None] for i in range(3))
+        cosines = np.abs(
+            np.stack(
+                [
+                    np.einsum("ni,ni->n", x, y),
+                    np.einsum("ni,ni->n", x, z),
+                    np.einsum("ni,ni->n", y, z),
+                ],
+                axis=1,
+            )
+        )
+        skew = cosines.max(axis=1)
+        skew[degenerate] = 0.0
+        return skew
+
+    @staticmethod
+    def _paths(nodes: Sequence[str]) -> Tuple[List[str], list]:
+        """``(names, MDagPaths)`` for the *nodes* that are transforms."""
+        names, paths = [], []
+        sel = om.MSelectionList()
+        for name in nodes:
+            sel.clear()  # re-adding a listed item would not grow the list
+            try:
+                sel.add(name)
+                path = sel.getDagPath(0)
+            except (RuntimeError, TypeError):
+                continue
+            if path.node().hasFn(om.MFn.kTransform):
+                names.append(name)
+                paths.append(path)
+        return names, paths
+
+    def measure(self, nodes: Sequence[str]) -> MatrixScanResult:
+        """Read and measure *nodes*.
+
+        Parameters:
+            nodes: Transform names; results keep these names and their
+                order. Names that do not resolve to a transform are dropped.
+
+        Returns:
+            (MatrixScanResult) The world matrices, skew and local shear.
+        """
+        start = time.perf_counter()
+        names, paths = self._paths(nodes)
+        n = len(paths)
+        rows = np.empty((n, 32))
+        shear = np.empty((n, 3))
+        keys, handles = [], []
+        for i, path in enumerate(paths):
+            rows[i, :16] = tuple(path.inclusiveMatrix())
+            rows[i, 16:] = tuple(path.exclusiveMatrix())
+            handle = om.MObjectHandle(path.node())
+            keys.append(handle.hashCode())
+            handles.append(handle)
+
+        stale = []
+        for i, key in enumerate(keys):
+            entry = self._cache.get(key)
+            if (
+                entry is not None
+                and entry[0] == handles[i]
+                and np.array_equal(entry[1], rows[i])
+            ):
+                shear[i] = entry[2]
+            else:
+                stale.append(i)
+        for i in stale:
+            shear[i] = om.MFnTransform(paths[i]).shear(om.MSpace.kTransform)
+            self._cache[keys[i]] = (handles[i], rows[i].copy(), shear[i].copy())
+        # Amortized: the per-node calls of fix_non_orthogonal_axes must not
+        # each pay a sweep of the whole cache.
+        pruned = self.prune() if len(self._cache) > self._prune_at else 0
+
+        world = rows[:, :16]
+        result = MatrixScanResult(names, world, self.axis_skew(world), shear)
+        self.stats = {
+            "nodes": n,
+            "shear_reads": len(stale),
+            "pruned": pruned,
+            "seconds": time.perf_counter() - start,
+        }
+        return result
+
+    def prune(self) -> int:
+        """Drop entries for deleted nodes; returns how many were dropped."""
+        dead = [k for k, entry in self._cache.items() if not entry[0].isAlive()]
+        for key in dead:
+            del self._cache[key]
+        self._prune_at = max(2 * len(self._cache), self.PRUNE_MIN)
+        return len(dead)
+
+    def clear(self) -> None:
+        """Forget every cached shear."""
+        self._cache.clear()
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -152,8 +152,7 @@ class UvDiagnostics:
         and packed within the 0-1 unit square (a single tile).
 
         Used by the UV2 stage to decide reuse-vs-regenerate. Delegates to
-        :meth:`_analyze_uv_set`, which sets the queried set as current as a
-        side effect -- callers that care should restore it.
+        :meth:`_analyze_uv_set`, which leaves the current set alone.
         """
         m = cls._analyze_uv_set(str(shape), uv_set)
         return bool(
@@ -358,6 +357,9 @@ class UvDiagnostics:
     def _analyze_uv_set(shape, uv_set: str) -> dict:
         """Analyze a UV set and return quality metrics.
 
+        Reads the set through the API (:class:`UvSetAnalyzer`); the shape's
+        current UV set is left alone.
+
         Parameters:
             shape: The mesh shape node
             uv_set: Name of the UV set to analyze
@@ -371,96 +373,11 @@ class UvDiagnostics:
             - is_valid: True if this is usable UV data
             - overlap_count: Number of overlapping UV faces (lower is better)
             - area_outside: Area of UV bounding box outside 0-1 range (lower is better)
+            - fill_rate: UV area over bounding-box area
         """
-        shape = str(shape)
-        result = {
-            "uv_count": 0,
-            "area": 0.0,
-            "bounds": (0, 0, 0, 0),
-            "in_bounds": False,
-            "is_valid": False,
-            "overlap_count": 0,
-            "area_outside": 0.0,
-        }
-
-        try:
-            cmds.polyUVSet(shape, currentUVSet=True, uvSet=uv_set)
-            uv_count = cmds.polyEvaluate(shape, uvcoord=True) or 0
-            result["uv_count"] = uv_count
-
-            if uv_count > 0:
-                # Get UV bounding box
-                try:
-                    bbox = cmds.polyEvaluate(shape, boundingBox2d=True)
-                    if bbox and len(bbox) == 2:
-                        umin, umax = bbox[0]
-                        vmin, vmax = bbox[1]
-                        result["bounds"] = (umin, vmin, umax, vmax)
-
-                        # Check if UVs are in reasonable range (0-10 for UDIM, allow some overflow)
-                        result["in_bounds"] = (
-                            umin >= -1 and umax <= 11 and vmin >= -1 and vmax <= 11
-                        )
-
-                        # Calculate area outside 0-1 unit square
-                        total_width = umax - umin
-                        total_height = vmax - vmin
-                        total_area = total_width * total_height
-
-                        # Intersection with unit square [0,0] to [1,1]
-                        i_umin = max(umin, 0.0)
-                        i_umax = min(umax, 1.0)
-                        i_vmin = max(vmin, 0.0)
-                        i_vmax = min(vmax, 1.0)
-
-                        if i_umax > i_umin and i_vmax > i_vmin:
-                            intersection_area = (i_umax - i_umin) * (i_vmax - i_vmin)
-                        else:
-                            intersection_area = 0.0
-
-                        result["area_outside"] = max(
-                            0.0, total_area - intersection_area
-                        )
-
-                        # Calculate Fill Rate (Normalized Area)
-                        # Avoid division by zero
-                        safe_total_area = total_area if total_area > 0.000001 else 1.0
-
-                        # Get UV area
-                        try:
-                            area = cmds.polyEvaluate(shape, uvArea=True) or 0.0
-                            if isinstance(area, (list, tuple)):
-                                area = area[0] if area else 0.0
-                            result["area"] = float(area)
-
-                            # Fill rate = What % of the bbox is covered by UVs?
-                            # This metric is independent of global scale.
-                            result["fill_rate"] = result["area"] / safe_total_area
-
-                        except Exception:
-                            result["area"] = 0.0
-                            result["fill_rate"] = 0.0
-                except Exception:
-                    pass
+        from mayatk.core_utils.diagnostics.uv_metrics import UvSetAnalyzer
 
-                # Get Overlap Count
-                try:
-                    overlaps = cmds.polyUVOverlap(shape, oc=True)
-                    if overlaps:
-                        result["overlap_count"] = len(overlaps)
-                except Exception:
-                    pass
-
-                # Valid if has UVs, has area, and is in reasonable bounds
-                result["is_valid"] = (
-                    uv_count > 0
-                    and result["area"] > 0.001  # Non-degenerate
-                    and result["in_bounds"]
-                )
-        except RuntimeError:
-            pass
-
-        return result
+        return UvSetAnalyzer.analyze_shape(str(shape), [uv_set])[uv_set]
 
     @staticmethod
     def _find_primary_uv_set(
@@ -503,7 +420,11 @@ class UvDiagnostics:
         # Only consider "real" UV sets (those that can actually be deleted)
         real_sets = UvDiagnostics._get_real_uv_sets(shape)
 
-        # Analyze each unique UV set
+        # Analyze every unique UV set in one API pass.
+        from mayatk.core_utils.diagnostics.uv_metrics import UvSetAnalyzer
+
+        analyzed = UvSetAnalyzer.analyze_shape(shape, list(dict.fromkeys(all_sets)))
+
         candidates = []  # List of (name, metrics, is_real)
         checked = set()
 
@@ -521,8 +442,7 @@ class UvDiagnostics:
                 continue
 
             is_real = uv_set in real_sets
-            metrics = UvDiagnostics._analyze_uv_set(shape, uv_set)
-            candidates.append((uv_set, metrics, is_real))
+            candidates.append((uv_set, analyzed[uv_set], is_real))
 
         if not candidates:
             # No non-delete-marked sets found - fall back to any set with data
@@ -530,7 +450,7 @@ class UvDiagnostics:
                 if uv_set in exclude:
                     continue
                 is_real = uv_set in real_sets
-                metrics = UvDiagnostics._analyze_uv_set(shape, uv_set)
+                metrics = analyzed[uv_set]
                 if metrics["uv_count"] > 0:
                     candidates.append((uv_set, metrics, is_real))
 
@@ -587,22 +507,13 @@ class UvDiagnostics:
     @staticmethod
     def _get_empty_uv_sets(shape, primary_uv_set: str) -> list[str]:
         """Get list of empty UV sets (excluding primary)."""
+        from mayatk.core_utils.diagnostics.uv_metrics import UvSetAnalyzer
+
         shape = str(shape)
         all_sets = cmds.polyUVSet(shape, query=True, allUVSets=True) or []
-        empty_sets: list[str] = []
-
-        for uv_set in all_sets:
-            if uv_set == primary_uv_set:
-                continue
-            try:
-                cmds.polyUVSet(shape, currentUVSet=True, uvSet=uv_set)
-                uv_count = cmds.polyEvaluate(shape, uvcoord=True) or 0
-                if uv_count == 0:
-                    empty_sets.append(uv_set)
-            except RuntimeError:
-                empty_sets.append(uv_set)  # Can't query, probably broken
-
-        return empty_sets
+        # None: can't query, probably broken -- counts as empty.
+        counts = UvSetAnalyzer.uv_counts(shape, all_sets)
+        return [s for s in all_sets if s != primary_uv_set and not counts.get(s)]
 
     @staticmethod
     def _execute_cleanup(
@@ -0,0 +1,452 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Batched UV-set quality metrics, read through the API.
+
+:meth:`UvDiagnostics._analyze_uv_set` made each UV set current, then ran
+``polyEvaluate`` three times and ``polyUVOverlap`` -- per shape, per set, and
+again for every pass of :meth:`UvDiagnostics.cleanup_uv_sets`.
+``polyUVOverlap`` alone took seconds on dense meshes.
+
+:class:`UvSetAnalyzer` reads each set's UVs and face-vertex UV ids with
+``MFnMesh.getUVs`` / ``getAssignedUVs``, which take the set by name, so the
+current set is never touched. Everything else is NumPy:
+
+* bounds, area outside the unit square and fill rate from the UV arrays;
+* per-face UV area with the shoelace formula, summed per set;
+* overlapping faces: faces are split into Maya's own triangles
+  (``MFnMesh.getTriangles``, whose corners are mapped to UV ids through the
+  face-vertex order), the triangles hashed into a uniform grid sized to the
+  triangles, and the pairs sharing a cell tested exactly with the
+  separating-axis test (oversized triangles are paired by bounding box
+  instead). Pairs from the same face, and pairs that only touch along an
+  edge, never count; pairs of faces already known to overlap are skipped,
+  which keeps stacked islands cheap. Maya's triangles follow concave faces;
+  the array-only entry points without them fall back to a fan, which is
+  exact for convex faces only.
+
+The metric dicts use the same keys :meth:`UvDiagnostics._analyze_uv_set`
+always returned. :meth:`UvSetAnalyzer.table` flattens a whole level into one
+row per shape and set, for use as a pre-export check.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:  # pragma: no cover - Maya runtime specific
+    print(__file__, error)
+
+
+class UvSetAnalyzer:
+    """UV-set quality metrics for many shapes, without changing current sets."""
+
+    #: Projections must overlap by more than this to count (UV units).
+    OVERLAP_TOLERANCE = 1e-6
+
+    @staticmethod
+    def empty_metrics() -> dict:
+        """The metrics of a set with no UVs."""
+        return {
+            "uv_count": 0,
+            "area": 0.0,
+            "bounds": (0, 0, 0, 0),
+            "in_bounds": False,
+            "is_valid": False,
+            "overlap_count": 0,
+            "area_outside": 0.0,
+            "fill_rate": 0.0,
+        }
+
+    @staticmethod
+    def _offsets(counts: np.ndarray) -> np.ndarray:
+        return np.cumsum(counts) - counts
+
+    @classmethod
+    def face_areas(
+        cls, u: np.ndarray, v: np.ndarray, counts: np.ndarray, ids: np.ndarray
+    ) -> np.ndarray:
+        """Absolute UV area per face (shoelace); zero for unmapped faces.
+
+        Parameters:
+            u, v: UV coordinates of the set.
+            counts: Mapped corners per face (``0`` for a face without UVs).
+            ids: UV id per mapped corner, face after face.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        areas = np.zeros(len(counts))
+        mapped = counts > 0
+        if not mapped.any():
+            return areas
+        offsets = cls._offsets(counts)
+        following = np.arange(1, len(ids) + 1)
+        following[offsets[mapped] + counts[mapped] - 1] = offsets[mapped]
+        x, y = u[ids], v[ids]
+        cross = x * y[following] - x[following] * y
+        areas[mapped] = 0.5 * np.abs(np.add.reduceat(cross, offsets[mapped]))
+        return areas
+
+    @classmethod
+    def fan_triangles(
+        cls, counts: np.ndarray, ids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Fan triangulation of every mapped face; exact for convex faces only.
+
+        Returns:
+            (tuple) ``(triangles, faces)``: ``(T, 3)`` UV ids and the face of
+                each triangle.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        per_face = np.maximum(counts - 2, 0)
+        total = int(per_face.sum())
+        if not total:
+            return np.empty((0, 3), dtype=np.int64), np.empty(0, dtype=np.int64)
+        faces = np.repeat(np.arange(len(counts)), per_face)
+        first = np.repeat(cls._offsets(counts), per_face)
+        k = np.arange(total) - np.repeat(np.cumsum(per_face) - per_face, per_face) + 1
+        triangles = np.stack([ids[first], ids[first + k], ids[first + k + 1]], axis=1)
+        return triangles, faces
+
+    @classmethod
+    def read_triangles(cls, fn) -> Tuple[np.ndarray, np.ndarray]:
+        """Maya's triangulation of an ``MFnMesh``, as face-local corners.
+
+        ``getTriangles`` lists mesh vertex ids; each is looked up among its
+        face's vertices (``getVertices``) to get its face-vertex position.
+
+        Returns:
+            (tuple) ``(corners, faces)``: ``(T, 3)`` corner positions within
+                each triangle's face and the face of each triangle.
+        """
+        tri_counts, tri_vertices = fn.getTriangles()
+        counts, vertices = fn.getVertices()
+        tri_counts = np.array(tri_counts, dtype=np.int64)
+        tri_vertices = np.array(tri_vertices, dtype=np.int64)
+        counts = np.array(counts, dtype=np.int64)
+        vertices = np.array(vertices, dtype=np.int64)
+        faces = np.repeat(np.arange(len(counts)), tri_counts)
+        if not len(faces):
+            return np.empty((0, 3), dtype=np.int64), faces
+        span = int(vertices.max()) + 1
+        keys = np.repeat(np.arange(len(counts)), counts) * span + vertices
+        order = np.argsort(keys, kind="stable")
+        wanted = np.repeat(faces, 3) * span + tri_vertices
+        position = order[np.searchsorted(keys[order], wanted)]
+        corners = position - np.repeat(cls._offsets(counts)[faces], 3)
+        return corners.reshape(-1, 3), faces
+
+    @classmethod
+    def uv_triangles(
+        cls,
+        counts: np.ndarray,
+        ids: np.ndarray,
+        corners: np.ndarray,
+        faces: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """UV ids of the triangles from :meth:`read_triangles`.
+
+        Triangles of unmapped faces are dropped.
+
+        Returns:
+            (tuple) ``(triangles, faces)`` as :meth:`fan_triangles` returns.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        mapped = counts[faces] > 0
+        corners, faces = corners[mapped], faces[mapped]
+        return ids[cls._offsets(counts)[faces, None] + corners], faces
+
+    #: A triangle spanning more grid cells than this per axis skips the grid
+    #: and is paired with every box it touches directly.
+    MAX_CELL_SPAN = 16
+
+    @classmethod
+    def _candidate_pairs(cls, lo: np.ndarray, hi: np.ndarray, settled=None):
+        """Yield batches of box pairs ``(P, 2)`` that share a grid cell.
+
+        The cell is the 90th-percentile box size, so nearly every triangle
+        lands in one to four cells. Batches (one per depth within the cells,
+        then one per oversized box) keep memory bounded when many triangles
+        stack in one place; a pair may come up more than once.
+
+        Parameters:
+            settled: Optional per-box flags the consumer sets between batches;
+                cells whose boxes are all settled stop producing pairs.
+        """
+        count = len(lo)
+        origin = lo.min(axis=0)
+        extent = float((hi.max(axis=0) - origin).max())
+        cell = max(float(np.percentile((hi - lo).max(axis=1), 90)), extent / 2048.0)
+        cell = cell or 1.0
+        first = np.floor((lo - origin) / cell).astype(np.int64)
+        last = np.floor((hi - origin) / cell).astype(np.int64)
+        span = last - first + 1
+        big = span.max(axis=1) > cls.MAX_CELL_SPAN
+        span[big] = 0
+
+        cells = span[:, 0] * span[:, 1]
+        owner = np.repeat(np.arange(count), cells)
+        local = np.arange(len(owner)) - np.repeat(np.cumsum(cells) - cells, cells)
+        cx = first[owner, 0] + local % np.maximum(span[owner, 0], 1)
+        cy = first[owner, 1] + local // np.maximum(span[owner, 0], 1)
+        key = cx * (int(last[:, 1].max()) + 1) + cy
+        order = np.argsort(key, kind="stable")
+        key, owner = key[order], owner[order]
+
+        # Entry i pairs with i + step while both sit in the same cell.
+        starts = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        group = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(key)]))
+        remaining = np.r_[starts[1:], len(key)][group] - np.arange(len(key)) - 1
+        active = np.flatnonzero(remaining > 0)
+        step = 1
+        while len(active):
+            yield np.stack([owner[active], owner[active + step]], axis=1)
+            step += 1
+            active = active[remaining[active] >= step]
+            if settled is not None and len(active) and step & (step - 1) == 0:
+                done = np.ones(len(starts), dtype=bool)
+                np.logical_and.at(done, group, settled[owner])
+                active = active[~done[group[active]]]
+
+        everyone = np.arange(count)
+        for index in np.flatnonzero(big):
+            touching = everyone[
+                (lo[index] < hi).all(axis=1) & (lo < hi[index]).all(axis=1)
+            ]
+            touching = touching[touching != index]
+            yield np.stack([np.full(len(touching), index), touching], axis=1)
+
+    @classmethod
+    def triangles_overlap(
+        cls, a: np.ndarray, b: np.ndarray, tolerance: Optional[float] = None
+    ) -> np.ndarray:
+        """Separating-axis test for triangle pairs ``(P, 3, 2)``.
+
+        True where the interiors overlap by more than *tolerance* along every
+        edge normal of both triangles; triangles sharing an edge or a corner,
+        and degenerate triangles, are False.
+        """
+        tol = cls.OVERLAP_TOLERANCE if tolerance is None else tolerance
+        overlap = np.ones(len(a), dtype=bool)
+        for tri in (a, b):
+            edges = np.roll(tri, -1, axis=1) - tri
+            normals = np.stack([-edges[..., 1], edges[..., 0]], axis=-1)
+            length = np.linalg.norm(normals, axis=-1, keepdims=True)
+            normals = np.divide(
+                normals, length, out=np.zeros_like(normals), where=length > 0
+            )
+            for e in range(3):
+                n = normals[:, e, None, :]
+                pa = (a * n).sum(axis=-1)
+                pb = (b * n).sum(axis=-1)
+                overlap &= (pa.max(axis=1) - tol > pb.min(axis=1)) & (
+                    pb.max(axis=1) - tol > pa.min(axis=1)
+                )
+        return overlap
+
+    @classmethod
+    def overlapping_faces(
+        cls,
+        u: np.ndarray,
+        v: np.ndarray,
+        counts: np.ndarray,
+        ids: np.ndarray,
+        tolerance: Optional[float] = None,
+        triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> np.ndarray:
+        """Faces whose UVs overlap another face's (sorted face ids).
+
+        Parameters:
+            triangles: ``(corners, faces)`` from :meth:`read_triangles`. None
+                fan-triangulates, which is wrong for concave faces.
+        """
+        if triangles is None:
+            triangles, faces = cls.fan_triangles(counts, ids)
+        else:
+            triangles, faces = cls.uv_triangles(counts, ids, *triangles)
+        if len(triangles) < 2:
+            return np.empty(0, dtype=np.int64)
+        points = np.stack([u, v], axis=1)[triangles]  # (T, 3, 2)
+        lo, hi = points.min(axis=1), points.max(axis=1)
+        overlapping = np.zeros(int(faces.max()) + 1, dtype=bool)
+        settled = np.zeros(len(triangles), dtype=bool)
+        for pairs in cls._candidate_pairs(lo, hi, settled):
+            i, j = pairs[:, 0], pairs[:, 1]
+            fi, fj = faces[i], faces[j]
+            # Same face, boxes apart, or both faces already known: skip.
+            keep = (
+                (fi != fj)
+                & ~(overlapping[fi] & overlapping[fj])
+                & (lo[i] < hi[j]).all(axis=1)
+                & (lo[j] < hi[i]).all(axis=1)
+            )
+            i, j = i[keep], j[keep]
+            if not len(i):
+                continue
+            hit = cls.triangles_overlap(points[i], points[j], tolerance)
+            overlapping[faces[i[hit]]] = True
+            overlapping[faces[j[hit]]] = True
+            settled[:] = overlapping[faces]
+        return np.flatnonzero(overlapping)
+
+    @classmethod
+    def set_metrics(
+        cls,
+        u: np.ndarray,
+        v: np.ndarray,
+        counts: np.ndarray,
+        ids: np.ndarray,
+        overlaps: bool = True,
+        triangles: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> dict:
+        """Quality metrics of one UV set (see :meth:`UvDiagnostics._analyze_uv_set`).
+
+        Parameters:
+            u, v: UV coordinates of the set.
+            counts, ids: Face-vertex UV assignment (``MFnMesh.getAssignedUVs``).
+            overlaps: Count overlapping faces. With False ``overlap_count``
+                stays 0.
+            triangles: The mesh's triangulation for the overlap search
+                (see :meth:`overlapping_faces`).
+        """
+        result = cls.empty_metrics()
+        u = np.asarray(u, dtype=float)
+        v = np.asarray(v, dtype=float)
+        result["uv_count"] = len(u)
+        if not len(u):
+            return result
+        umin, umax, vmin, vmax = u.min(), u.max(), v.min(), v.max()
+        result["bounds"] = (float(umin), float(vmin), float(umax), float(vmax))
+        result["in_bounds"] = bool(
+            umin >= -1 and umax <= 11 and vmin >= -1 and vmax <= 11
+        )
+        total_area = (umax - umin) * (vmax - vmin)
+        inside = max(0.0, min(umax, 1.0) - max(umin, 0.0)) * max(
+            0.0, min(vmax, 1.0) - max(vmin, 0.0)
+        )
+        result["area_outside"] = float(max(0.0, total_area - inside))
+
+        counts = np.asarray(counts, dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        result["area"] = float(cls.face_areas(u, v, counts, ids).sum())
+        result["fill_rate"] = result["area"] / float(
+            total_area if total_area > 0.000001 else 1.0
+        )
+        if overlaps:
+            result["overlap_count"] = len(
+                cls.overlapping_faces(u, v, counts, ids, triangles=triangles)
+            )
+        result["is_valid"] = result["area"] > 0.001 and result["in_bounds"]
+        return result
+
+    @staticmethod
+    def _mesh_fn(shape: str):
+        return om.MFnMesh(om.MSelectionList().add(str(shape)).getDagPath(0))
+
+    @staticmethod
+    def read_set(fn, uv_set: str) -> Tuple[np.ndarray, ...]:
+        """``(u, v, counts, ids)`` of *uv_set* on an ``MFnMesh``."""
+        u, v = fn.getUVs(uv_set)
+        counts, ids = fn.getAssignedUVs(uv_set)
+        return (
+            np.array(u, dtype=float),
+            np.array(v, dtype=float),
+            np.array(counts, dtype=np.int64),
+            np.array(ids, dtype=np.int64),
+        )
+
+    @classmethod
+    def uv_counts(cls, shape, uv_sets: Optional[Sequence[str]] = None) -> dict:
+        """``{uv_set: number of UVs}``; None where a set can't be read."""
+        fn = cls._mesh_fn(shape)
+        counts = {}
+        for uv_set in dict.fromkeys(uv_sets or fn.getUVSetNames()):
+            try:
+                counts[uv_set] = fn.numUVs(uv_set)
+            except RuntimeError:
+                counts[uv_set] = None
+        return counts
+
+    @classmethod
+    def analyze_shape(
+        cls, shape, uv_sets: Optional[Sequence[str]] = None, overlaps: bool = True
+    ) -> Dict[str, dict]:
+        """``{uv_set: metrics}`` for *uv_sets* (default: every set) of *shape*.
+
+        A set that can't be read (a ghost set left by history) reports
+        :meth:`empty_metrics`, as the command path did.
+        """
+        try:
+            fn = cls._mesh_fn(shape)
+        except RuntimeError:
+            return {s: cls.empty_metrics() for s in uv_sets or ()}
+        # The triangulation is shared by every set of the shape.
+        triangles = cls.read_triangles(fn) if overlaps else None
+        metrics = {}
+        for uv_set in dict.fromkeys(uv_sets or fn.getUVSetNames()):
+            try:
+                data = cls.read_set(fn, uv_set)
+            except RuntimeError:
+                metrics[uv_set] = cls.empty_metrics()
+                continue
+            metrics[uv_set] = cls.set_metrics(
+                *data, overlaps=overlaps, triangles=triangles
+            )
+        return metrics
+
+    @classmethod
+    def analyze(
+        cls, objects, uv_sets: Optional[Sequence[str]] = None, overlaps: bool = True
+    ) -> Dict[str, Dict[str, dict]]:
+        """``{shape: {uv_set: metrics}}`` for every mesh under *objects*."""
+        shapes = (
+            cmds.ls(objects, dag=True, type="mesh", noIntermediate=True, long=True)
+            or []
+        )
+        return {
+            shape: cls.analyze_shape(shape, uv_sets, overlaps)
+            for shape in dict.fromkeys(shapes)
+        }
+
+    @classmethod
+    def table(
+        cls, objects, uv_sets: Optional[Sequence[str]] = None, overlaps: bool = True
+    ) -> List[dict]:
+        """One row per shape and UV set: ``shape``, ``uv_set``, the metrics and
+        ``seconds`` (that shape's read and analysis time, on its first row).
+        """
+        rows = []
+        shapes = (
+            cmds.ls(objects, dag=True, type="mesh", noIntermediate=True, long=True)
+            or []
+        )
+        for shape in dict.fromkeys(shapes):
+            start = time.perf_counter()
+            metrics = cls.analyze_shape(shape, uv_sets, overlaps)
+            elapsed = time.perf_counter() - start
+            for index, (uv_set, values) in enumerate(metrics.items()):
+                rows.append(
+                    dict(
+                        shape=shape,
+                        uv_set=uv_set,
+                        seconds=elapsed if index == 0 else 0.0,
+                        **values,
+                    )
+                )
+        return rows
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
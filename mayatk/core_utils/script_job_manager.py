@@ -27,6 +27,22 @@ Usage::
 
     with mgr.suppressed(token):  # silence listeners while mutating the scene
         ...
+
+Bursty events can be coalesced per subscription instead of per panel::
+
+    # One rebuild per idle, however many selection changes queued up.
+    mgr.subscribe("SelectionChanged", self._rebuild, owner=self, policy="idle")
+    # At most ~30 refreshes a second while scrubbing (leading + trailing).
+    mgr.subscribe("timeChanged", self._refresh, owner=self,
+                  policy="throttle", interval=1 / 30)
+    # Once, 250 ms after an import stops creating nodes; the callback gets
+    # every accumulated (node, clientData) payload in one list.
+    mgr.add_om_callback(
+        om2.MDGMessage.addNodeAddedCallback, self._on_nodes_added,
+        owner=self, policy="debounce", interval=0.25, delivery="batch",
+    )
+
+    mgr.print_status()  # per-callback events / calls / time: who is slow?
 """
 from __future__ import annotations
 
@@ -35,6 +51,7 @@ import maya.cmds as cmds
 import contextlib
 import itertools
 import logging
+import time
 from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 
@@ -42,18 +59,93 @@ logger = logging.getLogger(__name__)
 
 _SCENE_CHANGE_EVENTS = frozenset({"SceneOpened", "NewSceneOpened"})
 
+POLICIES = ("immediate", "idle", "debounce", "throttle")
+DELIVERIES = ("latest", "batch")
+
+
+class _CallStats:
+    """Per-subscription counters: events received vs. callbacks actually run."""
+
+    __slots__ = ("events", "calls", "errors", "total", "max", "last")
+
+    def __init__(self):
+        self.events = 0
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total += elapsed
+        self.last = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "events": self.events,
+            "calls": self.calls,
+            "coalesced": max(self.events - self.calls, 0),
+            "errors": self.errors,
+            "total_ms": self.total * 1000.0,
+            "mean_ms": (self.total / self.calls * 1000.0) if self.calls else 0.0,
+            "max_ms": self.max * 1000.0,
+            "last_ms": self.last * 1000.0,
+        }
+
+
+class _Coalescer:
+    """Pending-call state for a non-immediate subscription policy.
+
+    Tracks whether a flush is scheduled, the payloads accumulated since the
+    last call (OM callbacks only — scriptJob events carry none), and a
+    generation counter so a superseded debounce timer fires as a no-op
+    (``QTimer.singleShot`` cannot be cancelled).
+    """
+
+    __slots__ = (
+        "policy",
+        "interval",
+        "delivery",
+        "pending",
+        "generation",
+        "last_run",
+        "payloads",
+    )
+
+    def __init__(self, policy: str, interval: float, delivery: str):
+        self.policy = policy
+        self.interval = max(float(interval), 0.0)
+        self.delivery = delivery
+        self.pending = False
+        self.generation = 0
+        self.last_run = float("-inf")
+        self.payloads: List[Tuple[Any, ...]] = []
+
 
 class _Subscription:
     """Internal subscription record for a ``cmds.scriptJob`` listener."""
 
-    __slots__ = ("token", "event", "callback", "owner", "ephemeral")
+    __slots__ = (
+        "token",
+        "event",
+        "callback",
+        "owner",
+        "ephemeral",
+        "stats",
+        "coalescer",
+    )
 
-    def __init__(self, token, event, callback, owner, ephemeral):
+    def __init__(self, token, event, callback, owner, ephemeral, coalescer=None):
         self.token = token
         self.event = event
         self.callback = callback
         self.owner = owner
         self.ephemeral = ephemeral
+        self.stats = _CallStats()
+        self.coalescer = coalescer
 
 
 class _OMSubscription:
@@ -64,12 +156,15 @@ class _OMSubscription:
     through ``MMessage.removeCallback``.
     """
 
-    __slots__ = ("token", "cb_id", "owner")
+    __slots__ = ("token", "cb_id", "owner", "callback", "stats", "coalescer")
 
-    def __init__(self, token, cb_id, owner):
+    def __init__(self, token, cb_id, owner, callback=None, coalescer=None):
         self.token = token
         self.cb_id = cb_id
         self.owner = owner
+        self.callback = callback
+        self.stats = _CallStats()
+        self.coalescer = coalescer
 
 
 class ScriptJobManager:
@@ -83,6 +178,10 @@ class ScriptJobManager:
     ``NewSceneOpened``) fires, mirroring Maya's ``killWithScene``
     behaviour without destroying the shared job.
 
+    Each subscription has a dispatch *policy* (see :meth:`subscribe`) that
+    coalesces bursts into fewer calls, and every callback is timed — see
+    :meth:`status` / :meth:`print_status`.
+
     Parameters
     ----------
     None — obtain the singleton via :meth:`instance`.
@@ -120,6 +219,7 @@ class ScriptJobManager:
         # token -> nested suppress count; counted so overlapping suppressed()
         # blocks (and their in-flight deferred resumes) compose correctly.
         self._suppressed: Dict[int, int] = {}
+        self._clock: Callable[[], float] = time.perf_counter
 
     # -------------------------------------------------------------- public API
 
@@ -130,6 +230,8 @@ class ScriptJobManager:
         *,
         owner: Any = None,
         ephemeral: bool = False,
+        policy: str = "immediate",
+        interval: float = 0.0,
     ) -> int:
         """Register *callback* for a Maya scriptJob *event*.
 
@@ -146,15 +248,35 @@ class ScriptJobManager:
             time a scene-change event fires (``SceneOpened`` or
             ``NewSceneOpened``).  Useful for ``SelectionChanged`` listeners
             whose context is invalidated by a scene switch.
+        policy : str
+            How bursts of *event* reach *callback*:
+
+            - ``"immediate"`` (default) — once per event, synchronously.
+            - ``"idle"`` — once per Maya idle, however many events queued
+              (``cmds.evalDeferred``; note the idle queue does not drain
+              during manipulator drags).
+            - ``"debounce"`` — once, *interval* seconds after the LAST event
+              of a burst (an import's hundreds of ``DagObjectCreated``).
+            - ``"throttle"`` — at most once per *interval*: the first event
+              runs immediately, later ones collapse into one trailing call.
+
+            Timed policies run on a Qt timer, which keeps ticking during
+            drags; without a Qt application (batch) every policy degrades
+            to ``"immediate"``.
+        interval : float
+            Seconds, for ``"debounce"`` / ``"throttle"``.
 
         Returns
         -------
         int
             Opaque token passed to :meth:`unsubscribe`.
         """
+        coalescer = self._make_coalescer(policy, interval, "latest")
         self._ensure_job(event)  # before bookkeeping: a failure leaves no orphan
         token = next(self._counter)
-        self._subs[token] = _Subscription(token, event, callback, owner, ephemeral)
+        self._subs[token] = _Subscription(
+            token, event, callback, owner, ephemeral, coalescer
+        )
         self._events.setdefault(event, []).append(token)
         return token
 
@@ -163,6 +285,9 @@ class ScriptJobManager:
         register_fn: Callable,
         *register_args: Any,
         owner: Any = None,
+        policy: str = "immediate",
+        interval: float = 0.0,
+        delivery: str = "latest",
     ) -> Optional[int]:
         """Register an OpenMaya ``MMessage`` callback under SJM management.
 
@@ -201,6 +326,17 @@ class ScriptJobManager:
             usually the last positional argument.
         owner : object, optional
             Grouping key for :meth:`unsubscribe_all`.
+        policy, interval : str, float
+            Coalescing, as for :meth:`subscribe`.  The callback is the
+            first callable in *register_args*; SJM registers a timing
+            wrapper in its place.
+        delivery : str
+            What a coalesced call receives. ``"latest"`` (default) — the
+            callback's own signature with the most recent payload only.
+            ``"batch"`` — ONE argument: the list of every payload tuple
+            since the last call, oldest first.  Payloads are held past the
+            callback that produced them: keep ``MObject``/``MObjectHandle``
+            style references, not transient iterators.
 
         Returns
         -------
@@ -208,8 +344,17 @@ class ScriptJobManager:
             Opaque token for :meth:`unsubscribe`, or ``None`` if the
             registration failed.
         """
+        coalescer = self._make_coalescer(policy, interval, delivery)
+        token = next(self._counter)
+        args = list(register_args)
+        callback = None
+        for i, arg in enumerate(args):
+            if callable(arg):
+                callback = arg
+                args[i] = lambda *payload, t=token: self._on_om_event(t, payload)
+                break
         try:
-            cb_id = register_fn(*register_args)
+            cb_id = register_fn(*args)
         except Exception:
             logger.warning(
                 "ScriptJobManager.add_om_callback: %s failed",
@@ -217,8 +362,7 @@ class ScriptJobManager:
                 exc_info=True,
             )
             return None
-        token = next(self._counter)
-        self._om_subs[token] = _OMSubscription(token, cb_id, owner)
+        self._om_subs[token] = _OMSubscription(token, cb_id, owner, callback, coalescer)
         return token
 
     def unsubscribe(self, token: int) -> None:
@@ -332,10 +476,16 @@ class ScriptJobManager:
         -------
         dict
             ``managed_jobs`` — ``{event: job_id}`` for SJM-owned scriptJobs.
-            ``subscriptions`` — list of dicts (token, event, owner, ephemeral, suppressed).
-            ``om_callbacks`` — list of dicts (token, cb_id, owner) for OpenMaya callbacks.
+            ``subscriptions`` — list of dicts (token, event, owner, ephemeral,
+            suppressed, callback, policy, stats).
+            ``om_callbacks`` — list of dicts (token, cb_id, owner, callback,
+            policy, stats) for OpenMaya callbacks.
             ``unmanaged_jobs`` — raw ``cmds.scriptJob(listJobs=True)`` entries
             whose leading id is not present in ``managed_jobs.values()``.
+
+            ``stats`` holds ``events`` (received), ``calls`` (callbacks run),
+            ``coalesced`` (events absorbed by the policy), ``errors`` and
+            ``total_ms`` / ``mean_ms`` / ``max_ms`` / ``last_ms``.
         """
         managed_ids = set(self._jobs.values())
         unmanaged: List[str] = []
@@ -358,11 +508,21 @@ class ScriptJobManager:
                     "owner": repr(s.owner),
                     "ephemeral": s.ephemeral,
                     "suppressed": t in self._suppressed,
+                    "callback": self._callback_name(s.callback),
+                    "policy": s.coalescer.policy if s.coalescer else "immediate",
+                    "stats": s.stats.as_dict(),
                 }
                 for t, s in self._subs.items()
             ],
             "om_callbacks": [
-                {"token": s.token, "cb_id": s.cb_id, "owner": repr(s.owner)}
+                {
+                    "token": s.token,
+                    "cb_id": s.cb_id,
+                    "owner": repr(s.owner),
+                    "callback": self._callback_name(s.callback),
+                    "policy": s.coalescer.policy if s.coalescer else "immediate",
+                    "stats": s.stats.as_dict(),
+                }
                 for s in self._om_subs.values()
             ],
             "unmanaged_jobs": unmanaged,
@@ -382,14 +542,37 @@ class ScriptJobManager:
                 flags.append("ephemeral")
             if sub["suppressed"]:
                 flags.append("suppressed")
+            if sub["policy"] != "immediate":
+                flags.append(sub["policy"])
             tag = f" ({', '.join(flags)})" if flags else ""
             print(f"    #{sub['token']} {sub['event']} owner={sub['owner']}{tag}")
+            print(f"        {sub['callback']}: {self._format_stats(sub['stats'])}")
         print(f"  OM callbacks ({len(s['om_callbacks'])}):")
         for cb in s["om_callbacks"]:
-            print(f"    #{cb['token']} cb_id={cb['cb_id']} owner={cb['owner']}")
+            tag = f" ({cb['policy']})" if cb["policy"] != "immediate" else ""
+            print(f"    #{cb['token']} cb_id={cb['cb_id']} owner={cb['owner']}{tag}")
+            print(f"        {cb['callback']}: {self._format_stats(cb['stats'])}")
         print(f"  unmanaged Maya scriptJobs ({len(s['unmanaged_jobs'])}):")
         for entry in s["unmanaged_jobs"]:
             print(f"    {entry}")
+        busiest = sorted(
+            s["subscriptions"] + s["om_callbacks"],
+            key=lambda entry: entry["stats"]["total_ms"],
+            reverse=True,
+        )
+        busiest = [b for b in busiest[:5] if b["stats"]["calls"]]
+        if busiest:
+            print("  slowest callbacks (total time):")
+            for entry in busiest:
+                print(
+                    f"    {entry['stats']['total_ms']:9.1f} ms  "
+                    f"{entry['callback']} owner={entry['owner']}"
+                )
+
+    def reset_stats(self) -> None:
+        """Zero every subscription's timing counters (start a fresh profile)."""
+        for sub in list(self._subs.values()) + list(self._om_subs.values()):
+            sub.stats = _CallStats()
 
     def teardown(self) -> None:
         """Kill every managed scriptJob, OM callback, and subscription."""
@@ -447,19 +630,181 @@ class ScriptJobManager:
                 continue
             sub = self._subs.get(token)
             if sub is not None:
-                try:
-                    sub.callback()
-                except Exception:
-                    logger.warning(
-                        "ScriptJobManager: %r listener error (owner=%r)",
-                        event,
-                        sub.owner,
-                        exc_info=True,
-                    )
+                sub.stats.events += 1
+                if sub.coalescer is None:
+                    self._run_subscription(token)
+                else:
+                    self._coalesce(token, sub.coalescer, ())
         # Prune ephemeral subscriptions on scene change
         if event in _SCENE_CHANGE_EVENTS:
             self._prune_ephemerals()
 
+    def _run_subscription(self, token: int) -> None:
+        """Run a scriptJob subscriber now: timed, errors logged not raised."""
+        sub = self._subs.get(token)
+        if sub is None or token in self._suppressed:
+            return
+        start = self._clock()
+        try:
+            sub.callback()
+        except Exception:
+            sub.stats.errors += 1
+            logger.warning(
+                "ScriptJobManager: %r listener error (owner=%r)",
+                sub.event,
+                sub.owner,
+                exc_info=True,
+            )
+        finally:
+            sub.stats.record(self._clock() - start)
+
+    def _on_om_event(self, token: int, payload: Tuple[Any, ...]) -> None:
+        """Timing/coalescing wrapper registered in place of an OM callback."""
+        sub = self._om_subs.get(token)
+        if sub is None:
+            return
+        sub.stats.events += 1
+        if sub.coalescer is None:
+            start = self._clock()
+            try:
+                sub.callback(*payload)
+            except Exception:
+                sub.stats.errors += 1
+                raise
+            finally:
+                sub.stats.record(self._clock() - start)
+            return
+        self._coalesce(token, sub.coalescer, payload)
+
+    def _run_om_subscription(self, token: int) -> None:
+        """Deliver a coalesced OM subscription's accumulated payloads."""
+        sub = self._om_subs.get(token)
+        if sub is None or sub.coalescer is None:
+            return
+        payloads, sub.coalescer.payloads = sub.coalescer.payloads, []
+        if not payloads:
+            return
+        start = self._clock()
+        try:
+            if sub.coalescer.delivery == "batch":
+                sub.callback(payloads)
+            else:
+                sub.callback(*payloads[-1])
+        except Exception:
+            # Deferred: nothing upstream to raise into but the idle loop.
+            sub.stats.errors += 1
+            logger.warning(
+                "ScriptJobManager: OM callback error (owner=%r)",
+                sub.owner,
+                exc_info=True,
+            )
+        finally:
+            sub.stats.record(self._clock() - start)
+
+    # ----------------------------------------------------------- coalescing
+
+    @staticmethod
+    def _make_coalescer(
+        policy: str, interval: float, delivery: str
+    ) -> Optional[_Coalescer]:
+        """Validate a policy; ``None`` for ``"immediate"`` (the fast path)."""
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}; expected one of {POLICIES}.")
+        if delivery not in DELIVERIES:
+            raise ValueError(
+                f"Unknown delivery {delivery!r}; expected one of {DELIVERIES}."
+            )
+        if policy in ("debounce", "throttle") and interval <= 0:
+            raise ValueError(f"policy={policy!r} needs a positive interval.")
+        if policy == "immediate":
+            return None
+        return _Coalescer(policy, interval, delivery)
+
+    def _coalesce(
+        self, token: int, state: _Coalescer, payload: Tuple[Any, ...]
+    ) -> None:
+        """Record one event under *state*'s policy; schedule or run the call."""
+        if token in self._om_subs:
+            if state.delivery == "batch":
+                state.payloads.append(payload)
+            else:
+                state.payloads[:] = [payload]
+
+        if state.policy == "idle":
+            if not state.pending:
+                state.pending = True
+                self._defer(lambda: self._flush(token, state))
+        elif state.policy == "debounce":
+            state.pending = True
+            state.generation += 1
+
+            def _fire(gen=state.generation):
+                if gen == state.generation:  # else superseded by a later event
+                    self._flush(token, state)
+
+            self._start_timer(state.interval, _fire)
+        else:  # throttle
+            wait = state.last_run + state.interval - self._clock()
+            if wait <= 0 and not state.pending:
+                self._flush(token, state)
+            elif not state.pending:
+                state.pending = True
+                self._start_timer(wait, lambda: self._flush(token, state))
+
+    def _flush(self, token: int, state: _Coalescer) -> None:
+        """Run the coalesced call for *token* (a no-op once unsubscribed)."""
+        state.pending = False
+        state.last_run = self._clock()
+        if token in self._om_subs:
+            self._run_om_subscription(token)
+        else:
+            self._run_subscription(token)
+
+    def _defer(self, fn: Callable[[], Any]) -> None:
+        """Run *fn* at Maya idle; immediately in batch (no idle loop there)."""
+        try:
+            if not cmds.about(batch=True):
+                cmds.evalDeferred(fn)
+                return
+        except Exception:
+            pass
+        fn()
+
+    def _start_timer(self, delay: float, fn: Callable[[], Any]) -> None:
+        """Run *fn* after *delay* seconds on the Qt event loop.
+
+        Qt rather than the idle queue: Maya's idle queue stalls during
+        manipulator drags and scrubbing, exactly when throttling matters.
+        Without a ``QApplication`` (batch / mayapy) *fn* runs now.
+        """
+        try:
+            from qtpy import QtCore, QtWidgets
+
+            if QtWidgets.QApplication.instance() is not None:
+                QtCore.QTimer.singleShot(max(int(delay * 1000), 0), fn)
+                return
+        except Exception:
+            pass
+        fn()
+
+    @staticmethod
+    def _callback_name(callback: Any) -> str:
+        """``module.Class.method`` style label for status output."""
+        if callback is None:
+            return "<unknown>"
+        name = getattr(callback, "__qualname__", None) or repr(callback)
+        module = getattr(callback, "__module__", None)
+        return f"{module}.{name}" if module else name
+
+    @staticmethod
+    def _format_stats(stats: Dict[str, Any]) -> str:
+        return (
+            f"{stats['events']} events -> {stats['calls']} calls "
+            f"({stats['coalesced']} coalesced, {stats['errors']} errors), "
+            f"{stats['total_ms']:.1f} ms total, {stats['mean_ms']:.2f} mean, "
+            f"{stats['max_ms']:.2f} max"
+        )
+
     def _remove_om_callback(self, cb_id: Any) -> None:
         """Remove a single OpenMaya callback by id (best effort)."""
         try:
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
+import itertools
+import math
 import random
 
 try:
     import maya.cmds as cmds
+    import maya.api.OpenMaya as om
 except ModuleNotFoundError as error:
     print(__file__, error)
 
@@ -15,6 +18,17 @@ from mayatk.node_utils.attributes._attributes import Attributes
 
 
 class ColorUtils:
+    #: The shared :class:`ColorIndex`, once something asked for it (see
+    #: :meth:`ColorId.color_index`). Every writer below invalidates the nodes
+    #: it touches so an indexed lookup never answers from a stale color.
+    _color_index: Optional["ColorIndex"] = None
+
+    @staticmethod
+    def _invalidate_index(objects) -> None:
+        index = ColorUtils._color_index
+        if index is not None and objects:
+            index.invalidate(objects)
+
     @staticmethod
     def assign_material(obj: str, color: Tuple[float, float, float]) -> str:
         """Assigns a material to an object based on the RGB value. Creates the material if it does not exist."""
@@ -94,6 +108,7 @@ class ColorUtils:
 
         except Exception as e:
             cmds.warning(f"Color assignment failed on {obj}: {e}")
+        cls._invalidate_index(obj)
 
     @classmethod
     def _material_colors(cls, obj: str) -> List[Tuple[float, float, float]]:
@@ -168,6 +183,7 @@ class ColorUtils:
                     cmds.polyColorPerVertex(obj, rgb=color, colorDisplayOption=True)
                 except RuntimeError as e:
                     print(f"Error applying vertex color to {obj}: {e}")
+        ColorUtils._invalidate_index(objects)
 
     @staticmethod
     def get_color_difference(
@@ -239,6 +255,7 @@ class ColorUtils:
             if not cmds.sets(obj, isMember=node):
                 cmds.sets(obj, add=node)
         cls._gc_color_sets()
+        cls._invalidate_index(objects)
         return node
 
     @classmethod
@@ -257,6 +274,7 @@ class ColorUtils:
                 if cmds.sets(obj, isMember=node):
                     cmds.sets(obj, remove=node)
         cls._gc_color_sets()
+        cls._invalidate_index(objects)
 
     @classmethod
     def _gc_color_sets(cls) -> None:
@@ -267,7 +285,555 @@ class ColorUtils:
                 cmds.delete(node)
 
 
+class ColorIndex:
+    """Quantized color lookup behind :meth:`ColorId.get_objects_by_color`.
+
+    Every geometry transform's channel colors -- material, wireframe,
+    outliner, ID set and mean vertex color -- are read in one pass (plugs and
+    vertex colors through the API, materials and ID sets one set at a time
+    rather than one object at a time) and bucketed on a ``BUCKET``-wide RGB
+    grid per channel. A lookup only visits the buckets the tolerance can
+    reach, so its cost follows the number of nearby colors, not the scene
+    size.
+
+    Entries are keyed by UUID (renames and reparents don't strand them) and
+    go stale per node: :meth:`invalidate` marks nodes dirty and the next
+    lookup re-reads just those. ColorId's own writers invalidate what they
+    touch; :meth:`watch` adds DG callbacks for edits made elsewhere (nodes
+    created or deleted, connections made or broken -- material assignment,
+    set membership, vertex-color history -- and edits to a material's
+    ``color``, which dirty every object the material is assigned to, and
+    edits to an indexed transform's or shape's :attr:`DISPLAY_PLUGS`) and
+    drops the whole index on scene change, undo and redo.
+    """
+
+    CHANNELS = ("material", "wireframe", "outliner", "set", "vertex")
+    #: Wireframe and outliner plugs whose edits dirty the node when watched.
+    DISPLAY_PLUGS = frozenset(
+        (
+            "overrideEnabled",
+            "overrideRGBColors",
+            "overrideColorRGB",
+            "overrideColor",
+            "useOutlinerColor",
+            "outlinerColor",
+        )
+    )
+    #: Grid spacing in normalized RGB -- 8-bit colors land 8 values to a bucket.
+    BUCKET = 1.0 / 32
+
+    def __init__(self):
+        self._colors: Dict[str, Dict[str, List[Tuple[float, float, float]]]] = {}
+        self._buckets: Dict[str, Dict[Tuple[int, int, int], set]] = {
+            channel: {} for channel in self.CHANNELS
+        }
+        self._order: Dict[str, int] = {}  # uuid -> scene-order rank
+        self._dirty: set = set()
+        self._dirty_materials: set = set()  # material uuids whose color changed
+        self._watched_materials: Dict[str, int] = {}  # material uuid -> SJM token
+        self._watched_nodes: Dict[str, List[int]] = {}  # transform uuid -> tokens
+        self._watching = False
+        self._built = False
+
+    # -- maintenance ---------------------------------------------------
+
+    @property
+    def is_built(self) -> bool:
+        return self._built
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def invalidate(self, nodes=None) -> None:
+        """Mark *nodes* (names or UUIDs) for re-read; None drops the whole index."""
+        if nodes is None:
+            self._built = False
+            return
+        if isinstance(nodes, str):
+            nodes = [nodes]
+        for node in nodes:
+            if node in self._colors or self._is_uuid(node):
+                self._dirty.add(node)
+                continue
+            for name in cmds.ls(node, long=True) or []:
+                if cmds.objectType(name, isAType="shape"):
+                    parents = cmds.listRelatives(name, parent=True, fullPath=True)
+                    name = parents[0] if parents else name
+                self._dirty.update(cmds.ls(name, uuid=True) or [])
+
+    def build(self) -> None:
+        """Read every geometry transform's colors in one pass."""
+        self._colors.clear()
+        self._order.clear()
+        self._dirty.clear()
+        for buckets in self._buckets.values():
+            buckets.clear()
+        self._dirty_materials.clear()
+        transforms = NodeUtils.list_transforms(geometry=True, long=True)
+        for uuid, colors in self.read_colors(transforms).items():
+            self._store(uuid, colors)
+        self._watch_materials(rewatch=True)
+        self._watch_nodes(transforms, rewatch=True)
+        self._built = True
+
+    def refresh(self) -> None:
+        """Build if never built (or dropped); otherwise re-read the dirty nodes."""
+        if not self._built:
+            self.build()
+            return
+        materials, self._dirty_materials = self._dirty_materials, set()
+        if materials:
+            self.invalidate(self._material_users(materials))
+        dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        live = {}
+        for uuid in dirty:
+            names = cmds.ls(uuid, long=True) or []
+            if names and self._is_geometry_transform(names[0]):
+                live[names[0]] = uuid
+            else:
+                self._discard(uuid)
+                self._unwatch_node(uuid)
+        if live:
+            read = self.read_colors(list(live), bulk=False)
+            for name, uuid in live.items():
+                self._discard(uuid)
+                self._store(uuid, read.get(uuid, {}))
+            self._watch_materials()  # a re-read node may use a new material
+            self._watch_nodes(live)  # ... or be a new one
+
+    def _store(self, uuid: str, colors: Dict[str, list]) -> None:
+        self._order.setdefault(uuid, len(self._order))
+        self._colors[uuid] = colors
+        for channel, values in colors.items():
+            for color in values:
+                key = self._bucket(color)
+                self._buckets[channel].setdefault(key, set()).add(uuid)
+
+    def _discard(self, uuid: str) -> None:
+        for channel, values in self._colors.pop(uuid, {}).items():
+            buckets = self._buckets[channel]
+            for color in values:
+                key = self._bucket(color)
+                members = buckets.get(key)
+                if members is not None:
+                    members.discard(uuid)
+                    if not members:
+                        del buckets[key]
+
+    # -- lookup --------------------------------------------------------
+
+    def query(
+        self,
+        target_color: Tuple[float, float, float],
+        threshold: float = 0.1,
+        channels: Iterable[str] = CHANNELS,
+    ) -> List[str]:
+        """Long names of the nodes with a color on *channels* within *threshold*.
+
+        The match rule is :meth:`ColorUtils.get_color_difference` ``<= threshold``
+        (mean absolute difference), so no component can differ by more than
+        ``3 * threshold`` -- which bounds the buckets worth visiting. Results
+        come back in scene order.
+        """
+        self.refresh()
+        target = tuple(target_color[:3])
+        reach = 3.0 * threshold
+        bounds = [
+            (
+                math.floor((c - reach) / self.BUCKET),
+                math.floor((c + reach) / self.BUCKET),
+            )
+            for c in target
+        ]
+        cell_count = 1
+        for lo, hi in bounds:
+            cell_count *= hi - lo + 1
+
+        matched = set()
+        for channel in channels:
+            buckets = self._buckets[channel]
+            if cell_count <= len(buckets):
+                cells = itertools.product(*(range(lo, hi + 1) for lo, hi in bounds))
+                keys = (k for k in cells if k in buckets)
+            else:
+                keys = (
+                    k
+                    for k in buckets
+                    if all(lo <= i <= hi for i, (lo, hi) in zip(k, bounds))
+                )
+            for key in keys:
+                for uuid in buckets[key]:
+                    if uuid in matched:
+                        continue
+                    if any(
+                        ColorUtils.get_color_difference(color, target) <= threshold
+                        for color in self._colors[uuid][channel]
+                    ):
+                        matched.add(uuid)
+
+        result = []
+        for uuid in sorted(matched, key=self._order.__getitem__):
+            result.extend((cmds.ls(uuid, long=True) or [])[:1])
+        return result
+
+    @classmethod
+    def _bucket(cls, color) -> Tuple[int, int, int]:
+        return tuple(math.floor(c / cls.BUCKET) for c in color[:3])
+
+    @staticmethod
+    def _is_uuid(value: str) -> bool:
+        return len(value) == 36 and value.count("-") == 4 and "|" not in value
+
+    @staticmethod
+    def _is_geometry_transform(name: str) -> bool:
+        shapes = cmds.listRelatives(name, shapes=True, fullPath=True) or []
+        return bool(cmds.ls(shapes, geometry=True))
+
+    # -- reading -------------------------------------------------------
+
+    @classmethod
+    def read_colors(cls, transforms: List[str], bulk: bool = True) -> Dict[str, dict]:
+        """Channel colors per transform, keyed by UUID.
+
+        Returns:
+            (dict): ``{uuid: {channel: [(r, g, b), ...]}}`` holding only the
+                channels that carry a color. Materials can give several.
+
+        *bulk* resolves materials and ID sets by walking each shading group
+        and stamped set once -- right for the whole scene; for a handful of
+        dirty nodes the per-object queries are cheaper.
+        """
+        colors: Dict[str, dict] = {}
+        names: Dict[str, str] = {}  # long name (transform or shape) -> uuid
+        roots: Dict[str, str] = {}  # long transform name -> uuid
+        sel = om.MSelectionList()
+        for name in transforms:
+            try:
+                sel.add(name)
+            except RuntimeError:
+                continue
+        for i in range(sel.length()):
+            path = sel.getDagPath(i)
+            node = om.MFnDagNode(path)
+            uuid = node.uuid().asString()
+            names[path.fullPathName()] = roots[path.fullPathName()] = uuid
+            found = colors.setdefault(uuid, {})
+            wireframe = cls._plug_color(
+                node, "overrideColorRGB", ("overrideEnabled", "overrideRGBColors")
+            )
+            if wireframe:
+                found["wireframe"] = [wireframe]
+            outliner = cls._plug_color(node, "outlinerColor", ("useOutlinerColor",))
+            if outliner:
+                found["outliner"] = [outliner]
+            for c in range(path.childCount()):
+                child = path.child(c)
+                if not child.hasFn(om.MFn.kShape):
+                    continue
+                shape_path = om.MDagPath(path)
+                shape_path.push(child)
+                names[shape_path.fullPathName()] = uuid
+                if child.hasFn(om.MFn.kMesh) and "vertex" not in found:
+                    vertex = cls._mean_vertex_color(shape_path)
+                    if vertex:
+                        found["vertex"] = [vertex]
+
+        if bulk:
+            cls._read_bulk_memberships(colors, names)
+        else:
+            for name, uuid in roots.items():
+                material = ColorUtils._material_colors(name)
+                if material:
+                    colors[uuid]["material"] = material
+                stamped = ColorUtils.get_color_set_color(name)
+                if stamped:
+                    colors[uuid]["set"] = [stamped]
+        return colors
+
+    @staticmethod
+    def _plug_color(node, attr: str, gates: Tuple[str, ...]):
+        try:
+            if not all(node.findPlug(g, False).asBool() for g in gates):
+                return None
+            plug = node.findPlug(attr, False)
+            return tuple(plug.child(i).asFloat() for i in range(3))
+        except RuntimeError:  # not a plug this node carries
+            return None
+
+    @staticmethod
+    def _mean_vertex_color(shape_path):
+        """Mean of the mesh's per-vertex colors, or None without any.
+
+        Vertices with no color assigned read back as -1 and are skipped.
+        """
+        mesh = om.MFnMesh(shape_path)
+        if not mesh.numColorSets:
+            return None
+        try:
+            vertex_colors = mesh.getVertexColors()
+        except RuntimeError:
+            return None
+        total = [0.0, 0.0, 0.0]
+        count = 0
+        for color in vertex_colors:
+            if color.r < 0:
+                continue
+            total[0] += color.r
+            total[1] += color.g
+            total[2] += color.b
+            count += 1
+        return tuple(c / count for c in total) if count else None
+
+    @classmethod
+    def _read_bulk_memberships(cls, colors: Dict[str, dict], names: Dict[str, str]):
+        """Material and ID-set colors by walking each set once, not each object."""
+
+        def owners(members):
+            found = set()
+            for member in cmds.ls(members or [], long=True, objectsOnly=True) or []:
+                uuid = names.get(member)
+                if uuid is not None:
+                    found.add(uuid)
+            return found
+
+        for sg in cmds.ls(type="shadingEngine") or []:
+            members = cmds.sets(sg, query=True)
+            if not members:
+                continue
+            materials = cmds.ls(cmds.listConnections(sg) or [], materials=True) or []
+            values = [
+                tuple(cmds.getAttr(f"{mat}.color")[0])
+                for mat in dict.fromkeys(materials)
+                if Attributes.has_attr(mat, "color")
+            ]
+            if not values:
+                continue
+            for uuid in owners(members):
+                existing = colors[uuid].setdefault("material", [])
+                existing.extend(v for v in values if v not in existing)
+
+        for node in ColorUtils._stamped_sets():
+            members = cmds.sets(node, query=True)
+            if not members:
+                continue
+            stamped = tuple(cmds.getAttr(f"{node}.{ColorUtils._ID_SET_ATTR}")[0])
+            for uuid in owners(members):
+                colors[uuid].setdefault("set", [stamped])
+
+    # -- change tracking -----------------------------------------------
+
+    def watch(self) -> bool:
+        """Keep the index current through DG callbacks; True when installed.
+
+        Owned by this index in :class:`ScriptJobManager`; :meth:`unwatch`
+        removes them all.
+        """
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        mgr.unsubscribe_all(self)
+        self._watched_materials.clear()
+        self._watched_nodes.clear()
+        try:
+            for event in ("SceneOpened", "NewSceneOpened", "Undo", "Redo"):
+                mgr.subscribe(event, self.invalidate, owner=self)
+            for register in (
+                om.MDGMessage.addNodeAddedCallback,
+                om.MDGMessage.addNodeRemovedCallback,
+            ):
+                mgr.add_om_callback(register, self._on_node, "dagNode", owner=self)
+            mgr.add_om_callback(
+                om.MDGMessage.addConnectionCallback, self._on_connection, owner=self
+            )
+        except Exception:  # noqa: BLE001 - batch / no UI: run unwatched
+            mgr.unsubscribe_all(self)
+            self._watching = False
+            return False
+        self._watching = True
+        if self._built:
+            self._watch_materials()
+            self._watch_nodes(cmds.ls(list(self._colors), long=True) or [])
+        return True
+
+    def unwatch(self) -> None:
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        ScriptJobManager.instance().unsubscribe_all(self)
+        self._watched_materials.clear()
+        self._watched_nodes.clear()
+        self._watching = False
+
+    def _watch_materials(self, rewatch: bool = False) -> None:
+        """Attribute-changed callbacks on every material not watched yet.
+
+        *rewatch* first drops the existing ones (a full build: the scene may
+        be a different one).
+        """
+        if not self._watching:
+            return
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        if rewatch:
+            for token in self._watched_materials.values():
+                mgr.unsubscribe(token)
+            self._watched_materials.clear()
+        sel = om.MSelectionList()
+        for material in cmds.ls(materials=True) or []:
+            sel.clear()
+            try:
+                sel.add(material)
+                mobj = sel.getDependNode(0)
+            except RuntimeError:
+                continue
+            uuid = om.MFnDependencyNode(mobj).uuid().asString()
+            if uuid in self._watched_materials:
+                continue
+            token = mgr.add_om_callback(
+                om.MNodeMessage.addAttributeChangedCallback,
+                mobj,
+                self._on_material_attr,
+                owner=self,
+            )
+            if token is not None:
+                self._watched_materials[uuid] = token
+
+    def _watch_nodes(self, transforms: Iterable[str], rewatch: bool = False) -> None:
+        """Attribute-changed callbacks on *transforms* and their shapes.
+
+        Each transform not watched yet gets one callback per node, reporting
+        :attr:`DISPLAY_PLUGS` edits. *rewatch* first drops the existing ones.
+        """
+        if not self._watching:
+            return
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        if rewatch:
+            for uuid in list(self._watched_nodes):
+                self._unwatch_node(uuid)
+        sel = om.MSelectionList()
+        for name in transforms:
+            sel.clear()
+            try:
+                sel.add(name)
+                path = sel.getDagPath(0)
+            except RuntimeError:
+                continue
+            uuid = om.MFnDagNode(path).uuid().asString()
+            if uuid in self._watched_nodes:
+                continue
+            nodes = [path.node()]
+            nodes.extend(
+                child
+                for child in (path.child(c) for c in range(path.childCount()))
+                if child.hasFn(om.MFn.kShape)
+            )
+            tokens = [
+                mgr.add_om_callback(
+                    om.MNodeMessage.addAttributeChangedCallback,
+                    node,
+                    self._on_display_attr,
+                    owner=self,
+                )
+                for node in nodes
+            ]
+            self._watched_nodes[uuid] = [t for t in tokens if t is not None]
+
+    def _unwatch_node(self, uuid: str) -> None:
+        tokens = self._watched_nodes.pop(uuid, None)
+        if tokens:
+            from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+            mgr = ScriptJobManager.instance()
+            for token in tokens:
+                mgr.unsubscribe(token)
+
+    @staticmethod
+    def _material_users(materials: Iterable[str]) -> List[str]:
+        """Long names of the objects (or components) assigned *materials* (UUIDs)."""
+        names = cmds.ls(list(materials)) or []
+        if not names:
+            return []
+        users = []
+        for sg in dict.fromkeys(
+            cmds.listConnections(names, type="shadingEngine") or []
+        ):
+            users.extend(cmds.sets(sg, query=True) or [])
+        return cmds.ls(users, long=True, objectsOnly=True) or []
+
+    def _mark(self, mobj) -> None:
+        """Dirty the transform that owns *mobj* (itself, or a shape's parent)."""
+        try:
+            if mobj.hasFn(om.MFn.kShape):
+                fn = om.MFnDagNode(mobj)
+                if not fn.parentCount():
+                    return
+                mobj = fn.parent(0)
+            if mobj.hasFn(om.MFn.kTransform):
+                self._dirty.add(om.MFnDependencyNode(mobj).uuid().asString())
+        except RuntimeError:
+            pass
+
+    def _on_node(self, mobj, *_):
+        if self._built:
+            self._mark(mobj)
+
+    def _on_material_attr(self, msg, plug, *_):
+        """A watched material's ``color`` was set: its users re-read on next lookup."""
+        if not self._built or not msg & om.MNodeMessage.kAttributeSet:
+            return
+        try:
+            if plug.isChild:  # colorR / colorG / colorB
+                plug = plug.parent()
+            if plug.partialName(useLongNames=True) != "color":
+                return
+            self._dirty_materials.add(
+                om.MFnDependencyNode(plug.node()).uuid().asString()
+            )
+        except RuntimeError:
+            pass
+
+    def _on_display_attr(self, msg, plug, *_):
+        """A wireframe / outliner plug was set: re-read the node on next lookup."""
+        if not self._built or not msg & om.MNodeMessage.kAttributeSet:
+            return
+        try:
+            # Walk up from a child plug: overrideColorR -> overrideColorRGB.
+            while plug.partialName(useLongNames=True) not in self.DISPLAY_PLUGS:
+                if not plug.isChild:
+                    return
+                plug = plug.parent()
+            self._mark(plug.node())
+        except RuntimeError:
+            pass
+
+    def _on_connection(self, src_plug, dst_plug, made, *_):
+        if not self._built:
+            return
+        for plug in (src_plug, dst_plug):
+            # Set membership (shading group or ID set) and vertex-color
+            # history both connect to the member's shape or transform, so
+            # one end of the connection always names the node to re-read.
+            self._mark(plug.node())
+
+
 class ColorId(ColorUtils):
+    @classmethod
+    def color_index(cls, watch: bool = True) -> ColorIndex:
+        """The shared :class:`ColorIndex`, created (and watched) on first use.
+
+        It is built lazily by the first lookup, so asking for it costs nothing.
+        """
+        index = ColorUtils._color_index
+        if index is None:
+            index = ColorUtils._color_index = ColorIndex()
+            if watch:
+                index.watch()
+        return index
+
     @classmethod
     def apply_color(
         cls,
@@ -307,8 +873,25 @@ class ColorId(ColorUtils):
         check_wireframe_color: bool = False,
         check_outliner_color: bool = False,
         check_set: bool = False,
+        use_index: bool = False,
     ) -> List[str]:
-        """Select objects by color, with optional checks for material, vertex, wireframe, and outliner colors."""
+        """Select objects by color, with optional checks for material, vertex, wireframe, and outliner colors.
+
+        ``use_index`` answers from the shared :meth:`color_index` instead of
+        re-reading every object: the first call pays one bulk pass, later
+        calls only re-read nodes whose colors changed since."""
+        if use_index:
+            flags = {
+                "material": check_material_color,
+                "wireframe": check_wireframe_color,
+                "outliner": check_outliner_color,
+                "set": check_set,
+                "vertex": check_vertex_color,
+            }
+            return cls.color_index().query(
+                target_color, threshold, [c for c, on in flags.items() if on]
+            )
+
         matching_objects = []
 
         for obj in NodeUtils.list_transforms(geometry=True, long=True):
@@ -423,6 +1006,7 @@ class ColorId(ColorUtils):
 
         if reset_vertex:
             cls.reset_vertex_colors(objects)
+        cls._invalidate_index(objects)
 
     @staticmethod
     def reset_vertex_colors(objects: List[str]) -> None:
@@ -451,6 +1035,7 @@ class ColorId(ColorUtils):
                             cmds.polyColorSet(shape, delete=True, colorSet=color_set)
                 except RuntimeError as e:
                     print(f"Error removing vertex colors from {shape}: {e}")
+        ColorUtils._invalidate_index(list(shapes))
 
     # Desaturated defaults so swatches aren't all white on first launch.
     DEFAULT_SWATCH_COLORS = [
@@ -700,6 +1285,7 @@ class ColorIdSlots(ColorId):
             check_outliner_color=ch["outliner"],
             check_material_color=ch["material"],
             check_set=ch["set"],
+            use_index=True,
         )
         if found_objects:
             cmds.select(found_objects)
@@ -414,6 +414,83 @@ class _EditUtilsInternal(object):
             for key in a
         )
 
+    #: Rounding precision of :meth:`_duplicate_fingerprint`'s spatial values.
+    _FINGERPRINT_PRECISION = 5
+
+    @classmethod
+    def _duplicate_fingerprint(cls, obj) -> Optional[tuple]:
+        """*obj*'s identity for :meth:`EditUtils.get_overlapping_duplicates`.
+
+        Bounding box min/max (world, rounded), topology counts and sampled
+        vertex positions. Bbox + poly-count alone can match objects that are
+        geometrically different (same counts, same extents but different
+        shapes), producing false positives. None when *obj* can't be safely
+        compared.
+        """
+        _R = cls._FINGERPRINT_PRECISION
+        bbox = cmds.xform(obj, query=True, ws=True, bb=True)
+        if not bbox:
+            return None
+
+        bbox_min = (round(bbox[0], _R), round(bbox[1], _R), round(bbox[2], _R))
+        bbox_max = (round(bbox[3], _R), round(bbox[4], _R), round(bbox[5], _R))
+
+        # Single polyEvaluate call — reuse for both topo hash and vtx count.
+        # Only the INTEGER counts go into the fingerprint: the flagless
+        # dict also carries unrounded object-space floats (boundingBox,
+        # area), which differ between a duplicate and its frozen-transform
+        # twin even when the world-space geometry is identical — the old
+        # str(dict) hash silently missed exactly those duplicates.
+        poly_eval = cmds.polyEvaluate(obj)
+        if not isinstance(poly_eval, dict):
+            return None
+        topo = tuple(
+            poly_eval.get(k, 0)
+            for k in ("vertex", "edge", "face", "triangle", "uvcoord", "shell")
+        )
+
+        # Sample vertex positions for a stronger fingerprint.  The sample
+        # is the ONLY thing distinguishing same-bbox/same-count different
+        # meshes, so an object whose sampling fails is EXCLUDED from
+        # grouping (loudly) rather than degraded to a bbox+counts match —
+        # the degraded mode was this check's false-positive path.
+        try:
+            vtx_count = poly_eval.get("vertex", 0)
+            if vtx_count <= 0:
+                return None
+            # Pick up to 8 evenly-spaced vertex indices
+            sample_count = min(8, vtx_count)
+            step = max(1, vtx_count // sample_count)
+            components = [f"{obj}.vtx[{i * step}]" for i in range(sample_count)]
+            # Batch query — single Maya round-trip for all vertices
+            flat = (
+                cmds.xform(
+                    components,
+                    query=True,
+                    worldSpace=True,
+                    translation=True,
+                )
+                or []
+            )
+            vtx_sample = tuple(
+                (
+                    round(flat[i], _R),
+                    round(flat[i + 1], _R),
+                    round(flat[i + 2], _R),
+                )
+                for i in range(0, len(flat), 3)
+            )
+            if not vtx_sample:
+                raise RuntimeError("empty vertex sample")
+        except Exception as exc:
+            cmds.warning(
+                f"Overlap check skipped '{obj}' — vertex sampling failed "
+                f"({exc}); it cannot be safely compared."
+            )
+            return None
+
+        return (bbox_min, bbox_max, topo, vtx_sample)
+
 
 class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
     """ """
@@ -424,6 +501,26 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
     snap_closest_verts = staticmethod(Snap.snap_to_closest_vertex)
     conform_to_surface = staticmethod(Snap.snap_to_surface)
 
+    #: The shared :class:`~mayatk.edit_utils.mesh_metrics.MeshMetricIndex`,
+    #: once something asked for it (see :meth:`mesh_metric_index`).
+    _mesh_metric_index = None
+
+    @classmethod
+    def mesh_metric_index(cls, watch: bool = True):
+        """The shared mesh-metric index behind :meth:`get_similar_mesh` and
+        :meth:`get_overlapping_duplicates`, created (and watched) on first use.
+
+        It re-measures only meshes whose geometry or transform changed since
+        the last query; call its ``invalidate()`` to force a re-read.
+        """
+        from mayatk.edit_utils.mesh_metrics import MeshMetricIndex
+
+        if EditUtils._mesh_metric_index is None:
+            EditUtils._mesh_metric_index = MeshMetricIndex()
+            if watch:
+                EditUtils._mesh_metric_index.watch()
+        return EditUtils._mesh_metric_index
+
     @staticmethod
     @CoreUtils.undoable
     @CoreUtils.reparent
@@ -1062,6 +1159,8 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
         are reduced (the rest of the mesh, including the region's border, is
         held fixed); verts / edges / UVs reduce the faces they touch — Maya's
         own Reduce-on-components behavior. Both forms mix freely in one call.
+        :meth:`MeshReducer.decimate` runs the same reduce and reports face
+        counts and timing per mesh.
 
         Parameters:
             objects: Mesh transforms and/or poly components (uses the selection
@@ -1078,36 +1177,30 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
         Returns:
             The decimated mesh transforms (owners, for components).
         """
+        from mayatk.edit_utils.mesh_reduce import MeshReducer
+
         targets = _EditUtilsInternal._mesh_targets(objects, "f")
         objects = list(targets)
         if not objects:
             return []
-        pct = max(0.0, min(99.0, float(percentage)))
-        if pct <= 0.0:  # nothing to remove — skip the no-op polyReduce node
+        if percentage <= 0.0:  # nothing to remove — skip the no-op polyReduce node
             return objects
-        # polyReduce rejects multi-object selections ("Doesn't work with multiple
-        # objects selected"), so reduce each mesh independently.
-        for obj, faces in targets.items():
-            cmds.polyReduce(
-                faces or obj,
-                version=1,
-                percentage=pct,
-                keepBorder=preserve_borders,
-                keepFaceGroupBorder=preserve_borders,
-                keepHardEdge=preserve_hard_edges,
-                keepCreaseEdge=preserve_hard_edges,
-                keepMapBorder=preserve_uv_borders,
-                keepColorBorder=preserve_uv_borders,
-                keepQuadsWeight=1.0 if preserve_quads else 0.0,
-                preserveTopology=True,
-                useVirtualSymmetry=1 if symmetry else 0,
-                symmetryTolerance=symmetry_tolerance,
-                replaceOriginal=True,
-                cachingReduce=True,
-                constructionHistory=not delete_history,
-            )
-        if delete_history:
-            cmds.delete(objects, constructionHistory=True)
+        MeshReducer.decimate(
+            targets,
+            percentage=percentage,
+            delete_history=delete_history,
+            keepBorder=preserve_borders,
+            keepFaceGroupBorder=preserve_borders,
+            keepHardEdge=preserve_hard_edges,
+            keepCreaseEdge=preserve_hard_edges,
+            keepMapBorder=preserve_uv_borders,
+            keepColorBorder=preserve_uv_borders,
+            keepQuadsWeight=1.0 if preserve_quads else 0.0,
+            preserveTopology=True,
+            useVirtualSymmetry=1 if symmetry else 0,
+            symmetryTolerance=symmetry_tolerance,
+            cachingReduce=True,
+        )
         return objects
 
     @staticmethod
@@ -1139,6 +1232,10 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
         them (a face region collapses within itself and keeps its outline).
         Both forms mix freely in one call.
 
+        The coplanar test runs on whole-mesh arrays (:class:`MeshReducer`);
+        :meth:`MeshReducer.dissolve` also reports face counts and timing per
+        mesh.
+
         Parameters:
             objects: Mesh transforms and/or poly components (uses the selection
                 when ``None``).
@@ -1148,56 +1245,15 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
         Returns:
             The processed mesh transforms (owners, for components).
         """
+        from mayatk.edit_utils.mesh_reduce import MeshReducer
+
         targets = _EditUtilsInternal._mesh_targets(objects, "e", internal=True)
         objects = list(targets)
         if not objects:
             return []
-        tol = math.radians(max(0.0, float(angle_tolerance)))
-        for obj, edges in targets.items():
-            # Component-scoped: only the given edges are candidates.
-            allowed = (
-                None
-                if edges is None
-                else set(Components.get_component_index(list(edges)) or [])
-            )
-            if allowed is not None and not allowed:
-                continue  # e.g. faces with no interior edges — nothing to dissolve
-            shapes = (
-                cmds.listRelatives(
-                    obj, shapes=True, type="mesh", noIntermediate=True, fullPath=True
-                )
-                or []
-            )
-            if not shapes:
-                continue
-            sel = om.MSelectionList()
-            sel.add(shapes[0])
-            dag = sel.getDagPath(0)
-            mesh = om.MFnMesh(dag)
-            edge_it = om.MItMeshEdge(dag)
-            flat_edges = []
-            while not edge_it.isDone():
-                # Interior edges only — boundary edges are the silhouette.
-                if (allowed is None or edge_it.index() in allowed) and (
-                    not edge_it.onBoundary()
-                ):
-                    faces = edge_it.getConnectedFaces()
-                    if len(faces) == 2:
-                        # Object space: coplanarity is intrinsic to the mesh, so
-                        # the result shouldn't depend on the object's transform.
-                        n0 = mesh.getPolygonNormal(faces[0], om.MSpace.kObject)
-                        n1 = mesh.getPolygonNormal(faces[1], om.MSpace.kObject)
-                        if n0.angle(n1) <= tol:
-                            flat_edges.append(edge_it.index())
-                edge_it.next()
-            if flat_edges:
-                cmds.polyDelEdge(
-                    [f"{obj}.e[{i}]" for i in flat_edges],
-                    cleanVertices=True,
-                    constructionHistory=not delete_history,
-                )
-                if delete_history:
-                    cmds.delete(obj, constructionHistory=True)
+        MeshReducer.dissolve(
+            targets, angle_tolerance=angle_tolerance, delete_history=delete_history
+        )
         return objects
 
     @staticmethod
@@ -2052,75 +2108,9 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
                 if shapes and cmds.nodeType(shapes[0]) == "mesh":
                     scene_objs.append(obj)
 
-        # Fingerprint by bounding box min/max (rounded), topology, and
-        # sampled vertex positions.  Bbox + poly-count alone can match
-        # objects that are geometrically different (same counts, same
-        # extents but different shapes), producing false positives.
-        _R = 5  # Rounding precision for all spatial comparisons
-        obj_fingerprints = {}
-        for obj in scene_objs:
-            bbox = cmds.xform(obj, query=True, ws=True, bb=True)
-            if not bbox:
-                continue
-
-            bbox_min = (round(bbox[0], _R), round(bbox[1], _R), round(bbox[2], _R))
-            bbox_max = (round(bbox[3], _R), round(bbox[4], _R), round(bbox[5], _R))
-
-            # Single polyEvaluate call — reuse for both topo hash and vtx count.
-            # Only the INTEGER counts go into the fingerprint: the flagless
-            # dict also carries unrounded object-space floats (boundingBox,
-            # area), which differ between a duplicate and its frozen-transform
-            # twin even when the world-space geometry is identical — the old
-            # str(dict) hash silently missed exactly those duplicates.
-            poly_eval = cmds.polyEvaluate(obj)
-            if not isinstance(poly_eval, dict):
-                continue
-            topo = tuple(
-                poly_eval.get(k, 0)
-                for k in ("vertex", "edge", "face", "triangle", "uvcoord", "shell")
-            )
-
-            # Sample vertex positions for a stronger fingerprint.  The sample
-            # is the ONLY thing distinguishing same-bbox/same-count different
-            # meshes, so an object whose sampling fails is EXCLUDED from
-            # grouping (loudly) rather than degraded to a bbox+counts match —
-            # the degraded mode was this check's false-positive path.
-            try:
-                vtx_count = poly_eval.get("vertex", 0)
-                if vtx_count <= 0:
-                    continue
-                # Pick up to 8 evenly-spaced vertex indices
-                sample_count = min(8, vtx_count)
-                step = max(1, vtx_count // sample_count)
-                components = [f"{obj}.vtx[{i * step}]" for i in range(sample_count)]
-                # Batch query — single Maya round-trip for all vertices
-                flat = (
-                    cmds.xform(
-                        components,
-                        query=True,
-                        worldSpace=True,
-                        translation=True,
-                    )
-                    or []
-                )
-                vtx_sample = tuple(
-                    (
-                        round(flat[i], _R),
-                        round(flat[i + 1], _R),
-                        round(flat[i + 2], _R),
-                    )
-                    for i in range(0, len(flat), 3)
-                )
-                if not vtx_sample:
-                    raise RuntimeError("empty vertex sample")
-            except Exception as exc:
-                cmds.warning(
-                    f"Overlap check skipped '{obj}' — vertex sampling failed "
-                    f"({exc}); it cannot be safely compared."
-                )
-                continue
-
-            obj_fingerprints[obj] = (bbox_min, bbox_max, topo, vtx_sample)
+        # Fingerprints come from the shared metric index: only meshes whose
+        # geometry or transform changed since the last call are re-measured.
+        obj_fingerprints = EditUtils.mesh_metric_index().fingerprints(scene_objs)
 
         if objects is None:
             selected_set = set(
@@ -2291,90 +2281,52 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
     def get_overlapping_vertices(objects, threshold=0.0003):
         """Query the given objects for overlapping vertices.
 
+        Each mesh's world points are read once and bucketed on a spatial hash
+        (:class:`~mayatk.edit_utils.overlap.MeshOverlaps`), so only nearby
+        points are ever measured.
+
         Parameters:
             objects (str/obj/list): The objects to query.
-            threshold (float) = The maximum allowed distance.
+            threshold (float) = The maximum allowed distance (inclusive).
 
         Returns:
-            (list)
-        """
-        import maya.OpenMaya as om
-
-        result = []
-        for mfnMesh in CoreUtils.get_mfn_mesh(objects, api_version=1):
-            points = om.MPointArray()
-            mfnMesh.getPoints(points, om.MSpace.kWorld)
-
-            for i in range(points.length()):
-                for ii in range(points.length()):
-                    if i == ii:
-                        continue
+            (dict) ``{mesh transform: sorted vertex index array}`` for each mesh
+                with vertices within *threshold* of another of its vertices.
 
-                    dist = points[i].distanceTo(points[ii])
-                    if dist < threshold:
-                        if i not in result:
-                            result.append(i)
+        Example: cmds.select(MeshOverlaps.as_components(result, "vtx"))
+        """
+        from mayatk.edit_utils.overlap import MeshOverlaps
 
-                        if ii not in result:
-                            result.append(ii)
-        return result
+        return MeshOverlaps.vertices(objects, tolerance=threshold)
 
     @classmethod
-    def get_overlapping_faces(cls, objects, delete_history=False):
+    def get_overlapping_faces(cls, objects, delete_history=False, tolerance=0.0003):
         """Get any duplicate overlapping faces of the given objects.
 
+        Faces are compared across all the given meshes: of each set of
+        duplicates the first (in object order, then face index) is kept and
+        the others are returned. Candidates are found by face centroid on a
+        spatial hash, then every corner is compared.
+
         Parameters:
             objects (str/obj/list): Faces or polygon objects.
             delete_history (bool): If True, deletes the history of the objects before processing.
+            tolerance (float): The maximum corner distance for faces to count as duplicates.
 
         Returns:
-            (list) duplicate overlapping faces.
+            (dict) ``{mesh transform: sorted face index array}`` of the duplicates.
 
-        Example: cmds.select(get_overlapping_faces(selection))
+        Example: cmds.select(MeshOverlaps.as_components(result, "f"))
         """
+        from mayatk.edit_utils.overlap import MeshOverlaps
+
         if not objects:
-            return []
+            return {}
 
         if delete_history:
             cmds.delete(objects, constructionHistory=True)
 
-        def get_vertex_positions(face):
-            # Convert face to vertices and get their world positions, then make a tuple to be hashable
-            return tuple(
-                sorted(
-                    tuple(cmds.pointPosition(v, world=True))
-                    for v in cmds.ls(
-                        cmds.polyListComponentConversion(face, toVertex=True),
-                        flatten=True,
-                    )
-                )
-            )
-
-        def find_duplicates(faces):
-            checked = {}
-            duplicates = []
-            for face in faces:
-                positions = get_vertex_positions(face)
-                if positions in checked:
-                    duplicates.append(face)
-                else:
-                    checked[positions] = face
-            return duplicates
-
-        # Ensure the input is a list
-        if isinstance(objects, str):
-            objects = [objects]
-
-        objects = cmds.ls(CoreUtils.as_strings(objects), flatten=True, type="transform")
-
-        faces = []
-        for obj in objects:
-            meshes = cmds.listRelatives(obj, type="mesh", fullPath=True) or []
-            for mesh in meshes:
-                all_faces = cmds.ls(f"{mesh}.f[*]", flatten=True)
-                faces.extend(all_faces)
-
-        return find_duplicates(faces)
+        return MeshOverlaps.faces(objects, tolerance=tolerance)
 
     @staticmethod
     def _get_scene_polygon_transforms():
@@ -2456,27 +2408,16 @@ class EditUtils(ptk.HelpMixin, _EditUtilsInternal):
             )
         }
 
-        otherSceneMeshes = EditUtils._get_scene_polygon_transforms()
-        # One polyEvaluate pass per scene mesh, not one per (query, mesh) pair.
-        metrics = {m: EditUtils._metric_values(m, kwargs) for m in otherSceneMeshes}
+        # The shared index re-evaluates only the scene meshes that changed
+        # since the last query, then compares metric columns in bulk.
+        index = EditUtils.mesh_metric_index()
+        index.refresh()
 
         all_similar = []
         originals = set()
         for obj in objects_list:
             originals.add(obj)
-            objProps = (
-                metrics[obj]
-                if obj in metrics  # a poly mesh: already evaluated above
-                else EditUtils._metric_values(obj, kwargs)
-            )
-
-            similar = [
-                m
-                for m in otherSceneMeshes
-                if m != obj
-                and EditUtils._metrics_are_similar(objProps, metrics[m], tolerance)
-            ]
-            all_similar.extend(similar)
+            all_similar.extend(index.similar(obj, kwargs, tolerance))
 
         # Deduplicate while preserving order
         seen = set()
@@ -0,0 +1,443 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Reusable per-mesh metric index behind the "similar" and "duplicate" queries.
+
+:meth:`EditUtils.get_similar_mesh` used to ``polyEvaluate`` every scene mesh on
+every call (one command per metric per mesh) and compare each query against
+each mesh in Python; :meth:`EditUtils.get_overlapping_duplicates` issued an
+``xform``, a ``polyEvaluate`` and a sampled-vertex ``xform`` per transform.
+Repeating "select similar" in a large set re-paid that whole sweep each time.
+
+:class:`MeshMetricIndex` keeps those results between calls:
+
+* Entries are keyed by UUID (renames and reparents don't strand them) and
+  carry a cheap *signature* read through the API in one pass: vertex / edge /
+  face / UV counts, the shape's object-space bounding box, the world matrix
+  and a few sampled points. A mesh whose signature is unchanged keeps its
+  cached metrics; only changed or new meshes are evaluated again.
+* The signature alone misses an edit that leaves all of that untouched (an
+  unsampled vertex slid inside the box, UVs moved in place). A watched index
+  (:meth:`watch`, as :meth:`EditUtils.mesh_metric_index` sets up) also keeps a
+  node-dirty callback on every indexed mesh shape, and a dirtied mesh is
+  evaluated again on the next query. Unwatched, pass such a mesh to
+  :meth:`invalidate`.
+* Metric values are assembled into NumPy columns per metric set, so one
+  query is a handful of vectorized comparisons over every mesh. The first
+  integer metric (a count) is kept sorted and narrows each query to the
+  tolerance range with ``searchsorted`` before the rest are compared.
+
+The comparison rules are :meth:`EditUtils._metrics_are_similar`'s, applied
+column-wise: counts compare with the caller's tolerance, float metrics with
+its relative floor.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pythontk as ptk
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+# From this package:
+from mayatk.core_utils._core_utils import CoreUtils
+
+
+@dataclass
+class _MeshEntry:
+    name: str
+    signature: tuple
+    metrics: Dict[tuple, list] = field(default_factory=dict)
+    fingerprint: Optional[tuple] = None
+
+
+@dataclass
+class _Column:
+    """One metric across every indexed mesh, in index order."""
+
+    values: np.ndarray  # (n, width) float, NaN-padded
+    widths: np.ndarray  # (n,) values per mesh; -1 when not numeric
+    floats: np.ndarray  # (n,) bool, any float among the values
+    order: Optional[np.ndarray] = None  # argsort of values[:, 0] (count columns)
+
+
+class MeshMetricIndex:
+    """Cached ``polyEvaluate`` metrics and duplicate fingerprints per mesh."""
+
+    #: Points sampled into each signature (evenly spaced vertex ids).
+    SAMPLE_POINTS = 8
+
+    def __init__(self):
+        self._entries: Dict[str, _MeshEntry] = {}  # uuid -> entry
+        self._scene: List[str] = []  # uuids of the last full refresh, in order
+        self._columns: Dict[tuple, Tuple[int, Dict[tuple, _Column]]] = {}
+        self._generation = 0  # bumped whenever a cached metric changes
+        self._stale: set = set()  # uuids dirtied since their signature was read
+        self._watched: Dict[str, int] = {}  # uuid -> ScriptJobManager token
+        self._watching = False
+        self.evaluations = 0
+        """Metric / fingerprint evaluations performed (cache misses)."""
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def invalidate(self, nodes=None) -> None:
+        """Forget the cached values of *nodes* (names or UUIDs); None drops all."""
+        if nodes is None:
+            self._entries.clear()
+            self._scene = []
+        else:
+            names = CoreUtils.as_strings(nodes)
+            uuids = set(names)
+            if names:
+                uuids.update(cmds.ls(names, uuid=True) or [])
+            for uuid in uuids:
+                self._entries.pop(uuid, None)
+        self._columns.clear()
+        self._generation += 1
+
+    # -- refresh ---------------------------------------------------------
+
+    @classmethod
+    def read_signatures(cls, transforms: Iterable[str]) -> Dict[str, Tuple[str, tuple]]:
+        """``{uuid: (long name, signature)}`` of the mesh *transforms*, in order.
+
+        One API pass; transforms without a mesh shape are left out.
+        """
+        found = {}
+        sel = om.MSelectionList()
+        for name in transforms:
+            try:
+                sel.add(name)
+            except RuntimeError:
+                continue
+        for i in range(sel.length()):
+            try:
+                path = sel.getDagPath(i)
+            except (RuntimeError, TypeError):
+                continue
+            shape = cls._mesh_shape(path)
+            if shape is None:
+                continue
+            mesh = om.MFnMesh(shape)
+            box = om.MFnDagNode(shape).boundingBox
+            count = mesh.numVertices
+            step = max(1, count // cls.SAMPLE_POINTS)
+            samples = tuple(
+                tuple(mesh.getPoint(i * step))[:3]
+                for i in range(min(cls.SAMPLE_POINTS, count))
+            )
+            signature = (
+                count,
+                mesh.numEdges,
+                mesh.numPolygons,
+                mesh.numUVs(),
+                tuple(box.min)[:3],
+                tuple(box.max)[:3],
+                tuple(path.inclusiveMatrix()),
+                samples,
+            )
+            uuid = om.MFnDagNode(path).uuid().asString()
+            found[uuid] = (path.fullPathName(), signature)
+        return found
+
+    @staticmethod
+    def _mesh_shape(path):
+        """The first non-intermediate mesh shape under transform *path*."""
+        for c in range(path.childCount()):
+            child = path.child(c)
+            if not child.hasFn(om.MFn.kMesh):
+                continue
+            if om.MFnDagNode(child).isIntermediateObject:
+                continue
+            shape = om.MDagPath(path)
+            shape.push(child)
+            return shape
+        return None
+
+    def refresh(self, names: Optional[Iterable[str]] = None) -> List[str]:
+        """Re-read signatures and drop cached values for the meshes that changed.
+
+        Parameters:
+            names: Mesh transforms to refresh. None refreshes every polygon
+                mesh in the scene and forgets meshes that are gone.
+
+        Returns:
+            (list) Long names of the refreshed meshes, in index order.
+        """
+        if names is None:
+            from mayatk.edit_utils._edit_utils import EditUtils
+
+            transforms = sorted(EditUtils._get_scene_polygon_transforms())
+        else:
+            transforms = CoreUtils.as_strings(names)
+        read = self.read_signatures(transforms)
+        self._update(read, full=names is None)
+        return [name for name, _ in read.values()]
+
+    def _update(self, read: Dict[str, Tuple[str, tuple]], full: bool) -> None:
+        """Apply freshly read signatures; *full* also prunes and reorders."""
+        changed = False
+        for uuid, (name, signature) in read.items():
+            entry = self._entries.get(uuid)
+            if entry is None or entry.signature != signature or uuid in self._stale:
+                self._entries[uuid] = _MeshEntry(name, signature)
+                changed = True
+            elif entry.name != name:
+                entry.name = name  # renamed or reparented: values still hold
+            self._stale.discard(uuid)
+        if full:
+            for uuid in set(self._entries) - set(read):
+                del self._entries[uuid]
+                self._unwatch_mesh(uuid)
+                changed = True
+            if list(read) != self._scene:
+                self._scene = list(read)
+                changed = True
+        if changed:
+            self._columns.clear()
+            self._generation += 1
+        if self._watching:
+            self._watch_meshes({uuid: name for uuid, (name, _) in read.items()})
+
+    # -- change tracking ---------------------------------------------------
+
+    def watch(self) -> bool:
+        """Re-evaluate a mesh whenever its shape is dirtied; True when installed.
+
+        Node-dirty callbacks are added as meshes enter the index, all owned
+        by this index in :class:`ScriptJobManager`; :meth:`unwatch` removes
+        them. A scene change drops the whole index.
+        """
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        mgr.unsubscribe_all(self)
+        self._watched.clear()
+        try:
+            for event in ("SceneOpened", "NewSceneOpened"):
+                mgr.subscribe(event, self._on_scene_change, owner=self)
+        except Exception:  # noqa: BLE001 - batch / no UI: run unwatched
+            mgr.unsubscribe_all(self)
+            self._watching = False
+            return False
+        self._watching = True
+        self._watch_meshes({uuid: e.name for uuid, e in self._entries.items()})
+        return True
+
+    def unwatch(self) -> None:
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        ScriptJobManager.instance().unsubscribe_all(self)
+        self._watched.clear()
+        self._watching = False
+
+    def _watch_meshes(self, names: Dict[str, str]) -> None:
+        """Add a node-dirty callback for each ``{uuid: transform}`` not watched yet."""
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        for uuid, name in names.items():
+            if uuid in self._watched:
+                continue
+            shape = self._shape_object(name)
+            if shape is None:
+                continue
+            token = mgr.add_om_callback(
+                om.MNodeMessage.addNodeDirtyCallback,
+                shape,
+                self._on_dirty,
+                uuid,
+                owner=self,
+            )
+            if token is not None:
+                self._watched[uuid] = token
+
+    def _unwatch_mesh(self, uuid: str) -> None:
+        token = self._watched.pop(uuid, None)
+        if token is not None:
+            from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+            ScriptJobManager.instance().unsubscribe(token)
+
+    @classmethod
+    def _shape_object(cls, name: str):
+        """The ``MObject`` of transform *name*'s mesh shape, or None."""
+        sel = om.MSelectionList()
+        try:
+            sel.add(name)
+            shape = cls._mesh_shape(sel.getDagPath(0))
+        except (RuntimeError, TypeError):
+            return None
+        return shape.node() if shape is not None else None
+
+    def _on_dirty(self, _node, uuid: str) -> None:
+        self._stale.add(uuid)
+
+    def _on_scene_change(self) -> None:
+        for uuid in list(self._watched):
+            self._unwatch_mesh(uuid)
+        self._stale.clear()
+        self.invalidate()
+
+    # -- metrics -----------------------------------------------------------
+
+    @staticmethod
+    def _metric_keys(metrics: Dict[str, Any]) -> Tuple[tuple, ...]:
+        return tuple((key, repr(flag)) for key, flag in metrics.items())
+
+    def metric_values(self, uuid: str, metrics: Dict[str, Any]) -> Dict[str, list]:
+        """Cached :meth:`EditUtils._metric_values` of the indexed mesh *uuid*."""
+        from mayatk.edit_utils._edit_utils import EditUtils
+
+        entry = self._entries[uuid]
+        missing = {
+            key: flag
+            for key, flag in metrics.items()
+            if (key, repr(flag)) not in entry.metrics
+        }
+        if missing:
+            self.evaluations += 1
+            for key, value in EditUtils._metric_values(entry.name, missing).items():
+                entry.metrics[(key, repr(missing[key]))] = value
+            self._columns.clear()
+        return {key: entry.metrics[(key, repr(flag))] for key, flag in metrics.items()}
+
+    def _build_columns(self, metrics: Dict[str, Any]) -> Dict[tuple, _Column]:
+        keys = self._metric_keys(metrics)
+        cached = self._columns.get(keys)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+        rows = [self.metric_values(uuid, metrics) for uuid in self._scene]
+        columns = {}
+        for (key, flag), (name, _) in zip(keys, metrics.items()):
+            columns[(key, flag)] = self._column([row[name] for row in rows])
+        # The first all-integer scalar metric is the range-query key.
+        for column in columns.values():
+            if (column.widths == 1).all() and not column.floats.any():
+                column.order = np.argsort(column.values[:, 0], kind="stable")
+                break
+        self._columns[keys] = (self._generation, columns)
+        return columns
+
+    @staticmethod
+    def _flat(value) -> list:
+        """A metric value as a flat list (bounding-box metrics nest)."""
+        return list(ptk.flatten(ptk.make_iterable(value)))
+
+    @staticmethod
+    def _column(values: List[list]) -> _Column:
+        width = max((len(MeshMetricIndex._flat(v)) for v in values), default=0)
+        array = np.full((len(values), max(width, 1)), np.nan)
+        widths = np.empty(len(values), dtype=np.int64)
+        floats = np.zeros(len(values), dtype=bool)
+        for row, value in enumerate(values):
+            flat = MeshMetricIndex._flat(value)
+            if not all(isinstance(v, (int, float)) for v in flat):
+                widths[row] = -1
+                continue
+            array[row, : len(flat)] = flat
+            widths[row] = len(flat)
+            floats[row] = any(isinstance(v, float) for v in flat)
+        return _Column(array, widths, floats)
+
+    def similar(
+        self,
+        obj: str,
+        metrics: Dict[str, Any],
+        tolerance: float = 0.0,
+    ) -> List[str]:
+        """Indexed meshes whose *metrics* match *obj*'s, in index order.
+
+        Call :meth:`refresh` first. *obj* itself is never returned; when it is
+        not an indexed mesh its metrics are evaluated directly.
+        """
+        from mayatk.edit_utils._edit_utils import EditUtils
+
+        uuid = (cmds.ls(obj, uuid=True) or [None])[0]
+        if uuid in self._entries:
+            query = self.metric_values(uuid, metrics)
+        else:
+            query = EditUtils._metric_values(obj, metrics)
+        columns = self._build_columns(metrics)
+        if not self._scene:
+            return []
+
+        candidates = np.arange(len(self._scene))
+        for (key, _), column in columns.items():
+            if column.order is None:
+                continue
+            q = self._flat(query[key])
+            if len(q) != 1 or not isinstance(q[0], int):
+                break  # a float query gets a relative floor: compare them all
+            ordered = column.values[column.order, 0]
+            lo = np.searchsorted(ordered, q[0] - tolerance, side="left")
+            hi = np.searchsorted(ordered, q[0] + tolerance, side="right")
+            candidates = np.sort(column.order[lo:hi])
+            break
+
+        keep = np.ones(len(candidates), dtype=bool)
+        for (key, _), column in columns.items():
+            q = self._flat(query[key])
+            if not all(isinstance(v, (int, float)) for v in q):
+                return []
+            keep &= column.widths[candidates] == len(q)
+            if not len(q):
+                continue
+            values = column.values[candidates, : len(q)]
+            qv = np.asarray(q, dtype=float)
+            magnitude = np.maximum(
+                np.nan_to_num(np.abs(values)).max(axis=1), np.abs(qv).max()
+            )
+            eps = (
+                EditUtils._WORLD_METRIC_EPS
+                if key in EditUtils._WORLD_SPACE_METRICS
+                else EditUtils._METRIC_FLOAT_EPS
+            )
+            floats = column.floats[candidates] | any(isinstance(v, float) for v in q)
+            limit = np.where(floats, np.maximum(tolerance, eps * magnitude), tolerance)
+            with np.errstate(invalid="ignore"):
+                keep &= (np.abs(values - qv) <= limit[:, None]).all(axis=1)
+
+        return [
+            self._entries[self._scene[i]].name
+            for i in candidates[keep]
+            if self._scene[i] != uuid
+        ]
+
+    # -- duplicate fingerprints --------------------------------------------
+
+    def fingerprints(self, names: Iterable[str]) -> Dict[str, tuple]:
+        """``{long name: fingerprint}`` (:meth:`EditUtils._duplicate_fingerprint`).
+
+        Refreshes *names* and evaluates only the meshes that changed. Meshes
+        whose fingerprint cannot be taken are left out (and warned about each
+        time).
+        """
+        from mayatk.edit_utils._edit_utils import EditUtils
+
+        read = self.read_signatures(CoreUtils.as_strings(names))
+        self._update(read, full=False)
+        result = {}
+        for uuid, (name, _) in read.items():
+            entry = self._entries[uuid]
+            if entry.fingerprint is None:
+                self.evaluations += 1
+                entry.fingerprint = EditUtils._duplicate_fingerprint(name)
+            if entry.fingerprint is not None:
+                result[name] = entry.fingerprint
+        return result
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -0,0 +1,343 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Batched planar dissolve and decimate over many meshes.
+
+:meth:`EditUtils.dissolve_coplanar` used to walk every edge with
+``MItMeshEdge`` and fetch both face normals through the API per edge, and
+both it and :meth:`EditUtils.decimate` deleted history once per mesh. On a
+kitbash set of hundreds of dense meshes the Python side dominated.
+
+:class:`MeshReducer` reads each mesh once and keeps the per-edge work in NumPy:
+
+* Face normals come from the object-space points and face-vertex lists
+  (``MFnMesh.getPoints`` / ``getVertices``) with Newell's method, one array
+  operation for the whole mesh.
+* Edge-face adjacency is a single ``polyInfo -edgeToFace`` per mesh, parsed
+  as one token array (:meth:`MeshReducer.parse_edge_faces`).
+* The dihedral test is an ``arctan2`` of the cross and dot products of each
+  interior edge's two normals, compared against the tolerance at once.
+
+The topology edits stay one Maya command per mesh (``polyDelEdge`` and
+``polyReduce`` are per-object), with the edge list passed as compact ranges,
+and history is deleted for every mesh in one ``delete -ch`` afterward. Each
+mesh yields a :class:`ReduceResult` with its face counts and timing.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pythontk as ptk
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+# From this package:
+from mayatk.core_utils._core_utils import CoreUtils
+from mayatk.core_utils.components import Components
+
+
+@dataclass
+class ReduceResult:
+    """Outcome of one mesh in a :class:`MeshReducer` run."""
+
+    mesh: str
+    faces_before: int
+    faces_after: int
+    edges: int = 0  # edges dissolved; 0 for decimate
+    duration: float = 0.0  # seconds, read + edit (history deletion excluded)
+
+    @property
+    def removed(self) -> int:
+        return self.faces_before - self.faces_after
+
+
+class MeshReducer(ptk.LoggingMixin):
+    """Planar dissolve and decimate for many meshes in one pass."""
+
+    _INDEX = re.compile(r"\[(\d+)(?::(\d+))?\]$")
+
+    @staticmethod
+    def face_normals(
+        points: np.ndarray, counts: np.ndarray, connects: np.ndarray
+    ) -> np.ndarray:
+        """Unit normal per polygon (Newell's method); zero for degenerate faces.
+
+        Parameters:
+            points: ``(N, 3)`` positions.
+            counts: Corner count per polygon.
+            connects: Flat corner (point) indices, polygon after polygon.
+
+        Returns:
+            (np.ndarray) ``(F, 3)`` normals.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        connects = np.asarray(connects, dtype=np.int64)
+        if not len(counts):
+            return np.zeros((0, 3))
+        offsets = np.cumsum(counts) - counts
+        # Each corner's successor within its own polygon.
+        following = np.arange(1, len(connects) + 1)
+        following[offsets + counts - 1] = offsets
+        p = np.asarray(points, dtype=float)[connects]
+        q = p[following]
+        normals = np.add.reduceat(np.cross(p, q), offsets, axis=0)
+        length = np.linalg.norm(normals, axis=1)
+        ok = length > 0
+        normals[ok] /= length[ok, None]
+        normals[~ok] = 0.0
+        return normals
+
+    @staticmethod
+    def parse_edge_faces(info: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Edges with exactly two faces, from ``polyInfo -edgeToFace`` output.
+
+        Lines read ``"EDGE   12:    4    9 \\n"``. Border edges (one face) and
+        non-manifold edges (three or more) are left out.
+
+        Returns:
+            (tuple) ``(edges, faces)``: edge ids ``(E,)`` and their two faces
+                ``(E, 2)``.
+        """
+        tokens = np.array(" ".join(info or []).replace(":", " ").split())
+        heads = np.flatnonzero(tokens == "EDGE")
+        if not len(heads):
+            return np.empty(0, dtype=np.int64), np.empty((0, 2), dtype=np.int64)
+        width = np.diff(np.append(heads, len(tokens))) - 2
+        heads = heads[width == 2]
+        edges = tokens[heads + 1].astype(np.int64)
+        faces = np.stack([tokens[heads + 2], tokens[heads + 3]], axis=1)
+        return edges, faces.astype(np.int64)
+
+    @staticmethod
+    def flat_edges(
+        normals: np.ndarray,
+        edges: np.ndarray,
+        faces: np.ndarray,
+        angle_tolerance: float,
+        allowed: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """The edges whose two faces are within *angle_tolerance* of coplanar.
+
+        Parameters:
+            normals: ``(F, 3)`` unit face normals (zero marks a degenerate face,
+                which never counts as coplanar).
+            edges, faces: Interior edges and their two faces
+                (:meth:`parse_edge_faces`).
+            angle_tolerance: Max dihedral angle, in degrees, inclusive.
+            allowed: Optional edge ids to restrict the result to.
+
+        Returns:
+            (np.ndarray) Sorted edge ids.
+        """
+        if allowed is not None:
+            keep = np.isin(edges, allowed)
+            edges, faces = edges[keep], faces[keep]
+        if not len(edges):
+            return np.empty(0, dtype=np.int64)
+        tol = np.radians(max(0.0, float(angle_tolerance)))
+        a, b = normals[faces[:, 0]], normals[faces[:, 1]]
+        # arctan2 keeps precision near 0 degrees, where arccos(dot) does not.
+        angle = np.arctan2(np.linalg.norm(np.cross(a, b), axis=1), (a * b).sum(axis=1))
+        valid = a.any(axis=1) & b.any(axis=1)
+        return np.sort(edges[valid & (angle <= tol)])
+
+    @classmethod
+    def component_indices(cls, components) -> np.ndarray:
+        """Indices of ``node.e[3]`` / ``node.e[3:9]`` style names, unflattened."""
+        found = []
+        for comp in CoreUtils.as_strings(components):
+            match = cls._INDEX.search(comp)
+            if match is None:  # anything unusual: let Maya flatten it
+                found.extend(Components.get_component_index([comp]) or [])
+                continue
+            start = int(match.group(1))
+            stop = int(match.group(2) or start)
+            found.extend(range(start, stop + 1))
+        return np.unique(np.asarray(found, dtype=np.int64))
+
+    @staticmethod
+    def as_ranges(node: str, component: str, indices: np.ndarray) -> List[str]:
+        """Sorted *indices* as compact component names, e.g. ``"pCube1.e[4:9]"``."""
+        indices = np.unique(np.asarray(indices, dtype=np.int64))
+        if not len(indices):
+            return []
+        breaks = np.flatnonzero(np.diff(indices) != 1)
+        starts = indices[np.r_[0, breaks + 1]]
+        stops = indices[np.r_[breaks, len(indices) - 1]]
+        return [
+            f"{node}.{component}[{a}]" if a == b else f"{node}.{component}[{a}:{b}]"
+            for a, b in zip(starts.tolist(), stops.tolist())
+        ]
+
+    @staticmethod
+    def _shape(transform: str) -> Optional[str]:
+        shapes = (
+            cmds.listRelatives(
+                transform, shapes=True, type="mesh", noIntermediate=True, fullPath=True
+            )
+            or []
+        )
+        return shapes[0] if shapes else None
+
+    @staticmethod
+    def _face_count(shape: str) -> int:
+        return om.MFnMesh(om.MSelectionList().add(shape).getDagPath(0)).numPolygons
+
+    @classmethod
+    def coplanar_edges(
+        cls, transform: str, angle_tolerance: float = 1.0, allowed=None
+    ) -> np.ndarray:
+        """Interior edges of *transform*'s mesh within *angle_tolerance* of flat.
+
+        Normals are object space: coplanarity is intrinsic to the mesh, so the
+        result doesn't depend on the object's transform.
+        """
+        shape = cls._shape(transform)
+        if shape is None:
+            return np.empty(0, dtype=np.int64)
+        fn = om.MFnMesh(om.MSelectionList().add(shape).getDagPath(0))
+        points = np.array(fn.getPoints(om.MSpace.kObject), dtype=float)
+        counts, connects = fn.getVertices()
+        normals = cls.face_normals(
+            points.reshape(-1, 4)[:, :3],
+            np.array(counts, dtype=np.int64),
+            np.array(connects, dtype=np.int64),
+        )
+        edges, faces = cls.parse_edge_faces(cmds.polyInfo(shape, edgeToFace=True) or [])
+        return cls.flat_edges(normals, edges, faces, angle_tolerance, allowed)
+
+    @classmethod
+    @CoreUtils.undoable
+    def dissolve(
+        cls,
+        targets: Dict[str, Optional[List[str]]],
+        angle_tolerance: float = 1.0,
+        delete_history: bool = True,
+    ) -> List[ReduceResult]:
+        """Dissolve the near-coplanar interior edges of every mesh in *targets*.
+
+        Parameters:
+            targets: ``{transform: edge components or None}``; ``None`` means
+                every edge is a candidate (see ``_EditUtilsInternal._mesh_targets``).
+            angle_tolerance: Max dihedral angle (degrees) treated as coplanar.
+            delete_history: Delete construction history afterward (one
+                ``delete -ch`` for all edited meshes).
+
+        Returns:
+            (list) One :class:`ReduceResult` per mesh, in *targets* order.
+        """
+        results, edited = [], []
+        for obj, edges in targets.items():
+            t0 = time.perf_counter()
+            shape = cls._shape(obj)
+            if shape is None:
+                continue
+            before = cls._face_count(shape)
+            allowed = None if edges is None else cls.component_indices(edges)
+            flat = (
+                np.empty(0, dtype=np.int64)
+                if allowed is not None and not len(allowed)
+                else cls.coplanar_edges(obj, angle_tolerance, allowed)
+            )
+            if len(flat):
+                cmds.polyDelEdge(
+                    cls.as_ranges(obj, "e", flat),
+                    cleanVertices=True,
+                    constructionHistory=not delete_history,
+                )
+                edited.append(obj)
+                shape = cls._shape(obj) or shape
+            results.append(
+                ReduceResult(
+                    obj,
+                    before,
+                    cls._face_count(shape),
+                    edges=len(flat),
+                    duration=time.perf_counter() - t0,
+                )
+            )
+        if delete_history and edited:
+            cmds.delete(edited, constructionHistory=True)
+        cls._log(results, "Dissolve")
+        return results
+
+    @classmethod
+    @CoreUtils.undoable
+    def decimate(
+        cls,
+        targets: Dict[str, Optional[List[str]]],
+        percentage: float = 50.0,
+        delete_history: bool = True,
+        **reduce_kwargs,
+    ) -> List[ReduceResult]:
+        """``polyReduce`` every mesh in *targets* toward *percentage*.
+
+        Parameters:
+            targets: ``{transform: face components or None}``.
+            percentage: Percent of faces to remove (``0``–``99``; clamped).
+            delete_history: Delete construction history afterward (one
+                ``delete -ch`` for all meshes).
+            **reduce_kwargs: Further ``polyReduce`` flags.
+
+        Returns:
+            (list) One :class:`ReduceResult` per mesh, in *targets* order.
+        """
+        pct = max(0.0, min(99.0, float(percentage)))
+        results = []
+        for obj, faces in targets.items():
+            t0 = time.perf_counter()
+            shape = cls._shape(obj)
+            if shape is None:
+                continue
+            before = cls._face_count(shape)
+            if pct > 0.0:  # skip the no-op polyReduce node
+                # polyReduce rejects multi-object selections ("Doesn't work
+                # with multiple objects selected"), so one call per mesh.
+                cmds.polyReduce(
+                    faces or obj,
+                    version=1,
+                    percentage=pct,
+                    replaceOriginal=True,
+                    constructionHistory=not delete_history,
+                    **reduce_kwargs,
+                )
+                shape = cls._shape(obj) or shape
+            results.append(
+                ReduceResult(
+                    obj,
+                    before,
+                    cls._face_count(shape),
+                    duration=time.perf_counter() - t0,
+                )
+            )
+        if delete_history and pct > 0.0 and results:
+            cmds.delete([r.mesh for r in results], constructionHistory=True)
+        cls._log(results, "Decimate")
+        return results
+
+    @classmethod
+    def _log(cls, results: List[ReduceResult], label: str) -> None:
+        if not results:
+            return
+        cls.logger.debug(
+            f"{label}: {len(results)} meshes, "
+            f"{sum(r.faces_before for r in results)} -> "
+            f"{sum(r.faces_after for r in results)} faces in "
+            f"{sum(r.duration for r in results):.3f}s"
+        )
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
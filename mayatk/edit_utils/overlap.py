@@ -0,0 +1,303 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tolerance-based overlap detection for vertices and faces.
+
+:meth:`EditUtils.get_overlapping_vertices` used to compare every point with
+every other point in Python, and :meth:`EditUtils.get_overlapping_faces`
+issued one ``pointPosition`` command per vertex per face. Both now run on
+this module:
+
+* :class:`SpatialHash` -- pure NumPy. Points are bucketed on a uniform grid
+  whose cells are at least *tolerance* wide, so any two points within
+  *tolerance* of each other share a cell or sit in adjacent ones. Candidate
+  pairs come from the same cell and 13 "forward" neighbours (each adjacent
+  cell pair is visited once), and only those are measured. The cost follows
+  the point count plus the number of close candidates, not its square.
+* :class:`MeshOverlaps` -- reads each mesh's world points and face topology
+  once through the API and hands whole arrays to :class:`SpatialHash`.
+
+Results are ``{mesh transform: sorted index array}``; only meshes with at
+least one hit appear. :meth:`MeshOverlaps.as_components` turns a result into
+component names for ``cmds.select``.
+"""
+
+from itertools import product
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+# From this package:
+from mayatk.core_utils._core_utils import CoreUtils
+
+
+class SpatialHash:
+    """Close-pair queries over an ``(N, 3)`` point array."""
+
+    #: Cells per axis are capped at this, so a packed cell key always fits an
+    #: int64 however small the tolerance is against the point spread.
+    MAX_CELLS = 2**20
+
+    #: The cell itself and the 13 neighbours "ahead" of it in key order.
+    _OFFSETS = np.array(
+        [(0, 0, 0)] + [o for o in product((-1, 0, 1), repeat=3) if o > (0, 0, 0)],
+        dtype=np.int64,
+    )
+
+    @classmethod
+    def close_pairs(
+        cls, points: np.ndarray, tolerance: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Every pair of points no more than *tolerance* apart.
+
+        Parameters:
+            points: ``(N, 3)`` positions.
+            tolerance: Maximum distance, inclusive. 0 finds coincident points.
+
+        Returns:
+            (tuple) ``(i, j)`` int arrays with ``i < j``, one entry per pair.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        empty = np.empty(0, dtype=np.int64)
+        if len(points) < 2:
+            return empty, empty
+        tolerance = max(float(tolerance), 0.0)
+        origin = points.min(axis=0)
+        span = float((points.max(axis=0) - origin).max())
+        cell = max(tolerance, span / (cls.MAX_CELLS - 2), 1e-12)
+        cells = np.floor((points - origin) / cell).astype(np.int64)
+        # +2: a neighbour one past either end of an axis lands on a slot no
+        # point occupies instead of wrapping onto the next row.
+        dims = cells.max(axis=0) + 2
+
+        def pack(c):
+            return (c[:, 0] * dims[1] + c[:, 1]) * dims[2] + c[:, 2]
+
+        order = np.argsort(pack(cells), kind="stable")
+        keys, start, count = np.unique(
+            pack(cells)[order], return_index=True, return_counts=True
+        )
+        occupied = cells[order[start]]
+
+        limit = tolerance * tolerance
+        found_i, found_j = [], []
+        for offset in cls._OFFSETS:
+            if not offset.any():
+                a = np.flatnonzero(count > 1)
+                b = a
+            else:
+                wanted = pack(occupied + offset)
+                pos = np.searchsorted(keys, wanted)
+                hit = pos < len(keys)
+                hit[hit] = keys[pos[hit]] == wanted[hit]
+                a = np.flatnonzero(hit)
+                b = pos[hit]
+            total = count[a] * count[b]
+            n = int(total.sum())
+            if not n:
+                continue
+            # Expand every cell pair into its point pairs, all at once.
+            pair = np.repeat(np.arange(len(a)), total)
+            local = np.arange(n) - np.repeat(np.cumsum(total) - total, total)
+            width = count[b][pair]
+            ii = start[a][pair] + local // width
+            jj = start[b][pair] + local % width
+            keep = ii < jj if not offset.any() else np.ones(n, dtype=bool)
+            i, j = order[ii[keep]], order[jj[keep]]
+            near = ((points[i] - points[j]) ** 2).sum(axis=1) <= limit
+            found_i.append(i[near])
+            found_j.append(j[near])
+
+        if not found_i:
+            return empty, empty
+        i, j = np.concatenate(found_i), np.concatenate(found_j)
+        return np.minimum(i, j), np.maximum(i, j)
+
+    @classmethod
+    def overlapping(cls, points: np.ndarray, tolerance: float) -> np.ndarray:
+        """Sorted indices of the points with another point within *tolerance*."""
+        i, j = cls.close_pairs(points, tolerance)
+        return np.unique(np.concatenate([i, j]))
+
+    @staticmethod
+    def matching_polygons(
+        points: np.ndarray,
+        counts: np.ndarray,
+        connects: np.ndarray,
+        i: np.ndarray,
+        j: np.ndarray,
+        tolerance: float,
+    ) -> np.ndarray:
+        """Which candidate polygon pairs ``(i[k], j[k])`` cover the same corners.
+
+        Two polygons match when they have the same corner count and every
+        corner of each lies within *tolerance* of a corner of the other, in
+        any winding or starting corner.
+
+        Parameters:
+            points: ``(N, 3)`` corner positions.
+            counts: Corner count per polygon.
+            connects: Flat corner (point) indices, polygon after polygon.
+            i, j: Candidate polygon pairs.
+            tolerance: Maximum corner distance, inclusive.
+
+        Returns:
+            (np.ndarray) Bool mask over the candidates.
+        """
+        counts = np.asarray(counts, dtype=np.int64)
+        connects = np.asarray(connects, dtype=np.int64)
+        offsets = np.cumsum(counts) - counts
+        match = np.zeros(len(i), dtype=bool)
+        same = counts[i] == counts[j]
+        limit = tolerance * tolerance
+        for k in np.unique(counts[i][same]):
+            sel = np.flatnonzero(same & (counts[i] == k))
+            corners = np.arange(k)
+            a = points[connects[offsets[i[sel]][:, None] + corners]]  # (m, k, 3)
+            b = points[connects[offsets[j[sel]][:, None] + corners]]
+            dist = ((a[:, :, None, :] - b[:, None, :, :]) ** 2).sum(axis=3)
+            match[sel] = (dist.min(axis=2).max(axis=1) <= limit) & (
+                dist.min(axis=1).max(axis=1) <= limit
+            )
+        return match
+
+
+class MeshOverlaps:
+    """Overlapping vertices and duplicate faces of Maya meshes, in bulk."""
+
+    @staticmethod
+    def read_meshes(objects) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """World points and face topology of each mesh among *objects*.
+
+        Parameters:
+            objects (str/obj/list): Mesh transforms or shapes. Groups are not
+                descended; components resolve to their mesh.
+
+        Returns:
+            (dict) ``{transform: (points (N, 3), counts, connects)}`` in input
+                order, keyed by long transform name.
+        """
+        meshes = {}
+        names = CoreUtils.as_strings(objects)
+        if not names:  # ls([]) would list the whole scene
+            return meshes
+        for node in cmds.ls(names, objectsOnly=True, long=True) or []:
+            if cmds.objectType(node, isAType="transform"):
+                shapes = (
+                    cmds.listRelatives(
+                        node,
+                        shapes=True,
+                        noIntermediate=True,
+                        type="mesh",
+                        fullPath=True,
+                    )
+                    or []
+                )
+                if not shapes:
+                    continue
+                transform, shape = node, shapes[0]
+            elif cmds.objectType(node, isAType="mesh"):
+                transform = cmds.listRelatives(node, parent=True, fullPath=True)[0]
+                shape = node
+            else:
+                continue
+            if transform in meshes:
+                continue
+            dag = om.MSelectionList().add(shape).getDagPath(0)
+            fn = om.MFnMesh(dag)
+            points = np.array(fn.getPoints(om.MSpace.kWorld), dtype=float)
+            counts, connects = fn.getVertices()
+            meshes[transform] = (
+                points.reshape(-1, 4)[:, :3],
+                np.array(counts, dtype=np.int64),
+                np.array(connects, dtype=np.int64),
+            )
+        return meshes
+
+    @classmethod
+    def vertices(cls, objects, tolerance: float = 0.0003) -> Dict[str, np.ndarray]:
+        """Per mesh, the vertices within *tolerance* of another vertex of that mesh.
+
+        Returns:
+            (dict) ``{transform: sorted vertex indices}``, meshes with hits only.
+        """
+        result = {}
+        for mesh, (points, _, _) in cls.read_meshes(objects).items():
+            hits = SpatialHash.overlapping(points, tolerance)
+            if len(hits):
+                result[mesh] = hits
+        return result
+
+    @classmethod
+    def faces(cls, objects, tolerance: float = 0.0003) -> Dict[str, np.ndarray]:
+        """Per mesh, the faces duplicating an earlier face of any of *objects*.
+
+        Faces are compared across every given mesh; of each set of duplicates
+        the first (in mesh order, then face index) is kept and the rest are
+        reported. Candidates come from face centroids, then every corner is
+        checked (:meth:`SpatialHash.matching_polygons`).
+
+        Returns:
+            (dict) ``{transform: sorted face indices}``, meshes with hits only.
+        """
+        meshes = cls.read_meshes(objects)
+        if not meshes:
+            return {}
+        names = list(meshes)
+        points, counts, connects, owner = [], [], [], []
+        base = 0
+        for n, name in enumerate(names):
+            pts, cnt, con = meshes[name]
+            points.append(pts)
+            counts.append(cnt)
+            connects.append(con + base)
+            owner.append(np.full(len(cnt), n, dtype=np.int64))
+            base += len(pts)
+        points = np.concatenate(points)
+        counts = np.concatenate(counts)
+        connects = np.concatenate(connects)
+        owner = np.concatenate(owner)
+        if not len(counts):
+            return {}
+
+        offsets = np.cumsum(counts) - counts
+        centroids = np.add.reduceat(points[connects], offsets, axis=0) / counts[:, None]
+        i, j = SpatialHash.close_pairs(centroids, tolerance)
+        match = SpatialHash.matching_polygons(points, counts, connects, i, j, tolerance)
+        duplicates = np.unique(j[match])
+
+        face_start = np.cumsum([len(meshes[name][1]) for name in names])
+        face_start = np.concatenate([[0], face_start[:-1]])
+        result = {}
+        for n in np.unique(owner[duplicates]):
+            hits = duplicates[owner[duplicates] == n]
+            result[names[n]] = hits - face_start[n]
+        return result
+
+    @staticmethod
+    def as_components(result: Dict[str, np.ndarray], component: str) -> List[str]:
+        """``{mesh: indices}`` as component names, e.g. ``"pCube1.f[3]"``.
+
+        Parameters:
+            component: ``"vtx"`` or ``"f"``.
+        """
+        return [
+            f"{mesh}.{component}[{int(index)}]"
+            for mesh, indices in result.items()
+            for index in indices
+        ]
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
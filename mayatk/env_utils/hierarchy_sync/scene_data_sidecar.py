@@ -17,7 +17,8 @@ Format v3::
         "paths": [...], "object_count": N, "hash": "...",
         "last_diff": {"missing": [...], "extra": [...], "reparented": [...]}
       },
-      "data_export": {"shot_metadata": {...}, "fbx_takes": [...], ...}
+      "data_export": {"shot_metadata": {...}, "fbx_takes": [...], ...},
+      "export": {"fingerprint": "...", "components": {...}, "outputs": [...]}
     }
 
 - ``hierarchy`` — change-detection baseline: sorted namespace-stripped DAG
@@ -39,6 +40,12 @@ Format v3::
   ``data_internal``: that node's contract is scene-private state that must
   not export, and a sidecar next to the deliverable is a form of export.
   Omitted entirely when the carrier shipped nothing.
+- ``export`` — the incremental-export record: the content fingerprint of
+  the exported nodes and settings (see ``ExportFingerprint``) plus the
+  output file names it produced.  An incremental re-export whose
+  fingerprint matches, with every output still on disk, skips the run.
+  Written only by incremental exports; any other export drops it, so the
+  next incremental run rebuilds.
 
 One file per stem is the contract (2026-08): the previous trio (manifest +
 ``.prev`` backup + ``.hierarchy_diff.txt`` report) cluttered shared
@@ -504,6 +511,7 @@ class SceneDataSidecar:
         *,
         data: Optional[dict] = None,
         last_diff: Optional[dict] = None,
+        export: Optional[dict] = None,
         base_stem: bool = False,
     ) -> Optional[str]:
         """Write the sidecar manifest for *export_path*.
@@ -526,6 +534,9 @@ class SceneDataSidecar:
                 stored as ``hierarchy.last_diff``.  Pass None when the check
                 matched or didn't run — the payload is rebuilt every write,
                 so a clean export drops the previous record.
+            export: The incremental-export record (fingerprint, component
+                hashes, output names), stored as ``export``.  Omitted when
+                None.
             base_stem: If True, strip the version suffix from the path
                 derivation so all versions share one manifest.
 
@@ -550,6 +561,8 @@ class SceneDataSidecar:
             # records no authoring-machine paths (see the pythontk twin, which
             # scrubs the GLB the same way).
             payload["data_export"] = ptk.MeshConvert.without_locate_hints(data)
+        if export:
+            payload["export"] = export
 
         # tmp-then-replace is not just atomicity: a hidden file rejects
         # open('w') outright on Windows, so the manifest can never be
@@ -633,6 +646,24 @@ class SceneDataSidecar:
         section = data.get("data_export")
         return section if isinstance(section, dict) else None
 
+    @classmethod
+    def read_export(
+        cls, export_path: str, *, base_stem: bool = False
+    ) -> Optional[dict]:
+        """Read the incremental-export record from the manifest for *export_path*.
+
+        Returns:
+            The ``export`` section, or ``None`` when no manifest exists or the
+            last export that wrote it was not incremental.
+        """
+        data = cls._load_manifest(
+            cls.manifest_path_for(export_path, base_stem=base_stem)
+        )
+        if data is None:
+            return None
+        section = data.get("export")
+        return section if isinstance(section, dict) else None
+
     # ------------------------------------------------------------------
     # Diff report
     # ------------------------------------------------------------------
@@ -717,6 +717,9 @@ class ReferenceManagerController(ReferenceManager, ptk.LoggingMixin):
     #: into an "...and N more" line).
     DELETE_PROMPT_MAX_NAMES = 10
 
+    #: Browse through the persistent ``WorkspaceIndex`` (see ``WorkspaceManager``).
+    USE_WORKSPACE_INDEX = True
+
     def __init__(self, slot, log_level="WARNING"):
         super().__init__()
         self.logger.setLevel(log_level)
@@ -1378,6 +1381,12 @@ class ReferenceManagerController(ReferenceManager, ptk.LoggingMixin):
         else:
             self.ui.tbl000.setRowCount(0)
 
+    def _on_workspace_index_changed(self, index):
+        """A background index refresh found changes on disk: repopulate the
+        combo (which reloads the selected workspace's file list)."""
+        super()._on_workspace_index_changed(index)
+        self._update_workspace_combo()
+
     def refresh_file_list(self, invalidate=False):
         """Refresh the file list for the table widget."""
         # Row indices change on refresh — invalidate any captured context-menu row
@@ -1419,29 +1428,42 @@ class ReferenceManagerController(ReferenceManager, ptk.LoggingMixin):
             )
             return
 
-        file_list = self.workspace_files.get(workspace_path, [])
-
         # Include Types — the native scan caches every NATIVE_EXTENSIONS type, so a toggle
         # only re-filters (no cache invalidation). Unchecking .mb replaces the old
         # "Hide Binary Files" checkbox; .fbx is native (referenced via the FBX plugin).
         header_menu = self.slot.ui.header.menu
         included = self.slot._included_extensions()
-        file_list = [
-            f for f in file_list if os.path.splitext(f)[1].lower() in included
-        ]
 
         # Check for filter by suffix setting
         filter_suffix = getattr(header_menu, "chk_filter_suffix", None)
         suffix = getattr(header_menu, "txt_suffix", None)
         suffix_text = suffix.text() if suffix else ""
+        suffix_active = bool(
+            filter_suffix and filter_suffix.isChecked() and suffix_text
+        )
+
+        index = self.workspace_index(refresh=False)
+        if index is not None:
+            # Type and suffix filters run inside the index query.
+            file_list = index.scenes(
+                workspace_path,
+                file_types=included,
+                suffix=suffix_text if suffix_active else None,
+            )
+        else:
+            file_list = [
+                f
+                for f in self.workspace_files.get(workspace_path, [])
+                if os.path.splitext(f)[1].lower() in included
+            ]
 
-        if filter_suffix and filter_suffix.isChecked() and suffix_text:
-            filtered_list = []
-            for f in file_list:
-                name_without_ext = os.path.splitext(os.path.basename(f))[0]
-                if name_without_ext.endswith(suffix_text):
-                    filtered_list.append(f)
-            file_list = filtered_list
+            if suffix_active:
+                filtered_list = []
+                for f in file_list:
+                    name_without_ext = os.path.splitext(os.path.basename(f))[0]
+                    if name_without_ext.endswith(suffix_text):
+                        filtered_list.append(f)
+                file_list = filtered_list
 
         # Check for filter by folder structure setting
         filter_structure = getattr(header_menu, "chk_filter_folder_structure", None)
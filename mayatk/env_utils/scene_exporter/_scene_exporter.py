@@ -9,6 +9,7 @@ import maya.mel as mel
 import os
 import re
 import time
+import contextlib
 import base64
 import ctypes
 import shutil
@@ -33,6 +34,11 @@ class SceneExporter(ptk.LoggingMixin):
 
         self.task_manager = TaskManager(self.logger)
         self.logger.debug("Task manager initialized in SceneExporter.")
+        # One record per incremental perform_export call: {"unit", "status",
+        # "changed", "fingerprint"}, status "skipped" / "rebuilt" / "failed",
+        # "changed" naming the fingerprint components that differed from the
+        # last export's record. See incremental_summary.
+        self.incremental_results: List[Dict[str, Any]] = []
 
     def _setup_logging(self, log_level: str, log_handler: Optional[object]) -> None:
         """Setup logging configuration."""
@@ -46,6 +52,26 @@ class SceneExporter(ptk.LoggingMixin):
         self.logger.info(f"Generating log file path: {log_file_path}")
         self.setup_file_logging(log_file_path)
 
+    @staticmethod
+    def objects_for_mode(export_mode: str = "visible") -> List[str]:
+        """The objects an export mode ships: "visible", "selected" or "all".
+
+        Unknown modes fall back to "visible". Resolved when called, so pass
+        ``lambda: SceneExporter.objects_for_mode(mode)`` as ``objects`` to
+        read the scene after it is open.
+        """
+        from maya import cmds
+
+        if export_mode == "selected":
+            return cmds.ls(selection=True, long=True)
+        if export_mode == "all":
+            return cmds.ls(transforms=True, geometry=True, long=True)
+        return DisplayUtils.get_visible_geometry(
+            consider_templated_visible=False,
+            inherit_parent_visibility=True,
+            consider_animated_visible=True,
+        )
+
     def _initialize_objects(
         self, objects: Optional[Union[List[str], Callable]]
     ) -> List:
@@ -109,8 +135,33 @@ class SceneExporter(ptk.LoggingMixin):
         hide_log_file: Optional[bool] = None,
         log_handler: Optional[object] = None,
         tasks: Optional[Dict[str, Any]] = None,
+        profile_report: Optional[bool] = None,
+        slow_task_threshold: Optional[float] = None,
+        incremental: bool = False,
+        force_rebuild: bool = False,
     ) -> Optional[Dict[str, bool]]:
-        """Perform the export operation, including initialization and task management."""
+        """Perform the export operation, including initialization and task management.
+
+        Every task, check and export phase is timed by the task manager's
+        :class:`~mayatk.env_utils.scene_exporter.task_profiler.TaskProfiler`;
+        the slowest are summarized in the log once the run ends.
+
+        Parameters:
+            profile_report: Write the per-task profile as JSON next to the
+                export log (``<name>.profile.json``). Defaults to
+                ``create_log_file``.
+            slow_task_threshold: Seconds above which a task or check is
+                flagged as slow. None keeps the profiler's current threshold.
+            incremental: Fingerprint the export set and settings first
+                (:class:`~.export_fingerprint.ExportFingerprint`)
+                and skip the tasks and the file write when the fingerprint
+                matches the record in the scene-data sidecar and every
+                recorded output still exists. A skipped export returns True.
+                Each run is added to :attr:`incremental_results`. Timestamped
+                output names never match an earlier record.
+            force_rebuild: With *incremental*, export regardless of the
+                record (and refresh it).
+        """
         from maya import cmds
 
         start_time = time.time()  # Track export duration
@@ -157,6 +208,7 @@ class SceneExporter(ptk.LoggingMixin):
         # `version` influences path generation (resolved below); `output_format`
         # selects FBX / GLB / FBX+GLB and is consumed after the FBX is written.
         tasks = dict(tasks) if tasks else {}
+        task_settings = dict(tasks)  # as given, for the incremental fingerprint
         version_format = tasks.pop("version", "") or ""
         # Output format: "fbx" (default), "glb" (GLB only — the FBX is written to
         # a temp dir and discarded after conversion), or "fbx_glb" (both, side by
@@ -274,15 +326,38 @@ class SceneExporter(ptk.LoggingMixin):
         self.export_path = self.generate_export_path(version_format=version_format)
         self.logger.debug(f"Generated export path: {self.export_path}")
 
-        if self.create_log_file:
-            self._setup_file_logging()
-
         # Initialize objects
         initialized_objs = self._initialize_objects(objects)
         if not initialized_objs:
             self.logger.error("Export aborted: No objects available for export.")
             return False
 
+        # Incremental: fingerprint the source state before any task mutates
+        # it, and stop here when the last export of this unit already shipped
+        # it. Stamped (or cleared) every run, like the other per-run modes.
+        self.task_manager._export_record = None
+        unit = None
+        if incremental:
+            unit = self._incremental_check(
+                initialized_objs,
+                {
+                    "tasks": task_settings,
+                    "file_format": file_format,
+                    "export_visible": export_visible,
+                },
+                output_format,
+                version_format,
+                force_rebuild,
+            )
+            if unit["status"] == "skipped":
+                return True
+
+        # Opened only once the export is going ahead: an early return above
+        # would leave the handler attached and, for a versioned series, a log
+        # named after a version that is never written.
+        if self.create_log_file:
+            self._setup_file_logging()
+
         # Apply preset before running tasks
         if self.preset_file:
             self.load_fbx_export_preset(self.preset_file, verify=True)
@@ -294,6 +369,12 @@ class SceneExporter(ptk.LoggingMixin):
         self.task_manager.export_path = self.export_path
         self.task_manager._version_format = version_format
 
+        profiler = self.task_manager.profiler
+        if profiler is not None:
+            if slow_task_threshold is not None:
+                profiler.slow_threshold = slow_task_threshold
+            profiler.start()
+
         export_succeeded = False
         try:
             # Run tasks and checks
@@ -379,13 +460,14 @@ class SceneExporter(ptk.LoggingMixin):
                 from mayatk.env_utils.fbx_utils import FbxUtils
 
                 with FbxUtils.embed_media_write_cwd():
-                    cmds.file(
-                        fbx_write_path,
-                        force=True,
-                        options="v=0;",
-                        type=file_format,
-                        exportSelected=True,
-                    )
+                    with self._profile_phase("fbx_write"):
+                        cmds.file(
+                            fbx_write_path,
+                            force=True,
+                            options="v=0;",
+                            type=file_format,
+                            exportSelected=True,
+                        )
                 export_succeeded = True
 
                 # GLB conversion. For GLB-only, convert the temp FBX then move the
@@ -395,9 +477,10 @@ class SceneExporter(ptk.LoggingMixin):
                 # is written alongside it *after* the banner.
                 deliverable_path = self.export_path
                 if glb_only:
-                    glb_path = self.task_manager.create_glb(
-                        fbx_path=fbx_write_path, announce=False
-                    )
+                    with self._profile_phase("create_glb"):
+                        glb_path = self.task_manager.create_glb(
+                            fbx_path=fbx_write_path, announce=False
+                        )
                     if not (glb_path and os.path.exists(glb_path)):
                         self.logger.error(
                             "GLB-only export failed: FBX→GLB conversion produced "
@@ -417,7 +500,8 @@ class SceneExporter(ptk.LoggingMixin):
                 # hierarchy diff compare against a phantom. Keyed off the
                 # logical export path (output dir + stem), independent of
                 # where the FBX was actually written.
-                self.task_manager.write_scene_data_sidecar()
+                with self._profile_phase("write_scene_data_sidecar"):
+                    self.task_manager.write_scene_data_sidecar()
 
                 # Build the single, consolidated success banner. Measure the
                 # duration here (vs. right after the FBX write) so GLB-only
@@ -447,7 +531,8 @@ class SceneExporter(ptk.LoggingMixin):
                 # message isn't visually preceded by an unrelated GLB error if
                 # conversion fails.
                 if create_glb_enabled and not glb_only:
-                    self.task_manager.create_glb()
+                    with self._profile_phase("create_glb"):
+                        self.task_manager.create_glb()
             except Exception as e:
                 self.logger.error(f"Failed to export objects: {e}")
                 raise RuntimeError(f"Failed to export objects: {e}")
@@ -457,6 +542,16 @@ class SceneExporter(ptk.LoggingMixin):
                 if self.create_log_file:
                     self.close_file_handlers()
         finally:
+            if unit is not None and not export_succeeded:
+                unit["status"] = "failed"
+            # Closed first, so a failing restore below cannot leave the
+            # session open (and every later run nested inside it).
+            if profiler is not None:
+                profiler.stop()
+                self._report_task_profile(
+                    create_log_file if profile_report is None else profile_report,
+                    export_succeeded,
+                )
             # Scene state the FBX write itself reads (working linear unit,
             # active workspace) is staged rather than set_/revert_-paired,
             # because that pairing fires before the write. Undo it here, on
@@ -677,6 +772,153 @@ class SceneExporter(ptk.LoggingMixin):
         base_name = os.path.splitext(os.path.basename(export_path))[0]
         return os.path.join(self.export_dir, f"{base_name}.log")
 
+    def incremental_summary(self, reset: bool = False) -> Dict[str, List[str]]:
+        """Log and return the skipped / rebuilt / failed units of the batch so far.
+
+        Parameters:
+            reset: Start a new batch afterwards.
+
+        Returns:
+            (dict) ``{"skipped": [...], "rebuilt": [...], "failed": [...]}``
+                of unit (output file) names.
+        """
+        summary = {"skipped": [], "rebuilt": [], "failed": []}
+        for unit in self.incremental_results:
+            summary[unit["status"]].append(unit["unit"])
+        if self.incremental_results:
+            lines = [
+                f"Skipped (unchanged): {len(summary['skipped'])}",
+                f"Rebuilt: {len(summary['rebuilt'])}",
+            ]
+            if summary["failed"]:
+                lines.append(f"Failed: {len(summary['failed'])}")
+            lines += [""] + [
+                f"{u['status']}: {u['unit']}"
+                + (f" ({', '.join(u['changed'])})" if u["changed"] else "")
+                for u in self.incremental_results
+            ]
+            self.logger.log_box("INCREMENTAL EXPORT", lines, level="INFO")
+        if reset:
+            self.incremental_results.clear()
+        return summary
+
+    def _incremental_outputs(self, output_format: str) -> List[str]:
+        """File names the export writes into the output dir for *output_format*."""
+        fbx = os.path.basename(self.export_path)
+        glb = os.path.splitext(fbx)[0] + ".glb"
+        return {"glb": [glb], "fbx_glb": [fbx, glb]}.get(output_format, [fbx])
+
+    def _incremental_check(
+        self,
+        objects: List[str],
+        settings: Dict[str, Any],
+        output_format: str,
+        version_format: str,
+        force_rebuild: bool,
+    ) -> Dict[str, Any]:
+        """Fingerprint this export unit and decide whether it must be rebuilt.
+
+        A rebuild stamps the record (fingerprint + outputs) on the task manager,
+        and ``write_scene_data_sidecar`` stores it once the deliverable exists,
+        so an export that fails never records a fingerprint it did not ship.
+
+        Returns:
+            (dict) The unit's entry in :attr:`incremental_results`.
+        """
+        from mayatk.env_utils.scene_exporter.export_fingerprint import (
+            ExportFingerprint,
+        )
+
+        record = ExportFingerprint.compute(
+            objects, settings=settings, preset_file=self.preset_file
+        )
+        record["outputs"] = self._incremental_outputs(output_format)
+        previous = SceneDataSidecar.read_export(
+            self.export_path, base_stem=bool(version_format)
+        )
+        changed = (
+            ExportFingerprint.changed_components(previous, record)
+            if previous
+            else ["no previous record"]
+        )
+        # Versioned series: the record names the version that shipped, which
+        # is what must still exist -- not the next version about to be named.
+        outputs = (previous or {}).get("outputs") or []
+        missing = [
+            o for o in outputs if not os.path.exists(os.path.join(self.export_dir, o))
+        ]
+        unit = {
+            "unit": record["outputs"][0],
+            "status": "rebuilt",
+            "changed": changed,
+            "fingerprint": record["fingerprint"],
+        }
+        if force_rebuild:
+            unit["changed"] = ["forced"]
+        elif not changed and outputs and not missing:
+            unit["status"] = "skipped"
+            unit["unit"] = outputs[0]
+            self.logger.success(
+                f"Unchanged since the last export — skipped: "
+                f"{os.path.join(self.export_dir, outputs[0])}"
+            )
+        elif not changed:
+            unit["changed"] = ["outputs missing"]
+        if unit["status"] == "rebuilt":
+            self.logger.info(
+                f"Incremental: rebuilding {unit['unit']} "
+                f"({', '.join(unit['changed'])})."
+            )
+            self.task_manager._export_record = record
+        self.incremental_results.append(unit)
+        return unit
+
+    def generate_profile_report_path(self, export_path: str) -> str:
+        """Generate the profile report path, beside the log file."""
+        base_name = os.path.splitext(os.path.basename(export_path))[0]
+        return os.path.join(self.export_dir, f"{base_name}.profile.json")
+
+    def _profile_phase(self, name: str):
+        """Measure an export phase (outside the task pipeline) as one entry."""
+        profiler = self.task_manager.profiler
+        if profiler is None or not profiler.active:
+            return contextlib.nullcontext()
+        return profiler.measure(name, kind="export")
+
+    def _report_task_profile(self, write_report: bool, succeeded: bool) -> None:
+        """Log the profile summary, flag slow entries and optionally write the JSON.
+
+        Runs from ``perform_export``'s ``finally``, so it never raises: a
+        report that cannot be written must not mask the export's own outcome.
+        """
+        profiler = self.task_manager.profiler
+        if profiler is None or not profiler.entries:
+            return
+        lines = profiler.summary_lines()
+        if write_report:
+            path = self.generate_profile_report_path(self.export_path)
+            try:
+                profiler.write_json(
+                    path,
+                    export_path=self.export_path,
+                    succeeded=succeeded,
+                    failed_checks=list(
+                        getattr(self.task_manager, "_last_failed_checks", [])
+                    ),
+                )
+            except (OSError, TypeError, ValueError) as e:
+                self.logger.warning(f"Could not write profile report {path}: {e}")
+            else:
+                lines += ["", f"Report: {path}"]
+                if self.hide_log_file and os.name == "nt":
+                    ctypes.windll.kernel32.SetFileAttributesW(path, 2)
+        self.logger.log_box("TASK PROFILE", lines, level="INFO")
+        for entry in profiler.slow_entries:
+            self.logger.warning(
+                f"Slow {entry.kind}: {entry.name} took {entry.wall_time:.1f}s "
+                f"(threshold {profiler.slow_threshold:g}s)."
+            )
+
     def setup_file_logging(self, log_file_path: str):
         """Setup file logging to log actions during export."""
         file_handler = logging.FileHandler(log_file_path)
@@ -952,6 +1194,42 @@ class SceneExporterSlots(SceneExporter):
             setChecked=False,
             setToolTip="Export a log file along with the fbx.",
         )
+        widget.menu.add(
+            "QCheckBox",
+            setText="Create Profile Report",
+            setObjectName="b014",
+            setChecked=False,
+            setToolTip="Write a per-task timing report (<name>.profile.json) "
+            "beside the fbx: wall time, Maya command count and peak memory "
+            "delta of every task, check and export phase.",
+        )
+        widget.menu.add(
+            "QDoubleSpinBox",
+            setPrefix="Slow Task: ",
+            setSuffix=" s",
+            setObjectName="s000",
+            set_limits=[0, 3600, 0.5, 1],
+            setValue=5.0,
+            setToolTip="Flag tasks and checks that take at least this long "
+            "(seconds) in the export log. 0 = never flag.",
+        )
+        widget.menu.add(
+            "QCheckBox",
+            setText="Incremental Export",
+            setObjectName="b015",
+            setChecked=False,
+            setToolTip="Skip the tasks and the file write when the exported "
+            "nodes (geometry, transforms, materials, animation) and the export "
+            "settings are unchanged since the last export to this file.",
+        )
+        widget.menu.add(
+            "QCheckBox",
+            setText="Force Rebuild",
+            setObjectName="b016",
+            setChecked=False,
+            setToolTip="With Incremental Export: export even when nothing "
+            "changed, and refresh the recorded fingerprint.",
+        )
         widget.menu.add(
             self.sb.registered_widgets.ComboBox,
             setObjectName="cmb003",  # Renamed from cmb001 to avoid collision
@@ -981,6 +1259,14 @@ class SceneExporterSlots(SceneExporter):
                             "each FBX.",
                             "<b>Log Level</b> — DEBUG / INFO / WARNING / ERROR / "
                             "CRITICAL output verbosity.",
+                            "<b>Create Profile Report</b> — write per-task "
+                            "timings as JSON next to each FBX; the slowest "
+                            "tasks are summarized in the log either way.",
+                            "<b>Slow Task</b> — seconds after which a task or "
+                            "check is flagged as slow.",
+                            "<b>Incremental Export</b> — skip exports whose "
+                            "content and settings are unchanged; <b>Force "
+                            "Rebuild</b> exports anyway.",
                         ],
                     ),
                 ],
@@ -1487,25 +1773,7 @@ class SceneExporterSlots(SceneExporter):
         export_mode = task_params.pop("export_visible_objects", "visible")
 
         def objects_to_export():
-            from maya import cmds
-
-            if export_mode == "visible":
-                return DisplayUtils.get_visible_geometry(
-                    consider_templated_visible=False,
-                    inherit_parent_visibility=True,
-                    consider_animated_visible=True,
-                )
-            elif export_mode == "selected":
-                return cmds.ls(selection=True, long=True)
-            elif export_mode == "all":
-                return cmds.ls(transforms=True, geometry=True, long=True)
-            else:
-                # Default to visible if unknown mode
-                return DisplayUtils.get_visible_geometry(
-                    consider_templated_visible=False,
-                    inherit_parent_visibility=True,
-                    consider_animated_visible=True,
-                )
+            return self.objects_for_mode(export_mode)
 
         # Output format (FBX / GLB / FBX+GLB) is the cmb004 Settings row, not
         # the task list; fold it into the tasks payload perform_export consumes.
@@ -1525,7 +1793,13 @@ class SceneExporterSlots(SceneExporter):
             create_log_file=self.ui.b011.isChecked(),
             log_level=self.ui.cmb003.currentData(),  # Updated from cmb001 to cmb003
             tasks=export_tasks,
+            profile_report=self.ui.b014.isChecked(),
+            slow_task_threshold=self.ui.s000.value(),
+            incremental=self.ui.b015.isChecked(),
+            force_rebuild=self.ui.b016.isChecked(),
         )
+        if self.ui.b015.isChecked():
+            self.incremental_summary(reset=True)
 
         output_dir = self.ui.txt000.text()
         self.save_output_dir(output_dir)
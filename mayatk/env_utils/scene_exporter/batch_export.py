@@ -0,0 +1,289 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Batch export farm: export many scene files across local headless ``mayapy`` workers.
+
+``SceneExporter.perform_export`` exports the *open* scene. A batch of scene files is
+embarrassingly parallel — each file is opened, run through the task pipeline and
+written on its own — so ``BatchExporter`` hands one job per scene to a pool of
+headless workers:
+
+1. Each scene gets a job file (JSON): the scene, the ``perform_export`` keyword
+   arguments, the export mode and where the worker writes its result.
+2. The *launcher* runs the job. The default, :class:`MayapyExportLauncher`, starts a
+   headless ``mayapy`` on ``templates/_export_scene.py``, which opens the scene, runs
+   ``SceneExporter().perform_export(...)`` and writes a result JSON (success, export
+   path, failed checks, incremental status, traceback). Any callable
+   ``launcher(job) -> None`` that writes ``job["output"]`` works — tests use an
+   in-process fake.
+3. Jobs are yielded as they finish (:meth:`BatchExporter.iter_run`), so a caller —
+   the panel, a CI script — reports progress while the rest of the pool works.
+
+Every job runs in its own process: a worker that crashes, hangs past ``timeout`` or
+exits without a result fails (and is retried) alone, never the batch. An export the
+worker *reported* as failed — blocked by checks, no objects — is not retried; the
+same scene would fail the same way. Workers never share a scene, so with enough
+cores the wall time approaches the slowest single scene (plus Maya start-up per job).
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import pythontk as ptk
+from mayatk.anim_utils.smart_bake.distributed_bake import MayapyLauncher
+
+_EXPORT_TEMPLATE = Path(__file__).parent / "templates" / "_export_scene.py"
+
+
+@dataclass
+class ExportJob:
+    """One scene file of a batch and what became of it."""
+
+    index: int
+    scene: str
+    export_dir: Optional[str] = None
+    status: str = "pending"
+    """``pending``, ``running``, ``done``, ``failed`` or ``skipped``
+    (an incremental export that found nothing to ship)."""
+    attempts: int = 0
+    duration: float = 0.0
+    """Seconds of the last attempt, as the driver measured it."""
+    error: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+    """The worker's result record (see ``templates/_export_scene.py``)."""
+
+    @property
+    def export_path(self) -> Optional[str]:
+        return self.result.get("export_path")
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed", "skipped")
+
+    @property
+    def reason(self) -> str:
+        """The last line of :attr:`error` (a worker traceback ends in the cause)."""
+        lines = (self.error or "").strip().splitlines()
+        return lines[-1] if lines else ""
+
+
+class MayapyExportLauncher(MayapyLauncher):
+    """Runs one scene export in a headless ``mayapy``.
+
+    Parameters:
+        mayapy: Interpreter to run; None resolves this host's own ``mayapy``.
+        timeout: Seconds before a worker is killed (its job then fails or
+            retries). Exports run the full task pipeline, hence the longer
+            default than a bake chunk's.
+    """
+
+    template = _EXPORT_TEMPLATE
+    script_prefix = "scene_export"
+
+    def __init__(self, mayapy: Optional[str] = None, timeout: float = 1800):
+        super().__init__(mayapy=mayapy, timeout=timeout)
+
+
+class BatchExporter(ptk.LoggingMixin):
+    """Export a list of scene files in parallel headless workers.
+
+    Example:
+        >>> farm = BatchExporter(workers=6, retries=1)
+        >>> for job in farm.iter_run(scenes, export_dir="D:/out", tasks={...}):
+        ...     print(job.scene, job.status, job.export_path)
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        launcher: Optional[Callable[[dict], None]] = None,
+        timeout: Optional[float] = None,
+        retries: int = 1,
+        keep_temp: bool = False,
+    ):
+        """Initialize the farm.
+
+        Parameters:
+            workers: Concurrent workers. 0 (default) uses one per CPU core but
+                one, leaving the interactive session a core.
+            launcher: Callable run once per job (a dict with ``scene``,
+                ``export_dir``, ``export_mode``, ``kwargs``, ``output``,
+                ``job_file`` and ``sys_path``); it must write ``output`` (the
+                result JSON) or raise. None uses ``MayapyExportLauncher()``.
+            timeout: Seconds per job, applied to the default launcher. None
+                keeps the launcher's own.
+            retries: Extra attempts for a job whose worker crashed, timed out
+                or wrote no result. Reported export failures are not retried.
+            keep_temp: Keep the scratch folder (job and result files) for
+                debugging instead of removing it after the batch.
+        """
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.launcher = launcher or MayapyExportLauncher()
+        if timeout is not None and hasattr(self.launcher, "timeout"):
+            self.launcher.timeout = timeout
+        self.retries = max(0, int(retries))
+        self.keep_temp = keep_temp
+        self.jobs: List[ExportJob] = []
+        """Jobs of the last batch, in scene order."""
+
+    def _write_job(self, job: ExportJob, folder: str, mode: str, kwargs: dict) -> dict:
+        stem = f"job_{job.index:04d}_{job.attempts}"
+        spec = {
+            "scene": job.scene,
+            "export_dir": job.export_dir,
+            "export_mode": mode,
+            "kwargs": kwargs,
+            "output": os.path.join(folder, f"{stem}.result.json").replace("\\", "/"),
+            "job_file": os.path.join(folder, f"{stem}.json").replace("\\", "/"),
+            # The worker imports mayatk (and pythontk) from wherever this session does.
+            "sys_path": [p for p in sys.path if p],
+        }
+        with open(spec["job_file"], "w", encoding="utf-8") as f:
+            json.dump(spec, f, indent=2, default=str)
+        return spec
+
+    def _run_job(self, spec: dict) -> Dict[str, Any]:
+        """Run *spec* through the launcher and read back the worker's result."""
+        self.launcher(spec)
+        if not os.path.isfile(spec["output"]):
+            raise RuntimeError("worker exited without writing its result")
+        with open(spec["output"], encoding="utf-8") as f:
+            return json.load(f)
+
+    def iter_run(
+        self,
+        scenes: Sequence[str],
+        export_dir: Optional[str] = None,
+        export_mode: str = "visible",
+        **export_kwargs,
+    ) -> Iterator[ExportJob]:
+        """Export *scenes*, yielding each job as soon as it is final.
+
+        Parameters:
+            scenes: Scene files to export.
+            export_dir: Output folder for every scene. None exports each one
+                alongside its scene file.
+            export_mode: ``visible``, ``selected`` or ``all`` — as the panel's
+                Export combo (``SceneExporter.objects_for_mode``).
+            **export_kwargs: Forwarded to ``SceneExporter.perform_export`` in
+                each worker (``tasks``, ``preset_file``, ``output_name``,
+                ``incremental``, ...). Must be JSON-serializable.
+
+        Yields:
+            (ExportJob) In completion order, each with its final status.
+        """
+        self.jobs = [
+            ExportJob(index=i, scene=os.path.abspath(s), export_dir=export_dir)
+            for i, s in enumerate(scenes)
+        ]
+        if not self.jobs:
+            return
+        folder = tempfile.mkdtemp(prefix="mayatk_batch_export_")
+        t0 = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+
+                def submit(job: ExportJob):
+                    job.attempts += 1
+                    job.status = "running"
+                    spec = self._write_job(job, folder, export_mode, export_kwargs)
+                    return pool.submit(self._timed, self._run_job, spec)
+
+                running = {submit(job): job for job in self.jobs}
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job = running.pop(future)
+                        job.duration, result, error = future.result()
+                        if error is not None and job.attempts <= self.retries:
+                            self.logger.warning(
+                                f"Batch export: {job.scene} attempt {job.attempts} "
+                                f"failed ({error}); retrying."
+                            )
+                            running[submit(job)] = job
+                            continue
+                        self._finish(job, result, error)
+                        yield job
+        finally:
+            if not self.keep_temp:
+                shutil.rmtree(folder, ignore_errors=True)
+        self.logger.info(
+            f"Batch export: {len(self.jobs)} scene(s) in "
+            f"{time.perf_counter() - t0:.1f}s across {self.workers} worker(s)."
+        )
+
+    @staticmethod
+    def _timed(fn: Callable, spec: dict):
+        """``(seconds, result, error)`` of ``fn(spec)``; never raises."""
+        t0 = time.perf_counter()
+        try:
+            result, error = fn(spec), None
+        except Exception as e:  # one bad worker fails its job, not the pool
+            result, error = {}, str(e) or type(e).__name__
+        return time.perf_counter() - t0, result, error
+
+    def _finish(
+        self, job: ExportJob, result: Dict[str, Any], error: Optional[str]
+    ) -> None:
+        job.result = result or {}
+        if error is not None:
+            job.status, job.error = "failed", error
+        elif not job.result.get("success"):
+            job.status = "failed"
+            job.error = job.result.get("error") or "export reported failure"
+        elif job.result.get("incremental") == "skipped":
+            job.status = "skipped"
+        else:
+            job.status = "done"
+        log = self.logger.warning if job.status == "failed" else self.logger.info
+        log(
+            f"Batch export [{job.index + 1}/{len(self.jobs)}] {job.status}: "
+            f"{job.scene} ({job.duration:.1f}s)"
+            + (f" — {job.reason}" if job.error else "")
+        )
+
+    def run(
+        self,
+        scenes: Sequence[str],
+        export_dir: Optional[str] = None,
+        export_mode: str = "visible",
+        on_progress: Optional[Callable[[ExportJob, int, int], None]] = None,
+        **export_kwargs,
+    ) -> List[ExportJob]:
+        """Export *scenes* and return every job in scene order.
+
+        Parameters:
+            on_progress: Called as ``on_progress(job, finished, total)`` each
+                time a job is final.
+            Others: As :meth:`iter_run`.
+        """
+        finished = 0
+        for job in self.iter_run(scenes, export_dir, export_mode, **export_kwargs):
+            finished += 1
+            if on_progress:
+                on_progress(job, finished, len(self.jobs))
+        failed = [job for job in self.jobs if job.status == "failed"]
+        if failed:
+            self.logger.log_box(
+                "BATCH EXPORT FAILURES",
+                [f"{job.scene}: {job.reason}" for job in failed],
+                level="WARNING",
+            )
+        return list(self.jobs)
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
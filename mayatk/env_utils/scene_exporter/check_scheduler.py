@@ -0,0 +1,151 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Concurrent disk work for the export checks.
+
+``TaskFactory`` dispatches the exporter's checks one after another on the
+main thread. Most of them only read the scene, and several spend most of
+their time on disk: ``check_texture_optimization`` reads every texture
+header, ``check_texture_file_size`` stats every map, ``check_valid_paths``
+probes every texture and reference file. Maya commands must stay on the
+main thread, but the disk work need not.
+
+Each check declares a :class:`CheckTraits`: the scene data it *reads*,
+whether it *mutates* the scene, and optionally the name of a method that
+splits it into a :class:`CheckJob`. The main-thread half does the Maya reads
+and returns ``work`` (disk only: no ``cmds``, no logging) plus ``finish``,
+which turns the work's output into the ``(status, messages)`` result back on
+the main thread. Tasks declare what they write the same way (see
+``TaskManager.TASK_WRITES``).
+
+When the first check of a run is dispatched, :meth:`CheckScheduler.eligible`
+picks every later check with a job that nothing between here and there
+can invalidate. Their Maya reads run right away, and :class:`CheckScheduler`
+hands the disk work to a thread pool. A conflict is a task that writes what
+the check reads, or any mutating check. Each check then collects its
+own result when the dispatcher reaches it, so the disk-bound checks overlap
+with each other and with the Maya-side checks between them.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class CheckTraits(NamedTuple):
+    """What a check reads, whether it changes the scene, and how it splits."""
+
+    reads: Tuple[str, ...]
+    mutates: bool = False
+    #: Method returning a :class:`CheckJob` (or a finished result) for the
+    #: check's arguments; None when the check runs whole on the main thread.
+    job: Optional[str] = None
+
+
+class CheckJob(NamedTuple):
+    """A check split at its Maya boundary."""
+
+    work: Callable[[], Any]
+    finish: Callable[[Any], tuple]
+
+
+class CheckScheduler:
+    """Runs the disk half of split checks on a thread pool."""
+
+    #: A write that conflicts with every read (an undeclared task).
+    EVERYTHING = "*"
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._launched: Dict[str, Tuple[Any, Optional[Future]]] = {}
+
+    @staticmethod
+    def run(job) -> tuple:
+        """Run *job* inline; a finished result passes through."""
+        if isinstance(job, CheckJob):
+            return job.finish(job.work())
+        return job
+
+    @classmethod
+    def conflicts(cls, reads: Iterable[str], writes: Iterable[str]) -> bool:
+        """Whether *writes* can change anything in *reads*."""
+        writes = set(writes)
+        return cls.EVERYTHING in writes or bool(writes.intersection(reads))
+
+    @classmethod
+    def eligible(
+        cls,
+        run_list: List[Tuple[str, Any]],
+        traits: Dict[str, CheckTraits],
+        task_writes: Dict[str, Tuple[str, ...]],
+    ) -> List[str]:
+        """The split checks in *run_list* whose inputs are already final.
+
+        Walks *run_list* (the remaining run, starting at the check being
+        dispatched) and collects the writes of everything passed on the way.
+        A task that is not in *task_writes* writes everything, and so does a
+        check that mutates the scene. A check is eligible when it has a job
+        and none of the writes before it touch what it reads.
+        """
+        written: set = set()
+        eligible = []
+        for name, _value in run_list:
+            trait = traits.get(name)
+            if not name.startswith("check_"):
+                written.update(task_writes.get(name, (cls.EVERYTHING,)))
+            elif trait is None or trait.mutates:
+                written.add(cls.EVERYTHING)
+            elif trait.job and not cls.conflicts(trait.reads, written):
+                eligible.append(name)
+            if cls.EVERYTHING in written:
+                break
+        return eligible
+
+    def launched(self, name: str) -> bool:
+        """Whether *name* has a job started (and not yet collected)."""
+        return name in self._launched
+
+    def launch(self, name: str, job) -> None:
+        """Start *job*'s work in the pool; a finished result is kept as is."""
+        if not isinstance(job, CheckJob):
+            self._launched[name] = (job, None)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ExportCheck"
+            )
+        self._launched[name] = (job, self._executor.submit(job.work))
+
+    def result(self, name: str) -> tuple:
+        """Wait for *name*'s work and finish it on the calling thread.
+
+        An exception raised by the work is re-raised here, so a failing
+        check fails in its own slot.
+        """
+        job, future = self._launched.pop(name)
+        if future is None:
+            return job
+        return job.finish(future.result())
+
+    def cancel(self) -> None:
+        """Drop every job not collected (the run ended before reaching it)."""
+        for _job, future in self._launched.values():
+            if future is not None:
+                future.cancel()
+        self._launched.clear()
+
+    def shutdown(self) -> None:
+        """Cancel pending jobs and stop the pool."""
+        self.cancel()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -0,0 +1,406 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Content fingerprints for incremental scene exports.
+
+An incremental export (``SceneExporter.perform_export(incremental=True)``)
+skips the task pipeline and the file write when nothing that reaches the
+output has changed since the last export to the same path.
+:meth:`ExportFingerprint.compute` condenses "what reaches the output" into
+one SHA-256 digest built from per-component digests, so a rebuild can say
+*what* changed:
+
+* ``transforms`` -- every exported DAG node (the roots and all their
+  descendants): path, type, local matrix and visibility;
+* ``geometry`` -- object-space points of every non-intermediate shape, plus
+  face topology, UVs, normals, edge smoothing and color sets for meshes, and
+  the deformers in each shape's history: their attributes, skin weights and
+  bind pre-matrices, and blend shape target deltas (including targets at
+  weight 0, which leave the points untouched);
+* ``materials`` -- shading-engine membership and the upstream shading
+  network: node types, settable attribute values, connections, and the
+  size and mtime of every file texture;
+* ``animation`` -- every anim curve driving an exported node (directly,
+  through anim layers or through the shapes' history): keys, tangents and
+  the plugs they drive, plus the playback range and time unit;
+* ``settings`` -- the task/check values, export options and the FBX
+  preset file's contents.
+
+The scene is read *before* the pipeline runs, so the fingerprint describes
+the source state the tasks start from, not their output. Influences and
+blend shape targets outside the export set contribute through the deformer
+data above and the curves that drive them.
+"""
+import os
+import json
+import hashlib
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+    import maya.api.OpenMayaAnim as oma
+except ImportError as error:
+    print(__file__, error)
+
+import pythontk as ptk
+
+
+class ExportFingerprint(ptk.LoggingMixin):
+    """Per-component and combined content digests of an export set."""
+
+    #: Bumped whenever what feeds a component changes, so records written by
+    #: an older build never match.
+    VERSION = 2
+
+    COMPONENTS = ("transforms", "geometry", "materials", "animation", "settings")
+
+    @classmethod
+    def compute(
+        cls,
+        objects: Iterable[str],
+        settings: Optional[Dict[str, Any]] = None,
+        preset_file: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Fingerprint *objects* (with their descendants) and the export *settings*.
+
+        Parameters:
+            objects: The export roots, as ``SceneExporter`` resolved them.
+            settings: Everything else that shapes the output: the task and
+                check values, file format, output format, export mode.
+                JSON-encoded with sorted keys; non-JSON values via ``str``.
+            preset_file: FBX export preset, hashed by content.
+
+        Returns:
+            (dict) ``{"fingerprint": str, "components": {name: str},
+                "node_count": int, "version": int}``.
+        """
+        nodes = cls.export_nodes(objects)
+        shapes = cmds.ls(nodes, shapes=True, long=True) or []
+        components = {
+            "transforms": cls._hash_transforms(nodes),
+            "geometry": cls._hash_geometry(shapes),
+            "materials": cls._hash_materials(shapes),
+            "animation": cls._hash_animation(nodes, shapes),
+            "settings": cls._hash_settings(settings, preset_file),
+        }
+        return {
+            "fingerprint": cls.combine(components),
+            "components": components,
+            "node_count": len(nodes),
+            "version": cls.VERSION,
+        }
+
+    @classmethod
+    def combine(cls, components: Dict[str, str]) -> str:
+        """The combined digest of per-component digests."""
+        digest = hashlib.sha256(f"v{cls.VERSION}".encode())
+        for name in sorted(components):
+            digest.update(f"\n{name}:{components[name]}".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def changed_components(old: Optional[dict], new: dict) -> List[str]:
+        """Names of the components whose digest differs between two records.
+
+        Every component when *old* is missing or from another version.
+        """
+        if not old or old.get("version") != new.get("version"):
+            return list(new.get("components", {}))
+        before = old.get("components") or {}
+        return [
+            name
+            for name, value in (new.get("components") or {}).items()
+            if before.get(name) != value
+        ]
+
+    @staticmethod
+    def export_nodes(objects: Iterable[str]) -> List[str]:
+        """The roots plus every DAG descendant, as sorted unique long names."""
+        roots = cmds.ls(list(objects), long=True) or []
+        if not roots:
+            return []
+        below = cmds.listRelatives(roots, allDescendents=True, fullPath=True) or []
+        return sorted(set(roots) | set(below))
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _dag_path(name: str):
+        sel = om.MSelectionList()
+        try:
+            sel.add(name)
+            return sel.getDagPath(0)
+        except (RuntimeError, TypeError):
+            return None
+
+    @staticmethod
+    def _attr_values(node: str) -> List[Any]:
+        """``(attr, value)`` pairs of *node*'s visible, settable scalar attributes."""
+        pairs = []
+        for attr in sorted(
+            set(cmds.listAttr(node, settable=True, scalar=True, visible=True) or [])
+        ):
+            try:
+                pairs.append((attr, cmds.getAttr(f"{node}.{attr}")))
+            except (RuntimeError, ValueError, TypeError):
+                continue  # multi / message children that will not query
+        return pairs
+
+    @classmethod
+    def _hash_transforms(cls, nodes: List[str]) -> str:
+        digest = hashlib.sha256()
+        for name in nodes:
+            path = cls._dag_path(name)
+            if path is None:
+                continue
+            fn = om.MFnDagNode(path)
+            digest.update(f"{name}|{fn.typeName}".encode())
+            if path.hasFn(om.MFn.kTransform):
+                matrix = om.MFnTransform(path).transformation().asMatrix()
+                digest.update(array("d", matrix).tobytes())
+            visible = fn.findPlug("visibility", False).asBool()
+            digest.update(b"1" if visible else b"0")
+        return digest.hexdigest()
+
+    @classmethod
+    def _hash_geometry(cls, shapes: List[str]) -> str:
+        digest = hashlib.sha256()
+        for name in shapes:
+            path = cls._dag_path(name)
+            if path is None or om.MFnDagNode(path).isIntermediateObject:
+                continue
+            digest.update(name.encode())
+            if path.hasFn(om.MFn.kMesh):
+                mesh = om.MFnMesh(path)
+                points = mesh.getPoints(om.MSpace.kObject)
+                digest.update(np.array(points, dtype=float).tobytes())
+                counts, connects = mesh.getVertices()
+                digest.update(array("i", counts).tobytes())
+                digest.update(array("i", connects).tobytes())
+                for uv_set in mesh.getUVSetNames():
+                    us, vs = mesh.getUVs(uv_set)
+                    digest.update(uv_set.encode())
+                    digest.update(array("f", us).tobytes())
+                    digest.update(array("f", vs).tobytes())
+                cls._hash_mesh_shading(digest, name, mesh)
+            else:
+                try:
+                    it = om.MItGeometry(path)
+                except RuntimeError:
+                    it = None  # not a geometry shape: its attributes describe it
+                if it is not None:
+                    positions = it.allPositions(om.MSpace.kObject)
+                    digest.update(np.array(positions, dtype=float).tobytes())
+                else:
+                    digest.update(repr(cls._attr_values(name)).encode())
+        history = (cmds.listHistory(shapes) or []) if shapes else []
+        if history:  # ls([]) would list every deformer in the scene
+            for deformer in sorted(set(cmds.ls(history, type="geometryFilter") or [])):
+                cls._hash_deformer(digest, deformer)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_mesh_shading(digest, name: str, mesh) -> None:
+        """Normals, hard / soft edges and vertex colors of a mesh."""
+        normals = mesh.getNormals(om.MSpace.kObject)
+        digest.update(np.array(normals, dtype=float).tobytes())
+        counts, ids = mesh.getNormalIds()
+        digest.update(array("i", counts).tobytes())
+        digest.update(array("i", ids).tobytes())
+        if mesh.numEdges:
+            # ``edge`` holds (vertex, vertex, hard) per edge: one query, not one per edge.
+            edges = cmds.getAttr(f"{name}.edge[0:{mesh.numEdges - 1}]") or []
+            digest.update(bytes(1 if edge[2] else 0 for edge in edges))
+        for color_set in mesh.getColorSetNames():
+            colors = mesh.getFaceVertexColors(color_set)
+            digest.update(color_set.encode())
+            digest.update(np.array(colors, dtype=float).tobytes())
+
+    @classmethod
+    def _hash_deformer(cls, digest, deformer: str) -> None:
+        """A deformer's settings and the data it deforms with.
+
+        The deformed points already reflect an edit that moves them; this
+        catches the ones that do not yet, such as a re-weighted influence at
+        the bind pose or a blend shape target sculpted at weight 0.
+        """
+        node_type = cmds.nodeType(deformer)
+        digest.update(f"{deformer}|{node_type}".encode())
+        digest.update(repr(cls._attr_values(deformer)).encode())
+        if node_type == "skinCluster":
+            cls._hash_skin_cluster(digest, deformer)
+        elif node_type == "blendShape":
+            cls._hash_blend_shape(digest, deformer)
+
+    @classmethod
+    def _hash_skin_cluster(cls, digest, skin_cluster: str) -> None:
+        influences = cmds.skinCluster(skin_cluster, q=True, influence=True) or []
+        digest.update(repr(influences).encode())
+        for i in cmds.getAttr(f"{skin_cluster}.bindPreMatrix", multiIndices=True) or []:
+            matrix = cmds.getAttr(f"{skin_cluster}.bindPreMatrix[{i}]")
+            digest.update(f"{i}:".encode() + array("d", matrix).tobytes())
+        sel = om.MSelectionList()
+        sel.add(skin_cluster)
+        fn = oma.MFnSkinCluster(sel.getDependNode(0))
+        for i in range(fn.numOutputConnections()):
+            path = fn.getPathAtIndex(fn.indexForOutputConnection(i))
+            if not path.hasFn(om.MFn.kMesh):
+                continue
+            component = om.MFnSingleIndexedComponent()
+            vertices = component.create(om.MFn.kMeshVertComponent)
+            component.setCompleteData(om.MFnMesh(path).numVertices)
+            weights, _count = fn.getWeights(path, vertices)
+            digest.update(np.array(weights, dtype=float).tobytes())
+
+    @classmethod
+    def _hash_blend_shape(cls, digest, blend_shape: str) -> None:
+        """Stored target deltas, and the points of live target shapes."""
+        base = f"{blend_shape}.inputTarget"
+        for g in cmds.getAttr(base, multiIndices=True) or []:
+            group = f"{base}[{g}].inputTargetGroup"
+            for t in cmds.getAttr(group, multiIndices=True) or []:
+                items = f"{group}[{t}].inputTargetItem"
+                for item in cmds.getAttr(items, multiIndices=True) or []:
+                    plug = f"{items}[{item}]"
+                    digest.update(f"{g}.{t}.{item}".encode())
+                    digest.update(
+                        repr(
+                            (
+                                cmds.getAttr(f"{plug}.inputPointsTarget"),
+                                cmds.getAttr(f"{plug}.inputComponentsTarget"),
+                            )
+                        ).encode()
+                    )
+        targets = cmds.listConnections(
+            base, source=True, destination=False, shapes=True
+        )
+        for target in sorted(set(targets or [])):
+            path = cls._dag_path(target)
+            if path is None:
+                continue
+            try:
+                positions = om.MItGeometry(path).allPositions(om.MSpace.kObject)
+            except RuntimeError:
+                continue
+            digest.update(target.encode())
+            digest.update(np.array(positions, dtype=float).tobytes())
+
+    @classmethod
+    def _hash_materials(cls, shapes: List[str]) -> str:
+        digest = hashlib.sha256()
+        engines = sorted(
+            set(cmds.listConnections(shapes, type="shadingEngine") or [])
+            if shapes
+            else ()
+        )
+        network = set()
+        for sg in engines:
+            members = sorted(cmds.sets(sg, q=True) or [])
+            digest.update(f"{sg}:{members}".encode())
+            history = cmds.listHistory(sg) or []
+            if history:  # ls([]) would list the whole scene
+                dag = set(cmds.ls(history, dag=True) or [])
+                network.update(n for n in history if n not in dag and n != sg)
+        for node in sorted(network):
+            digest.update(f"{node}|{cmds.nodeType(node)}".encode())
+            digest.update(repr(cls._attr_values(node)).encode())
+            connections = (
+                cmds.listConnections(
+                    node, source=True, destination=False, connections=True, plugs=True
+                )
+                or []
+            )
+            digest.update(repr(sorted(connections)).encode())
+            if cmds.nodeType(node) == "file":
+                texture = cmds.getAttr(f"{node}.fileTextureName") or ""
+                try:
+                    st = os.stat(texture)
+                    digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+                except OSError:
+                    digest.update(b"missing")
+        return digest.hexdigest()
+
+    @classmethod
+    def _hash_animation(cls, nodes: List[str], shapes: List[str]) -> str:
+        digest = hashlib.sha256()
+        curves = set()
+        history = []
+        if nodes:
+            curves.update(
+                cmds.listConnections(nodes, type="animCurve", s=True, d=False) or []
+            )
+            blends = (
+                cmds.listConnections(nodes, type="animBlendNodeBase", s=True, d=False)
+                or []
+            )
+            if blends:  # curves on anim layers sit behind the blend nodes
+                history += cmds.listHistory(blends) or []
+        if shapes:
+            history += cmds.listHistory(shapes) or []
+        if history:  # ls([]) would list every curve in the scene
+            curves.update(cmds.ls(history, type="animCurve") or [])
+        for crv in sorted(curves):
+            digest.update(crv.encode())
+            digest.update(
+                repr(
+                    (
+                        cmds.listConnections(crv, s=False, d=True, plugs=True),
+                        cmds.keyframe(crv, q=True, timeChange=True, valueChange=True),
+                        cmds.keyTangent(
+                            crv, q=True, inTangentType=True, outTangentType=True
+                        ),
+                        cmds.keyTangent(
+                            crv,
+                            q=True,
+                            inAngle=True,
+                            outAngle=True,
+                            inWeight=True,
+                            outWeight=True,
+                        ),
+                        cmds.getAttr(f"{crv}.preInfinity"),
+                        cmds.getAttr(f"{crv}.postInfinity"),
+                    )
+                ).encode()
+            )
+        digest.update(
+            repr(
+                (
+                    cmds.playbackOptions(q=True, minTime=True),
+                    cmds.playbackOptions(q=True, maxTime=True),
+                    cmds.playbackOptions(q=True, animationStartTime=True),
+                    cmds.playbackOptions(q=True, animationEndTime=True),
+                    cmds.currentUnit(q=True, time=True),
+                    cmds.currentUnit(q=True, linear=True),
+                    cmds.currentTime(q=True),
+                )
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def _hash_settings(
+        settings: Optional[Dict[str, Any]], preset_file: Optional[str]
+    ) -> str:
+        digest = hashlib.sha256(
+            json.dumps(settings or {}, sort_keys=True, default=str).encode()
+        )
+        if preset_file:
+            try:
+                with open(preset_file, "rb") as f:
+                    digest.update(f.read())
+            except OSError:
+                digest.update(f"unreadable:{preset_file}".encode())
+        return digest.hexdigest()
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -5,7 +5,7 @@ import os
 import re
 import math
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 try:
     import maya.cmds as cmds
@@ -27,6 +27,12 @@ from mayatk.node_utils.attributes._attributes import Attributes
 from mayatk.xform_utils._xform_utils import XformUtils
 from pythontk import TaskFactory
 from mayatk.env_utils.hierarchy_sync.scene_data_sidecar import SceneDataSidecar
+from mayatk.env_utils.scene_exporter.task_profiler import TaskProfiler
+from mayatk.env_utils.scene_exporter.check_scheduler import (
+    CheckJob,
+    CheckScheduler,
+    CheckTraits,
+)
 
 
 class _TaskDataMixin:
@@ -202,7 +208,12 @@ class _TaskDataMixin:
             getattr(self, "_texture_max_size", None), template, logger=self.logger
         )
 
-    def _assess_optimization(self, path: str, template: Optional[str]):
+    def _assess_optimization(
+        self,
+        path: str,
+        template: Optional[str],
+        clamp: Optional[Dict[str, Any]] = None,
+    ):
         """What the optimization pass would do to *path* — judged once.
 
         The one criterion the task (skip already-optimal sources, re-verify a
@@ -212,7 +223,8 @@ class _TaskDataMixin:
         the size ceiling when one is set
         (:meth:`_texture_size_clamp`). Without a clamp the template's
         :class:`~pythontk.DeliveryBudget` stays ADVISORY — assess reports it in
-        ``warnings`` and nothing here plans a resample.
+        ``warnings`` and nothing here plans a resample. A caller off the main
+        thread passes *clamp* resolved beforehand, since resolving it may log.
 
         Returns:
             None when the file cannot be read (missing / unreadable is
@@ -231,7 +243,7 @@ class _TaskDataMixin:
             output_profile=template,
             output_type=output_type,
             optimize_bit_depth=True,
-            **self._texture_size_clamp(template),
+            **(self._texture_size_clamp(template) if clamp is None else clamp),
         )
         if result.get("error"):
             return None
@@ -311,12 +323,7 @@ class _TaskDataMixin:
         sources: Dict[str, Dict[str, Any]] = {}
         skipped_tokens: List[str] = []
         no_frame_nodes: List[str] = []
-        for node in self._get_export_file_nodes():
-            if not cmds.attributeQuery("fileTextureName", node=node, exists=True):
-                continue
-            path = cmds.getAttr(f"{node}.fileTextureName")
-            if not path:
-                continue
+        for node, path in self._export_texture_paths().items():
             tiled = bool(
                 self._TEXTURE_TOKEN_RE.search(os.path.basename(path))
             ) or bool(
@@ -457,6 +464,7 @@ class _TaskDataMixin:
         """
         self._cached_materials = None
         self._cached_export_file_nodes = None
+        self._texture_path_snapshot = None
 
     def _get_all_materials(self) -> List[str]:
         """Return a list of all materials assigned to the specified objects.
@@ -501,6 +509,30 @@ class _TaskDataMixin:
         self._cached_export_file_nodes = list(set(cmds.ls(history, type="file") or []))
         return self._cached_export_file_nodes
 
+    def _export_texture_paths(self) -> Dict[str, str]:
+        """``{file node: stored fileTextureName}`` for the export file nodes.
+
+        Nodes without the attribute or with an empty path are left out. The
+        texture checks all walk the same paths, so during a run's check
+        phase the read is taken once and shared (the scheduler keeps
+        ``_check_phase`` set from the first check until a task runs). Outside
+        it every call reads fresh, because a task or a direct caller may
+        just have repointed a node.
+        """
+        cached = getattr(self, "_texture_path_snapshot", None)
+        if cached is not None:
+            return cached
+        paths: Dict[str, str] = {}
+        for node in self._get_export_file_nodes():
+            if not cmds.attributeQuery("fileTextureName", node=node, exists=True):
+                continue
+            path = cmds.getAttr(f"{node}.fileTextureName")
+            if path:
+                paths[node] = path
+        if getattr(self, "_check_phase", False):
+            self._texture_path_snapshot = paths
+        return paths
+
 
 class _TaskActionsMixin(_TaskDataMixin):
     """ """
@@ -1489,6 +1521,18 @@ class _TaskChecksMixin(_TaskDataMixin):
     _MAX_LISTED_OBJECTS = 25
     _DEFAULT_FLOOR_TOLERANCE = 0.5
 
+    def _run_check_job(self, name: str, factory, *args) -> tuple:
+        """The result of split check *name*.
+
+        Collects the job the check scheduler started for *name* when there is
+        one; otherwise builds it from ``factory(*args)`` and runs it inline, so
+        a direct call behaves exactly as the unsplit check did.
+        """
+        scheduler = getattr(self, "check_scheduler", None)
+        if scheduler is not None and scheduler.launched(name):
+            return scheduler.result(name)
+        return CheckScheduler.run(factory(*args))
+
     def _obj_link(self, node: str, action: str = "reveal") -> str:
         """Return a clickable log link for a Maya scene node.
 
@@ -1948,19 +1992,49 @@ class _TaskChecksMixin(_TaskDataMixin):
         Returns:
             tuple: (status: bool, messages: list)
         """
+        return self._run_check_job(
+            "check_texture_optimization", self._texture_optimization_job, template
+        )
+
+    def _texture_optimization_job(self, template):
+        """:meth:`check_texture_optimization` split for the check scheduler.
+
+        The header reads (``_assess_optimization``) are the work; the source
+        scan, the clamp (which may log) and the report stay on the main
+        thread.
+        """
         if not template:
             return True, []
         tpl = template if isinstance(template, str) else None
-
-        offenders: List[str] = []
-        notes: List[str] = []
         # include_tiled: the task cannot TOUCH a tiled set, but the gate
         # should still measure it (via its 1001 tile) so an unoptimized one
         # is at least reported instead of slipping past the scan.
-        for _key, entry in sorted(
-            self._export_texture_sources(include_tiled=True).items()
-        ):
-            verdict = self._assess_optimization(entry["path"], tpl)
+        entries = [
+            entry
+            for _key, entry in sorted(
+                self._export_texture_sources(include_tiled=True).items()
+            )
+        ]
+        clamp = self._texture_size_clamp(tpl)
+
+        def work():
+            return [
+                self._assess_optimization(entry["path"], tpl, clamp=clamp)
+                for entry in entries
+            ]
+
+        def finish(verdicts):
+            return self._texture_optimization_report(tpl, entries, verdicts)
+
+        return CheckJob(work, finish)
+
+    def _texture_optimization_report(
+        self, tpl: Optional[str], entries: List[dict], verdicts: List[Any]
+    ) -> tuple:
+        """Result of :meth:`check_texture_optimization` from its verdicts."""
+        offenders: List[str] = []
+        notes: List[str] = []
+        for entry, verdict in zip(entries, verdicts):
             if verdict is None:
                 continue
             name = os.path.basename(entry["path"])
@@ -2061,11 +2135,8 @@ class _TaskChecksMixin(_TaskDataMixin):
                 )
 
         seen_paths = set()
-        for node in self._get_export_file_nodes():
-            if not cmds.attributeQuery("fileTextureName", node=node, exists=True):
-                continue
-            path = cmds.getAttr(f"{node}.fileTextureName")
-            if not path or path in seen_paths:
+        for node, path in self._export_texture_paths().items():
+            if path in seen_paths:
                 continue
             seen_paths.add(path)
 
@@ -2132,22 +2203,20 @@ class _TaskChecksMixin(_TaskDataMixin):
         Returns:
             tuple: (status: bool, messages: list)
         """
-        log_messages = []
-        all_valid = True
+        return self._run_check_job("check_valid_paths", self._valid_paths_job)
 
+    def _valid_paths_job(self):
+        """:meth:`check_valid_paths` split for the check scheduler.
+
+        Maya's resolution (workspace, references) runs on the main thread;
+        the write-time probes of the paths that resolve and the reference
+        file probes are the work.
+        """
         # 1. Texture paths — scoped to the maps that will actually ship.
         missing_textures: Dict[str, List[str]] = {}
-        fbx_unlocatable: Dict[str, List[str]] = {}
         unresolved_tokens: Dict[str, List[str]] = {}
-        for node in self._get_export_file_nodes():
-            if not cmds.attributeQuery("fileTextureName", node=node, exists=True):
-                continue
-
-            path = cmds.getAttr(f"{node}.fileTextureName")
-            if not path:
-                # Some empty file nodes might exist?
-                continue
-
+        resolved: List[Tuple[str, str, Optional[str]]] = []  # (path, node, probe)
+        for node, path in self._export_texture_paths().items():
             # Tile/frame tokens collapse through MatUtils' single token table
             # rather than a local <UDIM>-only replace: a <uvtile>, <u>_<v>,
             # <f> or <frame> path failed that narrower probe and was then
@@ -2175,12 +2244,56 @@ class _TaskChecksMixin(_TaskDataMixin):
                 else:
                     missing_textures.setdefault(path, []).append(node)
                 continue
+            resolved.append((path, node, probe))
+
+        # 2. Reference paths
+        references: List[Tuple[str, str]] = []
+        for ref in cmds.ls(references=True) or []:
+            try:
+                # withoutCopyNumber=True gets actual file path
+                path = cmds.referenceQuery(ref, filename=True, withoutCopyNumber=True)
+            except Exception:
+                continue
+            if path:
+                references.append((ref, path))
+
+        def work():
+            # Maya resolves these — now probe them the way the FBX plugin will
+            # at write time (os.path.abspath resolves relative paths against
+            # the CWD, never the workspace).
+            unlocatable = [
+                (path, node)
+                for path, node, probe in resolved
+                if probe is None or not os.path.isfile(os.path.abspath(probe))
+            ]
+            missing_refs = [
+                (ref, path)
+                for ref, path in references
+                if not os.path.exists(os.path.expandvars(path))
+            ]
+            return unlocatable, missing_refs
 
-            # Maya resolves it — now probe it the way the FBX plugin will at
-            # write time (os.path.abspath resolves relative paths against the
-            # CWD, never the workspace).
-            if probe is None or not os.path.isfile(os.path.abspath(probe)):
+        def finish(output):
+            unlocatable, missing_refs = output
+            fbx_unlocatable: Dict[str, List[str]] = {}
+            for path, node in unlocatable:
                 fbx_unlocatable.setdefault(path, []).append(node)
+            return self._valid_paths_report(
+                missing_textures, fbx_unlocatable, unresolved_tokens, missing_refs
+            )
+
+        return CheckJob(work, finish)
+
+    def _valid_paths_report(
+        self,
+        missing_textures: Dict[str, List[str]],
+        fbx_unlocatable: Dict[str, List[str]],
+        unresolved_tokens: Dict[str, List[str]],
+        missing_refs: List[Tuple[str, str]],
+    ) -> tuple:
+        """Result of :meth:`check_valid_paths` from its findings."""
+        log_messages = []
+        all_valid = True
 
         if missing_textures:
             all_valid = False
@@ -2229,20 +2342,10 @@ class _TaskChecksMixin(_TaskDataMixin):
                 entries.append(f"Unresolved tile/frame pattern: {links} -> {path}")
             log_messages.extend(self._truncate_obj_entries(entries))
 
-        # 2. Reference Paths
-        references = cmds.ls(references=True) or []
-        for ref in references:
-            try:
-                # withoutCopyNumber=True gets actual file path
-                path = cmds.referenceQuery(ref, filename=True, withoutCopyNumber=True)
-                if path:
-                    expanded_path = os.path.expandvars(path)
-                    if not os.path.exists(expanded_path):
-                        all_valid = False
-                        link = self._obj_link(ref, "select")
-                        log_messages.append(f"Missing Reference: {link} -> {path}")
-            except Exception:
-                continue
+        for ref, path in missing_refs:
+            all_valid = False
+            link = self._obj_link(ref, "select")
+            log_messages.append(f"Missing Reference: {link} -> {path}")
 
         if all_valid:
             log_messages.append("All checked paths exist on disk.")
@@ -2267,6 +2370,16 @@ class _TaskChecksMixin(_TaskDataMixin):
         Returns:
             tuple: (status: bool, messages: list)
         """
+        return self._run_check_job(
+            "check_texture_file_size", self._texture_file_size_job, max_size_mb
+        )
+
+    def _texture_file_size_job(self, max_size_mb):
+        """:meth:`check_texture_file_size` split for the check scheduler.
+
+        Resolution runs on the main thread; the ``stat`` of every probe path
+        is the work.
+        """
         if not max_size_mb or str(max_size_mb).upper() == "OFF":
             return True, []
 
@@ -2279,17 +2392,10 @@ class _TaskChecksMixin(_TaskDataMixin):
             return True, []
         limit_bytes = limit_mb * 1024 * 1024
 
-        offenders: List[str] = []
+        probes: List[Tuple[str, str]] = []  # (node, probe path)
         seen_paths = set()
 
-        for node in self._get_export_file_nodes():
-            if not cmds.attributeQuery("fileTextureName", node=node, exists=True):
-                continue
-
-            path = cmds.getAttr(f"{node}.fileTextureName")
-            if not path:
-                continue
-
+        for node, path in self._export_texture_paths().items():
             # Resolve to the on-disk file via MatUtils.resolve_path so
             # project-relative paths still resolve — the default-on
             # convert_to_relative_paths task runs before checks and rewrites
@@ -2314,11 +2420,26 @@ class _TaskChecksMixin(_TaskDataMixin):
             if probe in seen_paths:
                 continue
             seen_paths.add(probe)
+            probes.append((node, probe))
 
-            if not os.path.isfile(probe):
-                continue
+        def work():
+            sizes = []
+            for node, probe in probes:
+                if os.path.isfile(probe):
+                    sizes.append((node, probe, os.path.getsize(probe)))
+            return sizes
 
-            size = os.path.getsize(probe)
+        def finish(sizes):
+            return self._texture_file_size_report(limit_mb, limit_bytes, sizes)
+
+        return CheckJob(work, finish)
+
+    def _texture_file_size_report(
+        self, limit_mb: float, limit_bytes: float, sizes: List[Tuple[str, str, int]]
+    ) -> tuple:
+        """Result of :meth:`check_texture_file_size` from the measured sizes."""
+        offenders: List[str] = []
+        for node, probe, size in sizes:
             if size > limit_bytes:
                 link = self._obj_link(node, "select")
                 offenders.append(
@@ -2827,8 +2948,9 @@ class _TaskChecksMixin(_TaskDataMixin):
         the ``data_export`` carrier channels.  The hierarchy section is
         maintained when the check is in play (it ran this export, or a
         manifest already exists); the data section is recorded whenever the
-        carrier shipped content.  A metadata-free export with the check off
-        leaves no sidecar.
+        carrier shipped content, and the incremental-export record whenever
+        SceneExporter stamped one (``_export_record``).  A metadata-free,
+        non-incremental export with the check off leaves no sidecar.
         """
         export_path = getattr(self, "export_path", None)
         if not export_path or not self.objects:
@@ -2846,7 +2968,13 @@ class _TaskChecksMixin(_TaskDataMixin):
 
         data = self._data_export_snapshot()
         check_ran = getattr(self, "_hierarchy_check_ran", False)
-        if not check_ran and not data and not os.path.exists(manifest_path):
+        export_record = getattr(self, "_export_record", None)
+        if (
+            not check_ran
+            and not data
+            and not export_record
+            and not os.path.exists(manifest_path)
+        ):
             return
 
         # Consume-and-clear: the stash belongs to THIS export's check; a
@@ -2861,7 +2989,12 @@ class _TaskChecksMixin(_TaskDataMixin):
         paths = self._build_full_hierarchy_set()
         if (
             SceneDataSidecar.write_manifest(
-                export_path, paths, data=data, last_diff=last_diff, **sk
+                export_path,
+                paths,
+                data=data,
+                last_diff=last_diff,
+                export=export_record,
+                **sk,
             )
             is None
         ):
@@ -3051,6 +3184,68 @@ class TaskManager(TaskFactory, _TaskActionsMixin, _TaskChecksMixin):
         "apply_declared_takes",
     ]
 
+    # What each check reads, and the job that splits off its disk work (see
+    # check_scheduler). None of the checks change the scene. The names are
+    # the ones TASK_WRITES uses: "objects" is the export set and its DAG
+    # paths, "textures" the file nodes' stored paths and the files they name,
+    # "workspace" the project root and working directory paths resolve
+    # against.
+    CHECK_TRAITS: Dict[str, CheckTraits] = {
+        "check_geometry_lod_suffix": CheckTraits(("objects",)),
+        "check_root_default_transforms": CheckTraits(("objects", "transforms")),
+        "check_material_compatibility": CheckTraits(("objects", "materials")),
+        "check_texture_optimization": CheckTraits(
+            ("objects", "materials", "textures", "workspace"),
+            job="_texture_optimization_job",
+        ),
+        "check_path_length": CheckTraits(
+            ("objects", "materials", "textures", "workspace")
+        ),
+        "check_valid_paths": CheckTraits(
+            ("objects", "materials", "textures", "workspace", "references"),
+            job="_valid_paths_job",
+        ),
+        "check_texture_file_size": CheckTraits(
+            ("objects", "materials", "textures", "workspace"),
+            job="_texture_file_size_job",
+        ),
+        "check_mangled_names": CheckTraits(("objects",)),
+        "check_duplicate_locator_names": CheckTraits(("objects",)),
+        "check_duplicate_materials": CheckTraits(
+            ("objects", "materials", "textures")
+        ),
+        "check_referenced_objects": CheckTraits(("objects", "references")),
+        "check_framerate": CheckTraits(("animation", "units")),
+        "check_objects_below_floor": CheckTraits(("objects", "transforms", "units")),
+        "check_overlapping_duplicate_mesh": CheckTraits(("objects", "transforms")),
+        "check_hidden_geometry": CheckTraits(("objects",)),
+        "check_untied_keyframes": CheckTraits(("objects", "animation")),
+        "check_floating_point_keys": CheckTraits(("objects", "animation")),
+        "check_hierarchy_vs_existing_fbx": CheckTraits(("objects",)),
+    }
+
+    # What each task may change, in CHECK_TRAITS' terms. A task missing here
+    # is taken to change everything.
+    TASK_WRITES: Dict[str, Tuple[str, ...]] = {
+        "set_workspace": ("workspace",),
+        "set_linear_unit": ("units", "transforms"),
+        "ignore_groups": ("objects",),
+        "exclude_hdr": ("objects", "materials", "textures"),
+        "conform_shape_names": ("objects",),
+        "reassign_duplicate_materials": ("objects", "materials", "textures"),
+        "resolve_invalid_texture_paths": ("textures",),
+        "convert_to_relative_paths": ("textures",),
+        "convert_textures": ("textures",),
+        "optimize_textures": ("textures",),
+        "smart_bake": ("objects", "transforms", "animation"),
+        "optimize_keys": ("animation",),
+        "snap_keys_to_frame": ("animation",),
+        "tie_all_keyframes": ("animation",),
+        "set_bake_animation_range": ("animation",),
+        "export_data_node": ("objects",),
+        "apply_declared_takes": ("animation",),
+    }
+
     _frame_rate_options: Dict[str, Any] = {
         (
             f"{k}"
@@ -3075,6 +3270,87 @@ class TaskManager(TaskFactory, _TaskActionsMixin, _TaskChecksMixin):
         super().__init__(logger)
         self._objects = None
         self._invalidate_material_caches()
+        # Every dispatched task and check is measured here; SceneExporter
+        # opens the session around the whole export so the FBX write lands
+        # in the same report. None disables profiling.
+        self.profiler: Optional[TaskProfiler] = TaskProfiler()
+        # Runs the disk half of the split checks concurrently. None runs
+        # every check whole, in order.
+        self.check_scheduler: Optional[CheckScheduler] = CheckScheduler()
+        self._run_list: List[Tuple[str, Any]] = []
+        self._check_phase = False
+
+    def _execute_task_method(self, method, value: Any):
+        name = method.__name__
+        is_check = name.startswith("check_")
+        if is_check:
+            self._check_phase = True
+            self._start_check_jobs(name)
+        try:
+            profiler = self.profiler
+            if profiler is None or not profiler.active:
+                return super()._execute_task_method(method, value)
+            with profiler.measure(name):
+                return super()._execute_task_method(method, value)
+        finally:
+            if not is_check:
+                # The task may have repointed textures; the next check
+                # phase reads them again.
+                self._check_phase = False
+                self._texture_path_snapshot = None
+
+    def _schedule(
+        self, ordered_tasks: Dict[str, Any], ordered_checks: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        schedule = super()._schedule(ordered_tasks, ordered_checks)
+        # Kept for _start_check_jobs, which looks ahead from each check.
+        self._run_list = list(schedule.items())
+        return schedule
+
+    def _start_check_jobs(self, name: str) -> None:
+        """Start the split checks that *name*'s dispatch makes safe to start.
+
+        Every later check :meth:`CheckScheduler.eligible` clears -- nothing
+        scheduled before it writes what it reads -- has its Maya reads done
+        now and its disk work handed to the pool; the check collects the
+        result when the dispatcher reaches it (:meth:`_run_check_job`). A
+        check whose main-thread half raises is left to raise in its own slot.
+
+        Each main-thread half is profiled as its own ``<check>:prepare``
+        entry, so the read is not billed to the check that happened to
+        trigger it.
+        """
+        scheduler = getattr(self, "check_scheduler", None)
+        run_list = getattr(self, "_run_list", None)
+        if scheduler is None or not run_list:
+            return
+        names = [entry for entry, _value in run_list]
+        if name not in names:
+            return
+        remaining = run_list[names.index(name) :]
+        values = dict(remaining)
+        profiler = self.profiler
+        profiling = profiler is not None and profiler.active
+        for check in scheduler.eligible(remaining, self.CHECK_TRAITS, self.TASK_WRITES):
+            method = self._get_cached_method(check)
+            if scheduler.launched(check) or method is None:
+                continue
+            if self._task_is_disabled(method, values[check]):
+                continue
+            factory = getattr(self, self.CHECK_TRAITS[check].job)
+            # Same argument rule as the dispatcher: the split checks take
+            # their value or nothing.
+            args = (values[check],) if self._positional_count(factory) else ()
+            try:
+                with (
+                    profiler.measure(f"{check}:prepare", kind="check")
+                    if profiling
+                    else contextlib.nullcontext()
+                ):
+                    job = factory(*args)
+            except Exception:  # noqa: BLE001 - re-raised by the check itself
+                continue
+            scheduler.launch(check, job)
 
     def _execute_tasks_and_checks(self, tasks_only, checks_only):
         # smart_bake needs its sibling's setting: baked override-layer curves
@@ -3090,7 +3366,20 @@ class TaskManager(TaskFactory, _TaskActionsMixin, _TaskChecksMixin):
         self._relative_paths_enabled = bool(
             tasks_only.get("convert_to_relative_paths", False)
         )
-        return super()._execute_tasks_and_checks(tasks_only, checks_only)
+        # A standalone run_tasks gets its own session; inside perform_export
+        # this only nests in the exporter's.
+        profiler = self.profiler
+        try:
+            with profiler.session() if profiler else contextlib.nullcontext():
+                return super()._execute_tasks_and_checks(tasks_only, checks_only)
+        finally:
+            # Jobs the run never reached (a failed check stopped it) are
+            # dropped, and the next run reads the scene afresh.
+            if getattr(self, "check_scheduler", None) is not None:
+                self.check_scheduler.cancel()
+            self._run_list = []
+            self._check_phase = False
+            self._texture_path_snapshot = None
 
     @property
     def objects(self):
@@ -0,0 +1,271 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Per-task timing, command counts and memory for the export pipeline.
+
+``TaskFactory`` logs one ``Completed <task> in N s`` line per entry, which
+says nothing about *why* a four-minute export took four minutes once the log
+has scrolled away. :class:`TaskProfiler` records every task and check the
+:class:`~mayatk.env_utils.scene_exporter.task_manager.TaskManager` dispatches
+-- plus the export phases ``SceneExporter.perform_export`` wraps (the FBX
+write, GLB conversion) -- as a :class:`TaskProfile`:
+
+* **wall time** from ``time.perf_counter``;
+* **commands**: Maya commands executed inside the entry, counted through an
+  ``MCommandMessage`` callback that lives only while a session is open
+  (None when OpenMaya is unavailable);
+* **peak memory delta**: how far the entry raised the process's peak
+  resident set, in MB (None where the platform does not report one).
+
+Entries slower than ``slow_threshold`` seconds are flagged. The session can
+be written as JSON (:meth:`TaskProfiler.write_json`) next to the export log
+and condensed into a few log lines (:meth:`TaskProfiler.summary_lines`).
+"""
+import os
+import sys
+import json
+import time
+import contextlib
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import maya.api.OpenMaya as om2
+except ImportError as error:
+    om2 = None
+    print(__file__, error)
+import pythontk as ptk
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """The process's peak resident set size in MB, or None if unavailable."""
+    if os.name == "nt":
+        try:
+            import ctypes
+            from ctypes import wintypes
+
+            class _Counters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = _Counters()
+            counters.cb = ctypes.sizeof(counters)
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(
+                ctypes.windll.kernel32.GetCurrentProcess(),
+                ctypes.byref(counters),
+                counters.cb,
+            ):
+                return None
+            return counters.PeakWorkingSetSize / (1024.0 * 1024.0)
+        except (AttributeError, OSError):
+            return None
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+@dataclass
+class TaskProfile:
+    """One measured task, check or export phase."""
+
+    name: str
+    kind: str  # "task", "check" or "export"
+    wall_time: float = 0.0
+    commands: Optional[int] = None
+    peak_memory_delta_mb: Optional[float] = None
+    ok: bool = True
+    slow: bool = False
+
+
+class TaskProfiler(ptk.LoggingMixin):
+    """Collects a :class:`TaskProfile` per measured entry of one export session.
+
+    Parameters:
+        slow_threshold: Seconds above which an entry is flagged as slow.
+            0 or None disables flagging.
+        count_commands: Count Maya commands per entry. The callback costs a
+            Python call per command, so it is only installed while a session
+            is open.
+    """
+
+    REPORT_VERSION = 1
+
+    def __init__(self, slow_threshold: float = 5.0, count_commands: bool = True):
+        super().__init__()
+        self.slow_threshold = slow_threshold
+        self.count_commands = count_commands
+        self.entries: List[TaskProfile] = []
+        self.started_at: Optional[str] = None
+        self.total_time = 0.0
+        self._depth = 0
+        self._t0 = 0.0
+        self._commands = 0
+        self._callback_id = None
+
+    # ---- session ----------------------------------------------------------
+
+    def start(self) -> None:
+        """Open a session; the outermost call resets the previous one.
+
+        Nested calls only deepen the session, so ``TaskManager`` can open one
+        around its own run without cutting the exporter's in two.
+        """
+        self._depth += 1
+        if self._depth > 1:
+            return
+        self.entries = []
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.total_time = 0.0
+        self._commands = 0
+        self._t0 = time.perf_counter()
+        if self.count_commands and om2 is not None:
+            try:
+                self._callback_id = om2.MCommandMessage.addCommandCallback(
+                    self._on_command
+                )
+            except (RuntimeError, AttributeError) as e:
+                self.logger.debug(f"Command counting unavailable: {e}")
+                self._callback_id = None
+
+    def stop(self) -> None:
+        """Close the session opened by the matching :meth:`start`."""
+        if self._depth == 0:
+            return
+        self._depth -= 1
+        if self._depth:
+            return
+        self.total_time = time.perf_counter() - self._t0
+        if self._callback_id is not None:
+            try:
+                om2.MMessage.removeCallback(self._callback_id)
+            except RuntimeError:
+                pass
+            self._callback_id = None
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator["TaskProfiler"]:
+        """:meth:`start` / :meth:`stop` as a context manager."""
+        self.start()
+        try:
+            yield self
+        finally:
+            self.stop()
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    def _on_command(self, *_args) -> None:
+        self._commands += 1
+
+    # ---- measuring --------------------------------------------------------
+
+    @contextlib.contextmanager
+    def measure(self, name: str, kind: Optional[str] = None) -> Iterator[TaskProfile]:
+        """Time the block as one entry named *name*.
+
+        Parameters:
+            name: The task / check method name, or an export phase label.
+            kind: "task", "check" or "export". Defaults to the ``check_``
+                prefix convention of the task pipeline.
+
+        Yields:
+            (TaskProfile): The entry, filled in when the block exits. An
+                exception marks it ``ok=False`` and propagates.
+        """
+        if kind is None:
+            kind = "check" if name.startswith("check_") else "task"
+        entry = TaskProfile(name=name, kind=kind)
+        counting = self._callback_id is not None
+        commands0 = self._commands
+        peak0 = _peak_rss_mb()
+        t0 = time.perf_counter()
+        try:
+            yield entry
+        except BaseException:
+            entry.ok = False
+            raise
+        finally:
+            entry.wall_time = time.perf_counter() - t0
+            if counting:
+                entry.commands = self._commands - commands0
+            peak1 = _peak_rss_mb()
+            if peak0 is not None and peak1 is not None:
+                entry.peak_memory_delta_mb = round(peak1 - peak0, 3)
+            entry.slow = bool(
+                self.slow_threshold and entry.wall_time >= self.slow_threshold
+            )
+            self.entries.append(entry)
+
+    # ---- reporting --------------------------------------------------------
+
+    @property
+    def slow_entries(self) -> List[TaskProfile]:
+        """Flagged entries, slowest first."""
+        return sorted(
+            (e for e in self.entries if e.slow), key=lambda e: -e.wall_time
+        )
+
+    def to_dict(self, **metadata) -> Dict[str, Any]:
+        """The session as a JSON-ready dict; *metadata* is stored alongside."""
+        total = self.total_time if not self.active else time.perf_counter() - self._t0
+        return {
+            "version": self.REPORT_VERSION,
+            "started_at": self.started_at,
+            "total_time": round(total, 6),
+            "measured_time": round(sum(e.wall_time for e in self.entries), 6),
+            "slow_threshold": self.slow_threshold,
+            "command_counting": any(e.commands is not None for e in self.entries),
+            **metadata,
+            "entries": [
+                {**asdict(e), "wall_time": round(e.wall_time, 6)}
+                for e in self.entries
+            ],
+            "slow": [e.name for e in self.slow_entries],
+        }
+
+    def write_json(self, path: str, **metadata) -> str:
+        """Write :meth:`to_dict` to *path* and return the path."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(**metadata), f, indent=2)
+        return path
+
+    def summary_lines(self, top: int = 5) -> List[str]:
+        """A short human-readable summary: totals, then the *top* slowest."""
+        if not self.entries:
+            return []
+        measured = sum(e.wall_time for e in self.entries)
+        lines = [f"Measured: {len(self.entries)} entries in {measured:.2f}s"]
+        for e in sorted(self.entries, key=lambda e: -e.wall_time)[:top]:
+            detail = [f"{e.wall_time:.2f}s"]
+            if e.commands is not None:
+                detail.append(f"{e.commands} cmds")
+            if e.peak_memory_delta_mb:
+                detail.append(f"+{e.peak_memory_delta_mb:.0f} MB peak")
+            flag = "  [SLOW]" if e.slow else ""
+            lines.append(f"{e.name}: {', '.join(detail)}{flag}")
+        return lines
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
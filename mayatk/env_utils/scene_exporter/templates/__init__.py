@@ -0,0 +1,9 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Headless worker scripts for the scene exporter's batch mode.
+
+Each ``*.py`` here is an executable ``mayapy`` script with ``__KEY__`` placeholders that
+:class:`~mayatk.env_utils.scene_exporter.batch_export.MayapyExportLauncher` substitutes
+before launching a worker. Unlike the bake samplers they import mayatk — an export runs
+the whole task pipeline — from the ``sys.path`` the job file carries.
+"""
@@ -0,0 +1,102 @@
+# Batch scene export. Generated by BatchExporter -- do not edit by hand.
+
+"""Open ONE saved scene headlessly (mayapy), run it through ``SceneExporter.perform_export``
+and write what happened as a JSON result.
+
+The job file (JSON) names the scene, the export folder, the export mode, the
+``perform_export`` keyword arguments, the output path and the driver's ``sys.path`` (so
+mayatk and pythontk import from wherever the driving session found them).
+
+The result records ``success``, ``export_path``, ``incremental`` (the unit's status when
+the export ran incrementally), ``failed_checks``, ``error`` (a traceback, when the export
+raised) and ``duration``. A failed export still writes its result -- the driver tells a
+reported failure (not retried) from a crashed worker (no result; retried).
+
+Runs under ``mayapy`` via ``pythontk.run_script_to_artifact``, which judges success by the
+output file's existence -- NOT the exit code (standalone teardown is a known crasher, hence
+the ``os._exit`` below). The result is written to a ``.part`` file and renamed, so a worker
+killed mid-write never leaves a plausible-looking artifact behind.
+
+Underscore-prefixed: internal to the batch exporter, not a user-pickable recipe.
+"""
+
+import os
+import sys
+import json
+import time
+import traceback
+
+JOB_FILE = r"__JOB_FILE__"
+
+
+def export(job, result):
+    """Open the job's scene and export it, filling *result* in place."""
+    import maya.standalone
+
+    maya.standalone.initialize(name="python")
+    import maya.cmds as cmds
+
+    try:
+        cmds.loadPlugin("fbxmaya", quiet=True)
+    except RuntimeError:
+        pass  # perform_export reports the missing translator itself
+    cmds.file(job["scene"], open=True, force=True, prompt=False)
+
+    from mayatk.env_utils.scene_exporter._scene_exporter import SceneExporter
+
+    mode = job.get("export_mode") or "visible"
+    exporter = SceneExporter()
+    success = exporter.perform_export(
+        export_dir=job.get("export_dir") or os.path.dirname(job["scene"]),
+        objects=lambda: SceneExporter.objects_for_mode(mode),
+        export_visible=mode != "selected",
+        **job.get("kwargs", {}),
+    )
+    result["success"] = bool(success)
+    result["export_path"] = getattr(exporter, "export_path", None)
+    result["failed_checks"] = [
+        str(c) for c in getattr(exporter.task_manager, "_last_failed_checks", [])
+    ]
+    if exporter.incremental_results:
+        result["incremental"] = exporter.incremental_results[-1].get("status")
+
+
+def main():
+    with open(JOB_FILE, "r") as f:
+        job = json.load(f)
+    for path in reversed(job.get("sys_path", [])):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    result = {"scene": job["scene"], "success": False}
+    t0 = time.time()
+    try:
+        export(job, result)
+    except Exception:
+        result["error"] = traceback.format_exc()
+        traceback.print_exc()
+    result["duration"] = time.time() - t0
+
+    part = job["output"] + ".part"
+    with open(part, "w") as f:
+        json.dump(result, f, indent=2, default=str)
+    os.replace(part, job["output"])
+    print(
+        "Exported {} -> {} ({})".format(
+            job["scene"],
+            result.get("export_path"),
+            "ok" if result["success"] else "failed",
+        )
+    )
+
+
+try:
+    main()
+except Exception:
+    traceback.print_exc()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(1)
+# Success is judged by the artifact; skip standalone teardown (known access violations).
+sys.stdout.flush()
+os._exit(0)
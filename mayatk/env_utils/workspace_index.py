@@ -0,0 +1,511 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Persistent, incrementally refreshed index of the scene files under a project root.
+
+``WorkspaceManager`` used to answer "which workspaces are under this root, and which
+scenes does each hold" by walking the tree and ``stat``-ing every scene on every refresh
+— synchronously, on the UI thread. On a networked project root that is seconds per
+refresh, and the Reference Manager and Workspace Map refresh often.
+
+``WorkspaceIndex`` keeps the answer in one SQLite file per root:
+
+- ``dirs`` — every directory under the root: its mtime, its subdirectories, whether it
+  holds a ``workspace.mel`` marker (and that workspace's scene folder).
+- ``files`` — every indexed scene: path, folder, stem, extension, size, mtime, and
+  whether it is a numbered autosave.
+
+A refresh walks the tree with ``os.scandir`` but only RE-LISTS a directory whose mtime
+changed: adding, removing or renaming an entry changes its parent's mtime, so an
+unchanged directory's listing (files and subdirectories) is reused from the index and
+the walk costs one ``stat`` per directory. Known trade: a scene re-saved IN PLACE keeps
+its directory's mtime, so its cached size/mtime stay stale until ``refresh(full=True)``.
+
+Refreshes run on a background thread (:meth:`refresh_async`); queries
+(:meth:`workspaces`, :meth:`scenes`, :meth:`workspace_stats`) are plain reads, so the
+UI thread never walks the disk once an index exists. Readers and the writer use
+separate connections in WAL mode — a read never blocks on an in-flight refresh.
+"""
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import pythontk as ptk
+
+
+class WorkspaceIndex(ptk.LoggingMixin):
+    """SQLite scene index for one project root.
+
+    Obtain instances through :meth:`for_root` so every panel browsing the same root
+    shares one index (and one background refresh).
+
+    Parameters:
+        root (str): The project root to index.
+        db_path (str): SQLite file. Default: :meth:`default_cache_dir` / ``<sha1>.sqlite``.
+        extensions (tuple): Scene extensions to index (lowercase, with dot). Queries
+            filter within this set; the default covers everything the Reference
+            Manager lists (``.fbx`` included).
+    """
+
+    SCHEMA_VERSION = 1
+    DEFAULT_EXTENSIONS: Tuple[str, ...] = (".ma", ".mb", ".fbx")
+    WORKSPACE_MARKER = "workspace.mel"
+    # Same rule as EnvUtils.get_workspace_scenes(omit_autosave=True).
+    _AUTOSAVE_RE = re.compile(r".+\.\d{4}\.(ma|mb)$")
+
+    _instances: Dict[Tuple[str, str], "WorkspaceIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root: str,
+        db_path: Optional[str] = None,
+        extensions: Iterable[str] = DEFAULT_EXTENSIONS,
+    ):
+        self.root = ptk.format_path(os.path.normpath(root))
+        self.extensions = tuple(sorted({e.lower() for e in extensions}))
+        if db_path is None:
+            key = hashlib.sha1(os.path.normcase(self.root).encode("utf-8")).hexdigest()
+            db_path = os.path.join(self.default_cache_dir(), f"{key}.sqlite")
+        self.db_path = db_path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._rerun = False
+        self.last_stats: Dict[str, float] = {}
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._init_schema()
+
+    @classmethod
+    def for_root(
+        cls, root: str, extensions: Iterable[str] = DEFAULT_EXTENSIONS
+    ) -> "WorkspaceIndex":
+        """The shared index for *root* (created on first request)."""
+        norm = ptk.format_path(os.path.normpath(root))
+        key = (os.path.normcase(norm), ",".join(sorted(e.lower() for e in extensions)))
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(norm, extensions=extensions)
+            return index
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        """``$MAYATK_WORKSPACE_INDEX_DIR``, else ``<maya user app dir>/mayatk/workspace_index``.
+
+        Falls back to ``~/.mayatk/workspace_index`` outside Maya.
+        """
+        env = os.environ.get("MAYATK_WORKSPACE_INDEX_DIR")
+        if env:
+            return env
+        try:
+            import maya.cmds as cmds
+
+            base = cmds.internalVar(userAppDir=True)
+            if isinstance(base, str) and base:
+                return os.path.join(base, "mayatk", "workspace_index")
+        except Exception:  # noqa: BLE001 - no Maya (headless tooling / mock tests)
+            pass
+        return os.path.join(os.path.expanduser("~"), ".mayatk", "workspace_index")
+
+    # ------------------------------------------------------------------ storage
+
+    def _connection(self) -> sqlite3.Connection:
+        """This thread's connection (sqlite3 connections are thread-bound)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE key='schema'").fetchone()
+            if row is not None and int(row[0]) != self.SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS dirs")
+                conn.execute("DROP TABLE IF EXISTS files")
+                conn.execute("DELETE FROM meta")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS dirs ("
+                " path TEXT PRIMARY KEY, mtime REAL, subdirs TEXT,"
+                " marker INTEGER, scene_dir TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS files ("
+                " path TEXT PRIMARY KEY, dir TEXT, stem TEXT, ext TEXT,"
+                " size INTEGER, mtime REAL, autosave INTEGER)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS files_dir ON files (dir)")
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('schema', ?)",
+                (str(self.SCHEMA_VERSION),),
+            )
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('root', ?)", (self.root,))
+
+    def close(self) -> None:
+        """Close this thread's connection (others close with their threads)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ------------------------------------------------------------------ refresh
+
+    @property
+    def is_populated(self) -> bool:
+        """True once a refresh has completed for this root."""
+        row = self._connection().execute(
+            "SELECT value FROM meta WHERE key='last_refresh'"
+        ).fetchone()
+        return row is not None
+
+    @property
+    def last_refresh(self) -> Optional[float]:
+        """Epoch seconds of the last completed refresh, or None."""
+        row = self._connection().execute(
+            "SELECT value FROM meta WHERE key='last_refresh'"
+        ).fetchone()
+        return float(row[0]) if row else None
+
+    @property
+    def is_refreshing(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def refresh(self, full: bool = False) -> Dict[str, float]:
+        """Bring the index up to date with the disk (blocking; any thread).
+
+        Parameters:
+            full (bool): Re-list every directory and re-stat every scene, ignoring
+                directory mtimes (picks up in-place re-saves).
+
+        Returns:
+            (dict) ``dirs_scanned``, ``dirs_skipped``, ``files``, ``changed``
+                (rows written or removed) and ``elapsed`` (s). Also kept on
+                :attr:`last_stats`.
+        """
+        with self._write_lock:
+            return self._refresh_locked(full)
+
+    def _refresh_locked(self, full: bool) -> Dict[str, float]:
+        start = time.perf_counter()
+        conn = self._connection()
+        known = {
+            path: (mtime, json.loads(subdirs), marker, scene_dir)
+            for path, mtime, subdirs, marker, scene_dir in conn.execute(
+                "SELECT path, mtime, subdirs, marker, scene_dir FROM dirs"
+            )
+        }
+        stats = {"dirs_scanned": 0, "dirs_skipped": 0, "files": 0, "changed": 0}
+        seen = set()
+        stack = [self.root]
+        with conn:
+            while stack:
+                path = stack.pop()
+                try:
+                    mtime = os.stat(path).st_mtime
+                except OSError:
+                    continue
+                seen.add(path)
+                prev = known.get(path)
+                if not full and prev is not None and prev[0] == mtime:
+                    stats["dirs_skipped"] += 1
+                    stack.extend(prev[1])
+                    continue
+                stats["dirs_scanned"] += 1
+                subdirs, rows, marker = self._scan_dir(path)
+                scene_dir = self._scene_dir(path) if marker else None
+                old_files = {
+                    r[0]: r[1:]
+                    for r in conn.execute(
+                        "SELECT path, size, mtime FROM files WHERE dir=?", (path,)
+                    )
+                }
+                new_files = {r[0]: (r[4], r[5]) for r in rows}
+                if old_files != new_files or prev is None or (
+                    (prev[2], prev[3]) != (int(marker), scene_dir)
+                ):
+                    stats["changed"] += 1
+                conn.execute("DELETE FROM files WHERE dir=?", (path,))
+                conn.executemany("INSERT OR REPLACE INTO files VALUES (?,?,?,?,?,?,?)", rows)
+                conn.execute(
+                    "INSERT OR REPLACE INTO dirs VALUES (?,?,?,?,?)",
+                    (path, mtime, json.dumps(subdirs), int(marker), scene_dir),
+                )
+                stack.extend(subdirs)
+
+            gone = [p for p in known if p not in seen]
+            if gone:
+                stats["changed"] += len(gone)
+                conn.executemany("DELETE FROM dirs WHERE path=?", [(p,) for p in gone])
+                conn.executemany("DELETE FROM files WHERE dir=?", [(p,) for p in gone])
+            stats["files"] = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('last_refresh', ?)",
+                (repr(time.time()),),
+            )
+        stats["elapsed"] = time.perf_counter() - start
+        self.last_stats = stats
+        self.logger.debug(f"WorkspaceIndex {self.root}: {stats}")
+        return stats
+
+    def _scan_dir(self, path: str) -> Tuple[List[str], List[tuple], bool]:
+        """One ``scandir`` of *path*: (subdirs, file rows, has workspace marker)."""
+        subdirs: List[str] = []
+        rows: List[tuple] = []
+        marker = False
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(ptk.format_path(entry.path))
+                            continue
+                        if entry.name == self.WORKSPACE_MARKER:
+                            marker = True
+                            continue
+                        stem, ext = os.path.splitext(entry.name)
+                        if ext.lower() not in self.extensions:
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    rows.append(
+                        (
+                            ptk.format_path(entry.path),
+                            path,
+                            stem,
+                            ext.lower(),
+                            st.st_size,
+                            st.st_mtime,
+                            int(bool(self._AUTOSAVE_RE.match(entry.name))),
+                        )
+                    )
+        except OSError:
+            pass
+        return sorted(subdirs), rows, marker
+
+    @staticmethod
+    def _scene_dir(workspace_path: str) -> str:
+        """The project's own ``scene`` rule folder (``Workspace.scene_dir``)."""
+        try:
+            return ptk.format_path(ptk.Workspace.load(workspace_path).scene_dir)
+        except Exception:  # noqa: BLE001 - unreadable workspace.mel: assume the root
+            return workspace_path
+
+    def refresh_async(
+        self,
+        full: bool = False,
+        on_complete: Optional[Callable[["WorkspaceIndex", Dict[str, float]], None]] = None,
+    ) -> threading.Thread:
+        """Refresh on a daemon thread; at most one in flight per index.
+
+        A request made while a refresh is running schedules ONE follow-up pass
+        (the running walk may already be past the change that prompted it).
+        *on_complete(index, stats)* runs on the WORKER thread — marshal to the UI
+        thread before touching widgets (``maya.utils.executeDeferred``).
+        """
+        with self._thread_lock:
+            if self.is_refreshing:
+                self._rerun = True
+                return self._thread
+
+            def run():
+                while True:
+                    try:
+                        stats = self.refresh(full=full)
+                    except Exception:
+                        self.logger.warning(
+                            f"WorkspaceIndex: refresh of {self.root} failed",
+                            exc_info=True,
+                        )
+                        stats = None
+                    finally:
+                        self.close()
+                    if stats is not None and on_complete is not None:
+                        try:
+                            on_complete(self, stats)
+                        except Exception:
+                            self.logger.warning(
+                                "WorkspaceIndex: on_complete failed", exc_info=True
+                            )
+                    with self._thread_lock:
+                        if not self._rerun:
+                            self._thread = None
+                            return
+                        self._rerun = False
+
+            self._thread = threading.Thread(
+                target=run, daemon=True, name="WorkspaceIndexRefresh"
+            )
+            self._thread.start()
+            return self._thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until an in-flight refresh finishes. False on timeout."""
+        thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    # ------------------------------------------------------------------ queries
+
+    @staticmethod
+    def _prefix_range(folder: str) -> Tuple[str, str]:
+        """``path >= lo AND path < hi`` selects everything under *folder*.
+
+        ``'0'`` sorts directly after ``'/'``, so the range is exactly the
+        ``folder/`` prefix — index-friendly and case-sensitive, unlike LIKE.
+        """
+        folder = ptk.format_path(os.path.normpath(folder)).rstrip("/")
+        return folder + "/", folder + "0"
+
+    @staticmethod
+    def _ext_filter(file_types: Optional[Iterable[str]]) -> Optional[List[str]]:
+        """Globs (``"*.ma"``) or extensions (``".ma"``) -> lowercase extensions."""
+        if file_types is None:
+            return None
+        return ["." + t.lower().lstrip("*").lstrip(".") for t in file_types]
+
+    def scenes(
+        self,
+        folder: Optional[str] = None,
+        file_types: Optional[Iterable[str]] = None,
+        omit_autosave: bool = True,
+        prefix: Optional[str] = None,
+        suffix: Optional[str] = None,
+        subfolder: Optional[str] = None,
+    ) -> List[str]:
+        """Indexed scene paths (formatted, sorted), optionally filtered.
+
+        Parameters:
+            folder (str): Only scenes under this folder (recursive). Default: all.
+            file_types: Globs or extensions; default every indexed extension.
+            omit_autosave (bool): Skip numbered autosaves (``name.0001.ma``).
+            prefix / suffix (str): Match the file STEM's start / end
+                (the Reference Manager's suffix filter).
+            subfolder (str): Relative folder path the scene's directory must END
+                with, matched by whole path components (``"scenes/shots"``).
+        """
+        sql = "SELECT path, dir, stem FROM files WHERE 1=1"
+        args: List = []
+        if folder:
+            lo, hi = self._prefix_range(folder)
+            sql += " AND path >= ? AND path < ?"
+            args += [lo, hi]
+        exts = self._ext_filter(file_types)
+        if exts is not None:
+            if not exts:
+                return []
+            sql += f" AND ext IN ({','.join('?' * len(exts))})"
+            args += exts
+        if omit_autosave:
+            sql += " AND autosave = 0"
+        sql += " ORDER BY path"
+        rows = self._connection().execute(sql, args).fetchall()
+
+        tail = None
+        if subfolder:
+            tail = [p for p in ptk.format_path(os.path.normpath(subfolder)).split("/") if p]
+        result = []
+        for path, dirpath, stem in rows:
+            if prefix and not stem.startswith(prefix):
+                continue
+            if suffix and not stem.endswith(suffix):
+                continue
+            if tail and dirpath.split("/")[-len(tail):] != tail:
+                continue
+            result.append(path)
+        return result
+
+    def workspaces(
+        self,
+        recursive: bool = True,
+        ignore_empty: bool = True,
+        file_types: Optional[Iterable[str]] = None,
+    ) -> List[Tuple[str, str]]:
+        """``(dirname, path)`` for every marked workspace under the root.
+
+        Mirrors ``EnvUtils.find_workspaces(return_type="dirname|dir")``:
+        *recursive* False keeps the root and its immediate children;
+        *ignore_empty* drops workspaces whose scene folder holds no scene of
+        *file_types*. Sorted root first, then by path.
+        """
+        rows = self._connection().execute(
+            "SELECT path, scene_dir FROM dirs WHERE marker = 1 ORDER BY path"
+        ).fetchall()
+        root_depth = self.root.rstrip("/").count("/")
+        result = []
+        for path, scene_dir in rows:
+            depth = path.rstrip("/").count("/") - root_depth
+            if not recursive and depth > 1:
+                continue
+            if ignore_empty and not self._has_scene(scene_dir or path, file_types):
+                continue
+            result.append((os.path.basename(path.rstrip("/")), path))
+        result.sort(key=lambda r: (r[1] != self.root, r[1].lower()))
+        return result
+
+    def _has_scene(self, folder: str, file_types) -> bool:
+        lo, hi = self._prefix_range(folder)
+        sql = "SELECT 1 FROM files WHERE path >= ? AND path < ? AND autosave = 0"
+        args: List = [lo, hi]
+        exts = self._ext_filter(file_types)
+        if exts is not None:
+            if not exts:
+                return False
+            sql += f" AND ext IN ({','.join('?' * len(exts))})"
+            args += exts
+        return self._connection().execute(sql + " LIMIT 1", args).fetchone() is not None
+
+    def workspace_stats(
+        self, folder: str, file_types: Optional[Iterable[str]] = None, recent: int = 5
+    ) -> Dict:
+        """Scene count, total size, newest mtime and the *recent* newest scenes under *folder*.
+
+        The numbers ``WorkspaceMap._analyze_workspace`` reports — one indexed
+        query instead of a ``stat`` per scene.
+        """
+        lo, hi = self._prefix_range(folder)
+        sql = "FROM files WHERE path >= ? AND path < ? AND autosave = 0"
+        args: List = [lo, hi]
+        exts = self._ext_filter(file_types)
+        if exts is not None:
+            sql += f" AND ext IN ({','.join('?' * len(exts)) or 'NULL'})"
+            args += exts
+        conn = self._connection()
+        count, size, newest = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0), MAX(mtime) {sql}", args
+        ).fetchone()
+        recent_rows = conn.execute(
+            f"SELECT path {sql} ORDER BY mtime DESC LIMIT ?", args + [recent]
+        ).fetchall()
+        return {
+            "scene_count": count,
+            "size": size,
+            "last_modified": newest,
+            "recent_files": [r[0] for r in recent_rows],
+        }
+
+    def stat(self, path: str) -> Optional[Tuple[int, float]]:
+        """Indexed ``(size, mtime)`` of a scene, or None if not indexed."""
+        row = self._connection().execute(
+            "SELECT size, mtime FROM files WHERE path = ?",
+            (ptk.format_path(os.path.normpath(path)),),
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+
+# -----------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
@@ -8,6 +8,7 @@ import pythontk as ptk
 
 # from this package:
 from mayatk.env_utils._env_utils import EnvUtils
+from mayatk.env_utils.workspace_index import WorkspaceIndex
 
 
 class WorkspaceManager(ptk.HelpMixin, ptk.LoggingMixin):
@@ -18,6 +19,11 @@ class WorkspaceManager(ptk.HelpMixin, ptk.LoggingMixin):
     # references natively) without reimplementing the scan.
     SCENE_FILE_TYPES: tuple[str, ...] = EnvUtils.SCENE_FILE_TYPES
 
+    # Serve workspace discovery and scene lists from the persistent
+    # ``WorkspaceIndex`` instead of walking the tree on every refresh. Off by default
+    # (scripted callers keep the synchronous scan); the interactive panels opt in.
+    USE_WORKSPACE_INDEX: bool = False
+
     def __init__(self):
         self._workspace_files = None
         self._recursive_search = True
@@ -123,6 +129,14 @@ class WorkspaceManager(ptk.HelpMixin, ptk.LoggingMixin):
         if not root_dir or not os.path.isdir(root_dir):
             return []
 
+        index = self.workspace_index(root_dir)
+        if index is not None:
+            return index.workspaces(
+                recursive=self.recursive_search,
+                ignore_empty=self.ignore_empty_workspaces,
+                file_types=self.SCENE_FILE_TYPES,
+            )
+
         return EnvUtils.find_workspaces(
             root_dir,
             return_type="dirname|dir",
@@ -140,8 +154,13 @@ class WorkspaceManager(ptk.HelpMixin, ptk.LoggingMixin):
         if not workspaces:
             return
 
+        index = self.workspace_index(refresh=False)
         for _, ws_path in workspaces:
-            if os.path.isdir(ws_path):
+            if index is not None:
+                self._workspace_files[ws_path] = index.scenes(
+                    ws_path, file_types=self.SCENE_FILE_TYPES
+                )
+            elif os.path.isdir(ws_path):
                 # Always search recursively within the workspace (including scenes/ subdirectory)
                 # The recursive_search setting only controls workspace discovery
                 scenes = EnvUtils.get_workspace_scenes(
@@ -153,6 +172,65 @@ class WorkspaceManager(ptk.HelpMixin, ptk.LoggingMixin):
                 )
                 self._workspace_files[ws_path] = scenes
 
+    def workspace_index(
+        self, root_dir: str = None, refresh: bool = True
+    ) -> Optional[WorkspaceIndex]:
+        """The scene index for *root_dir* (default: the current working dir), or None.
+
+        None unless :attr:`USE_WORKSPACE_INDEX` is set. A root not indexed yet
+        also returns None, so the caller falls back to the plain scan, while the
+        index is built on a background thread; its completion reaches
+        :meth:`_on_workspace_index_changed` and the panel re-queries from the
+        index. After that every call returns the stored index at once and
+        queues an incremental background refresh, whose completion — only when
+        something on disk changed — takes the same route. *refresh* False skips
+        the queueing (a second lookup within one rebuild).
+        """
+        if not getattr(self, "USE_WORKSPACE_INDEX", False):
+            return None
+        if root_dir is None:
+            root_dir = self.current_working_dir
+        if not root_dir or not os.path.isdir(root_dir):
+            return None
+        try:
+            index = WorkspaceIndex.for_root(root_dir)
+            if not index.is_populated:
+                if not index.is_refreshing:
+                    index.refresh_async(on_complete=self._workspace_index_refreshed)
+                return None
+            if refresh:
+                index.refresh_async(on_complete=self._workspace_index_refreshed)
+        except Exception as e:  # unwritable cache dir, corrupt db: fall back to scanning
+            self.logger.warning(f"Workspace index unavailable ({e}); scanning instead.")
+            return None
+        return index
+
+    def _workspace_index_refreshed(self, index: WorkspaceIndex, stats: dict) -> None:
+        """Worker-thread completion: forward real changes to the main thread."""
+        if not stats.get("changed"):
+            return
+        try:
+            from maya.utils import executeDeferred
+        except ImportError:
+            executeDeferred = lambda fn, *a: fn(*a)  # noqa: E731 - no Maya event loop
+        executeDeferred(self._deliver_workspace_index_change, index)
+
+    def _deliver_workspace_index_change(self, index: WorkspaceIndex) -> None:
+        # The user may have browsed elsewhere while the refresh ran.
+        current = self.current_working_dir
+        if current and os.path.normcase(
+            ptk.format_path(os.path.normpath(current))
+        ) == os.path.normcase(index.root):
+            self._on_workspace_index_changed(index)
+
+    def _on_workspace_index_changed(self, index: WorkspaceIndex) -> None:
+        """Main-thread hook: the index for *index.root* picked up disk changes.
+
+        Drops the cached scene lists; UI subclasses override to re-query and
+        repaint.
+        """
+        self._workspace_files = None
+
     def resolve_file_path(self, selected_file: str) -> Optional[str]:
         """Resolve a file name to its full path by searching in workspace files."""
         return EnvUtils.resolve_file_path_in_workspaces(
@@ -67,14 +67,15 @@ class WorkspaceMap(WorkspaceManager, ptk.HelpMixin, ptk.LoggingMixin):
         if not workspaces:
             self.logger.warning("No valid workspaces found.")
 
+        index = self.workspace_index(refresh=False)
         for workspace_name, workspace_path in workspaces:
             if os.path.isdir(workspace_path):
-                workspace_info = self._analyze_workspace(workspace_path)
+                workspace_info = self._analyze_workspace(workspace_path, index=index)
                 workspace_info["name"] = workspace_name
                 workspace_info["path"] = workspace_path
                 self._workspace_data[workspace_path] = workspace_info
 
-    def _analyze_workspace(self, workspace_path: str) -> Dict:
+    def _analyze_workspace(self, workspace_path: str, index=None) -> Dict:
         """Analyze a workspace and return information about it.
 
         Deliberately cheap: one ``stat`` per scene file (reused for both the
@@ -83,10 +84,12 @@ class WorkspaceMap(WorkspaceManager, ptk.HelpMixin, ptk.LoggingMixin):
         on disk — for every discovered workspace, synchronously, on each
         refresh — which stalls the UI for seconds on a real project root.
         ``size_mb`` is therefore the size of the *scene files*, which is what a
-        scene browser is actually reporting on.
+        scene browser is actually reporting on. With a ``WorkspaceIndex`` the
+        scene list and stats come from the index and nothing is stat'ed.
 
         Args:
             workspace_path: Path to the workspace directory
+            index: Optional ``WorkspaceIndex`` covering *workspace_path*.
 
         Returns:
             Dictionary containing workspace analysis data
@@ -101,6 +104,20 @@ class WorkspaceMap(WorkspaceManager, ptk.HelpMixin, ptk.LoggingMixin):
         }
 
         try:
+            if index is not None:
+                info["scenes"] = index.scenes(
+                    workspace_path, file_types=self.SCENE_FILE_TYPES
+                )
+                stats = index.workspace_stats(
+                    workspace_path, file_types=self.SCENE_FILE_TYPES
+                )
+                info["scene_count"] = stats["scene_count"]
+                info["recent_files"] = stats["recent_files"]
+                info["last_modified"] = stats["last_modified"]
+                info["size_mb"] = stats["size"] / (1024 * 1024)
+                info["subdirectories"] = self._list_subdirectories(workspace_path)
+                return info
+
             # Get scene files. Always recursive: ``recursive_search`` governs
             # workspace *discovery* only (same rule ``invalidate_workspace_files``
             # states) — a project's scenes/sub/ files are still its scenes.
@@ -133,22 +150,25 @@ class WorkspaceMap(WorkspaceManager, ptk.HelpMixin, ptk.LoggingMixin):
                 info["last_modified"] = scene_data[0][1]
             info["size_mb"] = total_size / (1024 * 1024)  # Convert to MB
 
-            # Get subdirectories
-            try:
-                subdirs = [
-                    d
-                    for d in os.listdir(workspace_path)
-                    if os.path.isdir(os.path.join(workspace_path, d))
-                ]
-                info["subdirectories"] = subdirs
-            except OSError:
-                pass
+            info["subdirectories"] = self._list_subdirectories(workspace_path)
 
         except Exception as e:
             self.logger.error(f"Error analyzing workspace {workspace_path}: {e}")
 
         return info
 
+    @staticmethod
+    def _list_subdirectories(workspace_path: str) -> List[str]:
+        """Names of the workspace's immediate subdirectories ([] if unreadable)."""
+        try:
+            return [
+                d
+                for d in os.listdir(workspace_path)
+                if os.path.isdir(os.path.join(workspace_path, d))
+            ]
+        except OSError:
+            return []
+
     def get_workspace_tree_data(self, filter_text: str = None) -> Dict:
         """Get workspace data organized for tree display.
 
@@ -241,6 +261,8 @@ class WorkspaceMap(WorkspaceManager, ptk.HelpMixin, ptk.LoggingMixin):
 class WorkspaceMapController(WorkspaceMap, ptk.LoggingMixin):
     """Controller for the WorkspaceMap UI components."""
 
+    USE_WORKSPACE_INDEX = True
+
     def __init__(self, slot, log_level="WARNING"):
         super().__init__()
         self.logger.setLevel(log_level)
@@ -343,6 +365,11 @@ class WorkspaceMapController(WorkspaceMap, ptk.LoggingMixin):
             self.invalidate_workspace_data()
         self._update_workspace_tree()
 
+    def _on_workspace_index_changed(self, index):
+        """A background index refresh found changes on disk: rebuild the tree."""
+        super()._on_workspace_index_changed(index)
+        self.refresh_tree(invalidate=True)
+
     def selected_workspace(self) -> Optional[Dict]:
         """The workspace record under the tree cursor, or None (a directory
         grouping row selects to None)."""
@@ -0,0 +1,127 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Background file-existence checks with a short-lived result cache.
+
+The Texture Path Editor colours every missing texture red, which meant an
+``os.path.exists`` per path on the UI thread each time the table rebuilt --
+seconds per scene edit with thousands of file nodes on a network share.
+
+:class:`PathStatusCache` moves the ``stat`` calls to a thread pool:
+:meth:`~PathStatusCache.request` queues the paths that have no fresh result
+and returns at once, :meth:`~PathStatusCache.drain` hands the finished
+results back on the caller's (UI) thread, and :meth:`~PathStatusCache.get`
+answers from the cache until an entry is ``ttl`` seconds old. Results never
+cross threads through Qt, so the cache has no Qt dependency; the panel polls
+``drain`` from a timer while :attr:`~PathStatusCache.pending` is non-zero.
+"""
+
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, NamedTuple, Optional
+
+
+class PathStatus(NamedTuple):
+    """Result of one ``stat``: whether the file exists and its size in bytes."""
+
+    exists: bool
+    size: Optional[int] = None
+
+
+class PathStatusCache:
+    """``stat`` results for absolute paths, checked off the calling thread."""
+
+    def __init__(self, ttl: float = 10.0, max_workers: int = 8):
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self._results: Dict[str, tuple] = {}  # path -> (PathStatus, time checked)
+        self._queued: set = set()
+        self._finished: Dict[str, PathStatus] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def check(path: str) -> PathStatus:
+        """``stat`` *path* (blocking)."""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return PathStatus(False)
+        return PathStatus(True, st.st_size)
+
+    @property
+    def pending(self) -> int:
+        """Checks queued or running."""
+        with self._lock:
+            return len(self._queued)
+
+    def get(self, path: str) -> Optional[PathStatus]:
+        """The cached status of *path*, or None when unchecked or expired."""
+        with self._lock:
+            entry = self._results.get(path)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def request(self, paths: Iterable[str]) -> int:
+        """Queue a check for each of *paths* without a fresh result.
+
+        Returns:
+            (int) The number of checks queued by this call.
+        """
+        queued = 0
+        for path in dict.fromkeys(paths):
+            if not path or self.get(path) is not None:
+                continue
+            with self._lock:
+                if path in self._queued:
+                    continue
+                self._queued.add(path)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="PathStatus"
+                )
+            self._executor.submit(self._run, path)
+            queued += 1
+        return queued
+
+    def _run(self, path: str) -> None:
+        status = self.check(path)
+        with self._lock:
+            self._results[path] = (status, time.monotonic())
+            self._finished[path] = status
+            self._queued.discard(path)
+
+    def drain(self) -> Dict[str, PathStatus]:
+        """Results finished since the last call, ``{path: PathStatus}``."""
+        with self._lock:
+            finished, self._finished = self._finished, {}
+        return finished
+
+    def invalidate(self, paths: Optional[Iterable[str]] = None) -> None:
+        """Forget *paths* (all results when None) so the next request re-checks."""
+        with self._lock:
+            if paths is None:
+                self._results.clear()
+            else:
+                for path in paths:
+                    self._results.pop(path, None)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; queued checks are dropped."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            self._queued.clear()
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
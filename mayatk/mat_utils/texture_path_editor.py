@@ -17,6 +17,8 @@ from uitk.widgets.footer import FooterStatusController
 from mayatk.core_utils.script_job_manager import ScriptJobManager
 from mayatk.env_utils._env_utils import EnvUtils
 from mayatk.mat_utils._mat_utils import MatUtils
+from mayatk.mat_utils.path_status import PathStatusCache
+from mayatk.mat_utils.texture_index import TextureStemIndex
 from mayatk.node_utils.attributes._attributes import Attributes
 
 
@@ -81,6 +83,10 @@ class TexturePathEditorSlots:
         self._previous_paths = {}  # node_name -> path before last in-session repath
         self._browse_in_progress = False  # re-entry guard
         self._find_copy_in_progress = False  # re-entry guard
+        # Existence checks for the path column, off the UI thread.
+        self._path_status = PathStatusCache()
+        self._status_timer = None
+        self._workspace_root = None
 
     # ------------------------------------------------------------------
     # Header menu
@@ -543,6 +549,9 @@ class TexturePathEditorSlots:
             _bind_menu_action("delete_file_node", self.delete_file_node)
 
             self._setup_scene_change_callback(widget)
+            scroll = widget.verticalScrollBar()
+            scroll.valueChanged.connect(lambda *_: self._format_visible_rows(widget))
+            scroll.rangeChanged.connect(lambda *_: self._format_visible_rows(widget))
 
         self._refresh_table_content(widget)
 
@@ -1665,18 +1674,16 @@ class TexturePathEditorSlots:
         For a missing ``c130j_..._ao``, this restricts candidates to other
         ``_AO`` files, so an ``_AO`` file node can never get repathed to a
         ``_DIFF`` / ``_NORM`` / ``_SPEC`` file.
+
+        ``index_stems`` is a :class:`TextureStemIndex` (or a plain list of
+        stems), whose per-map-type groups hold each stem's map type and base
+        name, resolved once per file rather than once per run.
         """
-        candidate_meta = []
-        for stem in index_stems:
-            try:
-                map_type = MapFactory.resolve_map_type(stem + ".png", key=True)
-            except Exception:
-                map_type = None
-            try:
-                base = ImgUtils.get_base_texture_name(stem + ".png").lower()
-            except Exception:
-                base = stem
-            candidate_meta.append((stem, base, map_type))
+        index = (
+            index_stems
+            if isinstance(index_stems, TextureStemIndex)
+            else TextureStemIndex.from_stems(index_stems)
+        )
 
         def texture(target, candidates):
             try:
@@ -1690,12 +1697,10 @@ class TexturePathEditorSlots:
             except Exception:
                 target_base = target
 
-            same_map_stems = []
-            same_map_bases = []
-            for stem, base, map_type in candidate_meta:
-                if map_type == target_map:
-                    same_map_stems.append(stem)
-                    same_map_bases.append(base)
+            # Only bases containing (or contained in) the target can score.
+            same_map_stems, same_map_bases = index.same_map_candidates(
+                target_map, target_base
+            )
 
             if not same_map_bases:
                 return None, 0.0, "no_match"
@@ -1764,25 +1769,17 @@ class TexturePathEditorSlots:
             om.MGlobal.displayInfo("No missing textures to resolve.")
             return
 
-        index = []
-        for root, _, files in os.walk(sourceimages):
-            for f in files:
-                stem = os.path.splitext(f)[0]
-                if stem:
-                    index.append((stem.lower(), os.path.join(root, f)))
-        if not index:
+        # Kept between runs; only folders that changed since are re-listed.
+        index = TextureStemIndex.for_root(sourceimages)
+        index.refresh()
+        if not len(index):
             cmds.warning("No files in sourceimages to match against.")
             return
 
         to_project_relative = lambda p: MatUtils.to_project_relative(  # noqa: E731
             p, workspace
         )
-        by_stem = {}
-        for stem_key, abs_path in index:
-            by_stem.setdefault(stem_key, []).append(abs_path)
-        index_stems = list(by_stem.keys())
-
-        strategies = self._strategies_for_modes(modes, index_stems)
+        strategies = self._strategies_for_modes(modes, index)
 
         resolved = 0
         ambiguous = 0
@@ -1791,14 +1788,11 @@ class TexturePathEditorSlots:
         try:
             for node, current_path, stem in missing:
                 stem_lower = stem.lower()
-                match_name, _score, status, strat_name = (
-                    FuzzyMatcher.find_with_fallbacks(
-                        stem_lower,
-                        index_stems,
-                        strategies=strategies,
-                        score_threshold=0.6,
-                        ambiguity_delta=0.05,
-                    )
+                match_name, _score, status, strat_name = index.find_with_fallbacks(
+                    stem_lower,
+                    strategies,
+                    score_threshold=0.6,
+                    ambiguity_delta=0.05,
                 )
                 if status == "no_match":
                     no_match += 1
@@ -1809,7 +1803,7 @@ class TexturePathEditorSlots:
                         f"{node}: ambiguous {strat_name} match for '{stem}', skipped."
                     )
                     continue
-                matches = by_stem.get(match_name) or []
+                matches = index.paths(match_name)
                 if not matches:
                     no_match += 1
                     continue
@@ -1836,6 +1830,7 @@ class TexturePathEditorSlots:
             f"(no match: {no_match}, ambiguous: {ambiguous}); "
             f"strategies: {', '.join(modes)}."
         )
+        om.MGlobal.displayInfo(index.report())
         self.ui.tbl000.init_slot()
 
     # ------------------------------------------------------------------
@@ -1891,11 +1886,18 @@ class TexturePathEditorSlots:
         cmds.evalDeferred(do_refresh)
 
     def _refresh_table_content(self, widget):
-        """Refresh the table content with current scene data."""
+        """Bring the table in line with the scene's file nodes.
+
+        A populated table is patched in place (``_apply_row_diff``): rows of
+        deleted file nodes go, new ones are appended and changed paths are
+        rewritten, so a scene edit costs the rows it touched. An empty table,
+        the "No file nodes found" placeholder, or a diff that would replace
+        every row (a newly opened scene) is rebuilt instead.
+        """
         cmds.waitCursor(state=True)
         try:
             widget.setUpdatesEnabled(False)
-            widget.clear()
+            self._workspace_root = EnvUtils.get_env_info("workspace")
             # Stored .ftn verbatim (no relativized display): Make Paths
             # Absolute / Select Absolute Paths and cell-edit write-back all
             # depend on the cell showing the path the node actually holds.
@@ -1903,39 +1905,14 @@ class TexturePathEditorSlots:
                 return_type="shaderName|path|fileNodeName",
                 exc_classification=self._exclude_arnold_pattern(),
             )
-            if not rows:
-                rows = [("", "", "No file nodes found")]
-
-            formatted = []
-            for shader_name, path, file_node_name in rows:
-                # Stash node names in UserRole so handle_cell_edit can recover
-                # the old name after editing.
-                formatted.append(
-                    [
-                        (shader_name, shader_name),
-                        path,
-                        (file_node_name, file_node_name),
-                    ]
-                )
-
-            widget.add(formatted, headers=["Shader", "Texture Path", "File Node"])
-
-            header = widget.horizontalHeader()
-            header.setSectionsMovable(False)
-            header.setSectionResizeMode(0, self.sb.QtWidgets.QHeaderView.Interactive)
-            header.setSectionResizeMode(1, self.sb.QtWidgets.QHeaderView.Stretch)
-            header.setSectionResizeMode(2, self.sb.QtWidgets.QHeaderView.Interactive)
-            widget.setColumnWidth(0, 200)
-            widget.setColumnWidth(2, 200)
-
-            self.setup_formatting(widget)
-            widget.apply_formatting()
-            self._apply_path_truncation(widget)
+            if not (rows and self._apply_row_diff(widget, rows)):
+                self._rebuild_table(widget, rows)
+            self._collect_over_long_paths(widget)
+            self._format_rows(widget, self._visible_rows(widget))
         finally:
             widget.setUpdatesEnabled(True)
             cmds.waitCursor(state=False)
 
-        # After apply_formatting — that pass is what fills the set.
         over_long = getattr(self, "_over_long_paths", None)
         if over_long:
             cmds.warning(
@@ -1946,6 +1923,113 @@ class TexturePathEditorSlots:
         if self._footer_controller:
             self._footer_controller.update()
 
+    def _rebuild_table(self, widget, rows):
+        """Clear and refill the table from ``(shader, path, file node)`` rows."""
+        widget.clear()
+        if not rows:
+            rows = [("", "", "No file nodes found")]
+
+        formatted = []
+        for shader_name, path, file_node_name in rows:
+            # Stash node names in UserRole so handle_cell_edit can recover
+            # the old name after editing.
+            formatted.append(
+                [
+                    (shader_name, shader_name),
+                    path,
+                    (file_node_name, file_node_name),
+                ]
+            )
+
+        self.setup_formatting(widget)
+        widget.add(formatted, headers=["Shader", "Texture Path", "File Node"])
+
+        header = widget.horizontalHeader()
+        header.setSectionsMovable(False)
+        header.setSectionResizeMode(0, self.sb.QtWidgets.QHeaderView.Interactive)
+        header.setSectionResizeMode(1, self.sb.QtWidgets.QHeaderView.Stretch)
+        header.setSectionResizeMode(2, self.sb.QtWidgets.QHeaderView.Interactive)
+        widget.setColumnWidth(0, 200)
+        widget.setColumnWidth(2, 200)
+        self._apply_path_truncation(widget)
+
+    @staticmethod
+    def _diff_rows(current, rows):
+        """Plan the edits that turn the table's rows into *rows*.
+
+        Parameters:
+            current: ``[(key, path)]`` per table row, top to bottom. ``key`` is
+                ``(shader, file_node)``, or None for a row that isn't one (the
+                placeholder).
+            rows: ``[(shader, path, file_node)]`` as ``get_file_nodes`` returns.
+
+        Returns:
+            (tuple) ``(removed, updated, added)``: table rows to delete, highest
+                first; ``{row: path}`` for surviving rows whose path changed,
+                indexed as after the deletions; ``[(shader, path, file_node)]``
+                to append, in *rows* order.
+        """
+        wanted = {}
+        for shader, path, node in rows:
+            wanted.setdefault((shader, node), path)
+        removed, kept, seen = [], [], set()
+        for row, (key, path) in enumerate(current):
+            if key is None or key not in wanted or key in seen:
+                removed.append(row)
+            else:
+                seen.add(key)
+                kept.append((key, path))
+        updated = {
+            row: wanted[key]
+            for row, (key, path) in enumerate(kept)
+            if wanted[key] != path
+        }
+        added = [
+            (shader, path, node)
+            for (shader, node), path in wanted.items()
+            if (shader, node) not in seen
+        ]
+        return removed[::-1], updated, added
+
+    def _apply_row_diff(self, widget, rows) -> bool:
+        """Patch the table toward *rows*; False when a full rebuild is due."""
+        if widget.columnCount() != 3 or not widget.rowCount():
+            return False
+        UserRole = self.sb.QtCore.Qt.UserRole
+        current = []
+        for row in range(widget.rowCount()):
+            shader, path, node = (widget.item(row, col) for col in range(3))
+            key = None
+            if shader is not None and node is not None and node.data(UserRole):
+                key = (shader.data(UserRole) or "", node.data(UserRole))
+            current.append((key, path.text() if path is not None else ""))
+        removed, updated, added = self._diff_rows(current, rows)
+        if len(removed) == len(current):
+            return False
+
+        QTableWidgetItem = self.sb.QtWidgets.QTableWidgetItem
+        was_blocked = widget.blockSignals(True)
+        try:
+            for row in removed:
+                widget.removeRow(row)
+            for row, path in updated.items():
+                widget.item(row, 1).setText(path)
+            for shader, path, node in added:
+                row = widget.rowCount()
+                widget.insertRow(row)
+                for col, (text, data) in enumerate(
+                    ((shader, shader), (path, None), (node, node))
+                ):
+                    item = QTableWidgetItem(text)
+                    if text:
+                        item.setToolTip(text)
+                    if data is not None:
+                        item.setData(UserRole, data)
+                    widget.setItem(row, col, item)
+        finally:
+            widget.blockSignals(was_blocked)
+        return True
+
     def _warn_path_length_enabled(self) -> bool:
         """State of the header's "Warn On Over-Long Paths" toggle.
 
@@ -1988,70 +2072,139 @@ class TexturePathEditorSlots:
         )
 
     def cleanup_scene_callbacks(self):
-        """Clean up scene-change subscriptions via ScriptJobManager."""
+        """Clean up scene-change subscriptions and pending path checks."""
         ScriptJobManager.instance().unsubscribe_all(self)
+        timer = getattr(self, "_status_timer", None)
+        if timer is not None:
+            try:
+                timer.stop()
+            except RuntimeError:  # parent table already deleted
+                pass
+        path_status = getattr(self, "_path_status", None)
+        if path_status is not None:
+            path_status.shutdown()
 
-    def setup_formatting(self, widget):
-        source_root = EnvUtils.get_env_info("workspace")
-        path_cache = {}
-        unique_paths = set()
+    def _absolute(self, path: str) -> str:
+        return MatUtils.to_absolute(path, getattr(self, "_workspace_root", None))
+
+    def _collect_over_long_paths(self, widget):
+        """Fill ``_over_long_paths`` from every row's path (string work only)."""
+        self._over_long_paths = set()
+        if not self._warn_path_length_enabled():
+            return
+        limit = FileUtils.path_length_limit()
         for row in range(widget.rowCount()):
             item = widget.item(row, 1)
-            if item:
-                path = str(item.text()).strip()
-                if path:
-                    unique_paths.add(path)
-
-        def resolve_and_check(path):
-            abs_path = MatUtils.to_absolute(path, source_root)
-            return path, os.path.exists(abs_path), abs_path
-
-        if len(unique_paths) > 50:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                futures = {
-                    executor.submit(resolve_and_check, p): p for p in unique_paths
-                }
-                for future in as_completed(futures):
-                    try:
-                        path, exists, abs_path = future.result(timeout=5)
-                        path_cache[path] = (exists, abs_path)
-                    except Exception:
-                        path = futures[future]
-                        path_cache[path] = (
-                            False,
-                            MatUtils.to_absolute(path, source_root),
-                        )
-        else:
-            for path in unique_paths:
-                _, exists, abs_path = resolve_and_check(path)
-                path_cache[path] = (exists, abs_path)
+            path = str(item.text()).strip() if item else ""
+            if path and len(self._absolute(path)) > limit:
+                self._over_long_paths.add(path)
+
+    @staticmethod
+    def _visible_rows(widget) -> range:
+        """Rows inside the table's viewport (every row while it has no size)."""
+        count = widget.rowCount()
+        if not count:
+            return range(0)
+        first = widget.rowAt(0)
+        last = widget.rowAt(widget.viewport().height() - 1)
+        first = 0 if first < 0 else first
+        last = count - 1 if last < 0 else last
+        return range(first, last + 1)
+
+    def _format_rows(self, widget, rows):
+        """Run the path-column formatter over *rows* only."""
+        formatter = getattr(self, "_path_formatter", None)
+        if formatter is None:
+            return
+        was_blocked = widget.blockSignals(True)
+        try:
+            for row in rows:
+                item = widget.item(row, 1)
+                if item is not None:
+                    formatter(item, item.text(), row, 1, widget, force=True)
+        finally:
+            widget.blockSignals(was_blocked)
 
-        warn_long = self._warn_path_length_enabled()
+    def _format_visible_rows(self, widget=None):
+        """Scroll/resize hook: colour the rows that just came into view."""
+        widget = widget if widget is not None else getattr(self.ui, "tbl000", None)
+        if widget is not None:
+            self._format_rows(widget, self._visible_rows(widget))
+
+    def _request_path_status(self, widget, abs_paths):
+        """Queue background checks and poll for their results while any run."""
+        if not self._path_status.request(abs_paths):
+            return
+        timer = getattr(self, "_status_timer", None)
+        if timer is None:
+            timer = self._status_timer = self.sb.QtCore.QTimer(widget)
+            timer.setInterval(100)
+            timer.timeout.connect(lambda w=widget: self._drain_path_status(w))
+        if not timer.isActive():
+            timer.start()
+
+    def _drain_path_status(self, widget):
+        """Re-format visible rows whose path check just finished."""
+        finished = self._path_status.drain()
+        if not self._path_status.pending:
+            self._status_timer.stop()
+        if not finished:
+            return
+        try:
+            rows = [
+                row
+                for row in self._visible_rows(widget)
+                if widget.item(row, 1) is not None
+                and self._absolute(str(widget.item(row, 1).text()).strip())
+                in finished
+            ]
+        except RuntimeError:  # widget deleted while checks were running
+            self.cleanup_scene_callbacks()
+            return
+        self._format_rows(widget, rows)
+
+    def setup_formatting(self, widget):
+        """Register the path column's missing/over-long formatter.
+
+        The formatter never touches the disk: it reads ``_path_status``, and a
+        path without a fresh result is queued for a background ``stat`` and
+        re-formatted when that lands (``_drain_path_status``). Rows outside
+        the viewport are skipped — ``apply_formatting`` passes over the whole
+        table — and formatted as they scroll into view.
+        """
         length_limit = FileUtils.path_length_limit()
-        # Reset per rebuild; the formatter fills it as it paints, so the caller
-        # reads it only after apply_formatting.
-        self._over_long_paths = set()
 
-        def format_if_invalid(item, value, row, col, *_):
+        def format_if_invalid(item, value, row, col, *_, force=False):
+            if not force and row not in self._visible_rows(widget):
+                return
             path = str(value).strip()
-            if path in path_cache:
-                exists, abs_path = path_cache[path]
-            else:
-                abs_path = MatUtils.to_absolute(path, source_root)
-                exists = os.path.exists(abs_path)
-                path_cache[path] = (exists, abs_path)
+            if not path:
+                return
+            abs_path = self._absolute(path)
+            status = self._path_status.get(abs_path)
+            if status is None:
+                # Keep the current colour until the check lands.
+                self._request_path_status(widget, [abs_path])
+                item.setToolTip(f"{abs_path}\n\nChecking…")
+                return
             # A missing file outranks an over-long one: it's the harder failure,
             # and an over-long path is usually WHY it went missing.
-            over_long = warn_long and len(abs_path) > length_limit
-            if over_long:
-                self._over_long_paths.add(path)
+            over_long = self._warn_path_length_enabled() and len(abs_path) > length_limit
             widget.format_item(
                 item,
-                key="invalid" if not exists else ("warning" if over_long else "reset"),
+                key=(
+                    "invalid"
+                    if not status.exists
+                    else ("warning" if over_long else "reset")
+                ),
             )
-            tooltip_lines = [abs_path if exists else f"Missing file:\n{abs_path}"]
+            tooltip_lines = [
+                (
+                    f"{abs_path}\n{status.size:,} bytes"
+                    if status.exists
+                    else f"Missing file:\n{abs_path}"
+                )
+            ]
             if over_long:
                 tooltip_lines.append(
                     f"Path is {len(abs_path)} characters — over this OS's "
@@ -2064,6 +2217,7 @@ class TexturePathEditorSlots:
                 tooltip_lines.append(f"Previous: {previous}")
             item.setToolTip("\n\n".join(tooltip_lines))
 
+        self._path_formatter = format_if_invalid
         widget.set_column_formatter(1, format_if_invalid)
 
     # ------------------------------------------------------------------
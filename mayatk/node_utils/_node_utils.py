@@ -1,7 +1,10 @@
 # !/usr/bin/python
 # coding=utf-8
 import contextlib
-from typing import Any, Dict, List, Optional, Tuple, Union
+import itertools
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
 
 try:
     import maya.cmds as cmds
@@ -1096,13 +1099,25 @@ class NodeUtils(ptk.HelpMixin):
         except Exception:
             matcher = None
 
+        # Exact duplicates (the scatter case) skip the matcher's PCA
+        # registration: a target whose single shape holds the source's own
+        # object-space points is placed by its world matrix alone.  The
+        # source is read once and compared as a buffer; anything else —
+        # multi-shape, differently ordered, or merely similar — still goes
+        # through the matcher.
+        source_points = cls._single_shape_points(source)
+
         new_instances = []
         for target in targets:
             name = CoreUtils.short_name(target)
             objParent = cmds.listRelatives(target, parent=True, fullPath=True) or []
             instance = cmds.instance(source)[0]
-            registered = False
-            if matcher is not None:
+            registered, rel_mtx = False, None
+            if source_points is not None and len(source_points):
+                registered = cls._points_match(
+                    source_points, cls._single_shape_points(target)
+                )
+            if not registered and matcher is not None:
                 try:
                     registered, rel_mtx = matcher.are_meshes_identical(source, target)
                 except Exception:
@@ -1167,6 +1182,12 @@ class NodeUtils(ptk.HelpMixin):
             cmds.select(new_instances)
         return new_instances
 
+    @classmethod
+    def _single_shape_points(cls, transform) -> Optional[np.ndarray]:
+        """Object-space points of *transform*'s only visible shape, else None."""
+        shapes = cls.get_shapes(transform, no_intermediate=True, full_path=True)
+        return cls._geometry_points(shapes[0]) if len(shapes) == 1 else None
+
     @classmethod
     def instance(cls, *args, **kwargs):
         """Deprecated: Use replace_with_instances instead."""
@@ -1443,8 +1464,8 @@ class NodeUtils(ptk.HelpMixin):
             return None
 
     @classmethod
-    def _geometry_points(cls, shape) -> Optional[List[float]]:
-        """Flat OBJECT-space point list for *shape*, or None when it has none.
+    def _geometry_points(cls, shape) -> Optional[np.ndarray]:
+        """``(N, 3)`` OBJECT-space point buffer for *shape*, or None when it has none.
 
         Object space on purpose: two instances of one shape sit at different
         world positions by definition, so a world-space compare could never
@@ -1456,7 +1477,35 @@ class NodeUtils(ptk.HelpMixin):
         it = cls._geometry_iterator(shape)
         if it is None:
             return None
-        return [c for p in it.allPositions(om.MSpace.kObject) for c in (p.x, p.y, p.z)]
+        pts = np.array(it.allPositions(om.MSpace.kObject), dtype=float)
+        return pts.reshape(-1, 4)[:, :3]
+
+    @staticmethod
+    def _geometry_key(points: Optional[np.ndarray], tol: float = 1e-6):
+        """Tolerance-quantized hash of a point buffer, or None for no points.
+
+        ``(point count, centroid cell)``, with cells ``2 * tol`` wide.  Two
+        buffers that :meth:`_geometry_matches` accepts have centroids within
+        *tol* of each other, so their cells differ by at most one per axis —
+        :meth:`_geometry_candidates` probes that 3x3x3 neighbourhood, which
+        is what keeps the hash a pure pre-filter that never loses a match.
+        """
+        if points is None:
+            return None
+        cell = np.floor(points.mean(axis=0) / (2.0 * tol)) if len(points) else ()
+        return (len(points),) + tuple(int(c) for c in cell)
+
+    @staticmethod
+    def _geometry_candidates(buckets: Dict[Tuple, List], key) -> Iterator:
+        """Every entry of *buckets* whose key could belong to matching geometry."""
+        if key is None:
+            return
+        if len(key) == 1:  # an empty buffer has no centroid
+            yield from buckets.get(key, ())
+            return
+        count, cx, cy, cz = key
+        for dx, dy, dz in itertools.product((-1, 0, 1), repeat=3):
+            yield from buckets.get((count, cx + dx, cy + dy, cz + dz), ())
 
     @classmethod
     def _geometry_matches(
@@ -1472,7 +1521,7 @@ class NodeUtils(ptk.HelpMixin):
 
         ``cache`` maps a stable KEY to that shape's points; pass
         ``(key, shape)`` pairs instead of bare paths to use it.  The restore
-        compares each candidate against every cluster head, which is the one
+        compares each candidate against its cluster heads, which is the one
         place re-reading a dense mesh per pair would hurt — and a path is not
         a safe cache key there, since the re-links between comparisons are
         themselves DAG edits.
@@ -1480,15 +1529,21 @@ class NodeUtils(ptk.HelpMixin):
         if cache is None:
             pa, pb = cls._geometry_points(a), cls._geometry_points(b)
         else:
-            pts = []
-            for key, shape in (a, b):
-                if key not in cache:
-                    cache[key] = cls._geometry_points(shape)
-                pts.append(cache[key])
-            pa, pb = pts
-        if pa is None or pb is None or len(pa) != len(pb):
+            pa, pb = (cls._cached_points(key, shape, cache) for key, shape in (a, b))
+        return cls._points_match(pa, pb, tol)
+
+    @staticmethod
+    def _points_match(pa, pb, tol: float = 1e-6) -> bool:
+        """Index-for-index comparison of two point buffers (None never matches)."""
+        if pa is None or pb is None or pa.shape != pb.shape:
             return False
-        return all(abs(x - y) <= tol for x, y in zip(pa, pb))
+        return not len(pa) or float(np.abs(pa - pb).max()) <= tol
+
+    @classmethod
+    def _cached_points(cls, key, shape, cache: Dict) -> Optional[np.ndarray]:
+        if key not in cache:
+            cache[key] = cls._geometry_points(shape)
+        return cache[key]
 
     @staticmethod
     def _shading_engines(shape) -> List[str]:
@@ -1666,7 +1721,7 @@ class NodeUtils(ptk.HelpMixin):
         leftovers: List[Tuple[str, str, str, str]] = []
         # Keyed by UUID, not path: the re-links below are DAG edits, so a path
         # captured before one is not guaranteed to name the same node after.
-        points: Dict[str, Optional[List[float]]] = {}
+        points: Dict[str, Optional[np.ndarray]] = {}
 
         for rec in records:
             transform = cls._resolve_uuid(rec["transform"])
@@ -1683,19 +1738,24 @@ class NodeUtils(ptk.HelpMixin):
 
         # Cluster the changed forks by their originating shape: two objects
         # that were never instances of each other must not become instances
-        # here just because they happen to match.
-        heads: Dict[str, List[Tuple[str, str]]] = {}
+        # here just because they happen to match.  Within a source the heads
+        # are bucketed by geometry key, so a fork is only compared point for
+        # point against heads it could possibly match — a scatter of
+        # thousands of forks no longer walks every head per fork.
+        heads: Dict[str, Dict[Tuple, List[Tuple[str, str]]]] = {}
         for transform, source_uuid, fork_uuid, fork in leftovers:
+            buckets = heads.setdefault(source_uuid, {})
+            key = cls._geometry_key(cls._cached_points(fork_uuid, fork, points))
             head = next(
                 (
                     h
-                    for h in heads.setdefault(source_uuid, [])
+                    for h in cls._geometry_candidates(buckets, key)
                     if cls._geometry_matches((fork_uuid, fork), h, cache=points)
                 ),
                 None,
             )
             if head is None:
-                heads[source_uuid].append((fork_uuid, fork))
+                buckets.setdefault(key, []).append((fork_uuid, fork))
             else:
                 restored += int(cls._relink_instanced_shape(transform, head[1], fork))
         return restored
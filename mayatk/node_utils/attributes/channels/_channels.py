@@ -11,6 +11,7 @@ import maya.cmds as cmds
 
 from mayatk.node_utils._node_utils import NodeUtils
 from mayatk.node_utils.attributes._attributes import Attributes
+from mayatk.node_utils.attributes.channels._snapshot import AttributeSnapshot
 
 
 class Channels:
@@ -35,6 +36,9 @@ class Channels:
         "All": {},
     }
 
+    # Shared by every caller; see :meth:`attribute_snapshot`.
+    _attribute_snapshot = None
+
     def __init__(self):
         self._pinned_targets = None
         self._single_object_mode = False
@@ -66,6 +70,13 @@ class Channels:
     # Querying
     # ------------------------------------------------------------------
 
+    @classmethod
+    def attribute_snapshot(cls):
+        """The shared :class:`AttributeSnapshot` the table reads through."""
+        if cls._attribute_snapshot is None:
+            cls._attribute_snapshot = AttributeSnapshot()
+        return cls._attribute_snapshot
+
     def get_selected_nodes(self):
         """Return the target node list.
 
@@ -171,14 +182,25 @@ class Channels:
         return kwargs
 
     @staticmethod
-    def query_connected_attrs(node):
-        """Return set of attribute names on *node* that have incoming connections."""
-        conns = (
-            cmds.listConnections(
-                node, source=True, destination=False, plugs=True, connections=True
+    def query_connected_attrs(node, **kwargs):
+        """Return set of attribute names on *node* that have incoming connections.
+
+        Extra *kwargs* go to ``cmds.listConnections`` (e.g. ``type="animCurve"``).
+        """
+        try:
+            conns = (
+                cmds.listConnections(
+                    node,
+                    source=True,
+                    destination=False,
+                    plugs=True,
+                    connections=True,
+                    **kwargs,
+                )
+                or []
             )
-            or []
-        )
+        except Exception:
+            conns = []
         result = set()
         for dst_plug, _src_plug in zip(conns[0::2], conns[1::2]):
             attr_name = str(dst_plug).split(".", 1)[-1]
@@ -215,27 +237,10 @@ class Channels:
                 common &= s
 
         if custom_filter == "keyed":
-            # Keep only attributes connected to animation curves
-            keyed_attrs = set()
-            for attr in list(common):
-                is_keyed = True
-                for node in nodes:
-                    try:
-                        conns = cmds.listConnections(
-                            f"{node}.{attr}",
-                            source=True,
-                            destination=False,
-                            type="animCurve",
-                        )
-                        if not conns:
-                            is_keyed = False
-                            break
-                    except Exception:
-                        is_keyed = False
-                        break
-                if is_keyed:
-                    keyed_attrs.add(attr)
-            common = keyed_attrs
+            # Keep only attributes connected to animation curves — one
+            # listConnections per node rather than one per attribute.
+            for node in nodes:
+                common &= Channels.query_connected_attrs(node, type="animCurve")
 
         if invert:
             # Scope inversion to AE-visible attrs (visible=True excludes truly internal
@@ -296,31 +301,29 @@ class Channels:
         """
         if not nodes:
             return {}
-        primary = nodes[0]
-        multi = len(nodes) > 1
+        snapshot = cls.attribute_snapshot().read(nodes, attr_names)
         result = {}
         for attr_name in attr_names:
-            attr_type = cls.get_attr_type(primary, attr_name)
-            if attr_type == "enum":
-                val = cls.get_enum_label(primary, attr_name)
-                if multi:
-                    for other in nodes[1:]:
-                        if cls.get_enum_label(other, attr_name) != val:
-                            val = "*"
-                            break
-                val_str = val if val is not None else ""
-            else:
-                val = cls.get_attr_value(primary, attr_name)
-                if multi:
-                    for other in nodes[1:]:
-                        if cls.get_attr_value(other, attr_name) != val:
-                            val = "*"
-                            break
-                val_str = cls.format_value(val)
-            conn_type = cls.classify_connection(primary, attr_name)
-            result[attr_name] = (val_str, conn_type)
+            state, val = cls._merged_state(nodes, snapshot, attr_name)
+            result[attr_name] = (cls._display_string(state, val), state.conn)
         return result
 
+    @staticmethod
+    def _merged_state(nodes, snapshot, attr_name):
+        """The primary node's state and the shared value (``"*"`` when mixed)."""
+        state = snapshot[nodes[0]][attr_name]
+        val = state.display
+        for other in nodes[1:]:
+            if snapshot[other][attr_name].display != val:
+                return state, "*"
+        return state, val
+
+    @classmethod
+    def _display_string(cls, state, val):
+        if state.attr_type == "enum":
+            return val if val is not None else ""
+        return cls.format_value(val)
+
     @staticmethod
     def get_attr_value(node, attr_name):
         """Safely get an attribute value, returning ``None`` on failure."""
@@ -517,47 +520,19 @@ class Channels:
         """
         attr_names = cls.collect_attr_names(nodes, filter_kwargs)
 
-        primary = nodes[0]
-        multi = len(nodes) > 1
+        # One API pass per node; nodes no longer shown leave the cache.
+        snap = cls.attribute_snapshot()
+        snap.retain(nodes)
+        snapshot = snap.read(nodes, attr_names)
 
         rows = []
         attr_states = []
         for attr_name in attr_names:
-            # Value
-            attr_type = cls.get_attr_type(primary, attr_name)
-
-            if attr_type == "enum":
-                val = cls.get_enum_label(primary, attr_name)
-                if multi:
-                    for other in nodes[1:]:
-                        other_val = cls.get_enum_label(other, attr_name)
-                        if other_val != val:
-                            val = "*"
-                            break
-                val_str = val if val is not None else ""
-            else:
-                val = cls.get_attr_value(primary, attr_name)
-                if multi:
-                    for other in nodes[1:]:
-                        other_val = cls.get_attr_value(other, attr_name)
-                        if other_val != val:
-                            val = "*"
-                            break
-                val_str = cls.format_value(val)
-
-            # Type (already fetched above for enum check)
-
-            # Locked
-            try:
-                locked = cmds.getAttr(f"{primary}.{attr_name}", lock=True)
-            except Exception:
-                locked = False
-
-            # Connection classification
-            conn_type = cls.classify_connection(primary, attr_name)
-
-            rows.append([attr_name, "", "", val_str, attr_type])
-            attr_states.append((locked, conn_type))
+            state, val = cls._merged_state(nodes, snapshot, attr_name)
+            rows.append(
+                [attr_name, "", "", cls._display_string(state, val), state.attr_type]
+            )
+            attr_states.append((state.locked, state.conn))
 
         if not rows:
             rows = [["", "", "", "", "No attributes"]]
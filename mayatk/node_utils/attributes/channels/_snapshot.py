@@ -0,0 +1,356 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Attribute snapshot behind the Channels table.
+
+``Channels.build_table_data`` and ``collect_value_strings`` used to issue a
+value ``getAttr``, a lock ``getAttr``, a type ``getAttr``, an enum lookup and
+a connection walk per attribute per node. With a few dozen controls selected
+that was tens of thousands of commands on every selection change and every
+live update.
+
+:class:`AttributeSnapshot` reads the same facts through the API, one pass per
+node: each plug is found once on the node's ``MFnDependencyNode`` and its
+value, lock state and "is it driven" bit come straight off the ``MPlug``.
+
+* Scalar numeric, unit (distance / angle / time, in UI units) and enum plugs
+  are read directly; anything else (strings, compounds, matrices, ...) goes
+  through ``Channels.get_attr_value`` for exactly the old result.
+* Type strings are ``getAttr -type``'s. Scalar numeric and enum types follow
+  from the attribute; the rest are looked up once per node type and
+  attribute (per node for dynamic attributes) and remembered.
+* Only plugs with an incoming connection (on themselves, their parent or
+  their array) are classified with ``Channels.classify_connection``; every
+  other plug is ``"none"`` without a command.
+
+Entries are kept per node, keyed by UUID and checked against the node's
+``MObjectHandle`` (a reopened scene reuses UUIDs, not objects). While a node
+is cached, attribute-changed, attribute-added/removed and (for DAG nodes)
+matrix-modified callbacks registered in :class:`ScriptJobManager` mark what
+went stale, so a repeat read only re-reads those plugs. Driven plugs are
+re-read every time: time changes and upstream evaluation don't send
+attribute-changed messages. If the callbacks can't be installed the node is
+simply never served from cache.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+
+@dataclass
+class PlugState:
+    """One attribute of one node, as the Channels table shows it."""
+
+    value: Any  # getAttr's value (the index, for an enum)
+    locked: bool
+    attr_type: str
+    conn: str  # Channels.classify_connection's result
+    label: Optional[str] = None  # enum label
+    driven: bool = False
+
+    @property
+    def display(self):
+        """The value rows are compared and formatted by (the label, for enums)."""
+        return self.label if self.attr_type == "enum" else self.value
+
+
+@dataclass
+class _NodeEntry:
+    handle: Any  # om.MObjectHandle
+    states: Dict[str, PlugState] = field(default_factory=dict)
+    types: Dict[str, str] = field(default_factory=dict)  # dynamic / indexed attrs
+    dirty: Set[str] = field(default_factory=set)
+    tokens: List[int] = field(default_factory=list)
+
+
+class AttributeSnapshot:
+    """Per-node cache of attribute values, locks, types and connection classes."""
+
+    _SIMPLE = re.compile(r"^\w+$")
+
+    def __init__(self):
+        self._entries: Dict[str, _NodeEntry] = {}
+        self._types: Dict[tuple, str] = {}  # (node type, attr) -> type string
+        #: Plugs read (not served from cache) since construction; for tests
+        #: and profiling.
+        self.reads = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- reading -------------------------------------------------------
+
+    def read(self, nodes, attr_names) -> Dict[str, Dict[str, PlugState]]:
+        """``{node: {attr: PlugState}}`` for every node and attribute given.
+
+        Cached states are reused unless a callback marked them stale or the
+        plug is driven.
+        """
+        return {node: self.read_node(node, attr_names) for node in nodes}
+
+    def read_node(self, node: str, attr_names) -> Dict[str, PlugState]:
+        """:meth:`read` for one node."""
+        try:
+            mobj = om.MSelectionList().add(node).getDependNode(0)
+            fn = om.MFnDependencyNode(mobj)
+        except Exception:  # not a node (or no API): the plain commands
+            return {name: self._read_fallback(node, name) for name in attr_names}
+
+        entry = self._entry(fn, mobj)
+        states = {}
+        for name in attr_names:
+            state = entry.states.get(name) if entry.tokens else None
+            if state is None or state.driven or name in entry.dirty:
+                try:
+                    state = self._read_plug(node, fn, entry, name)
+                except Exception:  # an unusual plug: the plain commands
+                    state = self._read_fallback(node, name)
+                entry.states[name] = state
+                entry.dirty.discard(name)
+            states[name] = state
+        return states
+
+    def _entry(self, fn, mobj) -> _NodeEntry:
+        uuid = fn.uuid().asString()
+        handle = om.MObjectHandle(mobj)
+        entry = self._entries.get(uuid)
+        if entry is not None and (
+            not entry.handle.isValid() or entry.handle.hashCode() != handle.hashCode()
+        ):
+            self._drop(uuid)
+            entry = None
+        if entry is None:
+            entry = _NodeEntry(handle)
+            self._entries[uuid] = entry
+            entry.tokens = self._watch(mobj, entry)
+        return entry
+
+    def _read_plug(self, node, fn, entry, name) -> PlugState:
+        self.reads += 1
+        try:
+            if self._SIMPLE.match(name):
+                plug = fn.findPlug(name, False)
+            else:
+                plug = om.MSelectionList().add(f"{node}.{name}").getPlug(0)
+        except Exception:
+            return self._read_fallback(node, name)
+
+        from mayatk.node_utils.attributes.channels._channels import Channels
+
+        attr = plug.attribute()
+        value, label, attr_type = self._read_value(plug, attr)
+        if attr_type is None:
+            attr_type = self._type(node, fn, entry, name, attr)
+        if value is _UNREAD:
+            if attr_type == "enum":
+                label = Channels.get_enum_label(node, name)
+            value = Channels.get_attr_value(node, name)
+
+        driven = plug.isDestination or plug.isCompound
+        if not driven and plug.isChild:
+            driven = plug.parent().isDestination
+        if not driven and plug.isElement:
+            driven = plug.array().isDestination
+        conn = Channels.classify_connection(node, name) if driven else "none"
+        return PlugState(value, plug.isLocked, attr_type, conn, label, driven)
+
+    @staticmethod
+    def _read_value(plug, attr):
+        """``(value, enum label, type)``; ``_UNREAD`` / ``None`` where not handled."""
+        if attr.hasFn(om.MFn.kEnumAttribute):
+            index = plug.asInt()
+            try:
+                label = om.MFnEnumAttribute(attr).fieldName(index)
+            except Exception:
+                label = None
+            return index, label, "enum"
+        if attr.hasFn(om.MFn.kNumericAttribute):
+            kind = om.MFnNumericAttribute(attr).numericType()
+            if kind == om.MFnNumericData.kBoolean:
+                return plug.asBool(), None, "bool"
+            if kind == om.MFnNumericData.kDouble:
+                return plug.asDouble(), None, "double"
+            if kind == om.MFnNumericData.kFloat:
+                return plug.asFloat(), None, "float"
+            for int_kind, int_type in (
+                (om.MFnNumericData.kInt, "long"),
+                (om.MFnNumericData.kShort, "short"),
+                (om.MFnNumericData.kByte, "byte"),
+                (om.MFnNumericData.kChar, "char"),
+            ):
+                if kind == int_kind:
+                    return plug.asInt(), None, int_type
+        elif attr.hasFn(om.MFn.kUnitAttribute):
+            # float vs double unit attributes share one API class, so the
+            # type string still comes from the per-node-type lookup.
+            kind = om.MFnUnitAttribute(attr).unitType()
+            if kind == om.MFnUnitAttribute.kDistance:
+                return plug.asMDistance().asUnits(om.MDistance.uiUnit()), None, None
+            if kind == om.MFnUnitAttribute.kAngle:
+                return plug.asMAngle().asUnits(om.MAngle.uiUnit()), None, None
+            if kind == om.MFnUnitAttribute.kTime:
+                return plug.asMTime().asUnits(om.MTime.uiUnit()), None, None
+        return _UNREAD, None, None
+
+    def _type(self, node, fn, entry, name, attr) -> str:
+        from mayatk.node_utils.attributes.channels._channels import Channels
+
+        try:
+            dynamic = om.MFnAttribute(attr).dynamic
+        except Exception:
+            dynamic = True
+        if dynamic or not self._SIMPLE.match(name):
+            if name not in entry.types:
+                entry.types[name] = Channels.get_attr_type(node, name)
+            return entry.types[name]
+        key = (fn.typeName, name)
+        if key not in self._types:
+            self._types[key] = Channels.get_attr_type(node, name)
+        return self._types[key]
+
+    @staticmethod
+    def _read_fallback(node, name) -> PlugState:
+        """The commands ``Channels`` used before the snapshot, uncached."""
+        from mayatk.node_utils.attributes.channels._channels import Channels
+
+        attr_type = Channels.get_attr_type(node, name)
+        label = Channels.get_enum_label(node, name) if attr_type == "enum" else None
+        try:
+            locked = bool(cmds.getAttr(f"{node}.{name}", lock=True))
+        except Exception:
+            locked = False
+        return PlugState(
+            Channels.get_attr_value(node, name),
+            locked,
+            attr_type,
+            Channels.classify_connection(node, name),
+            label,
+            driven=True,
+        )
+
+    # -- invalidation --------------------------------------------------
+
+    def invalidate(self, nodes=None) -> None:
+        """Forget the cached states of *nodes* (names), or of every node."""
+        if nodes is None:
+            for entry in self._entries.values():
+                entry.states.clear()
+                entry.types.clear()
+            return
+        for node in nodes:
+            entry = self._entries.get(self._uuid(node))
+            if entry is not None:
+                entry.states.clear()
+                entry.types.clear()
+
+    def retain(self, nodes) -> None:
+        """Drop every cached node not among *nodes*, with its callbacks."""
+        keep = {self._uuid(node) for node in nodes}
+        for uuid in [u for u in self._entries if u not in keep]:
+            self._drop(uuid)
+
+    def release(self) -> None:
+        """Drop every cached node and remove all callbacks."""
+        for uuid in list(self._entries):
+            self._drop(uuid)
+
+    @staticmethod
+    def _uuid(node) -> Optional[str]:
+        try:
+            mobj = om.MSelectionList().add(node).getDependNode(0)
+            return om.MFnDependencyNode(mobj).uuid().asString()
+        except Exception:
+            return None
+
+    def _drop(self, uuid) -> None:
+        entry = self._entries.pop(uuid, None)
+        if entry is None or not entry.tokens:
+            return
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        mgr = ScriptJobManager.instance()
+        for token in entry.tokens:
+            mgr.unsubscribe(token)
+
+    def _watch(self, mobj, entry) -> List[int]:
+        """Install the callbacks that keep *entry* current; ``[]`` when they fail."""
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
+
+        # Evaluation messages (kAttributeEval) are left out: they fire on
+        # every DG pull, and driven plugs are re-read regardless.
+        stale = (
+            om.MNodeMessage.kAttributeSet
+            | om.MNodeMessage.kAttributeLocked
+            | om.MNodeMessage.kAttributeUnlocked
+            | om.MNodeMessage.kConnectionMade
+            | om.MNodeMessage.kConnectionBroken
+            | om.MNodeMessage.kAttributeArrayAdded
+            | om.MNodeMessage.kAttributeArrayRemoved
+        )
+
+        def on_changed(msg, plug, *_):
+            if not msg & stale:
+                return
+            try:
+                name = plug.partialName(useLongNames=True)
+                if plug.isCompound or plug.isChild or plug.isElement:
+                    entry.states.clear()  # parent and children move together
+                else:
+                    entry.dirty.add(name)
+            except Exception:
+                entry.states.clear()
+
+        def on_reset(*_):
+            entry.states.clear()
+            entry.types.clear()
+
+        def on_matrix(*_):
+            # Manipulator drags write the data block without kAttributeSet.
+            entry.states.clear()
+
+        mgr = ScriptJobManager.instance()
+        tokens = []
+        try:
+            for register, callback, target in (
+                (om.MNodeMessage.addAttributeChangedCallback, on_changed, mobj),
+                (om.MNodeMessage.addAttributeAddedOrRemovedCallback, on_reset, mobj),
+            ):
+                token = mgr.add_om_callback(register, target, callback, owner=self)
+                if token is None:
+                    raise RuntimeError("callback not installed")
+                tokens.append(token)
+            if mobj.hasFn(om.MFn.kDagNode):
+                token = mgr.add_om_callback(
+                    om.MDagMessage.addMatrixModifiedCallback,
+                    om.MDagPath.getAPathTo(mobj),
+                    on_matrix,
+                    owner=self,
+                )
+                if token is None:
+                    raise RuntimeError("callback not installed")
+                tokens.append(token)
+        except Exception:  # noqa: BLE001 - run uncached rather than stale
+            for token in tokens:
+                mgr.unsubscribe(token)
+            return []
+        return tokens
+
+
+#: Marks a value :meth:`AttributeSnapshot._read_value` left to the commands.
+_UNREAD = object()
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
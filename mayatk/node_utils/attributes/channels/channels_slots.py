@@ -2473,19 +2473,30 @@ class ChannelsSlots:
         self._destroyed = False
 
         mgr = ScriptJobManager.instance()
-        for event in ("SelectionChanged", "SceneOpened", "NewSceneOpened"):
+        # A marquee or an import fires SelectionChanged in bursts; the idle
+        # policy folds each burst into one rebuild.  Scene loads stay
+        # immediate so the stale table is dropped right away.
+        for event, policy in (
+            ("SelectionChanged", "idle"),
+            ("SceneOpened", "immediate"),
+            ("NewSceneOpened", "immediate"),
+        ):
             mgr.subscribe(
                 event,
                 lambda w=widget: self._on_scene_change(w),
                 owner=self,
+                policy=policy,
             )
         # Time changes don't fire AttributeChanged callbacks for animated
         # attrs, so subscribe separately and run the lightweight values-only
         # updater (no full table rebuild — preserves selection / scroll).
+        # Throttled so scrubbing refreshes at most ~30 times a second.
         mgr.subscribe(
             "timeChanged",
             lambda w=widget: self._on_time_changed(w),
             owner=self,
+            policy="throttle",
+            interval=1 / 30,
         )
         mgr.connect_cleanup(widget, owner=self)
 
@@ -2504,10 +2515,13 @@ class ChannelsSlots:
                 except Exception:
                     pass
 
+            # Imports and reference loads make thousands of connections;
+            # coalesce them into one call per idle.
             mgr.add_om_callback(
                 om2.MDGMessage.addConnectionCallback,
                 _on_connection_change,
                 owner=self,
+                policy="idle",
             )
         except ImportError:
             pass
@@ -2749,11 +2763,16 @@ class ChannelsSlots:
                 if not name_item or name_item.text().strip() != attr_name:
                     continue
 
+                # Served by the attribute snapshot: its own callback has
+                # already marked this plug stale, so only it is re-read.
+                state = self.controller.attribute_snapshot().read_node(
+                    primary, [attr_name]
+                )[attr_name]
                 combo = widget.cellWidget(row, self.COL_VALUE)
                 if combo is not None:
                     # Enum combobox — update index without re-firing our signal.
                     try:
-                        maya_idx = cmds.getAttr(f"{primary}.{attr_name}")
+                        maya_idx = state.value
                         maya_indices = combo.property("_maya_indices") or []
                         if maya_idx in maya_indices:
                             pos = maya_indices.index(maya_idx)
@@ -2766,14 +2785,10 @@ class ChannelsSlots:
                         pass
                 else:
                     # Plain text cell — update displayed value.
-                    attr_type = self.controller.get_attr_type(primary, attr_name)
-                    if attr_type == "enum":
-                        val_str = (
-                            self.controller.get_enum_label(primary, attr_name) or ""
-                        )
+                    if state.attr_type == "enum":
+                        val_str = state.label or ""
                     else:
-                        val = self.controller.get_attr_value(primary, attr_name)
-                        val_str = self.controller.format_value(val)
+                        val_str = self.controller.format_value(state.value)
                     cell = widget.item(row, self.COL_VALUE)
                     if cell:
                         widget.blockSignals(True)
@@ -2797,7 +2812,11 @@ class ChannelsSlots:
         primary = nodes[0]
 
         try:
-            locked = cmds.getAttr(f"{primary}.{attr_name}", lock=True)
+            locked = (
+                self.controller.attribute_snapshot()
+                .read_node(primary, [attr_name])[attr_name]
+                .locked
+            )
         except Exception:
             return
 
@@ -2996,6 +3015,12 @@ class ChannelsSlots:
         except Exception:
             pass
 
+        # The attribute snapshot's per-node callbacks go with the table.
+        try:
+            self.controller.attribute_snapshot().release()
+        except Exception:
+            pass
+
     def __del__(self):
         self.cleanup_scene_callbacks()
 
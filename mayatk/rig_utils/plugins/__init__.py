@@ -0,0 +1,9 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Maya API 2.0 plugin files loaded on demand by rig_utils.
+
+Each module here is loaded with ``cmds.loadPlugin(<path>)`` by the class that
+needs it — never imported through the mayatk package — so it defines the
+``maya_useNewAPI`` / ``initializePlugin`` / ``uninitializePlugin`` trio and
+nothing else public.
+"""
@@ -0,0 +1,74 @@
+# !/usr/bin/python
+# coding=utf-8
+"""``mtkSetSkinWeights``: an undoable, batched skin weight write.
+
+``MFnSkinCluster.setWeights`` is one API call for any number of components,
+but it is not a command, so nothing it does reaches Maya's undo queue. The
+usual undo-safe route — ``cmds.skinPercent`` per vertex — is a command per
+component. This command wraps a single pending write:
+
+- ``SkinUtils.set_weights(undoable=True)`` builds a write record (old and new
+  weight arrays plus the cluster, geometry path and component) and queues it
+  on ``SkinUtils._pending_weight_writes``,
+- it then calls ``cmds.mtkSetSkinWeights()``, whose ``doIt`` takes that
+  record and applies it,
+- ``undoIt`` / ``redoIt`` call the record's ``undo`` / ``redo`` — one
+  ``setWeights`` each way.
+
+The command takes no arguments and is only meaningful when called by
+``SkinUtils``; called bare it raises.
+"""
+
+try:
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+COMMAND_NAME = "mtkSetSkinWeights"
+
+
+def maya_useNewAPI():
+    """Tell Maya this plugin uses API 2.0."""
+
+
+class SetSkinWeightsCommand(om.MPxCommand):
+    """Apply the pending SkinUtils weight write; undo restores the old rows."""
+
+    def __init__(self):
+        super().__init__()
+        self._record = None
+
+    @staticmethod
+    def creator():
+        return SetSkinWeightsCommand()
+
+    def isUndoable(self):
+        return True
+
+    def doIt(self, args):
+        # Resolved at call time: the plugin is loaded by path, so a module-level
+        # mayatk import would bind whatever sys.path held at load.
+        from mayatk.rig_utils.skinning import SkinUtils
+
+        if not SkinUtils._pending_weight_writes:
+            raise RuntimeError(
+                f"{COMMAND_NAME}: no pending write (call SkinUtils.set_weights)."
+            )
+        self._record = SkinUtils._pending_weight_writes.pop()
+        self.redoIt()
+
+    def redoIt(self):
+        self._record.redo()
+
+    def undoIt(self):
+        self._record.undo()
+
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin, "mayatk", "1.0").registerCommand(
+        COMMAND_NAME, SetSkinWeightsCommand.creator
+    )
+
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(COMMAND_NAME)
@@ -27,6 +27,7 @@ it predates curve support and keeps its name for compatibility.
 
 import os
 import bisect
+from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 try:
@@ -277,7 +278,9 @@ class CurveWeights(ptk.HelpMixin):
                 the *joints* input order — ready for SkinUtils.set_weights.
                 Guarantees: each row sums to 1.0; at most ``degree + 1``
                 non-zero influences per component; cap components clamp to
-                the end joints.
+                the end joints. To re-solve an existing cluster in place,
+                ``SkinUtils.set_weights(sc, weights, influences=joints,
+                undoable=True)`` writes the result in one undoable call.
         """
         if (curve is None) == (centerline is None):
             raise ValueError("Provide exactly one of 'curve' or 'centerline'.")
@@ -304,9 +307,50 @@ class CurveWeights(ptk.HelpMixin):
         return weights, joints
 
 
+@dataclass
+class _WeightWrite:
+    """One batched weight write, replayable both ways by ``mtkSetSkinWeights``.
+
+    *old* holds every influence of the affected components (physical order),
+    so undo restores rows exactly even when *new* covered an influence subset
+    and the forward write normalized the rest.
+    """
+
+    skin_cluster: "om.MObject"
+    dag: "om.MDagPath"
+    component: "om.MObject"
+    influence_indices: "om.MIntArray"
+    new: "om.MDoubleArray"
+    old: "om.MDoubleArray"
+    normalize: bool
+
+    def redo(self) -> None:
+        oma.MFnSkinCluster(self.skin_cluster).setWeights(
+            self.dag,
+            self.component,
+            self.influence_indices,
+            self.new,
+            self.normalize,
+            False,
+        )
+
+    def undo(self) -> None:
+        fn = oma.MFnSkinCluster(self.skin_cluster)
+        all_indices = om.MIntArray(list(range(len(fn.influenceObjects()))))
+        fn.setWeights(self.dag, self.component, all_indices, self.old, False, False)
+
+
 class SkinUtils(ptk.HelpMixin):
     """Skinning: binding, batch weight I/O, transfer, falloffs, delta mush."""
 
+    # Undoable batch writes: set_weights(undoable=True) queues a _WeightWrite
+    # here and runs the plugin command that applies (and undoes) it.
+    WEIGHTS_COMMAND = "mtkSetSkinWeights"
+    WEIGHTS_PLUGIN = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "plugins", "mtk_skin_weights.py"
+    )
+    _pending_weight_writes: List[_WeightWrite] = []
+
     BIND_METHODS = {"closest": 0, "hierarchy": 1, "heatmap": 2, "geodesic": 3}
     SKINNING_METHODS = {
         "classic": 0,
@@ -544,6 +588,21 @@ class SkinUtils(ptk.HelpMixin):
     # Batch weight I/O
     # ------------------------------------------------------------------
 
+    @classmethod
+    def _ensure_weights_command(cls) -> bool:
+        """Load the ``mtkSetSkinWeights`` plugin once. False if it cannot load."""
+        if hasattr(cmds, cls.WEIGHTS_COMMAND):
+            return True
+        try:
+            cmds.loadPlugin(cls.WEIGHTS_PLUGIN, quiet=True)
+        except RuntimeError as error:
+            om.MGlobal.displayWarning(
+                f"SkinUtils: could not load {cls.WEIGHTS_PLUGIN} ({error}); "
+                "undoable weight writes fall back to per-component skinPercent."
+            )
+            return False
+        return hasattr(cmds, cls.WEIGHTS_COMMAND)
+
     @classmethod
     def get_weights(
         cls, skin_cluster, vertices: Optional[Sequence[int]] = None
@@ -582,11 +641,14 @@ class SkinUtils(ptk.HelpMixin):
                 *weights* follow the order of this sequence.
             normalize (bool): Normalize after setting.
             undoable (bool): False (default) writes via a single
-                MFnSkinCluster.setWeights — fast and exact but NOT in Maya's
-                undo queue (safe when the cluster was created inside the same
-                undo chunk: undoing the chunk deletes the deformer entirely).
-                True routes through cmds.skinPercent per vertex inside an undo
-                chunk (slower; for interactive edits of existing clusters).
+                MFnSkinCluster.setWeights — NOT in Maya's undo queue (safe
+                when the cluster was created inside the same undo chunk:
+                undoing the chunk deletes the deformer entirely). True makes
+                the same single write through the ``mtkSetSkinWeights``
+                plugin command, which records the old and new arrays and
+                replays them on undo/redo — use it for edits of existing
+                clusters. If the plugin cannot load, True falls back to
+                cmds.skinPercent per vertex inside an undo chunk.
 
         Returns:
             (list) The previous weights of the affected vertices across ALL
@@ -644,8 +706,28 @@ class SkinUtils(ptk.HelpMixin):
             )
             return old_weights
 
-        # Undo-safe route: per-component skinPercent inside one undo chunk.
         old_weights, _ = cls.get_weights(skin_cluster, vertices)
+        if cls._ensure_weights_command():
+            cls._pending_weight_writes.append(
+                _WeightWrite(
+                    skin_cluster=fn.object(),
+                    dag=dag,
+                    component=comp,
+                    influence_indices=om.MIntArray(influence_indices),
+                    new=om.MDoubleArray([float(w) for w in weights]),
+                    old=om.MDoubleArray(old_weights),
+                    normalize=normalize,
+                )
+            )
+            try:
+                getattr(cmds, cls.WEIGHTS_COMMAND)()
+            finally:
+                # doIt pops the record; a failure before it ran must not
+                # leave it for the next call.
+                del cls._pending_weight_writes[:]
+            return old_weights
+
+        # Fallback: per-component skinPercent inside one undo chunk.
         geo = cls._resolve_geometry(skin_cluster)
         sel = cls._component_selector(geo)
         vertex_ids = list(vertices) if vertices is not None else list(range(n_verts))
@@ -673,28 +755,18 @@ class SkinUtils(ptk.HelpMixin):
         (1 - sum(specified)) redistributes across the unspecified influences
         proportionally to their current weights. Specified values summing past
         1 are renormalized to 1 (unspecified influences drop to 0), matching
-        skinPercent.
+        skinPercent. The redistribution is computed here and written in ONE
+        batched ``set_weights`` call.
 
         Parameters:
             vertex_weights (dict): ``{vertex_index: {influence_name: weight}}``.
-            undoable (bool): True (default) applies via cmds.skinPercent
-                (native semantics, undo-safe). False computes the
-                redistribution in Python and writes one batched setWeights.
+            undoable (bool): True (default) writes through the undoable
+                ``mtkSetSkinWeights`` path (see ``set_weights``); False
+                writes one plain setWeights outside the undo queue.
         """
         skin_cluster = str(skin_cluster)
         if not vertex_weights:
             return
-        if undoable:
-            geo = cls._resolve_geometry(skin_cluster)
-            sel = cls._component_selector(geo)
-            with CoreUtils.undo_chunk():
-                for v, row in vertex_weights.items():
-                    cmds.skinPercent(
-                        skin_cluster,
-                        f"{geo}.{sel}[{v}]",
-                        transformValue=[(str(i), float(w)) for i, w in row.items()],
-                    )
-            return
 
         index_map = cls._influence_index_map(skin_cluster)
         vertex_ids = sorted(vertex_weights)
@@ -729,7 +801,7 @@ class SkinUtils(ptk.HelpMixin):
                     row[i] *= scale
             flat[k * n_inf : (k + 1) * n_inf] = row
         cls.set_weights(
-            skin_cluster, flat, vertices=vertex_ids, normalize=False, undoable=False
+            skin_cluster, flat, vertices=vertex_ids, normalize=False, undoable=undoable
         )
 
     # ------------------------------------------------------------------
@@ -755,13 +827,22 @@ class SkinUtils(ptk.HelpMixin):
     @classmethod
     @CoreUtils.undoable
     def set_max_influences(
-        cls, skin_cluster, max_influences: int, enforce: bool = True
+        cls,
+        skin_cluster,
+        max_influences: int,
+        enforce: bool = True,
+        undoable: bool = False,
     ) -> None:
         """Set the influence cap; optionally re-weight existing vertices to obey it.
 
         Maya does not re-weight when ``.maxInfluences`` changes — with
         *enforce* True, each vertex keeps its top-N weights (renormalized) via
         one batched write.
+
+        Parameters:
+            undoable (bool): Keep the re-weighting write in the undo queue
+                (see ``set_weights``). Off by default, as before: the
+                attribute edits are undoable either way.
         """
         skin_cluster = str(skin_cluster)
         cmds.setAttr(f"{skin_cluster}.maxInfluences", max_influences)
@@ -782,7 +863,97 @@ class SkinUtils(ptk.HelpMixin):
             for i in range(n_inf):
                 flat[base + i] = row[i] / kept_sum if i in keep else 0.0
         if changed:
-            cls.set_weights(skin_cluster, flat, normalize=False, undoable=False)
+            cls.set_weights(skin_cluster, flat, normalize=False, undoable=undoable)
+
+    @staticmethod
+    def _vertex_adjacency(fn_mesh, n_verts: int):
+        """Edge neighbors as ``(row, neighbor)`` index arrays, both directions.
+
+        Built from one ``getVertices`` read: each polygon contributes the
+        edges between its consecutive face-vertices (wrapping around), and
+        shared edges collapse to one pair.
+        """
+        import numpy as np
+
+        counts, flat = fn_mesh.getVertices()
+        counts = np.asarray(counts, dtype=np.int64)
+        flat = np.asarray(flat, dtype=np.int64)
+        if not flat.size:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        starts = np.cumsum(counts) - counts
+        following = np.arange(1, flat.size + 1)
+        following[starts + counts - 1] = starts  # last face-vertex wraps
+        a, b = flat, flat[following]
+        keys = np.unique(np.concatenate([a * n_verts + b, b * n_verts + a]))
+        keys = keys[keys // n_verts != keys % n_verts]
+        return keys // n_verts, keys % n_verts
+
+    @classmethod
+    @CoreUtils.undoable
+    def smooth_weights(
+        cls,
+        skin_cluster,
+        vertices: Optional[Sequence[int]] = None,
+        iterations: int = 1,
+        strength: float = 0.5,
+        undoable: bool = True,
+    ) -> int:
+        """Relax weights toward the average of each vertex's edge neighbors.
+
+        Each iteration blends a row toward its neighbors' mean by *strength*
+        (Laplacian smoothing on the weight field; rows stay normalized).
+        Neighbors outside *vertices* are read but never written, so a
+        selection smooths against its surroundings without disturbing them.
+        The result is written in ONE batched ``set_weights`` call.
+
+        Parameters:
+            vertices (List[int]): Vertex subset to smooth. Default: all.
+            iterations (int): Smoothing passes.
+            strength (float): 0-1 blend toward the neighbor mean per pass.
+            undoable (bool): Keep the write in the undo queue (see
+                ``set_weights``).
+
+        Returns:
+            (int) The number of smoothed vertices.
+        """
+        import numpy as np
+
+        skin_cluster = str(skin_cluster)
+        dag = CurveWeights._geometry_dag(cls._resolve_geometry(skin_cluster))
+        if not dag.hasFn(om.MFn.kMesh):
+            raise ValueError(f"smooth_weights needs a mesh: {skin_cluster}")
+        flat, influences = cls.get_weights(skin_cluster)
+        dense = np.asarray(flat, dtype=np.float64).reshape(-1, len(influences))
+        n_verts = len(dense)
+
+        rows, cols = cls._vertex_adjacency(om.MFnMesh(dag), n_verts)
+        counts = np.maximum(np.bincount(rows, minlength=n_verts), 1)[:, None]
+
+        target = (
+            np.arange(n_verts)
+            if vertices is None
+            else np.unique(np.asarray(list(vertices), dtype=np.int64))
+        )
+        if not len(target):
+            return 0
+        strength = min(max(float(strength), 0.0), 1.0)
+        for _ in range(max(int(iterations), 0)):
+            mean = np.zeros_like(dense)
+            np.add.at(mean, rows, dense[cols])
+            mean /= counts
+            dense[target] += strength * (mean[target] - dense[target])
+        sums = dense[target].sum(axis=1, keepdims=True)
+        dense[target] /= np.where(sums > 1e-12, sums, 1.0)
+
+        cls.set_weights(
+            skin_cluster,
+            dense[target].ravel().tolist(),
+            vertices=target.tolist(),
+            normalize=False,
+            undoable=undoable,
+        )
+        return len(target)
 
     @classmethod
     @CoreUtils.undoable
@@ -908,7 +1079,9 @@ class SkinUtils(ptk.HelpMixin):
         full file path.
 
         Note: RigUtils.rebind_skin_clusters uses the same mechanism and should
-        delegate here eventually.
+        delegate here eventually. For dense meshes prefer
+        ``export_weights_binary`` — one API read and a sparse array instead of
+        an XML document per influence.
         """
         skin_cluster = cls.get_skin_cluster(mesh)
         if not skin_cluster:
@@ -948,6 +1121,233 @@ class SkinUtils(ptk.HelpMixin):
         )
         cmds.skinCluster(skin_cluster, edit=True, forceNormalizeWeights=True)
 
+    # Binary weight format (``export_weights_binary``). Bump on layout change;
+    # readers refuse newer files rather than misread them.
+    BINARY_WEIGHTS_VERSION = 1
+
+    @staticmethod
+    def _topology_hash(dag: "om.MDagPath") -> str:
+        """Hash of the component layout: vertex/face connectivity or CV layout.
+
+        Two shapes with equal hashes share component indices, so weights can
+        move by index; anything else needs the nearest-point path.
+        """
+        import hashlib
+        import array as _array
+
+        digest = hashlib.sha1()
+        if dag.hasFn(om.MFn.kNurbsCurve):
+            fn = om.MFnNurbsCurve(dag)
+            digest.update(f"curve:{fn.numCVs}:{fn.degree}:{fn.form}".encode())
+        else:
+            counts, connects = om.MFnMesh(dag).getVertices()
+            digest.update(_array.array("i", counts).tobytes())
+            digest.update(_array.array("i", connects).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _component_points(dag: "om.MDagPath") -> List[Tuple[float, float, float]]:
+        """World-space vertex (or CV) positions, in component order."""
+        if dag.hasFn(om.MFn.kNurbsCurve):
+            points = om.MFnNurbsCurve(dag).cvPositions(om.MSpace.kWorld)
+        else:
+            points = om.MFnMesh(dag).getPoints(om.MSpace.kWorld)
+        return [(p.x, p.y, p.z) for p in points]
+
+    @staticmethod
+    def _nearest_rows(source_points, target_points):
+        """Index of the nearest source point for every target point.
+
+        A KD-tree (scipy) when available; otherwise a blocked NumPy brute
+        force — exact, just O(n*m) instead of O(n log m).
+        """
+        import numpy as np
+
+        source = np.asarray(source_points, dtype=np.float64).reshape(-1, 3)
+        target = np.asarray(target_points, dtype=np.float64).reshape(-1, 3)
+        try:
+            from scipy.spatial import cKDTree
+        except ImportError:
+            cKDTree = None
+        if cKDTree is not None:
+            return cKDTree(source).query(target)[1].astype(np.int64)
+        nearest = np.empty(len(target), dtype=np.int64)
+        block = max(1, 2_000_000 // max(len(source), 1))
+        for i in range(0, len(target), block):
+            chunk = target[i : i + block]
+            d2 = ((chunk[:, None, :] - source[None, :, :]) ** 2).sum(axis=2)
+            nearest[i : i + block] = d2.argmin(axis=1)
+        return nearest
+
+    @classmethod
+    def export_weights_binary(
+        cls, mesh, file_path: Optional[str] = None, threshold: float = 1e-6
+    ) -> str:
+        """Export skin weights to a compact ``.npz`` (sparse CSR + header).
+
+        The fast sibling of ``export_weights``: one ``get_weights`` API read,
+        non-zero weights only, no XML. The file holds:
+
+        - ``influences`` — names in physical order (the CSR column space),
+        - ``vertex_count`` and ``topology_hash`` (``_topology_hash``),
+        - ``indptr`` / ``indices`` / ``data`` — CSR rows per component,
+          float32 weights (ample for a 0-1 weight),
+        - ``points`` — world-space component positions for the
+          nearest-point fallback of ``import_weights_binary``.
+
+        Default path: ``<maya user tmp>/skin_weights/<mesh>.npz``.
+
+        Parameters:
+            threshold (float): Weights at or below this are dropped.
+
+        Returns:
+            (str) The full file path.
+        """
+        import numpy as np
+
+        skin_cluster = cls.get_skin_cluster(mesh)
+        if not skin_cluster:
+            raise ValueError(f"No skinCluster on mesh: {mesh}")
+        if file_path is None:
+            directory = os.path.join(cmds.internalVar(userTmpDir=True), "skin_weights")
+            file_path = os.path.join(directory, f"{CoreUtils.leaf_name(mesh)}.npz")
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        weights, influences = cls.get_weights(skin_cluster)
+        dag = CurveWeights._geometry_dag(cls._resolve_geometry(skin_cluster))
+        dense = np.asarray(weights, dtype=np.float64).reshape(-1, len(influences))
+        rows, cols = np.nonzero(dense > threshold)
+        indptr = np.zeros(len(dense) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(dense)), out=indptr[1:])
+        with open(file_path, "wb") as f:  # file object: numpy won't append ".npz"
+            np.savez(
+                f,
+                version=np.int32(cls.BINARY_WEIGHTS_VERSION),
+                influences=np.array(influences, dtype=str),
+                vertex_count=np.int64(len(dense)),
+                topology_hash=np.array(cls._topology_hash(dag)),
+                indptr=indptr,
+                indices=cols.astype(np.int32),
+                data=dense[rows, cols].astype(np.float32),
+                points=np.asarray(cls._component_points(dag), dtype=np.float32),
+            )
+        return file_path
+
+    @classmethod
+    @CoreUtils.undoable
+    def import_weights_binary(
+        cls,
+        mesh,
+        file_path: str,
+        method: str = "auto",
+        add_missing_influences: bool = True,
+        normalize: bool = True,
+        undoable: bool = True,
+    ) -> str:
+        """Import weights written by ``export_weights_binary``.
+
+        Columns are remapped by influence NAME (full, partial or leaf), so a
+        cluster whose influences were added in a different order — or that
+        has extra influences — imports correctly.
+
+        Parameters:
+            method (str): "index" — component index to index (topology must
+                match); "nearest" — each component takes the row of the
+                nearest stored point (world space: export and import in
+                the same pose); "auto" (default) — "index" when the
+                vertex count and topology hash match, else "nearest".
+            add_missing_influences (bool): Add stored influences that exist in
+                the scene but not on the cluster (at weight 0) before writing.
+                False, or a stored influence absent from the scene, raises
+                ValueError when that influence carries any weight.
+            normalize (bool): Normalize after writing.
+            undoable (bool): Keep the weight write in the undo queue (see
+                ``set_weights``), so one undo reverts the whole import.
+
+        Returns:
+            (str) The method actually used: "index" or "nearest".
+        """
+        import numpy as np
+
+        if method not in ("auto", "index", "nearest"):
+            raise ValueError(
+                f"Invalid method: {method!r}. Expected 'auto', 'index' or 'nearest'."
+            )
+        skin_cluster = cls.get_skin_cluster(mesh)
+        if not skin_cluster:
+            raise ValueError(f"No skinCluster on mesh: {mesh}")
+
+        with np.load(str(file_path), allow_pickle=False) as data:
+            version = int(data["version"])
+            if version > cls.BINARY_WEIGHTS_VERSION:
+                raise ValueError(
+                    f"{file_path}: weight file version {version} is newer than "
+                    f"this reader ({cls.BINARY_WEIGHTS_VERSION})."
+                )
+            stored_influences = [str(i) for i in data["influences"]]
+            vertex_count = int(data["vertex_count"])
+            topology_hash = str(data["topology_hash"])
+            indptr, indices = data["indptr"], data["indices"]
+            values = data["data"].astype(np.float64)
+            points = data["points"]
+
+        # Influence remap: stored column -> target physical index.
+        index_map = cls._influence_index_map(skin_cluster)
+        used = np.zeros(len(stored_influences), dtype=bool)
+        used[np.unique(indices)] = True
+        missing = [
+            name
+            for k, name in enumerate(stored_influences)
+            if used[k] and name not in index_map and name.split("|")[-1] not in index_map
+        ]
+        if missing:
+            absent = [m for m in missing if not cmds.objExists(m)]
+            if absent or not add_missing_influences:
+                raise ValueError(
+                    f"Weighted influence(s) not on {skin_cluster}: {absent or missing}"
+                )
+            for name in missing:
+                cmds.skinCluster(skin_cluster, edit=True, addInfluence=name, weight=0.0)
+            index_map = cls._influence_index_map(skin_cluster)
+        column = np.array(
+            [
+                index_map.get(name, index_map.get(name.split("|")[-1], -1))
+                for name in stored_influences
+            ],
+            dtype=np.int64,
+        )
+
+        dag = CurveWeights._geometry_dag(cls._resolve_geometry(skin_cluster))
+        _, target_count, _ = cls._component_spec(dag)
+        if method == "auto":
+            same = target_count == vertex_count and (
+                cls._topology_hash(dag) == topology_hash
+            )
+            method = "index" if same else "nearest"
+        if method == "index" and target_count != vertex_count:
+            raise ValueError(
+                f"Component count mismatch: file has {vertex_count}, "
+                f"{mesh} has {target_count}. Use method='nearest'."
+            )
+
+        n_inf = len(cls.get_influences(skin_cluster))
+        stored = np.zeros((vertex_count, n_inf), dtype=np.float64)
+        rows = np.repeat(np.arange(vertex_count), np.diff(indptr))
+        keep = column[indices] >= 0
+        stored[rows[keep], column[indices][keep]] = values[keep]
+        if method == "nearest":
+            stored = stored[cls._nearest_rows(points, cls._component_points(dag))]
+
+        cls.set_weights(
+            skin_cluster,
+            stored.ravel().tolist(),
+            normalize=normalize,
+            undoable=undoable,
+        )
+        return method
+
     # ------------------------------------------------------------------
     # Procedural weighting
     # ------------------------------------------------------------------
@@ -981,7 +1381,8 @@ class SkinUtils(ptk.HelpMixin):
             center (str/tuple): World-space point or a node whose position to use.
             radius (float): World-space falloff distance.
             source_influence (str): Optional influence to blend against 1:1.
-            undoable (bool): Route the write through skinPercent (undo-safe).
+            undoable (bool): Keep the (single, batched) write in the undo
+                queue — see ``set_weights``.
 
         Returns:
             (int) The number of affected vertices.
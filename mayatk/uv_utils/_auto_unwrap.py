@@ -5,9 +5,18 @@
 Drives :class:`pythontk.UvUnwrap` (Ministry of Flat / Boundary First
 Flattening) from Maya. Reached through :meth:`mayatk.UvUtils.auto_unwrap`;
 nothing here is called directly.
+
+Batch mode merges several meshes' OBJ exports into one payload so a single
+engine launch unwraps them all, then splits the engine's output back into
+one OBJ per mesh by the face / vertex ranges recorded at merge time. The
+merge and split are plain text work with no Maya calls, which is what lets
+sessions run on a small thread pool while Maya waits.
 """
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     import maya.cmds as cmds
@@ -24,16 +33,146 @@ IMPORT_NAMESPACE = "UvUnwrapImport"
 
 @dataclass
 class AutoUnwrapResult:
-    """Per-object outcome of an :meth:`auto_unwrap` run."""
+    """Per-object outcome of an :meth:`auto_unwrap` run.
+
+    ``timings`` maps each mesh to its wall time in seconds: its own export
+    and write-back plus, in batch mode, an even share of every engine
+    session it rode in. ``sessions`` counts engine launches, retries
+    included.
+    """
 
     engine: str
     succeeded: List[str] = field(default_factory=list)
     failed: List[Tuple[str, str]] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)
+    sessions: int = 0
 
     def __bool__(self) -> bool:
         return bool(self.succeeded)
 
 
+# A face corner as ``(v, vt, vn)`` one-based indices; 0 where a slot is absent.
+_Corner = Tuple[int, int, int]
+
+
+def _read_obj(path: str) -> Dict[str, list]:
+    """The ``v`` / ``vt`` / ``vn`` lines and the faces of an OBJ, in file order.
+
+    Element lines are kept verbatim (they are copied, never re-formatted, so
+    no precision is lost in transit). Relative (negative) indices resolve
+    against the counts read so far, exactly as the format defines them.
+    Everything else -- comments, ``s`` / ``g`` / ``o`` / ``usemtl`` records
+    -- is dropped: the round-trip only carries geometry and UVs.
+    """
+    data = {"v": [], "vt": [], "vn": [], "f": []}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            parts = line.split()
+            if not parts:
+                continue
+            key = parts[0]
+            if key in ("v", "vt", "vn"):
+                data[key].append(line.rstrip("\n"))
+            elif key == "f":
+                counts = (len(data["v"]), len(data["vt"]), len(data["vn"]))
+                face = []
+                for token in parts[1:]:
+                    fields = (token.split("/") + ["", ""])[:3]
+                    corner = []
+                    for value, count in zip(fields, counts):
+                        index = int(value) if value else 0
+                        corner.append(count + index + 1 if index < 0 else index)
+                    face.append(tuple(corner))
+                data["f"].append(face)
+    return data
+
+
+def _format_corner(v: int, vt: int, vn: int) -> str:
+    if vn:
+        return f"{v}/{vt}/{vn}" if vt else f"{v}//{vn}"
+    return f"{v}/{vt}" if vt else str(v)
+
+
+def _merge_obj(sources: Sequence[str], path: str) -> List[Tuple[int, int]]:
+    """Concatenate the OBJ files *sources* into one payload at *path*.
+
+    Each source's indices are offset past the ones before it, so the payload
+    is every mesh side by side as disconnected components of one object.
+
+    Returns:
+        (list): ``(vertex_count, face_count)`` per source, in order -- the
+            ranges :func:`_split_obj` cuts the engine's output back along.
+    """
+    ranges = []
+    v_lines, vt_lines, vn_lines, f_lines = [], [], [], []
+    for source in sources:
+        data = _read_obj(source)
+        dv, dvt, dvn = len(v_lines), len(vt_lines), len(vn_lines)
+        for face in data["f"]:
+            f_lines.append(
+                "f "
+                + " ".join(
+                    _format_corner(
+                        v + dv, vt + dvt if vt else 0, vn + dvn if vn else 0
+                    )
+                    for v, vt, vn in face
+                )
+            )
+        v_lines += data["v"]
+        vt_lines += data["vt"]
+        vn_lines += data["vn"]
+        ranges.append((len(data["v"]), len(data["f"])))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"# auto_unwrap batch: {len(ranges)} meshes\n")
+        f.write("\n".join(v_lines + vt_lines + vn_lines + f_lines) + "\n")
+    return ranges
+
+
+def _split_obj(
+    path: str, ranges: Sequence[Tuple[int, int]], outputs: Sequence[str]
+) -> None:
+    """Cut an unwrapped batch payload back into one OBJ per source mesh.
+
+    Faces are assigned by the ranges :func:`_merge_obj` recorded, and every
+    face must reference only its own mesh's vertex block -- which holds as
+    long as the engine returned the input topology untouched, the same
+    guarantee the single-mesh component-space transfer already leans on.
+    Anything else raises ValueError rather than write back a scrambled mesh.
+    ``vt`` / ``vn`` are re-indexed per mesh in first-use order.
+    """
+    data = _read_obj(path)
+    faces = data["f"]
+    expected = sum(count for _, count in ranges)
+    if len(faces) != expected or len(data["v"]) != sum(n for n, _ in ranges):
+        raise ValueError(
+            f"engine output has {len(data['v'])} vertices / {len(faces)} faces; "
+            f"the batch payload had {sum(n for n, _ in ranges)} / {expected}"
+        )
+    v_start = f_start = 0
+    for (v_count, f_count), output in zip(ranges, outputs):
+        vt_map: Dict[int, int] = {}
+        vn_map: Dict[int, int] = {}
+        f_lines = []
+        for face in faces[f_start : f_start + f_count]:
+            corners = []
+            for v, vt, vn in face:
+                if not v_start < v <= v_start + v_count:
+                    raise ValueError(
+                        "engine output reordered the batch payload's vertices"
+                    )
+                vt = vt_map.setdefault(vt, len(vt_map) + 1) if vt else 0
+                vn = vn_map.setdefault(vn, len(vn_map) + 1) if vn else 0
+                corners.append(_format_corner(v - v_start, vt, vn))
+            f_lines.append("f " + " ".join(corners))
+        lines = data["v"][v_start : v_start + v_count]
+        lines += [data["vt"][i - 1] for i in vt_map]
+        lines += [data["vn"][i - 1] for i in vn_map]
+        with open(output, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines + f_lines) + "\n")
+        v_start += v_count
+        f_start += f_count
+
+
 class _AutoUnwrapInternal:
     """Round-trip mechanics for :meth:`mayatk.UvUtils.auto_unwrap`."""
 
@@ -156,12 +295,16 @@ class _AutoUnwrapInternal:
         pack: Optional[bool] = None,
         orient: bool = True,
         engine_params: Optional[Dict[str, Any]] = None,
+        batch_size: Optional[int] = 1,
+        workers: int = 1,
     ) -> AutoUnwrapResult:
         """Unwrap each mesh through an external engine. See ``UvUtils.auto_unwrap``."""
         engine = ptk.UvUnwrap.resolve_method(method)
         meshes = cls._resolve_meshes(objects)
         if not meshes:
             raise ValueError("auto_unwrap: no polygon meshes given or selected.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"auto_unwrap: batch_size must be >= 1, got {batch_size}.")
 
         # Resolve the executable before anything mutates the scene, so a
         # missing engine surfaces as a clean error rather than a half-run.
@@ -178,10 +321,17 @@ class _AutoUnwrapInternal:
         try:
             with CoreUtils.undo_chunk(f"Auto Unwrap ({engine})"):
                 with ptk.TempArtifacts("uv_unwrap", policy="scoped") as tmp:
-                    for mesh in meshes:
-                        cls._unwrap_one(
-                            uv_utils, mesh, engine, params, map_size, layout,
-                            orient, tmp, result,
+                    if batch_size == 1 and workers <= 1:
+                        for mesh in meshes:
+                            cls._unwrap_one(
+                                uv_utils, mesh, engine, params, map_size, layout,
+                                orient, tmp, result,
+                            )
+                    else:
+                        cls._unwrap_batched(
+                            uv_utils, meshes, engine, params, map_size, layout,
+                            orient, tmp, result, batch_size or len(meshes),
+                            max(1, workers),
                         )
         finally:
             cls._cleanup_namespace()
@@ -211,14 +361,168 @@ class _AutoUnwrapInternal:
         cls, uv_utils, mesh, engine, params, map_size, layout, orient, tmp, result
     ) -> None:
         """Round-trip one mesh, recording success or an isolated failure."""
+        start = time.perf_counter()
         snapshot = uv_utils.snapshot_uv_sets([mesh])
-        created: List[str] = []
         try:
             payload = tmp.path(extension=".obj")
             cls._export_obj(mesh, payload)
+            result.sessions += 1
             unwrapped = cls._engine_unwrap(payload, engine, **params)
             tmp.register(unwrapped)
+            cls._apply_unwrapped(uv_utils, mesh, unwrapped, map_size, layout, orient)
+        except Exception as error:  # noqa: BLE001 - one bad mesh must not stop the rest
+            uv_utils.restore_uv_snapshot(snapshot)
+            result.failed.append((mesh, str(error)))
+        else:
+            uv_utils.discard_uv_snapshot(snapshot)
+            result.succeeded.append(mesh)
+        finally:
+            result.timings[mesh] = time.perf_counter() - start
+
+    @classmethod
+    def _unwrap_batched(
+        cls,
+        uv_utils,
+        meshes,
+        engine,
+        params,
+        map_size,
+        layout,
+        orient,
+        tmp,
+        result,
+        batch_size,
+        workers,
+    ) -> None:
+        """Unwrap *meshes* through as few engine sessions as possible.
 
+        Three phases, so the Maya-bound work never overlaps the engine runs:
+        every mesh is exported on the main thread; the per-mesh OBJs are
+        merged into payloads of *batch_size* meshes and each payload is one
+        engine session (up to *workers* at once -- pure file and process
+        work, no Maya calls); then each mesh's slice of the output is written
+        back on the main thread in the caller's order, with its own snapshot
+        so a failure rolls back that mesh alone.
+
+        A session that fails -- the engine rejects the payload, or returns
+        something :func:`_split_obj` can't cut apart -- is bisected and its
+        halves retried, down to single meshes, so one bad mesh costs a few
+        extra launches instead of failing its whole batch.
+        """
+        timings = {mesh: 0.0 for mesh in meshes}
+        errors: Dict[str, str] = {}
+        exports: Dict[str, str] = {}
+        for mesh in meshes:
+            start = time.perf_counter()
+            try:
+                path = tmp.path(extension=".obj")
+                cls._export_obj(mesh, path)
+                exports[mesh] = path
+            except Exception as error:  # noqa: BLE001 - isolate the mesh
+                errors[mesh] = str(error)
+            timings[mesh] += time.perf_counter() - start
+
+        queued = [m for m in meshes if m in exports]
+        batches = [
+            queued[i : i + batch_size] for i in range(0, len(queued), batch_size)
+        ]
+        lock = threading.Lock()  # TempArtifacts bookkeeping is not thread-safe
+        outputs: Dict[str, str] = {}
+
+        def session(batch):
+            return cls._run_session(batch, exports, engine, params, tmp, lock)
+
+        if workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as pool:
+                reports = list(pool.map(session, batches))
+        else:
+            reports = [session(batch) for batch in batches]
+
+        for report, launches in reports:
+            result.sessions += launches
+            for mesh, (output, error, seconds) in report.items():
+                timings[mesh] += seconds
+                if error is None:
+                    outputs[mesh] = output
+                else:
+                    errors[mesh] = error
+
+        for mesh in meshes:
+            start = time.perf_counter()
+            if mesh in errors:
+                result.failed.append((mesh, errors[mesh]))
+                result.timings[mesh] = timings[mesh]
+                continue
+            snapshot = uv_utils.snapshot_uv_sets([mesh])
+            try:
+                cls._apply_unwrapped(
+                    uv_utils, mesh, outputs[mesh], map_size, layout, orient
+                )
+            except Exception as error:  # noqa: BLE001 - isolate the mesh
+                uv_utils.restore_uv_snapshot(snapshot)
+                result.failed.append((mesh, str(error)))
+            else:
+                uv_utils.discard_uv_snapshot(snapshot)
+                result.succeeded.append(mesh)
+            result.timings[mesh] = timings[mesh] + time.perf_counter() - start
+
+    @classmethod
+    def _run_session(cls, batch, exports, engine, params, tmp, lock):
+        """One engine session over *batch*; bisect and retry if it fails.
+
+        Runs off the main thread: no Maya calls.
+
+        Returns:
+            (tuple): ``({mesh: (output_obj, error, seconds)}, launches)``.
+                Exactly one of *output_obj* / *error* is None per mesh;
+                *seconds* is the mesh's even share of the sessions it was in.
+        """
+        start = time.perf_counter()
+        try:
+            if len(batch) == 1:
+                payload = exports[batch[0]]
+            else:
+                with lock:
+                    payload = tmp.path(extension=".obj")
+                ranges = _merge_obj([exports[m] for m in batch], payload)
+            unwrapped = cls._engine_unwrap(payload, engine, **params)
+            with lock:
+                tmp.register(unwrapped)
+                pieces = (
+                    [unwrapped]
+                    if len(batch) == 1
+                    else [tmp.path(extension=".obj") for _ in batch]
+                )
+            if len(batch) > 1:
+                _split_obj(unwrapped, ranges, pieces)
+        except Exception as error:  # noqa: BLE001 - bisect, or report the mesh
+            share = (time.perf_counter() - start) / len(batch)
+            if len(batch) == 1:
+                return {batch[0]: (None, str(error), share)}, 1
+            half = len(batch) // 2
+            report, launches = {}, 1
+            for part in (batch[:half], batch[half:]):
+                sub_report, sub_launches = cls._run_session(
+                    part, exports, engine, params, tmp, lock
+                )
+                launches += sub_launches
+                for mesh, (output, err, seconds) in sub_report.items():
+                    report[mesh] = (output, err, seconds + share)
+            return report, launches
+        share = (time.perf_counter() - start) / len(batch)
+        return {mesh: (piece, None, share) for mesh, piece in zip(batch, pieces)}, 1
+
+    @classmethod
+    def _apply_unwrapped(
+        cls, uv_utils, mesh, unwrapped, map_size, layout, orient
+    ) -> None:
+        """Import the engine's OBJ for *mesh* and transfer its UVs across.
+
+        Raises on anything that leaves the UVs unusable; the caller owns the
+        snapshot and rolls back.
+        """
+        created: List[str] = []
+        try:
             imported, created = cls._import_obj(unwrapped)
             if not imported:
                 raise RuntimeError("engine output contained no mesh")
@@ -249,12 +553,6 @@ class _AutoUnwrapInternal:
                 # the tile -- Ministry of Flat packs into a rectangle that
                 # routinely overruns 0-1.
                 uv_utils._fit_uvs_to_tile(mesh)
-        except Exception as error:  # noqa: BLE001 - one bad mesh must not stop the rest
-            uv_utils.restore_uv_snapshot(snapshot)
-            result.failed.append((mesh, str(error)))
-        else:
-            uv_utils.discard_uv_snapshot(snapshot)
-            result.succeeded.append(mesh)
         finally:
             # One at a time: deleting a transform takes its shape with it, so a
             # batched call would trip over nodes that no longer exist.
@@ -1285,6 +1285,8 @@ class UvUtils(ptk.HelpMixin):
         pack: Optional[bool] = None,
         orient: bool = True,
         engine_params: Optional[dict] = None,
+        batch_size: Optional[int] = 1,
+        workers: int = 1,
     ):
         """Automatically unwrap meshes with an external unwrapping engine.
 
@@ -1320,15 +1322,29 @@ class UvUtils(ptk.HelpMixin):
             engine_params (dict): Extra engine settings forwarded to
                 :class:`pythontk.UvUnwrap` (e.g. ``{"separate_hard_edges": True}``
                 for Ministry of Flat, ``{"n_cones": 8}`` for BFF).
+            batch_size (int): Meshes merged into one engine payload. The
+                default 1 is one launch per mesh; on a large kit, where
+                process start-up and file round-trips dominate, a larger
+                batch unwraps many meshes per launch. None puts every mesh in
+                one session. The output is split back per mesh and each
+                write-back keeps its own snapshot; a failed session is
+                bisected and retried, so one bad mesh is still isolated.
+                Ministry of Flat lays a shared session's islands out
+                together, so each mesh's slice is then fitted into the tile
+                on its own (or repacked with ``pack=True``).
+            workers (int): Engine sessions run concurrently. Only the engine
+                runs in parallel; export and write-back stay on Maya's thread.
 
         Returns:
             (AutoUnwrapResult): ``engine``, ``succeeded`` and ``failed``
-            ``(mesh, reason)`` pairs. Truthy when at least one mesh unwrapped.
+            ``(mesh, reason)`` pairs, per-mesh ``timings`` in seconds and the
+            ``sessions`` count. Truthy when at least one mesh unwrapped.
 
         Raises:
             FileNotFoundError: The engine executable isn't installed. The
                 message carries its download URL.
-            ValueError: No meshes given/selected, or an unknown *method*.
+            ValueError: No meshes given/selected, an unknown *method*, or a
+                *batch_size* below 1.
         """
         from mayatk.uv_utils._auto_unwrap import _AutoUnwrapInternal
 
@@ -1340,6 +1356,8 @@ class UvUtils(ptk.HelpMixin):
             pack=pack,
             orient=orient,
             engine_params=engine_params,
+            batch_size=batch_size,
+            workers=workers,
         )
 
     @classmethod
@@ -1,6 +1,8 @@
 import os
 import re
+import time
 import subprocess
+from dataclasses import dataclass, field
 from pathlib import Path
 
 try:
@@ -53,6 +55,24 @@ APP = ptk.AppSpec(
 _VERSION_RE = re.compile(r"(\d{4}(?:\.\d+)*)")
 
 
+@dataclass
+class RizomBatchResult:
+    """Per-object outcome of :meth:`RizomUVBridge.process_in_batches`.
+
+    ``timings`` maps each transform to its even share, in seconds, of every
+    RizomUV session it rode in (failed attempts included); ``sessions``
+    counts RizomUV launches, retries included.
+    """
+
+    succeeded: list = field(default_factory=list)
+    failed: list = field(default_factory=list)  # (transform, reason) pairs
+    timings: dict = field(default_factory=dict)
+    sessions: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.succeeded)
+
+
 class _RizomUVBridgeInternal(object):
     """Internal helpers for RizomUVBridge."""
 
@@ -380,6 +400,109 @@ class RizomUVBridge(ptk.LoggingMixin, _RizomUVBridgeInternal):
         # no-save error tells the user to open that very script in RizomUV.
         self._release_temp_payloads()
 
+    def process_in_batches(
+        self,
+        objects,
+        batch_size=None,
+        uv_script=None,
+        preset=None,
+        params=None,
+        skip_instances=True,
+    ) -> RizomBatchResult:
+        """Run :meth:`process_with_rizomuv` over *objects* with failure isolation.
+
+        A single :meth:`process_with_rizomuv` call already unwraps every
+        object in one RizomUV session, but one object RizomUV chokes on fails
+        the whole run -- so callers with a large kit fell back to one launch
+        per object, and paid RizomUV's start-up and the FBX round-trip every
+        time. Here the objects go through in sessions of *batch_size*
+        (``None``: all in one), and a session that raises is bisected and its
+        halves retried down to single objects. Every healthy object still
+        lands; the failures come back with their reasons.
+
+        Sessions run one after another: each is a Maya-side export, import
+        and UV transfer around the external run, and they share this bridge's
+        payload paths. All of them sit inside one undo chunk, so a single
+        Ctrl+Z reverts the batch.
+
+        Parameters:
+            objects: Maya transform nodes to process.
+            batch_size (int): Objects per RizomUV session. None (default)
+                starts with every object in one session.
+            uv_script / preset / params: As for :meth:`process_with_rizomuv`.
+                Presets that pack a sub-selection (``pack_into_existing``)
+                need the full object set in one session and are refused.
+            skip_instances (bool): Collapse true DAG instances to one
+                representative per shared shape, once, before batching.
+
+        Returns:
+            (RizomBatchResult): ``succeeded`` transforms, ``failed``
+            ``(transform, reason)`` pairs, per-object ``timings`` and the
+            ``sessions`` count. Truthy when at least one object succeeded.
+        """
+        if not objects:
+            raise ValueError("No objects specified for processing.")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}.")
+
+        transforms = NodeUtils.get_transform_node(objects)
+        if not transforms:
+            raise ValueError("No valid transform nodes supplied for processing.")
+        transforms = [str(t) for t in transforms]
+
+        resolved = self._resolve_script(uv_script=uv_script, preset=preset)
+        if resolved and "__PACK_SELECT_NAMES__" in resolved:
+            raise ValueError(
+                f"Preset '{preset or 'script'}' packs a sub-selection against "
+                "the rest of the objects and cannot be split into batches; "
+                "use process_with_rizomuv(select_objects=...)."
+            )
+        if skip_instances and len(transforms) > 1:
+            transforms = [
+                str(t) for t in NodeUtils.filter_duplicate_instances(transforms)
+            ]
+
+        size = batch_size or len(transforms)
+        result = RizomBatchResult()
+        pending = [transforms[i : i + size] for i in range(0, len(transforms), size)]
+        with CoreUtils.undo_chunk(f"RizomUV batch: {preset or 'script'}"):
+            while pending:
+                batch = pending.pop(0)
+                start = time.perf_counter()
+                result.sessions += 1
+                try:
+                    self.process_with_rizomuv(
+                        batch,
+                        uv_script=uv_script,
+                        preset=preset,
+                        params=params,
+                        skip_instances=False,
+                    )
+                    error = None
+                except Exception as exc:  # noqa: BLE001 - isolate, then bisect
+                    error = str(exc) or type(exc).__name__
+                share = (time.perf_counter() - start) / len(batch)
+                for node in batch:
+                    result.timings[node] = result.timings.get(node, 0.0) + share
+                if error is None:
+                    result.succeeded.extend(batch)
+                elif len(batch) == 1:
+                    self.logger.warning(f"RizomUV failed on {batch[0]}: {error}")
+                    result.failed.append((batch[0], error))
+                else:
+                    half = len(batch) // 2
+                    self.logger.info(
+                        f"RizomUV session over {len(batch)} object(s) failed "
+                        f"({error}); retrying as two batches."
+                    )
+                    pending[:0] = [batch[:half], batch[half:]]
+
+        self.logger.info(
+            f"RizomUV batch: {len(result.succeeded)} succeeded, "
+            f"{len(result.failed)} failed in {result.sessions} session(s)."
+        )
+        return result
+
     def _import_objects(self):
         """Import the RizomUV-processed FBX and return its transform nodes.
 
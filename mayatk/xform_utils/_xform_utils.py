@@ -6,6 +6,8 @@ import contextlib
 import math
 from typing import List, Tuple, Dict, Set, Optional
 
+import numpy as np
+
 try:
     import maya.cmds as cmds
     import maya.mel as mel
@@ -24,6 +26,7 @@ from mayatk.core_utils.components import Components
 from mayatk.node_utils._node_utils import NodeUtils
 from mayatk.node_utils.attributes._attributes import Attributes
 from mayatk.xform_utils.matrices import Matrices
+from mayatk.xform_utils.bounds import BulkBounds
 
 
 # ---------------------------------------------------------------------------
@@ -1364,10 +1367,12 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
         to_scale = cmds.ls(CoreUtils.as_strings(a), flatten=True, long=True) or []
 
         bx, by, bz = cls.get_bounding_box(b, "size", world_space=True)
+        # Every size up front: scaling an object never moves another's box.
+        boxes = BulkBounds.world_bounds(to_scale) if to_scale else []
 
         result = []
-        for obj in to_scale:
-            ax, ay, az = cls.get_bounding_box(obj, "size", world_space=True)
+        for obj, box in zip(to_scale, boxes):
+            ax, ay, az = cls._bounding_box_value(box, "size")
 
             try:
                 diffx, diffy, diffz = [bx / ax, by / ay, bz / az]
@@ -3478,8 +3483,8 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
 
         limit_pivots = {"xmin", "xmax", "ymin", "ymax", "zmin", "zmax"}
         if isinstance(pivot, str) and pivot in limit_pivots:
-            center = cls.get_bounding_box(node, "center")
-            limit_value = float(cls.get_bounding_box(node, pivot))
+            center, limit_value = cls.get_bounding_box(node, f"center|{pivot}")
+            limit_value = float(limit_value)
             axis_for_limit = {"x": 0, "y": 1, "z": 2}[pivot[0]]
 
             if axis_index is None:
@@ -3980,29 +3985,37 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
         )
         return center_pos
 
-    @staticmethod
-    def get_bounding_box(objects, value="", world_space=True, return_valid_keys=False):
-        """Calculate and retrieve specific properties of the bounding box for the given object(s) or component(s)."""
-        bbox_values = {
-            "xmin": None,
-            "xmax": None,
-            "ymin": None,
-            "ymax": None,
-            "zmin": None,
-            "zmax": None,
-            "sizex": None,
-            "sizey": None,
-            "sizez": None,
-            "size": None,
-            "volume": None,
-            "center": None,
-            "centroid": None,
-            "minsize": None,
-            "maxsize": None,
-        }
+    _BBOX_KEYS = (
+        "xmin",
+        "xmax",
+        "ymin",
+        "ymax",
+        "zmin",
+        "zmax",
+        "sizex",
+        "sizey",
+        "sizez",
+        "size",
+        "volume",
+        "center",
+        "centroid",
+        "minsize",
+        "maxsize",
+    )
 
+    @classmethod
+    def get_bounding_box(
+        cls, objects, value="", world_space=True, return_valid_keys=False
+    ):
+        """Calculate and retrieve specific properties of the bounding box for the given object(s) or component(s).
+
+        World-space boxes come from :class:`BulkBounds` (one API traversal for
+        the objects, one query for any components), so the result is the same
+        combined box ``exactWorldBoundingBox`` reports; inside a
+        ``BulkBounds.cached()`` block repeated queries reuse it.
+        """
         if return_valid_keys:
-            return list(bbox_values.keys())
+            return list(cls._BBOX_KEYS)
 
         if not objects:
             raise ValueError("No objects provided for bounding box calculation.")
@@ -4010,35 +4023,48 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
         objs = list(objects) if isinstance(objects, (list, tuple)) else [objects]
         objs = [str(o) for o in objs]
         bbox = (
-            cmds.exactWorldBoundingBox(objs)
+            BulkBounds.union_bounds(objs)
             if world_space
             else cmds.xform(objs, q=True, bb=True, ws=False)
         )
+        return cls._bounding_box_value(bbox, value)
+
+    @staticmethod
+    def get_bounding_boxes(objects):
+        """World bounding box of each object, read in one traversal.
+
+        Parameters:
+            objects (str/obj/list): Transforms, shapes or components.
+
+        Returns:
+            (np.ndarray) ``(N, 6)`` rows of ``xmin, ymin, zmin, xmax, ymax, zmax``,
+                one per object, in input order.
+        """
+        return BulkBounds.world_bounds(objects)
 
-        xmin, ymin, zmin, xmax, ymax, zmax = bbox
+    @classmethod
+    def _bounding_box_value(cls, bbox, value):
+        """Derive *value* (a key, or ``"a|b"`` for a tuple) from a 6-float box."""
+        xmin, ymin, zmin, xmax, ymax, zmax = (float(v) for v in bbox)
         size = (xmax - xmin, ymax - ymin, zmax - zmin)
         center = ((xmin + xmax) / 2, (ymin + ymax) / 2, (zmin + zmax) / 2)
-        volume = size[0] * size[1] * size[2]
-
-        bbox_values.update(
-            {
-                "xmin": xmin,
-                "xmax": xmax,
-                "ymin": ymin,
-                "ymax": ymax,
-                "zmin": zmin,
-                "zmax": zmax,
-                "sizex": size[0],
-                "sizey": size[1],
-                "sizez": size[2],
-                "size": size,
-                "volume": volume,
-                "center": center,
-                "centroid": center,
-                "minsize": min(size),
-                "maxsize": max(size),
-            }
-        )
+        bbox_values = {
+            "xmin": xmin,
+            "xmax": xmax,
+            "ymin": ymin,
+            "ymax": ymax,
+            "zmin": zmin,
+            "zmax": zmax,
+            "sizex": size[0],
+            "sizey": size[1],
+            "sizez": size[2],
+            "size": size,
+            "volume": size[0] * size[1] * size[2],
+            "center": center,
+            "centroid": center,
+            "minsize": min(size),
+            "maxsize": max(size),
+        }
 
         values = value.lower().split("|")
         try:
@@ -4055,10 +4081,13 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
         cls, objects, value="volume", descending=True, also_return_value=False
     ):
         """Sort the given objects by their bounding box value."""
-        valueAndObjs = []
-        for obj in cmds.ls(CoreUtils.as_strings(objects), flatten=False) or []:
-            v = cls.get_bounding_box(obj, value)
-            valueAndObjs.append((v, obj))
+        objs = cmds.ls(CoreUtils.as_strings(objects), flatten=False) or []
+        if not objs:
+            return []
+        boxes = BulkBounds.world_bounds(objs)
+        valueAndObjs = [
+            (cls._bounding_box_value(box, value), obj) for box, obj in zip(boxes, objs)
+        ]
 
         sorted_ = sorted(valueAndObjs, key=lambda x: x[0], reverse=descending)
         if also_return_value:
@@ -4307,16 +4336,14 @@ class XformUtils(_XformUtilsInternal, ptk.HelpMixin):
         if reference_point is None:
             reference_point = [0, 0, 0]
 
-        distance_object_pairs = []
-
-        for obj in cmds.ls(CoreUtils.as_strings(objects), flatten=True, long=True) or []:
-            bb_center = cls.get_bounding_box(obj, "center")
-            distance = (
-                (bb_center[0] - reference_point[0]) ** 2
-                + (bb_center[1] - reference_point[1]) ** 2
-                + (bb_center[2] - reference_point[2]) ** 2
-            ) ** 0.5
-            distance_object_pairs.append((distance, obj))
+        objs = cmds.ls(CoreUtils.as_strings(objects), flatten=True, long=True) or []
+        if not objs:
+            return []
+        boxes = BulkBounds.world_bounds(objs)
+        centers = (boxes[:, :3] + boxes[:, 3:]) / 2
+        offsets = centers - np.asarray(reference_point, dtype=float)
+        distances = np.linalg.norm(offsets, axis=1)
+        distance_object_pairs = list(zip(distances.tolist(), objs))
 
         distance_object_pairs.sort(key=lambda x: x[0], reverse=reverse)
 
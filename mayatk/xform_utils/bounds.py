@@ -0,0 +1,258 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Batched world bounding boxes for many DAG paths.
+
+``cmds.exactWorldBoundingBox`` is one command round-trip per object, and the
+sort / align helpers in :class:`~mayatk.xform_utils._xform_utils.XformUtils`
+used to issue it once per object -- and again for the same object later in
+the same operation. :class:`BulkBounds` resolves every requested name in one
+``MSelectionList`` pass and reads the paths through the API into an
+``(N, 6)`` array laid out exactly like
+``exactWorldBoundingBox`` (``xmin, ymin, zmin, xmax, ymax, zmax``).
+
+Meshes are measured natively: when the world matrix has no rotation or
+shear the shape's stored object-space box maps to the exact world box
+through its corners; otherwise the points themselves are transformed (the
+"exact" in ``exactWorldBoundingBox`` -- a rotated object-space box is
+looser). Anything else -- components, curves, surfaces, locators, empty
+groups -- is measured by ``exactWorldBoundingBox`` itself, so the numbers
+never depend on which path produced them.
+
+Usage::
+
+    from mayatk.xform_utils.bounds import BulkBounds
+
+    boxes = BulkBounds.world_bounds(nodes)          # one traversal
+    with BulkBounds.cached():                      # one operation
+        XformUtils.sort_by_bounding_box_value(nodes)
+        XformUtils.order_by_distance(nodes)        # reuses the boxes above
+"""
+from __future__ import annotations
+
+import contextlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import maya.cmds as cmds
+    import maya.api.OpenMaya as om
+except ImportError as error:
+    print(__file__, error)
+
+# From this package:
+from mayatk.core_utils._core_utils import CoreUtils
+
+
+class _BoundsCache:
+    """Per-shape world boxes, valid while the shape's matrix and geometry are.
+
+    The signature is the shape's world matrix plus its stored object-space
+    box: Maya keeps the latter current as the geometry changes, so a
+    deformed, edited or moved shape misses the cache by construction.
+    """
+
+    def __init__(self):
+        self.shapes: Dict[str, Tuple[tuple, np.ndarray]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, signature: tuple) -> Optional[np.ndarray]:
+        entry = self.shapes.get(key)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, signature: tuple, box: np.ndarray) -> None:
+        self.shapes[key] = (signature, box)
+
+
+class BulkBounds:
+    """World bounding boxes for many objects from one API traversal."""
+
+    # Stack of caches opened by :meth:`cached`; the innermost one is used.
+    _caches: List[_BoundsCache] = []
+
+    @classmethod
+    @contextlib.contextmanager
+    def cached(cls):
+        """Reuse boxes across every bounds read inside the block.
+
+        Scope it to one operation: entries are re-validated against matrix and
+        geometry on every read, but the cache holds a box per shape for as
+        long as the block runs. Nested blocks share the outermost cache.
+
+        Yields:
+            (_BoundsCache): The cache, whose ``hits`` / ``misses`` count reads.
+        """
+        cache = cls._caches[0] if cls._caches else _BoundsCache()
+        cls._caches.append(cache)
+        try:
+            yield cache
+        finally:
+            cls._caches.pop()
+
+    @classmethod
+    def world_bounds(cls, objects) -> np.ndarray:
+        """World bounding box of each object, one row per input.
+
+        Parameters:
+            objects (str/obj/list): Transforms, shapes or components. A
+                transform's box covers every non-intermediate shape below it,
+                as ``exactWorldBoundingBox`` does.
+
+        Returns:
+            (np.ndarray): ``(N, 6)`` float array, rows in input order, columns
+                ``xmin, ymin, zmin, xmax, ymax, zmax``.
+        """
+        names = [str(o) for o in CoreUtils.as_strings(objects)]
+        boxes = np.empty((len(names), 6), dtype=float)
+        cache = cls._caches[-1] if cls._caches else None
+        for row, (name, path) in enumerate(zip(names, cls._dag_paths(names))):
+            box = cls._native_bounds(path, cache) if path is not None else None
+            if box is None:
+                box = np.asarray(cmds.exactWorldBoundingBox(name), dtype=float)
+            boxes[row] = box
+        return boxes
+
+    @classmethod
+    def union(cls, boxes: np.ndarray) -> Tuple[float, ...]:
+        """The box enclosing every row of *boxes*, as ``exactWorldBoundingBox`` of a list.
+
+        Maya's "nothing to measure" rows (min +1e20 / max -1e20) drop out of
+        the min/max on their own, exactly as they do in the list query.
+        """
+        return tuple(np.concatenate([boxes[:, :3].min(0), boxes[:, 3:].max(0)]))
+
+    @classmethod
+    def union_bounds(cls, objects) -> Tuple[float, ...]:
+        """``exactWorldBoundingBox(objects)``, with the objects read in bulk.
+
+        Components are measured together in one ``exactWorldBoundingBox``
+        call -- a flattened selection of thousands of vertices must not turn
+        into thousands of queries -- and everything else goes through
+        :meth:`world_bounds`.
+
+        Parameters:
+            objects (str/obj/list): Transforms, shapes and/or components.
+
+        Returns:
+            (tuple) ``(xmin, ymin, zmin, xmax, ymax, zmax)``.
+        """
+        names = CoreUtils.as_strings(objects)
+        if not names:
+            raise ValueError("No objects provided for bounding box calculation.")
+        components = [n for n in names if "." in n]
+        nodes = [n for n in names if "." not in n]
+        rows = [cls.world_bounds(nodes)] if nodes else []
+        if components:
+            rows.append(np.array([cmds.exactWorldBoundingBox(components)], float))
+        return cls.union(np.concatenate(rows))
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _dag_paths(names: List[str]) -> list:
+        """The ``MDagPath`` of each name, or None where Maya should measure it.
+
+        Every name goes into one ``MSelectionList``; a name that grows it by
+        exactly one item owns that item. Components, names that fail to
+        resolve and names that add several items (a pattern, an ambiguous
+        short name) get None. A name that adds nothing is a node listed
+        already under another name; only those are resolved on their own.
+        """
+        sel = om.MSelectionList()
+        index: Dict[str, Optional[int]] = {}  # name -> item in sel
+        for name in names:
+            if "." in name or name in index:
+                continue
+            before = sel.length()
+            try:
+                sel.add(name)
+            except (RuntimeError, TypeError):
+                index[name] = None
+                continue
+            added = sel.length() - before
+            index[name] = before if added == 1 else (-1 if added == 0 else None)
+
+        paths = []
+        for name in names:
+            item = index.get(name)
+            path = None
+            try:
+                if item is not None and item >= 0:
+                    path = sel.getDagPath(item)
+                elif item is not None:
+                    single = om.MSelectionList()
+                    single.add(name)
+                    if single.length() == 1:
+                        path = single.getDagPath(0)
+            except (RuntimeError, TypeError):  # a DG node: not a DAG path
+                path = None
+            paths.append(path)
+        return paths
+
+    @classmethod
+    def _native_bounds(cls, root, cache: Optional[_BoundsCache]):
+        """Union of the mesh boxes under DAG path *root*, or None to defer to Maya.
+
+        None whenever a non-mesh shape is involved (or nothing measurable is),
+        so mixed hierarchies stay on ``exactWorldBoundingBox`` wholesale.
+        """
+        it = om.MItDag(om.MItDag.kDepthFirst, om.MFn.kShape)
+        it.reset(root, om.MItDag.kDepthFirst, om.MFn.kShape)
+        lo = np.full(3, np.inf)
+        hi = np.full(3, -np.inf)
+        found = False
+        while not it.isDone():
+            path = it.getPath()
+            it.next()
+            fn = om.MFnDagNode(path)
+            if fn.isIntermediateObject:
+                continue
+            if not path.hasFn(om.MFn.kMesh):
+                return None
+            box = cls._mesh_bounds(path, fn, cache)
+            if box is None:
+                continue  # no points: contributes nothing
+            lo = np.minimum(lo, box[:3])
+            hi = np.maximum(hi, box[3:])
+            found = True
+        return np.concatenate([lo, hi]) if found else None
+
+    @staticmethod
+    def _mesh_bounds(path, fn, cache: Optional[_BoundsCache]):
+        local = fn.boundingBox
+        if local.min.x > local.max.x:  # empty mesh
+            return None
+        matrix = path.inclusiveMatrix()
+        signature = tuple(matrix) + tuple(local.min) + tuple(local.max)
+        key = path.fullPathName()
+        if cache is not None:
+            box = cache.get(key, signature)
+            if box is not None:
+                return box
+
+        m = np.array(matrix, dtype=float).reshape(4, 4)
+        if not (m[0, 1] or m[0, 2] or m[1, 0] or m[1, 2] or m[2, 0] or m[2, 1]):
+            # Axis-aligned: the stored box's corners land exactly.
+            corners = np.array([tuple(local.min)[:3], tuple(local.max)[:3]])
+        else:
+            corners = np.array(om.MFnMesh(path).getPoints(om.MSpace.kObject))[:, :3]
+        world = corners @ m[:3, :3] + m[3, :3]  # row vectors: p * M
+        box = np.concatenate([world.min(0), world.max(0)])
+        if cache is not None:
+            cache.put(key, signature, box)
+        return box
+
+
+# --------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    pass
+
+# --------------------------------------------------------------------------------------------
+# Notes
+# --------------------------------------------------------------------------------------------
@@ -0,0 +1,241 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the Channels attribute snapshot's caching rules.
+
+``maya.api.OpenMaya`` is replaced by a small in-memory node/plug model and
+``ScriptJobManager`` by a recorder, so which plugs are read, what the
+callbacks mark stale and when the ``Channels`` command fallbacks run can be
+checked without Maya. Real nodes are covered by ``TestBuildTableData`` in
+``test/test_channels.py``.
+"""
+
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.node_utils.attributes.channels import _snapshot
+from mayatk.node_utils.attributes.channels._snapshot import AttributeSnapshot
+from mayatk.node_utils.attributes.channels._channels import Channels
+
+SET, EVAL = 1, 2  # MNodeMessage bits
+
+
+class _Attr:
+    def __init__(self, kind, value, locked=False, driven=False, label=None):
+        self.kind, self.value, self.locked = kind, value, locked
+        self.driven, self.label = driven, label
+
+    def hasFn(self, fn):
+        return fn == {"enum": "enum", "double": "numeric", "bool": "numeric"}.get(
+            self.kind, "typed"
+        )
+
+
+class _Plug:
+    isCompound = isChild = isElement = False
+
+    def __init__(self, attr):
+        self._attr = attr
+        self.isDestination = attr.driven
+        self.isLocked = attr.locked
+
+    def attribute(self):
+        return self._attr
+
+    def asDouble(self):
+        return self._attr.value
+
+    asBool = asInt = asFloat = asDouble
+
+
+class _Node:
+    def __init__(self, name, attrs):
+        self.name, self.attrs = name, attrs
+        self.uuid = SimpleNamespace(asString=lambda: f"uuid-{name}")
+        self.typeName = "transform"
+
+    def findPlug(self, name, _networked):
+        return _Plug(self.attrs[name])
+
+    def hasFn(self, _fn):
+        return False
+
+
+def _fake_om(scene):
+    class Selection:
+        def add(self, name):
+            self.node = scene[name]
+            return self
+
+        def getDependNode(self, _index):
+            return self.node
+
+    return SimpleNamespace(
+        MSelectionList=Selection,
+        MFnDependencyNode=lambda node: SimpleNamespace(
+            uuid=lambda: node.uuid, typeName=node.typeName, findPlug=node.findPlug
+        ),
+        MObjectHandle=lambda node: SimpleNamespace(
+            isValid=lambda: True, hashCode=lambda: id(node)
+        ),
+        MFn=SimpleNamespace(
+            kEnumAttribute="enum",
+            kNumericAttribute="numeric",
+            kUnitAttribute="unit",
+            kDagNode="dag",
+        ),
+        MFnNumericAttribute=lambda attr: SimpleNamespace(numericType=lambda: attr.kind),
+        MFnNumericData=SimpleNamespace(
+            kBoolean="bool",
+            kDouble="double",
+            kFloat="float",
+            kInt="long",
+            kShort="short",
+            kByte="byte",
+            kChar="char",
+        ),
+        MFnEnumAttribute=lambda attr: SimpleNamespace(
+            fieldName=lambda index: attr.label
+        ),
+        MFnAttribute=lambda attr: SimpleNamespace(dynamic=False),
+        MNodeMessage=SimpleNamespace(
+            kAttributeSet=SET,
+            kAttributeLocked=4,
+            kAttributeUnlocked=8,
+            kConnectionMade=16,
+            kConnectionBroken=32,
+            kAttributeArrayAdded=64,
+            kAttributeArrayRemoved=128,
+            addAttributeChangedCallback="changed",
+            addAttributeAddedOrRemovedCallback="added",
+        ),
+    )
+
+
+class _Manager:
+    def __init__(self):
+        self.callbacks = {}
+        self.removed = []
+
+    def add_om_callback(self, register, target, callback, owner=None):
+        self.callbacks[(register, target.name)] = callback
+        return len(self.callbacks)
+
+    def unsubscribe(self, token):
+        self.removed.append(token)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestAttributeSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.scene = {
+            "ctl": _Node(
+                "ctl",
+                {
+                    "tx": _Attr("double", 1.5),
+                    "visibility": _Attr("bool", True, locked=True),
+                    "mode": _Attr("enum", 1, label="Fk"),
+                    "note": _Attr("string", None),
+                    "ty": _Attr("double", 2.0, driven=True),
+                },
+            )
+        }
+        self.commands = []
+        self.manager = _Manager()
+        patches = [
+            patch.object(_snapshot, "om", _fake_om(self.scene)),
+            patch(
+                "mayatk.core_utils.script_job_manager.ScriptJobManager.instance",
+                return_value=self.manager,
+            ),
+            patch.object(Channels, "get_attr_type", side_effect=self._command("type")),
+            patch.object(
+                Channels, "get_attr_value", side_effect=self._command("value", "hi")
+            ),
+            patch.object(
+                Channels,
+                "classify_connection",
+                side_effect=self._command("conn", "keyframe"),
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.snapshot = AttributeSnapshot()
+
+    def _command(self, kind, result="string"):
+        def run(node, name):
+            self.commands.append((kind, name))
+            return result
+
+        return run
+
+    def changed(self, name, msg=SET):
+        plug = MagicMock(isCompound=False, isChild=False, isElement=False)
+        plug.partialName.return_value = name
+        self.manager.callbacks[("changed", "ctl")](msg, plug, None, None)
+
+    def read(self, *names):
+        return self.snapshot.read(["ctl"], names)["ctl"]
+
+    def test_api_read_matches_the_table_fields(self):
+        states = self.read("tx", "visibility", "mode", "note", "ty")
+        self.assertEqual(
+            [(s.display, s.locked, s.attr_type, s.conn) for s in states.values()],
+            [
+                (1.5, False, "double", "none"),
+                (True, True, "bool", "none"),
+                ("Fk", False, "enum", "none"),
+                ("hi", False, "string", "none"),
+                (2.0, False, "double", "keyframe"),
+            ],
+        )
+        # Only the string needed commands, and only the driven plug a trace.
+        self.assertEqual(
+            self.commands, [("type", "note"), ("value", "note"), ("conn", "ty")]
+        )
+
+    def test_repeat_reads_only_driven_and_changed_plugs(self):
+        self.read("tx", "visibility", "ty")
+        before = self.snapshot.reads
+        self.read("tx", "visibility", "ty")
+        self.assertEqual(self.snapshot.reads, before + 1, "Only the driven plug")
+
+        self.scene["ctl"].attrs["tx"].value = 4.0
+        self.changed("tx")
+        self.changed("visibility", msg=EVAL)  # evaluation: not a change
+        states = self.read("tx", "visibility", "ty")
+        self.assertEqual(self.snapshot.reads, before + 3)
+        self.assertEqual(states["tx"].value, 4.0)
+
+    def test_type_lookups_are_shared_per_node_type(self):
+        self.read("note")
+        self.snapshot.invalidate()
+        self.commands.clear()
+        self.read("note")
+        self.assertNotIn(("type", "note"), self.commands)
+
+    def test_retain_and_release_remove_callbacks(self):
+        self.read("tx")
+        self.assertEqual(len(self.snapshot), 1)
+        self.snapshot.retain(["ctl"])
+        self.assertEqual(self.manager.removed, [])
+        self.snapshot.release()
+        self.assertEqual(len(self.snapshot), 0)
+        self.assertEqual(sorted(self.manager.removed), [1, 2])
+
+    def test_unwatched_nodes_are_never_served_from_cache(self):
+        self.manager.add_om_callback = MagicMock(return_value=None)
+        self.read("tx")
+        self.read("tx")
+        self.assertEqual(self.snapshot.reads, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
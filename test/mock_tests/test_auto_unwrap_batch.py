@@ -0,0 +1,222 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for auto_unwrap's batch mode -- payload merge/split and session pooling.
+
+The engine is a Python stub and the Maya-side export / write-back are
+patched out, so the merge, the split, the bisecting retry and the per-mesh
+bookkeeping run for real without Maya. The real round-trip is covered by
+``TestAutoUnwrap`` in ``test/test_uv_utils.py``.
+"""
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+import pythontk as ptk
+from mayatk.uv_utils._auto_unwrap import (
+    AutoUnwrapResult,
+    _AutoUnwrapInternal,
+    _merge_obj,
+    _read_obj,
+    _split_obj,
+)
+
+# A quad and a triangle, written the way Maya's objExport lays a mesh out.
+QUAD = (
+    "v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n"
+    "vt 0 0\nvt 1 0\nvt 1 1\nvt 0 1\n"
+    "vn 0 0 1\n"
+    "s off\n"
+    "f 1/1/1 2/2/1 3/3/1 4/4/1\n"
+)
+TRI = "v 5 5 5\nv 6 5 5\nv 5 6 5\nvt 0.5 0.5\nvn 0 1 0\nf 1/1/1 2/1/1 3/1/1\n"
+
+
+def _shift_uvs(obj_in, obj_out, du=0.25):
+    """Engine stand-in: one ``vt`` per face corner (like MoF), shifted by *du*."""
+    data = _read_obj(obj_in)
+    lines = list(data["v"]) + list(data["vn"])
+    next_vt = 1
+    for face in data["f"]:
+        refs = []
+        for v, vt, vn in face:
+            u, w = (float(x) for x in data["vt"][vt - 1].split()[1:3])
+            lines.append(f"vt {u + du:.6f} {w:.6f}")
+            refs.append(f"{v}/{next_vt}/{vn}")
+            next_vt += 1
+        lines.append("f " + " ".join(refs))
+    with open(obj_out, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestObjMergeSplit(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="unwrap_batch_")
+        self.quad = self._write("quad.obj", QUAD)
+        self.tri = self._write("tri.obj", TRI)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_merge_offsets_every_index_past_the_previous_mesh(self):
+        payload = os.path.join(self.tmp, "batch.obj")
+        ranges = _merge_obj([self.quad, self.tri], payload)
+        self.assertEqual(ranges, [(4, 1), (3, 1)])
+        data = _read_obj(payload)
+        self.assertEqual(len(data["v"]), 7)
+        self.assertEqual(data["f"][1], [(5, 5, 2), (6, 5, 2), (7, 5, 2)])
+
+    def test_split_restores_each_mesh(self):
+        payload = os.path.join(self.tmp, "batch.obj")
+        ranges = _merge_obj([self.quad, self.tri], payload)
+        unwrapped = os.path.join(self.tmp, "batch_out.obj")
+        _shift_uvs(payload, unwrapped)
+        pieces = [os.path.join(self.tmp, f"piece{i}.obj") for i in range(2)]
+        _split_obj(unwrapped, ranges, pieces)
+
+        quad, tri = (_read_obj(p) for p in pieces)
+        self.assertEqual(quad["v"], _read_obj(self.quad)["v"])
+        self.assertEqual(tri["v"], _read_obj(self.tri)["v"])
+        self.assertEqual(tri["f"], [[(1, 1, 1), (2, 2, 1), (3, 3, 1)]])
+        self.assertEqual(len(tri["vt"]), 3)
+        self.assertEqual(tri["vt"][0], "vt 0.750000 0.500000")
+        self.assertEqual(quad["vn"], ["vn 0 0 1"])
+
+    def test_relative_indices_resolve(self):
+        path = self._write("rel.obj", "v 0 0 0\nv 1 0 0\nv 0 1 0\nf -3 -2 -1\n")
+        self.assertEqual(_read_obj(path)["f"], [[(1, 0, 0), (2, 0, 0), (3, 0, 0)]])
+
+    def test_split_rejects_changed_topology(self):
+        payload = os.path.join(self.tmp, "batch.obj")
+        ranges = _merge_obj([self.quad, self.tri], payload)
+        pieces = [os.path.join(self.tmp, name) for name in ("a.obj", "b.obj")]
+        # An engine that dropped a face can't be cut back apart.
+        broken = self._write("broken.obj", QUAD)
+        with self.assertRaises(ValueError):
+            _split_obj(broken, ranges, pieces)
+        # Nor one that moved a face onto the other mesh's vertices.
+        swapped = self._write(
+            "swapped.obj",
+            QUAD.replace("s off\n", "") + "v 5 5 5\nv 6 5 5\nv 5 6 5\nf 1 2 3\n",
+        )
+        with self.assertRaises(ValueError):
+            _split_obj(swapped, ranges, pieces)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBatchedSessions(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="unwrap_batch_")
+        self.sources = {}
+        self.sessions = []
+        self.applied = {}
+        self.poison = None
+        self.lock = threading.Lock()
+
+        def export(node, path):
+            if node == "broken_export":
+                raise RuntimeError("objExport failed")
+            shutil.copyfile(self.sources[node], path)
+
+        def engine(obj_in, engine_key, **params):
+            faces = len(_read_obj(obj_in)["f"])
+            with self.lock:
+                self.sessions.append(faces)
+            if self.poison and self.poison in open(obj_in, encoding="utf-8").read():
+                raise RuntimeError("engine exploded")
+            obj_out = obj_in.replace(".obj", "_out.obj")
+            _shift_uvs(obj_in, obj_out)
+            return obj_out
+
+        def apply(uv_utils, mesh, unwrapped, map_size, layout, orient):
+            self.applied[mesh] = _read_obj(unwrapped)
+
+        patches = [
+            patch.object(_AutoUnwrapInternal, "_export_obj", staticmethod(export)),
+            patch.object(_AutoUnwrapInternal, "_engine_unwrap", staticmethod(engine)),
+            patch.object(_AutoUnwrapInternal, "_apply_unwrapped", staticmethod(apply)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _meshes(self, count):
+        names = []
+        for i in range(count):
+            name = f"|prop{i}"
+            path = os.path.join(self.tmp, f"src{i}.obj")
+            # A unique x coordinate marks each mesh's payload lines.
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(QUAD.replace("v 1 0 0", f"v 1{i:03d}.5 0 0"))
+            self.sources[name] = path
+            names.append(name)
+        return names
+
+    def _run(self, meshes, batch_size, workers=1):
+        result = AutoUnwrapResult(engine="mof")
+        with ptk.TempArtifacts("unwrap_test", policy="scoped", dir=self.tmp) as tmp:
+            _AutoUnwrapInternal._unwrap_batched(
+                MagicMock(), meshes, "mof", {}, 1024, "none", True, tmp, result,
+                batch_size, workers,
+            )
+        return result
+
+    def test_one_session_per_batch(self):
+        meshes = self._meshes(10)
+        result = self._run(meshes, batch_size=4)
+        self.assertEqual(result.succeeded, meshes)
+        self.assertEqual(result.sessions, 3)
+        self.assertEqual(sorted(self.sessions), [2, 4, 4])
+        for mesh in meshes:
+            self.assertEqual(len(self.applied[mesh]["f"]), 1)
+            self.assertEqual(len(self.applied[mesh]["vt"]), 4)
+        self.assertEqual(set(result.timings), set(meshes))
+
+    def test_bad_mesh_is_bisected_out_of_its_batch(self):
+        meshes = self._meshes(8)
+        self.poison = "v 1005.5 0 0"  # prop5
+        result = self._run(meshes, batch_size=len(meshes))
+        self.assertEqual(result.failed, [("|prop5", "engine exploded")])
+        self.assertEqual(result.succeeded, [m for m in meshes if m != "|prop5"])
+        # 8 -> 4+4 -> 2+2 -> 1+1: seven launches rather than eight.
+        self.assertEqual(result.sessions, 7)
+        self.assertNotIn("|prop5", self.applied)
+
+    def test_export_failure_never_reaches_the_engine(self):
+        meshes = self._meshes(3)
+        meshes.insert(1, "broken_export")
+        result = self._run(meshes, batch_size=len(meshes))
+        self.assertEqual(result.failed, [("broken_export", "objExport failed")])
+        self.assertEqual(len(result.succeeded), 3)
+        self.assertEqual(self.sessions, [3])
+
+    def test_worker_pool_keeps_caller_order(self):
+        meshes = self._meshes(9)
+        result = self._run(meshes, batch_size=2, workers=3)
+        self.assertEqual(result.succeeded, meshes)
+        self.assertEqual(result.sessions, 5)
+        self.assertEqual(sum(self.sessions), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for BatchExporter's driver — job files, streaming, retry and failure
+isolation.
+
+The launcher is an in-process fake that writes the worker's result JSON, so no
+mayapy starts. The worker template itself (``templates/_export_scene.py``) runs
+a real export and is covered by ``TestSceneExporter`` in
+``test/test_scene_exporter.py``.
+"""
+import os
+import sys
+import json
+import time
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.env_utils.scene_exporter.batch_export import (
+    BatchExporter,
+    MayapyExportLauncher,
+)
+
+
+def _write_result(job, **result):
+    record = {"scene": job["scene"], "success": True}
+    record.update(result)
+    with open(job["output"], "w", encoding="utf-8") as f:
+        json.dump(record, f)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBatchExporter(unittest.TestCase):
+    def test_jobs_carry_scene_settings_and_sys_path(self):
+        seen = []
+
+        def fake(job):
+            with open(job["job_file"], encoding="utf-8") as f:
+                seen.append(json.load(f))
+            _write_result(job, export_path=job["scene"] + ".fbx")
+
+        farm = BatchExporter(workers=2, launcher=fake)
+        jobs = farm.run(
+            ["a.ma", "b.ma"],
+            export_dir="/out",
+            export_mode="all",
+            tasks={"set_linear_unit": "cm"},
+        )
+        self.assertEqual([j.status for j in jobs], ["done", "done"])
+        self.assertEqual(jobs[0].export_path, os.path.abspath("a.ma") + ".fbx")
+        spec = next(s for s in seen if s["scene"].endswith("a.ma"))
+        self.assertEqual(spec["export_mode"], "all")
+        self.assertEqual(spec["export_dir"], "/out")
+        self.assertEqual(spec["kwargs"], {"tasks": {"set_linear_unit": "cm"}})
+        self.assertTrue(spec["sys_path"])
+
+    def test_jobs_stream_in_completion_order(self):
+        release = threading.Event()
+
+        def fake(job):
+            if job["scene"].endswith("slow.ma"):
+                release.wait(5)
+            _write_result(job)
+
+        farm = BatchExporter(workers=2, launcher=fake)
+        stream = farm.iter_run(["slow.ma", "fast.ma"])
+        first = next(stream)
+        self.assertTrue(first.scene.endswith("fast.ma"))
+        self.assertEqual(farm.jobs[0].status, "running")
+        release.set()
+        second = next(stream)
+        self.assertTrue(second.scene.endswith("slow.ma"))
+        self.assertEqual(list(stream), [])
+
+    def test_crashed_worker_is_retried(self):
+        attempts = []
+
+        def fake(job):
+            attempts.append(job["scene"])
+            if len(attempts) == 1:
+                raise RuntimeError("worker crashed")
+            _write_result(job)
+
+        farm = BatchExporter(workers=1, launcher=fake, retries=1)
+        (job,) = farm.run(["a.ma"])
+        self.assertEqual((job.status, job.attempts), ("done", 2))
+
+    def test_retries_are_bounded_and_isolated(self):
+        def fake(job):
+            if job["scene"].endswith("bad.ma"):
+                return  # exits without a result, like a killed worker
+            _write_result(job)
+
+        progress = []
+        farm = BatchExporter(workers=2, launcher=fake, retries=2)
+        jobs = farm.run(
+            ["bad.ma", "good.ma"], on_progress=lambda j, n, t: progress.append((n, t))
+        )
+        self.assertEqual([j.status for j in jobs], ["failed", "done"])
+        self.assertEqual(jobs[0].attempts, 3)
+        self.assertIn("without writing", jobs[0].error)
+        self.assertEqual(progress, [(1, 2), (2, 2)])
+
+    def test_reported_failure_is_not_retried(self):
+        def fake(job):
+            _write_result(job, success=False, error="Traceback ...\nValueError: no")
+
+        farm = BatchExporter(workers=1, launcher=fake, retries=3)
+        (job,) = farm.run(["a.ma"])
+        self.assertEqual((job.status, job.attempts), ("failed", 1))
+        self.assertEqual(job.reason, "ValueError: no")
+
+    def test_incremental_skip_is_reported(self):
+        farm = BatchExporter(
+            workers=1, launcher=lambda job: _write_result(job, incremental="skipped")
+        )
+        (job,) = farm.run(["a.ma"], incremental=True)
+        self.assertEqual(job.status, "skipped")
+
+    def test_jobs_run_concurrently(self):
+        def fake(job):
+            time.sleep(0.2)
+            _write_result(job)
+
+        farm = BatchExporter(workers=4, launcher=fake)
+        t0 = time.perf_counter()
+        farm.run([f"s{i}.ma" for i in range(4)])
+        self.assertLess(time.perf_counter() - t0, 0.6)
+
+    def test_defaults(self):
+        farm = BatchExporter(timeout=42)
+        self.assertGreaterEqual(farm.workers, 1)
+        self.assertIsInstance(farm.launcher, MayapyExportLauncher)
+        self.assertEqual(farm.launcher.timeout, 42)
+        self.assertTrue(os.path.isfile(farm.launcher.template))
+        self.assertEqual(farm.run([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for BulkBounds' box maths, union and per-operation cache.
+
+The API traversal is stubbed with plain stand-ins for the DAG path and the
+shape's bounding box, so the corner / point transforms, the union rules and
+the cache signature run without Maya. Agreement with
+``exactWorldBoundingBox`` on a real scene is covered by ``TestBulkBounds``
+in ``test/test_xform_utils.py``.
+"""
+import sys
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.xform_utils import bounds
+from mayatk.xform_utils.bounds import BulkBounds
+from mayatk.xform_utils._xform_utils import XformUtils
+
+CUBE = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+
+
+class _Point(tuple):
+    x = property(lambda self: self[0])
+
+
+class _Shape:
+    """A DAG path and its MFnDagNode rolled into one."""
+
+    def __init__(self, name, matrix, points=CUBE):
+        self.name, self.matrix, self.points = name, matrix, points
+        pts = np.array(points, float)
+        self.boundingBox = MagicMock(
+            min=_Point(list(pts.min(0)) + [1.0]), max=_Point(list(pts.max(0)) + [1.0])
+        )
+
+    def inclusiveMatrix(self):
+        return list(self.matrix)
+
+    def fullPathName(self):
+        return self.name
+
+
+def _matrix(scale=(1, 1, 1), rot_z=0.0, translate=(0, 0, 0)):
+    c, s = math.cos(rot_z), math.sin(rot_z)
+    rows = np.array([[c, s, 0], [-s, c, 0], [0, 0, 1]]) * np.array(scale)[:, None]
+    m = np.identity(4)
+    m[:3, :3] = rows
+    m[3, :3] = translate
+    return m.ravel().tolist()
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBulkBoundsMaths(unittest.TestCase):
+    def _bounds(self, shape, cache=None):
+        mesh = MagicMock()
+        mesh.getPoints.return_value = [list(p) + [1.0] for p in shape.points]
+        with patch.object(bounds.om, "MFnMesh", return_value=mesh):
+            return BulkBounds._mesh_bounds(shape, shape, cache)
+
+    def test_axis_aligned_corners_include_negative_scale(self):
+        shape = _Shape("|a", _matrix(scale=(2, -3, 1), translate=(10, 0, 0)))
+        np.testing.assert_allclose(self._bounds(shape), [8, -3, -1, 12, 3, 1])
+
+    def test_rotation_transforms_the_points(self):
+        # A 45 degree turn about Z: the half-width becomes sqrt(2).
+        shape = _Shape("|a", _matrix(rot_z=math.pi / 4))
+        r = math.sqrt(2)
+        np.testing.assert_allclose(
+            self._bounds(shape), [-r, -r, -1, r, r, 1], atol=1e-9
+        )
+
+    def test_cache_misses_when_matrix_or_geometry_change(self):
+        cache = bounds._BoundsCache()
+        shape = _Shape("|a", _matrix())
+        self._bounds(shape, cache)
+        self._bounds(shape, cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        shape.matrix = _matrix(translate=(0, 1, 0))
+        np.testing.assert_allclose(self._bounds(shape, cache)[1], 0)
+        moved = _Shape("|a", shape.matrix, points=[(0, 0, 0), (5, 5, 5)])
+        np.testing.assert_allclose(self._bounds(moved, cache)[3:], [5, 6, 5])
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+    def test_nested_blocks_share_the_outer_cache(self):
+        with BulkBounds.cached() as outer:
+            with BulkBounds.cached() as inner:
+                self.assertIs(inner, outer)
+        self.assertEqual(BulkBounds._caches, [])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBulkBoundsUnion(unittest.TestCase):
+    def setUp(self):
+        self.native = {"|a": np.array([0.0, 0, 0, 1, 1, 1])}
+        self.queries = []
+
+        def exact(names):
+            self.queries.append(names)
+            if names == "|empty":  # Maya's "nothing to measure" sentinel
+                return [1e20, 1e20, 1e20, -1e20, -1e20, -1e20]
+            return [-1.0, 0, 0, 0, 0, 0]
+
+        patches = [
+            # Paths stand in as their names.
+            patch.object(
+                BulkBounds,
+                "_dag_paths",
+                side_effect=lambda names: [None if "." in n else n for n in names],
+            ),
+            patch.object(
+                BulkBounds,
+                "_native_bounds",
+                side_effect=lambda path, cache: self.native.get(path),
+            ),
+            patch.object(bounds.cmds, "exactWorldBoundingBox", side_effect=exact),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_components_are_measured_in_one_query(self):
+        comps = [f"|a.vtx[{i}]" for i in range(500)]
+        box = BulkBounds.union_bounds(["|a"] + comps)
+        self.assertEqual(self.queries, [comps])
+        self.assertEqual(box, (-1, 0, 0, 1, 1, 1))
+
+    def test_unmeasurable_rows_drop_out_of_the_union(self):
+        box = BulkBounds.union_bounds(["|a", "|empty"])
+        self.assertEqual(box, (0, 0, 0, 1, 1, 1))
+
+    def test_value_helper_matches_the_key_set(self):
+        box = (0, 0, 0, 2, 4, 6)
+        self.assertEqual(XformUtils._bounding_box_value(box, "size"), (2, 4, 6))
+        self.assertEqual(
+            XformUtils._bounding_box_value(box, "volume|center"), (48, (1, 2, 3))
+        )
+        self.assertEqual(
+            sorted(XformUtils.get_bounding_box(None, return_valid_keys=True)),
+            sorted(XformUtils._BBOX_KEYS),
+        )
+        with self.assertRaises(ValueError):
+            XformUtils._bounding_box_value(box, "nope")
+
+
+class _SelectionList:
+    """``MSelectionList`` over a name -> nodes table, counting every ``add``."""
+
+    def __init__(self, scene, adds):
+        self.scene, self.adds, self.items = scene, adds, []
+
+    def add(self, name):
+        self.adds.append(name)
+        if name not in self.scene:
+            raise RuntimeError(name)
+        self.items.extend(n for n in self.scene[name] if n not in self.items)
+
+    def length(self):
+        return len(self.items)
+
+    def getDagPath(self, index):
+        return f"path:{self.items[index]}"
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBulkBoundsResolve(unittest.TestCase):
+    """Added: 2026-10-19"""
+
+    SCENE = {
+        "a": ["|a"],
+        "|a": ["|a"],  # a long name for a node listed as "a" already
+        "b": ["|b"],
+        "dup": ["|x|dup", "|y|dup"],  # ambiguous short name
+    }
+
+    def test_one_selection_list_for_every_name(self):
+        adds, lists = [], []
+
+        def selection_list():
+            lists.append(_SelectionList(self.SCENE, adds))
+            return lists[-1]
+
+        names = ["a", "b", "a", "|a.vtx[0]", "gone", "dup", "|a"]
+        with patch.object(bounds.om, "MSelectionList", side_effect=selection_list):
+            paths = BulkBounds._dag_paths(names)
+        self.assertEqual(
+            paths, ["path:|a", "path:|b", "path:|a", None, None, None, "path:|a"]
+        )
+        # One list for the whole pass, plus one for the node listed twice.
+        self.assertEqual(len(lists), 2)
+        self.assertEqual(adds, ["a", "b", "gone", "dup", "|a", "|a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
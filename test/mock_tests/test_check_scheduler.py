@@ -0,0 +1,238 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the export check scheduler.
+
+The scheduler and the task manager's dispatch run on stub checks; the split
+file-size check runs on temporary files with the texture path snapshot and
+``MatUtils`` resolution patched out, since ``maya.cmds`` is the conftest
+mock. Real scenes are covered by ``TestSceneExporter`` in
+``test/test_scene_exporter.py``.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.env_utils.scene_exporter import task_manager
+from mayatk.env_utils.scene_exporter.check_scheduler import (
+    CheckJob,
+    CheckScheduler,
+    CheckTraits,
+)
+from mayatk.env_utils.scene_exporter.task_manager import TaskManager
+from mayatk.env_utils.scene_exporter.task_profiler import TaskProfiler
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestCheckScheduler(unittest.TestCase):
+    def test_eligible_stops_at_conflicting_writes(self):
+        traits = {
+            "check_a": CheckTraits(("textures",), job="_a"),
+            "check_b": CheckTraits(("animation",), job="_b"),
+            "check_c": CheckTraits(("textures",), job="_c"),
+            "check_plain": CheckTraits(("objects",)),
+            "check_mutating": CheckTraits(("objects",), mutates=True),
+        }
+        writes = {"bake": ("animation",), "relink": ("textures",)}
+        run = [
+            ("check_a", 1),
+            ("check_plain", 1),
+            ("bake", 1),
+            ("check_b", 1),  # reads what bake writes
+            ("check_c", 1),
+        ]
+        eligible = CheckScheduler.eligible(run, traits, writes)
+        self.assertEqual(eligible, ["check_a", "check_c"])
+
+        for blocker in ("undeclared_task", "check_mutating", "check_unknown"):
+            run = [("check_a", 1), (blocker, 1), ("check_c", 1)]
+            self.assertEqual(
+                CheckScheduler.eligible(run, traits, writes), ["check_a"], blocker
+            )
+
+    def test_work_runs_off_thread_and_finish_on_caller(self):
+        scheduler = CheckScheduler()
+        self.addCleanup(scheduler.shutdown)
+        threads = {}
+
+        def work():
+            threads["work"] = threading.current_thread()
+            return 2
+
+        def finish(value):
+            threads["finish"] = threading.current_thread()
+            return value > 1, []
+
+        scheduler.launch("check_a", CheckJob(work, finish))
+        scheduler.launch("check_b", (True, ["done inline"]))
+        self.assertEqual(scheduler.result("check_a"), (True, []))
+        self.assertEqual(scheduler.result("check_b"), (True, ["done inline"]))
+        self.assertIsNot(threads["work"], threading.current_thread())
+        self.assertIs(threads["finish"], threading.current_thread())
+        self.assertFalse(scheduler.launched("check_a"))
+
+    def test_work_errors_surface_at_collection(self):
+        scheduler = CheckScheduler()
+        self.addCleanup(scheduler.shutdown)
+
+        def work():
+            raise OSError("unreadable")
+
+        scheduler.launch("check_a", CheckJob(work, lambda value: (True, [])))
+        with self.assertRaises(OSError):
+            scheduler.result("check_a")
+        scheduler.launch("check_b", CheckJob(lambda: None, lambda v: (True, [])))
+        scheduler.cancel()
+        self.assertFalse(scheduler.launched("check_b"))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTaskManagerCheckJobs(unittest.TestCase):
+    def setUp(self):
+        self.manager = TaskManager(TaskProfiler().logger)
+        self.manager.objects = []
+        self.manager.profiler = None
+        self.addCleanup(self.manager.check_scheduler.shutdown)
+        self.calls = []
+
+    def stub_task(self, name):
+        def method(value=None):
+            self.calls.append(name)
+            return True
+
+        method.__name__ = name
+        self.manager._method_cache[name] = method
+
+    def split_check(self, name, work):
+        """Register *name* as a split check whose disk half is *work*."""
+
+        def job(value):
+            self.calls.append(f"{name}:read")
+            return CheckJob(work, lambda output: (output, []))
+
+        def check(value):
+            return self.manager._run_check_job(name, job, value)
+
+        check.__name__ = name
+        self.manager._method_cache[name] = check
+        setattr(self.manager, f"_{name}_job", job)
+        return CheckTraits(("textures",), job=f"_{name}_job")
+
+    def test_declarations_cover_every_check_and_task(self):
+        checks = {n for n in dir(TaskManager) if n.startswith("check_")}
+        checks.discard("check_definitions")
+        self.assertEqual(set(TaskManager.CHECK_TRAITS), checks)
+        for name, traits in TaskManager.CHECK_TRAITS.items():
+            self.assertFalse(traits.mutates, name)
+            if traits.job:
+                self.assertTrue(callable(getattr(TaskManager, traits.job)), name)
+        self.assertEqual(set(TaskManager.TASK_WRITES), set(TaskManager.TASK_ORDER))
+
+    def test_split_checks_overlap_and_report_in_order(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def work():
+            barrier.wait()  # only passes when both run at once
+            return True
+
+        traits = {
+            "check_a": self.split_check("check_a", work),
+            "check_b": self.split_check("check_b", work),
+        }
+        self.stub_task("relink")
+        writes = {"relink": ("textures",)}
+        with patch.object(TaskManager, "CHECK_TRAITS", traits):
+            with patch.object(TaskManager, "TASK_WRITES", writes):
+                passed = self.manager.run_tasks(
+                    {"relink": True, "check_a": True, "check_b": True}
+                )
+        self.assertTrue(passed)
+        # Both reads happen at the first check, after the task that wrote.
+        self.assertEqual(self.calls, ["relink", "check_a:read", "check_b:read"])
+        self.assertFalse(self.manager.check_scheduler.launched("check_b"))
+
+    def test_main_thread_halves_get_their_own_profile_entries(self):
+        """Added: 2026-10-18"""
+        traits = {
+            "check_a": self.split_check("check_a", lambda: True),
+            "check_b": self.split_check("check_b", lambda: True),
+        }
+        self.manager.profiler = TaskProfiler(count_commands=False)
+        with patch.object(TaskManager, "CHECK_TRAITS", traits):
+            self.assertTrue(self.manager.run_tasks({"check_a": True, "check_b": True}))
+        entries = [(e.name, e.kind) for e in self.manager.profiler.entries]
+        self.assertEqual(
+            entries,
+            [
+                ("check_a:prepare", "check"),
+                ("check_b:prepare", "check"),
+                ("check_a", "check"),
+                ("check_b", "check"),
+            ],
+        )
+
+    def test_scheduler_off_runs_checks_inline(self):
+        traits = {"check_a": self.split_check("check_a", lambda: False)}
+        self.manager.check_scheduler = None
+        with patch.object(TaskManager, "CHECK_TRAITS", traits):
+            self.assertFalse(self.manager.run_tasks({"check_a": True}))
+        self.assertEqual(self.manager._last_failed_checks, ["check_a"])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTextureFileSizeJob(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.paths = {}
+        for node, megabytes in (("big", 2), ("small", 0)):
+            path = os.path.join(self.root, f"{node}.png")
+            with open(path, "wb") as f:
+                f.write(b"\0" * (megabytes * 1024 * 1024 + 10))
+            self.paths[f"{node}_file"] = path
+        self.paths["gone_file"] = os.path.join(self.root, "gone.png")
+
+        self.manager = TaskManager(TaskProfiler().logger)
+        self.manager.objects = []
+        self.manager.profiler = None
+        self.addCleanup(self.manager.check_scheduler.shutdown)
+        self.manager._obj_link = lambda node, action="reveal": node
+        for patcher in (
+            patch.object(
+                TaskManager, "_export_texture_paths", lambda tm: dict(self.paths)
+            ),
+            patch.object(
+                task_manager.MatUtils, "resolve_path", lambda path, search: path
+            ),
+            patch.object(task_manager.MatUtils, "probe_texture_path", lambda p: p),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_direct_call_and_scheduled_run_agree(self):
+        passed, messages = self.manager.check_texture_file_size(1)
+        self.assertFalse(passed)
+        self.assertEqual(len(messages), 2)
+        self.assertIn("big_file -> big.png", messages[1])
+        self.assertEqual(self.manager.check_texture_file_size("OFF"), (True, []))
+
+        self.assertFalse(self.manager.run_tasks({"check_texture_file_size": 1}))
+        self.assertEqual(self.manager._last_failed_checks, ["check_texture_file_size"])
+        self.assertTrue(self.manager.run_tasks({"check_texture_file_size": 4}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for ColorIndex's bucketed tolerance lookup.
+
+Entries are stored directly and ``cmds.ls`` maps a UUID back to a name, so
+the quantization, the bucket walk and the invalidation bookkeeping run
+without Maya. Agreement with the per-object scan on a real scene is covered
+by ``TestColorIndex`` in ``test/test_display_utils.py``.
+"""
+import sys
+import random
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.display_utils import color_id
+from mayatk.display_utils.color_id import ColorIndex, ColorUtils
+
+
+def _uuid(i):
+    return f"{i:08X}-0000-0000-0000-000000000000"
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestColorIndexLookup(unittest.TestCase):
+    def setUp(self):
+        self.index = ColorIndex()
+        self.index._built = True  # entries are stored by hand below
+        self.alive = {}
+        patcher = patch.object(
+            color_id.cmds,
+            "ls",
+            side_effect=lambda node, **kw: (
+                [self.alive[node]] if node in self.alive else []
+            ),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _add(self, i, **channels):
+        uuid = _uuid(i)
+        self.alive[uuid] = f"|obj{i}"
+        self.index._store(uuid, {k: [v] for k, v in channels.items()})
+        return uuid
+
+    def _brute(self, target, threshold, channels):
+        return [
+            self.alive[uuid]
+            for uuid in sorted(self.index._colors, key=self.index._order.get)
+            if uuid in self.alive
+            and any(
+                ColorUtils.get_color_difference(c, target) <= threshold
+                for ch in channels
+                for c in self.index._colors[uuid].get(ch, [])
+            )
+        ]
+
+    def test_matches_the_brute_force_rule(self):
+        rng = random.Random(7)
+        palette = [tuple(rng.random() for _ in range(3)) for _ in range(12)]
+        for i in range(600):
+            base = rng.choice(palette)
+            jitter = tuple(
+                min(1.0, max(0.0, c + rng.uniform(-0.05, 0.05))) for c in base
+            )
+            self._add(i, **{rng.choice(ColorIndex.CHANNELS): jitter})
+        for threshold in (0.0, 0.01, 0.05, 0.1, 0.4):  # cell probe and bucket scan
+            for target in palette[:4]:
+                for channels in (["wireframe"], list(ColorIndex.CHANNELS)):
+                    self.assertEqual(
+                        self.index.query(target, threshold, channels),
+                        self._brute(target, threshold, channels),
+                        (threshold, target, channels),
+                    )
+
+    def test_channels_are_independent(self):
+        self._add(1, wireframe=(1.0, 0.0, 0.0))
+        self._add(2, vertex=(1.0, 0.0, 0.0))
+        self.assertEqual(self.index.query((1, 0, 0), 0.01, ["wireframe"]), ["|obj1"])
+        self.assertEqual(self.index.query((1, 0, 0), 0.01, ["vertex"]), ["|obj2"])
+        self.assertEqual(self.index.query((1, 0, 0), 0.01, []), [])
+
+    def test_results_keep_scene_order(self):
+        for i in (5, 3, 9):
+            self._add(i, outliner=(0.2, 0.2, 0.2))
+        self.assertEqual(
+            self.index.query((0.2, 0.2, 0.2), 0.01, ["outliner"]),
+            ["|obj5", "|obj3", "|obj9"],
+        )
+
+    def test_discard_empties_buckets(self):
+        uuid = self._add(1, wireframe=(0.5, 0.5, 0.5), set=(0.1, 0.1, 0.1))
+        self.index._discard(uuid)
+        self.assertEqual(self.index._buckets["wireframe"], {})
+        self.assertEqual(self.index._buckets["set"], {})
+        self.assertEqual(len(self.index), 0)
+
+    def test_dirty_nodes_are_reread_alone(self):
+        kept = self._add(1, wireframe=(0.5, 0.5, 0.5))
+        changed = self._add(2, wireframe=(0.5, 0.5, 0.5))
+        gone = self._add(3, wireframe=(0.5, 0.5, 0.5))
+        del self.alive[gone]
+        self.index.invalidate([changed, gone])
+        reads = []
+
+        def read(names, bulk=True):
+            reads.append((list(names), bulk))
+            return {changed: {"wireframe": [(0.0, 0.0, 1.0)]}}
+
+        with patch.object(ColorIndex, "read_colors", side_effect=read), patch.object(
+            ColorIndex, "_is_geometry_transform", return_value=True
+        ):
+            self.assertEqual(
+                self.index.query((0.5, 0.5, 0.5), 0.01, ["wireframe"]), ["|obj1"]
+            )
+        self.assertEqual(reads, [(["|obj2"], False)])
+        self.assertNotIn(gone, self.index._colors)
+        self.assertIn(kept, self.index._colors)
+        self.assertEqual(
+            self.index.query((0.0, 0.0, 1.0), 0.01, ["wireframe"]), ["|obj2"]
+        )
+
+    def test_invalidate_all_forces_a_rebuild(self):
+        self._add(1, wireframe=(0.5, 0.5, 0.5))
+        self.index.invalidate()
+        with patch.object(ColorIndex, "build") as build:
+            self.index.refresh()
+        build.assert_called_once()
+
+
+class _Plug:
+    """``MPlug`` stand-in: a named plug on a node, optionally a compound's child."""
+
+    def __init__(self, node, name, parent=None):
+        self._node, self._name, self._parent = node, name, parent
+        self.isChild = parent is not None
+
+    def parent(self):
+        return self._parent
+
+    def node(self):
+        return self._node
+
+    def partialName(self, useLongNames=False):
+        return self._name
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestColorIndexMaterialWatch(unittest.TestCase):
+    """Material and display-plug color edits dirty the objects they color.
+
+    Added: 2026-10-18
+    """
+
+    SET = 2
+
+    def setUp(self):
+        self.index = ColorIndex()
+        self.index._built = True
+        fake_om = SimpleNamespace(
+            MNodeMessage=SimpleNamespace(kAttributeSet=self.SET),
+            MFnDependencyNode=lambda node: SimpleNamespace(
+                uuid=lambda: SimpleNamespace(asString=lambda: node)
+            ),
+        )
+        patcher = patch.object(color_id, "om", fake_om)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_color_sets_are_recorded(self):
+        mat = _uuid(7)
+        color = _Plug(mat, "color")
+        self.index._on_material_attr(self.SET, _Plug(mat, "colorR", parent=color))
+        self.index._on_material_attr(self.SET, _Plug(_uuid(8), "diffuse"))
+        self.index._on_material_attr(0, _Plug(_uuid(9), "color"))
+        self.assertEqual(self.index._dirty_materials, {mat})
+
+    def test_users_of_an_edited_material_are_reread(self):
+        kept = _uuid(1)
+        user = _uuid(2)
+        for uuid in (kept, user):
+            self.index._store(uuid, {"material": [(0.5, 0.5, 0.5)]})
+        self.index._on_material_attr(self.SET, _Plug(_uuid(7), "color"))
+        reads = []
+
+        def read(names, bulk=True):
+            reads.append(list(names))
+            return {user: {"material": [(1.0, 0.0, 0.0)]}}
+
+        with (
+            patch.object(ColorIndex, "_material_users", return_value=[user]) as users,
+            patch.object(ColorIndex, "read_colors", side_effect=read),
+            patch.object(ColorIndex, "_is_geometry_transform", return_value=True),
+            patch.object(
+                color_id.cmds, "ls", side_effect=lambda node, **kw: [f"|{node}"]
+            ),
+        ):
+            self.index.refresh()
+        users.assert_called_once_with({_uuid(7)})
+        self.assertEqual(reads, [[f"|{user}"]])
+        self.assertEqual(self.index._colors[user], {"material": [(1.0, 0.0, 0.0)]})
+        self.assertEqual(self.index._colors[kept], {"material": [(0.5, 0.5, 0.5)]})
+        self.assertEqual(self.index._dirty_materials, set())
+
+    def test_display_plug_edits_dirty_the_node(self):
+        drawing = _Plug("shape", "drawOverride")
+        rgb = _Plug("shape", "overrideColorRGB", parent=drawing)
+        marked = []
+        with patch.object(ColorIndex, "_mark", side_effect=marked.append):
+            self.index._on_display_attr(self.SET, _Plug("shape", "overrideColorG", rgb))
+            self.index._on_display_attr(self.SET, _Plug("xform", "useOutlinerColor"))
+            self.index._on_display_attr(self.SET, _Plug("xform", "translateX"))
+            self.index._on_display_attr(
+                self.SET, _Plug("xform", "hideOnPlayback", parent=drawing)
+            )
+            self.index._on_display_attr(0, _Plug("xform", "outlinerColor"))
+        self.assertEqual(marked, ["shape", "xform"])
+
+    def test_deleted_nodes_drop_their_display_callbacks(self):
+        gone = _uuid(3)
+        self.index._store(gone, {"wireframe": [(1.0, 0.0, 0.0)]})
+        self.index._watched_nodes[gone] = ["t1", "t2"]
+        self.index._dirty.add(gone)
+        mgr = MagicMock()
+        with (
+            patch(
+                "mayatk.core_utils.script_job_manager.ScriptJobManager.instance",
+                return_value=mgr,
+            ),
+            patch.object(color_id.cmds, "ls", return_value=[]),
+        ):
+            self.index.refresh()
+        self.assertEqual(
+            [c.args for c in mgr.unsubscribe.call_args_list], [("t1",), ("t2",)]
+        )
+        self.assertNotIn(gone, self.index._watched_nodes)
+        self.assertNotIn(gone, self.index._colors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for DistributedBake's Maya-free parts — chunk planning, the worker
+array format, pool failure isolation and the range clear before a merge.
+
+The merge into live curves needs a real Maya; it is covered by
+``TestDistributedBake`` in ``test/test_smart_bake.py``.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.anim_utils.smart_bake.distributed_bake import (
+    DistributedBake,
+    read_samples,
+    write_samples,
+)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestChunkPlanning(unittest.TestCase):
+    def test_bake_frames_honour_sample_by(self):
+        self.assertEqual(
+            DistributedBake(sample_by=2).bake_frames(1, 9), [1, 3, 5, 7, 9]
+        )
+        self.assertEqual(
+            DistributedBake(sample_by=0.5).bake_frames(0, 1), [0.0, 0.5, 1.0]
+        )
+
+    def test_even_split_tiles_range_once(self):
+        baker = DistributedBake(workers=4, min_chunk_frames=10)
+        frames = [float(f) for f in range(1, 101)]
+        chunks = baker.plan_chunks(frames)
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual([f for c in chunks for f in c.frames], frames)
+        self.assertEqual([c.index for c in chunks], [0, 1, 2, 3])
+
+    def test_min_chunk_frames_caps_chunk_count(self):
+        baker = DistributedBake(workers=16, min_chunk_frames=24)
+        chunks = baker.plan_chunks([float(f) for f in range(50)])
+        self.assertEqual(len(chunks), 2)
+
+    def test_shot_boundaries_split_at_shots_and_gaps(self):
+        baker = DistributedBake(workers=2)
+        frames = [float(f) for f in range(1, 31)]
+        # Shots 1-10 and 16-30; frames 11-15 are a gap chunk.
+        chunks = baker.plan_chunks(frames, boundaries=[1, 10 + 1e-6, 16, 30 + 1e-6])
+        self.assertEqual([(c.start, c.end) for c in chunks], [(1, 10), (11, 15), (16, 30)])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestSampleFormat(unittest.TestCase):
+    def test_round_trip_is_frame_major(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chunk.bin")
+            write_samples(path, [1.0, 10.0, 2.0, 20.0, 3.0, 30.0])
+            samples = read_samples(path, frame_count=3, plug_count=2)
+            self.assertEqual(list(samples[0::2]), [1.0, 2.0, 3.0])
+            self.assertEqual(list(samples[1::2]), [10.0, 20.0, 30.0])
+
+    def test_short_array_raises(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "chunk.bin")
+            write_samples(path, [1.0, 2.0])
+            with self.assertRaises(ValueError):
+                read_samples(path, frame_count=2, plug_count=2)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestPool(unittest.TestCase):
+    def _fake(self, job):
+        n = len(job["plugs"])
+        values = []
+        for frame in job["frames"]:
+            values.extend(frame * 10 + p for p in range(n))
+        write_samples(job["output"], values)
+
+    def test_sample_merges_chunks_in_order(self):
+        baker = DistributedBake(
+            workers=3, min_chunk_frames=2, launcher=self._fake, scene_path="x.mb"
+        )
+        frames = [float(f) for f in range(1, 10)]
+        values = baker.sample(["a.tx", "a.ty"], frames)
+        self.assertEqual(values["a.tx"], [f * 10 for f in frames])
+        self.assertEqual(values["a.ty"], [f * 10 + 1 for f in frames])
+        self.assertEqual(len(baker.chunks), 3)
+
+    def test_one_failed_chunk_fails_the_sample(self):
+        def flaky(job):
+            if job["frames"][0] > 5:
+                raise RuntimeError("boom")
+            self._fake(job)
+
+        baker = DistributedBake(
+            workers=2, min_chunk_frames=2, launcher=flaky, scene_path="x.mb"
+        )
+        self.assertIsNone(baker.sample(["a.tx"], [float(f) for f in range(1, 11)]))
+        self.assertEqual([bool(c.error) for c in baker.chunks], [False, True])
+        self.assertIn("boom", baker.chunks[1].error)
+
+    def test_worker_without_output_is_a_failure(self):
+        baker = DistributedBake(
+            workers=1, launcher=lambda job: None, scene_path="x.mb"
+        )
+        self.assertIsNone(baker.sample(["a.tx"], [1.0, 2.0]))
+        self.assertIn("without writing", baker.chunks[0].error)
+
+
+class _Curve:
+    """An ``MFnAnimCurve`` stand-in keyed by frame, with Maya's ``addKeys``:
+    without ``keepExistingKeys`` every existing key goes."""
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+
+    @property
+    def numKeys(self):
+        return len(self.keys)
+
+    def input(self, index):
+        frame = self.keys[index][0]
+        return SimpleNamespace(asUnits=lambda unit: frame)
+
+    def remove(self, index):
+        del self.keys[index]
+
+    def addKeys(self, times, values, tin, tout, keep_existing):
+        kept = self.keys if keep_existing else []
+        self.keys = sorted(kept + list(zip(times, values)))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestRangeClear(unittest.TestCase):
+    """Added: 2026-10-18"""
+
+    def test_only_keys_inside_the_range_go(self):
+        curve = _Curve([(-10, -5.0), (1, 0.0), (24.5, 3.0), (48, 12.0), (60, 99.0)])
+        removed = DistributedBake._clear_range(curve, 1, 48, "film")
+        self.assertEqual(removed, 3)
+        curve.addKeys([1, 2], [7.0, 8.0], None, None, True)
+        self.assertEqual(curve.keys, [(-10, -5.0), (1, 7.0), (2, 8.0), (60, 99.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
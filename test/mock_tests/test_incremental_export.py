@@ -0,0 +1,193 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the incremental export decision.
+
+``ExportFingerprint.compute`` is patched to return canned records, and the
+sidecar lives in a temp dir, so the skip / rebuild rules, the recorded
+outputs and the batch report run without Maya. Fingerprints of a real
+scene and the skipped file write are covered by ``TestSceneExporter`` in
+``test/test_scene_exporter.py``.
+"""
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.env_utils.hierarchy_sync.scene_data_sidecar import SceneDataSidecar
+from mayatk.env_utils.scene_exporter._scene_exporter import SceneExporter
+from mayatk.env_utils.scene_exporter.export_fingerprint import ExportFingerprint
+
+
+def _record(**components):
+    components = {
+        name: components.get(name, "same") for name in ExportFingerprint.COMPONENTS
+    }
+    return {
+        "fingerprint": ExportFingerprint.combine(components),
+        "components": components,
+        "node_count": 1,
+        "version": ExportFingerprint.VERSION,
+    }
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestIncrementalExport(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.exporter = SceneExporter()
+        self.exporter.export_dir = tmp.name
+        self.exporter.export_path = os.path.join(tmp.name, "crate.fbx")
+        self.exporter.preset_file = None
+        self.current = _record()
+        patcher = patch.object(
+            ExportFingerprint,
+            "compute",
+            side_effect=lambda *a, **kw: dict(self.current),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _check(self, output_format="fbx", version_format="", force=False):
+        return self.exporter._incremental_check(
+            ["|crate"], {}, output_format, version_format, force
+        )
+
+    def _ship(self, version_format=""):
+        """What a successful export leaves behind: the outputs and the sidecar."""
+        record = self.exporter.task_manager._export_record
+        for name in record["outputs"]:
+            open(os.path.join(self.exporter.export_dir, name), "w").close()
+        SceneDataSidecar.write_manifest(
+            self.exporter.export_path,
+            {"crate"},
+            export=record,
+            base_stem=bool(version_format),
+        )
+
+    def test_first_export_rebuilds_then_skips(self):
+        unit = self._check()
+        self.assertEqual(unit["status"], "rebuilt")
+        self.assertEqual(unit["changed"], ["no previous record"])
+        self._ship()
+        self.exporter.task_manager._export_record = None
+        unit = self._check()
+        self.assertEqual(unit["status"], "skipped")
+        self.assertIsNone(self.exporter.task_manager._export_record)
+
+    def test_changed_components_are_reported(self):
+        self._check()
+        self._ship()
+        self.current = _record(geometry="edited", materials="edited")
+        unit = self._check()
+        self.assertEqual(unit["status"], "rebuilt")
+        self.assertEqual(unit["changed"], ["geometry", "materials"])
+
+    def test_missing_output_forces_a_rebuild(self):
+        self._check(output_format="fbx_glb")
+        self._ship()
+        os.remove(os.path.join(self.exporter.export_dir, "crate.glb"))
+        unit = self._check(output_format="fbx_glb")
+        self.assertEqual(unit["status"], "rebuilt")
+        self.assertEqual(unit["changed"], ["outputs missing"])
+
+    def test_force_rebuild(self):
+        self._check()
+        self._ship()
+        unit = self._check(force=True)
+        self.assertEqual((unit["status"], unit["changed"]), ("rebuilt", ["forced"]))
+        self.assertIsNotNone(self.exporter.task_manager._export_record)
+
+    def test_versioned_series_skips_against_the_shipped_version(self):
+        self.exporter.export_path = os.path.join(
+            self.exporter.export_dir, "crate_v001.fbx"
+        )
+        self._check(version_format="{stem}_v{n:03d}")
+        self._ship(version_format="{stem}_v{n:03d}")
+        # The next run is named v002, but v001 already carries this content.
+        self.exporter.export_path = os.path.join(
+            self.exporter.export_dir, "crate_v002.fbx"
+        )
+        unit = self._check(version_format="{stem}_v{n:03d}")
+        self.assertEqual(unit["status"], "skipped")
+        self.assertEqual(unit["unit"], "crate_v001.fbx")
+
+    def test_skipped_export_opens_no_log_file(self):
+        """Added: 2026-10-18"""
+        skipped = {"unit": "crate_v002.fbx", "status": "skipped"}
+        versioned = os.path.join(self.exporter.export_dir, "crate_v003.fbx")
+        with (
+            patch.object(SceneExporter, "generate_export_path", return_value=versioned),
+            patch.object(SceneExporter, "_initialize_objects", return_value=["|crate"]),
+            patch.object(SceneExporter, "_incremental_check", return_value=skipped),
+            patch.object(SceneExporter, "_setup_file_logging") as file_logging,
+        ):
+            result = self.exporter.perform_export(
+                self.exporter.export_dir,
+                create_log_file=True,
+                incremental=True,
+                tasks={"version": "{stem}_v{n:03d}"},
+            )
+        self.assertTrue(result)
+        file_logging.assert_not_called()
+        self.assertEqual(os.listdir(self.exporter.export_dir), [])
+
+    def test_summary_groups_units(self):
+        self._check()
+        self._ship()
+        self._check()
+        self.exporter.incremental_results.append(
+            {"unit": "b.fbx", "status": "failed", "changed": [], "fingerprint": ""}
+        )
+        summary = self.exporter.incremental_summary(reset=True)
+        self.assertEqual(
+            summary,
+            {
+                "skipped": ["crate.fbx"],
+                "rebuilt": ["crate.fbx"],
+                "failed": ["b.fbx"],
+            },
+        )
+        self.assertEqual(self.exporter.incremental_results, [])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestExportFingerprintRecords(unittest.TestCase):
+    def test_changed_components(self):
+        old, new = _record(), _record(animation="keyed")
+        self.assertEqual(ExportFingerprint.changed_components(old, new), ["animation"])
+        self.assertEqual(ExportFingerprint.changed_components(old, old), [])
+        stale = dict(old, version=old["version"] - 1)
+        self.assertEqual(
+            ExportFingerprint.changed_components(stale, old),
+            list(ExportFingerprint.COMPONENTS),
+        )
+
+    def test_settings_hash_covers_values_and_preset(self):
+        base = ExportFingerprint._hash_settings({"a": 1, "b": [1, 2]}, None)
+        self.assertEqual(
+            base, ExportFingerprint._hash_settings({"b": [1, 2], "a": 1}, None)
+        )
+        self.assertNotEqual(
+            base, ExportFingerprint._hash_settings({"a": 2, "b": [1, 2]}, None)
+        )
+        with tempfile.TemporaryDirectory() as d:
+            preset = os.path.join(d, "game.fbxexportpreset")
+            with open(preset, "w") as f:
+                f.write("FBXExportSmoothingGroups -v true;")
+            first = ExportFingerprint._hash_settings({}, preset)
+            with open(preset, "w") as f:
+                f.write("FBXExportSmoothingGroups -v false;")
+            self.assertNotEqual(first, ExportFingerprint._hash_settings({}, preset))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the point-buffer hash behind NodeUtils' instance restore.
+
+Point buffers are handed in directly and the DAG edits are patched out, so
+the key quantization, the neighbourhood probe and the bucketed clustering in
+``_restore_instanced_shapes`` run without Maya. The real round trip is
+covered by ``TestPreserveInstancing`` in ``test/test_node_utils.py``.
+"""
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.node_utils._node_utils import NodeUtils
+
+TOL = 1e-6
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestGeometryKey(unittest.TestCase):
+    def test_matching_buffers_always_land_in_a_probed_cell(self):
+        rng = np.random.default_rng(3)
+        for _ in range(500):
+            pa = rng.uniform(-100, 100, (12, 3))
+            pb = pa + rng.uniform(-TOL, TOL, pa.shape)  # within tol, any cell edge
+            self.assertTrue(NodeUtils._points_match(pa, pb, TOL))
+            buckets = {NodeUtils._geometry_key(pa, TOL): ["a"]}
+            found = list(
+                NodeUtils._geometry_candidates(buckets, NodeUtils._geometry_key(pb))
+            )
+            self.assertEqual(found, ["a"])
+
+    def test_point_count_separates_buckets(self):
+        pa = np.zeros((4, 3))
+        buckets = {NodeUtils._geometry_key(pa): ["a"]}
+        key = NodeUtils._geometry_key(np.zeros((5, 3)))
+        self.assertEqual(list(NodeUtils._geometry_candidates(buckets, key)), [])
+
+    def test_no_points_and_empty_buffers(self):
+        self.assertIsNone(NodeUtils._geometry_key(None))
+        self.assertEqual(list(NodeUtils._geometry_candidates({None: [1]}, None)), [])
+        empty = NodeUtils._geometry_key(np.zeros((0, 3)))
+        self.assertEqual(empty, (0,))
+        self.assertEqual(list(NodeUtils._geometry_candidates({(0,): [1]}, empty)), [1])
+
+    def test_points_match_is_index_for_index(self):
+        pa = np.arange(12, dtype=float).reshape(4, 3)
+        self.assertTrue(NodeUtils._points_match(pa, pa.copy()))
+        self.assertFalse(NodeUtils._points_match(pa, pa[::-1]))
+        self.assertFalse(NodeUtils._points_match(pa, pa[:3]))
+        self.assertFalse(NodeUtils._points_match(pa, None))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestBucketedRestore(unittest.TestCase):
+    def setUp(self):
+        self.buffers = {}
+        self.relinks = []
+        self.reads = []
+
+        def points(shape):
+            self.reads.append(shape)
+            return self.buffers[shape]
+
+        def relink(transform, shape, fork):
+            self.relinks.append((transform, shape, fork))
+            return True
+
+        patches = [
+            patch.object(NodeUtils, "_geometry_points", side_effect=points),
+            patch.object(NodeUtils, "_resolve_uuid", side_effect=lambda u: u),
+            patch.object(NodeUtils, "_relink_instanced_shape", side_effect=relink),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _record(self, i, buffer, source="src"):
+        fork = f"fork{i}"
+        self.buffers[fork] = buffer
+        return {"transform": f"t{i}", "source": source, "fork": fork}
+
+    def test_scatter_collapses_onto_one_head_per_variant(self):
+        self.buffers["src"] = np.full((8, 3), 99.0)  # every fork changed
+        variants = [np.random.default_rng(v).uniform(size=(8, 3)) for v in range(3)]
+        records = [self._record(i, variants[i % 3].copy()) for i in range(300)]
+
+        compares = []
+        original = NodeUtils._points_match
+
+        def counting(pa, pb, tol=TOL):
+            compares.append(1)
+            return original(pa, pb, tol)
+
+        with patch.object(NodeUtils, "_points_match", side_effect=counting):
+            restored = NodeUtils._restore_instanced_shapes(records)
+
+        self.assertEqual(restored, 297)
+        heads = {shape for _, shape, _ in self.relinks}
+        self.assertEqual(heads, {"fork0", "fork1", "fork2"})
+        # One check against the source plus one against the matching head.
+        self.assertEqual(len(compares), 300 + 297)
+        self.assertEqual(len(self.reads), len(set(self.reads)))  # each read once
+
+    def test_sources_never_cross(self):
+        shared = np.ones((4, 3))
+        self.buffers["srcA"] = self.buffers["srcB"] = np.zeros((4, 3))
+        records = [
+            self._record(0, shared.copy(), "srcA"),
+            self._record(1, shared.copy(), "srcB"),
+        ]
+        self.assertEqual(NodeUtils._restore_instanced_shapes(records), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
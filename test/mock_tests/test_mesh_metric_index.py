@@ -0,0 +1,232 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for MeshMetricIndex's caching and column queries.
+
+The API signature read, the scene listing and ``EditUtils._metric_values`` /
+``_duplicate_fingerprint`` are patched with canned values, so the refresh
+rules (what gets re-evaluated) and the vectorized comparison -- checked
+against ``EditUtils._metrics_are_similar`` -- run without Maya. Real meshes
+are covered by ``TestEditUtils`` in ``test/test_edit_utils.py``.
+"""
+
+import sys
+import random
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.edit_utils import mesh_metrics
+from mayatk.edit_utils.mesh_metrics import MeshMetricIndex
+from mayatk.edit_utils._edit_utils import EditUtils
+
+METRICS = {"vertex": True, "face": True, "area": True, "worldArea": True}
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestMeshMetricIndex(unittest.TestCase):
+    def setUp(self):
+        # name -> (uuid, signature, metric values)
+        self.scene = {}
+        self.evaluated = []
+        patches = [
+            patch.object(
+                EditUtils,
+                "_get_scene_polygon_transforms",
+                side_effect=lambda: set(self.scene),
+            ),
+            patch.object(
+                MeshMetricIndex, "read_signatures", side_effect=self._signatures
+            ),
+            patch.object(EditUtils, "_metric_values", side_effect=self._metric_values),
+            patch.object(
+                EditUtils, "_duplicate_fingerprint", side_effect=self._fingerprint
+            ),
+            patch.object(mesh_metrics.cmds, "ls", side_effect=self._ls),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.index = MeshMetricIndex()
+
+    def add(self, name, vertex, face, area, world_area=None, signature=0):
+        self.scene[name] = (
+            f"uuid-{name}",
+            (signature,),
+            {
+                "vertex": [vertex],
+                "face": [face],
+                "area": [area],
+                "worldArea": [area if world_area is None else world_area],
+            },
+        )
+
+    def _signatures(self, transforms):
+        return {
+            self.scene[n][0]: (n, self.scene[n][1])
+            for n in transforms
+            if n in self.scene
+        }
+
+    def _metric_values(self, obj, metrics):
+        self.evaluated.append(obj)
+        values = self.scene[obj][2]
+        return {key: values[key] for key in metrics}
+
+    def _fingerprint(self, obj):
+        self.evaluated.append(obj)
+        return ("fp", *self.scene[obj][2]["vertex"])
+
+    def _ls(self, names, uuid=False, **_):
+        names = [names] if isinstance(names, str) else names
+        return [self.scene[n][0] for n in names if n in self.scene] if uuid else []
+
+    def similar(self, obj, tolerance=0.0, metrics=METRICS):
+        self.index.refresh()
+        return self.index.similar(obj, metrics, tolerance)
+
+    def test_only_changed_meshes_are_reevaluated(self):
+        for name in ("a", "b", "c"):
+            self.add(name, 8, 6, 24.0)
+        self.assertEqual(self.similar("a"), ["b", "c"])
+        self.assertEqual(sorted(self.evaluated), ["a", "b", "c"])
+
+        self.evaluated.clear()
+        self.assertEqual(self.similar("b"), ["a", "c"])
+        self.assertEqual(self.evaluated, [], "Unchanged scene: all cached")
+
+        self.add("c", 8, 6, 30.0, signature=1)  # edited
+        self.assertEqual(self.similar("a"), ["b"])
+        self.assertEqual(self.evaluated, ["c"])
+
+    def test_deleted_meshes_are_forgotten(self):
+        self.add("a", 8, 6, 24.0)
+        self.add("b", 8, 6, 24.0)
+        self.assertEqual(self.similar("a"), ["b"])
+        del self.scene["b"]
+        self.assertEqual(self.similar("a"), [])
+        self.assertEqual(len(self.index), 1)
+
+    def test_invalidate_forces_a_reread(self):
+        self.add("a", 8, 6, 24.0)
+        self.add("b", 8, 6, 24.0)
+        self.similar("a")
+        self.evaluated.clear()
+        self.index.invalidate(["b"])
+        self.similar("a")
+        self.assertEqual(self.evaluated, ["b"])
+        self.evaluated.clear()
+        self.index.invalidate()
+        self.similar("a")
+        self.assertEqual(sorted(self.evaluated), ["a", "b"])
+
+    def test_counts_keep_the_callers_tolerance(self):
+        self.add("a", 250000, 10, 1.0)
+        self.add("b", 250001, 10, 1.0)
+        self.assertEqual(self.similar("a"), [])
+        self.assertEqual(self.similar("a", tolerance=1), ["b"])
+
+    def test_world_metrics_get_the_relative_floor(self):
+        self.add("a", 8, 6, 600.0, world_area=600.0)
+        self.add("b", 8, 6, 600.0, world_area=599.9)  # float32 drift
+        self.add("c", 8, 6, 600.0, world_area=612.0)  # a scaled copy
+        self.assertEqual(self.similar("a"), ["b"])
+
+    def test_query_outside_the_index(self):
+        self.add("a", 8, 6, 24.0)
+        values = {"vertex": [8], "face": [6], "area": [24.0], "worldArea": [24.0]}
+        with patch.object(EditUtils, "_metric_values", return_value=values):
+            self.index.refresh()
+            self.assertEqual(self.index.similar("curve1", METRICS), ["a"])
+
+    def test_matches_the_pairwise_rules(self):
+        rng = random.Random(3)
+        for n in range(60):
+            self.add(
+                f"m{n:02d}",
+                rng.choice([8, 9, 10]),
+                rng.choice([6, 7]),
+                rng.choice([24.0, 24.0000001, 25.0]),
+                world_area=rng.choice([24.0, 24.1, 30.0]),
+            )
+        for tolerance in (0.0, 1.0):
+            for name, (_, _, values) in self.scene.items():
+                expected = [
+                    other
+                    for other in sorted(self.scene)
+                    if other != name
+                    and EditUtils._metrics_are_similar(
+                        values, self.scene[other][2], tolerance
+                    )
+                ]
+                self.assertEqual(self.similar(name, tolerance), expected)
+
+    def test_fingerprints_are_cached_per_mesh(self):
+        self.add("a", 8, 6, 24.0)
+        self.add("b", 10, 6, 24.0)
+        self.assertEqual(
+            self.index.fingerprints(["a", "b"]), {"a": ("fp", 8), "b": ("fp", 10)}
+        )
+        self.evaluated.clear()
+        self.index.fingerprints(["a", "b"])
+        self.assertEqual(self.evaluated, [])
+        self.add("b", 12, 6, 24.0, signature=1)
+        self.assertEqual(self.index.fingerprints(["b"]), {"b": ("fp", 12)})
+        self.assertEqual(self.evaluated, ["b"])
+
+    def test_dirtied_mesh_is_reevaluated(self):
+        """Added: 2026-10-18"""
+        self.add("a", 8, 6, 24.0)
+        self.add("b", 8, 6, 24.0)
+        self.similar("a")
+        self.evaluated.clear()
+        # An unsampled vertex or a UV moved: same signature, shape dirtied.
+        self.scene["b"][2]["area"][0] = 30.0
+        self.index._on_dirty(None, "uuid-b")
+        self.assertEqual(self.similar("a"), [])
+        self.assertEqual(self.evaluated, ["b"])
+        self.evaluated.clear()
+        self.similar("a")
+        self.assertEqual(self.evaluated, [], "Dirty flag cleared by the re-read")
+
+    def test_watch_adds_one_dirty_callback_per_mesh(self):
+        """Added: 2026-10-18"""
+        mgr = MagicMock()
+        mgr.add_om_callback.side_effect = lambda *args, **_: f"token-{args[3]}"
+        with (
+            patch(
+                "mayatk.core_utils.script_job_manager.ScriptJobManager.instance",
+                return_value=mgr,
+            ),
+            patch.object(
+                MeshMetricIndex, "_shape_object", side_effect=lambda n: f"{n}Shape"
+            ),
+        ):
+            self.add("a", 8, 6, 24.0)
+            self.add("b", 8, 6, 24.0)
+            self.assertTrue(self.index.watch())
+            self.similar("a")
+            self.similar("b")
+            registered = [c.args[1:] for c in mgr.add_om_callback.call_args_list]
+            self.assertEqual(
+                sorted(registered),
+                [
+                    ("aShape", self.index._on_dirty, "uuid-a"),
+                    ("bShape", self.index._on_dirty, "uuid-b"),
+                ],
+            )
+
+            del self.scene["b"]
+            self.similar("a")
+            mgr.unsubscribe.assert_called_once_with("token-uuid-b")
+
+            self.index._on_scene_change()
+            mgr.unsubscribe.assert_called_with("token-uuid-a")
+            self.assertEqual(len(self.index), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for MeshReducer's array stages and batched execution.
+
+Face normals, ``polyInfo`` parsing and the dihedral test are pure NumPy and are
+checked against a per-edge reference; for ``dissolve`` / ``decimate`` the
+shape lookup, face counts and the coplanar read are patched, so the command
+batching (edge ranges, one history delete) runs without Maya. Real meshes are
+covered by ``TestEditUtils`` in ``test/test_edit_utils.py``.
+"""
+
+import sys
+import math
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.edit_utils import mesh_reduce
+from mayatk.edit_utils.mesh_reduce import MeshReducer
+
+
+# A 2x1 strip of quads folded along its middle edge by `angle` degrees.
+def _folded_strip(angle):
+    a = math.radians(angle)
+    points = np.array(
+        [
+            (0, 0, 0),
+            (1, 0, 0),
+            (1, 0, 1),
+            (0, 0, 1),
+            (1 + math.cos(a), math.sin(a), 0),
+            (1 + math.cos(a), math.sin(a), 1),
+        ]
+    )
+    return points, np.array([4, 4]), np.array([0, 3, 2, 1, 1, 2, 5, 4])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestMeshReducerArrays(unittest.TestCase):
+    def test_face_normals(self):
+        points, counts, connects = _folded_strip(0)
+        normals = MeshReducer.face_normals(points, counts, connects)
+        np.testing.assert_allclose(normals, [(0, 1, 0), (0, 1, 0)], atol=1e-12)
+        # A sliver triangle (all corners on a line) has no normal.
+        degenerate = MeshReducer.face_normals(
+            np.array([(0, 0, 0), (1, 0, 0), (2, 0, 0)]), [3], [0, 1, 2]
+        )
+        self.assertEqual(degenerate.tolist(), [[0.0, 0.0, 0.0]])
+
+    def test_parse_edge_faces(self):
+        info = [
+            "EDGE      0:      0 \n",
+            "EDGE      1:      0      1 \n",
+            "EDGE     12:      4      9      7 \n",
+            "EDGE     13:      9     11 \n",
+        ]
+        edges, faces = MeshReducer.parse_edge_faces(info)
+        self.assertEqual(edges.tolist(), [1, 13])
+        self.assertEqual(faces.tolist(), [[0, 1], [9, 11]])
+        self.assertEqual(len(MeshReducer.parse_edge_faces([])[0]), 0)
+
+    def test_dihedral_threshold(self):
+        for angle, tolerance, flat in ((0, 0, True), (0.5, 1, True), (2, 1, False)):
+            points, counts, connects = _folded_strip(angle)
+            normals = MeshReducer.face_normals(points, counts, connects)
+            result = MeshReducer.flat_edges(
+                normals, np.array([5]), np.array([[0, 1]]), tolerance
+            )
+            self.assertEqual(result.tolist(), [5] if flat else [], angle)
+
+    def test_matches_the_per_edge_angle(self):
+        rng = np.random.default_rng(11)
+        normals = rng.normal(size=(200, 3))
+        normals /= np.linalg.norm(normals, axis=1)[:, None]
+        normals[100:] = normals[:100] + rng.normal(0, 0.01, (100, 3))
+        normals /= np.linalg.norm(normals, axis=1)[:, None]
+        faces = np.stack([np.arange(100), np.arange(100, 200)], axis=1)
+        edges = np.arange(100) * 3
+        for tolerance in (0.1, 0.5, 1.0):
+            expected = [
+                int(e)
+                for e, (f0, f1) in zip(edges, faces)
+                if math.degrees(math.acos(min(1.0, float(normals[f0] @ normals[f1]))))
+                <= tolerance
+            ]
+            result = MeshReducer.flat_edges(normals, edges, faces, tolerance)
+            self.assertEqual(result.tolist(), expected)
+        allowed = MeshReducer.flat_edges(
+            normals, edges, faces, 180, allowed=np.array([3, 6])
+        )
+        self.assertEqual(allowed.tolist(), [3, 6])
+
+    def test_component_ranges_round_trip(self):
+        indices = MeshReducer.component_indices(["a.e[7]", "a.e[2:4]", "a.e[3]"])
+        self.assertEqual(indices.tolist(), [2, 3, 4, 7])
+        self.assertEqual(
+            MeshReducer.as_ranges("a", "e", indices), ["a.e[2:4]", "a.e[7]"]
+        )
+        self.assertEqual(MeshReducer.as_ranges("a", "e", []), [])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestMeshReducerBatch(unittest.TestCase):
+    def setUp(self):
+        self.faces = {"|a": 100, "|b": 50, "|c": 10}
+        self.flat = {"|a": [1, 2, 3, 9], "|b": [], "|c": [4]}
+        self.cmds = MagicMock()
+        self.cmds.polyDelEdge.side_effect = lambda comps, **_: self._edit(comps, 0.5)
+        self.cmds.polyReduce.side_effect = lambda obj, **_: self._edit(obj, 0.5)
+        patches = [
+            patch.object(mesh_reduce, "cmds", self.cmds),
+            patch.object(MeshReducer, "_shape", side_effect=lambda obj: obj),
+            patch.object(
+                MeshReducer, "_face_count", side_effect=lambda obj: self.faces[obj]
+            ),
+            patch.object(
+                MeshReducer,
+                "coplanar_edges",
+                side_effect=lambda obj, tol, allowed: np.intersect1d(
+                    self.flat[obj], allowed if allowed is not None else self.flat[obj]
+                ),
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _edit(self, comps, keep):
+        comps = [comps] if isinstance(comps, str) else comps
+        obj = comps[0].split(".")[0]
+        self.faces[obj] = int(self.faces[obj] * keep)
+
+    def test_dissolve_batches_history_and_reports_per_mesh(self):
+        results = MeshReducer.dissolve({"|a": None, "|b": None, "|c": ["|c.e[0:3]"]})
+        self.assertEqual([r.mesh for r in results], ["|a", "|b", "|c"])
+        self.assertEqual([r.edges for r in results], [4, 0, 0])
+        self.assertEqual(results[0].removed, 50)
+        self.assertTrue(all(r.duration >= 0 for r in results))
+        self.cmds.polyDelEdge.assert_called_once()
+        self.assertEqual(
+            self.cmds.polyDelEdge.call_args[0][0], ["|a.e[1:3]", "|a.e[9]"]
+        )
+        self.cmds.delete.assert_called_once_with(["|a"], constructionHistory=True)
+
+    def test_decimate_one_reduce_per_mesh_one_history_delete(self):
+        results = MeshReducer.decimate({"|a": None, "|b": ["|b.f[0:9]"]}, 50.0)
+        self.assertEqual([r.faces_after for r in results], [50, 25])
+        self.assertEqual(self.cmds.polyReduce.call_count, 2)
+        self.assertEqual(self.cmds.polyReduce.call_args_list[1][0][0], ["|b.f[0:9]"])
+        self.cmds.delete.assert_called_once_with(["|a", "|b"], constructionHistory=True)
+
+    def test_zero_percent_edits_nothing(self):
+        results = MeshReducer.decimate({"|a": None}, 0.0)
+        self.assertEqual(results[0].removed, 0)
+        self.cmds.polyReduce.assert_not_called()
+        self.cmds.delete.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the spatial-hash overlap engine.
+
+``SpatialHash`` is pure NumPy and is checked against a brute-force distance
+matrix; ``MeshOverlaps.read_meshes`` is patched to return canned arrays, so
+the per-mesh vertex and cross-mesh face results run without Maya. The API
+reads on real meshes are covered by ``TestEditUtils`` in
+``test/test_edit_utils.py``.
+"""
+
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.edit_utils.overlap import MeshOverlaps, SpatialHash
+
+# A unit quad in the XZ plane.
+QUAD = np.array([(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1)], dtype=float)
+
+
+def _brute_pairs(points, tolerance):
+    d = ((points[:, None] - points[None]) ** 2).sum(axis=2)
+    i, j = np.nonzero(np.triu(d <= tolerance * tolerance, 1))
+    return set(zip(i.tolist(), j.tolist()))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestSpatialHash(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        for scale, tolerance in ((1, 0.0), (1, 1e-3), (100, 0.5), (1e4, 3e-4)):
+            points = rng.random((300, 3)) * scale
+            near = points[:60] + rng.normal(0, tolerance / 4 + 1e-9, (60, 3))
+            points = np.vstack([points, near, points[:10]])
+            i, j = SpatialHash.close_pairs(points, tolerance)
+            self.assertTrue((i < j).all())
+            self.assertEqual(len(set(zip(i.tolist(), j.tolist()))), len(i))
+            self.assertEqual(
+                set(zip(i.tolist(), j.tolist())), _brute_pairs(points, tolerance)
+            )
+
+    def test_pairs_across_cell_borders(self):
+        points = np.array([(0.99999, 0, 0), (1.00001, 0, 0), (5, 5, 5)])
+        self.assertEqual(SpatialHash.overlapping(points, 1e-4).tolist(), [0, 1])
+        self.assertEqual(SpatialHash.overlapping(points, 1e-6).tolist(), [])
+
+    def test_degenerate_inputs(self):
+        self.assertEqual(len(SpatialHash.overlapping(np.empty((0, 3)), 0.1)), 0)
+        self.assertEqual(len(SpatialHash.overlapping(QUAD[:1], 0.1)), 0)
+        same = np.zeros((4, 3))
+        self.assertEqual(SpatialHash.overlapping(same, 0).tolist(), [0, 1, 2, 3])
+
+    def test_matching_polygons_ignore_winding(self):
+        points = np.vstack([QUAD, QUAD[::-1], QUAD + (0, 0.5, 0)])
+        counts = np.array([4, 4, 4])
+        connects = np.arange(12)
+        match = SpatialHash.matching_polygons(
+            points, counts, connects, np.array([0, 0]), np.array([1, 2]), 1e-4
+        )
+        self.assertEqual(match.tolist(), [True, False])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestMeshOverlaps(unittest.TestCase):
+    def _patch(self, meshes):
+        patcher = patch.object(MeshOverlaps, "read_meshes", return_value=meshes)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_vertices_per_mesh(self):
+        welded = np.vstack([QUAD, QUAD[:1] + 1e-5])
+        self._patch(
+            {
+                "|a": (welded, np.array([4]), np.arange(4)),
+                "|b": (QUAD, np.array([4]), np.arange(4)),
+            }
+        )
+        result = MeshOverlaps.vertices(["a", "b"])
+        self.assertEqual(list(result), ["|a"])
+        self.assertEqual(result["|a"].tolist(), [0, 4])
+        self.assertEqual(
+            MeshOverlaps.as_components(result, "vtx"), ["|a.vtx[0]", "|a.vtx[4]"]
+        )
+
+    def test_faces_across_meshes_keep_the_first(self):
+        # |a: the quad twice (face 1 duplicates face 0) and a raised copy.
+        a_points = np.vstack([QUAD, QUAD, QUAD + (0, 1, 0)])
+        # |b: one more copy of |a's face 0, wound the other way.
+        b_points = QUAD[::-1].copy()
+        self._patch(
+            {
+                "|a": (a_points, np.array([4, 4, 4]), np.arange(12)),
+                "|b": (b_points, np.array([4]), np.arange(4)),
+            }
+        )
+        result = MeshOverlaps.faces(["a", "b"])
+        self.assertEqual(
+            {k: v.tolist() for k, v in result.items()}, {"|a": [1], "|b": [0]}
+        )
+
+    def test_faces_need_every_corner(self):
+        # Same centroid, different corners: a quad and its 45-degree turn.
+        turned = np.array(
+            [(0.5, 0, -0.2), (1.2, 0, 0.5), (0.5, 0, 1.2), (-0.2, 0, 0.5)]
+        )
+        self._patch({"|a": (np.vstack([QUAD, turned]), np.array([4, 4]), np.arange(8))})
+        self.assertEqual(MeshOverlaps.faces(["a"]), {})
+
+    def test_no_objects(self):
+        self.assertEqual(MeshOverlaps.read_meshes([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the Texture Path Editor's background existence cache.
+
+``PathStatusCache`` is pure Python (a thread pool and a lock); these run it
+against a temporary folder. The table wiring is covered by
+``TestTableRowDiff`` in ``test/test_texture_path_editor.py``.
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.mat_utils.path_status import PathStatus, PathStatusCache
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestPathStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.present = os.path.join(self.root, "a.png")
+        with open(self.present, "wb") as f:
+            f.write(b"12345")
+        self.missing = os.path.join(self.root, "b.png")
+        self.cache = PathStatusCache(ttl=60.0)
+        self.addCleanup(self.cache.shutdown)
+
+    def wait(self):
+        deadline = time.monotonic() + 5
+        while self.cache.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_results_arrive_through_drain(self):
+        self.assertIsNone(self.cache.get(self.present))
+        self.assertEqual(self.cache.request([self.present, self.missing, ""]), 2)
+        self.wait()
+        self.assertEqual(
+            self.cache.drain(),
+            {self.present: PathStatus(True, 5), self.missing: PathStatus(False)},
+        )
+        self.assertEqual(self.cache.drain(), {})
+        self.assertEqual(self.cache.get(self.present), PathStatus(True, 5))
+
+    def test_fresh_results_are_not_rechecked(self):
+        self.cache.request([self.present])
+        self.wait()
+        with patch.object(PathStatusCache, "check") as check:
+            self.assertEqual(self.cache.request([self.present, self.present]), 0)
+            check.assert_not_called()
+
+    def test_expired_and_invalidated_results_are_rechecked(self):
+        self.cache.request([self.present, self.missing])
+        self.wait()
+        self.cache.invalidate([self.missing])
+        self.assertIsNone(self.cache.get(self.missing))
+        self.cache.ttl = 0.0
+        time.sleep(0.01)
+        self.assertIsNone(self.cache.get(self.present))
+        self.assertEqual(self.cache.request([self.present, self.missing]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for PlayblastExporter's streamed capture/encode pipeline.
+
+The viewport capture is replaced by a chunk writer and ffmpeg by a small
+Python process that copies stdin to the output file, so the queueing,
+backpressure, cleanup and failure paths run for real without Maya or ffmpeg.
+Real-playblast coverage lives in ``test/test_playblast_exporter.py``.
+"""
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+import pythontk as ptk
+from mayatk.anim_utils.playblast_exporter import PlayblastExporter
+
+# Stand-in encoder: copy stdin to argv[1] (optionally slowly, or fail fast).
+_COPY = (
+    "import sys, time\n"
+    "delay = float(sys.argv[2])\n"
+    "with open(sys.argv[1], 'wb') as out:\n"
+    "    while True:\n"
+    "        data = sys.stdin.buffer.read(4096)\n"
+    "        if not data:\n"
+    "            break\n"
+    "        out.write(data)\n"
+    "        time.sleep(delay)\n"
+)
+_FAIL = "import sys\nsys.stderr.write('bad option\\n')\nsys.exit(3)\n"
+
+FRAME_BYTES = 1000
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestStreamEncode(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="playblast_stream_")
+        self.exporter = PlayblastExporter()
+        self.exporter.STREAM_CHUNK_FRAMES = 4
+        self.exporter.STREAM_BUFFER_FRAMES = 2
+        self.chunks = []
+        self.disk_peaks = []
+        self.exporter._capture_chunk = self._fake_chunk
+        self.encoder_script = _COPY
+        self.delay = "0"
+        self.chunk_delay = 0.0
+        patches = [
+            patch.object(ptk.VidUtils, "resolve_ffmpeg", return_value="ffmpeg"),
+            patch.object(PlayblastExporter, "scene_fps", return_value=24.0),
+            patch.object(
+                PlayblastExporter, "_stream_command", side_effect=self._command
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _command(self, ffmpeg, output, fps, audio, offset, options):
+        return [sys.executable, "-c", self.encoder_script, output, self.delay]
+
+    def _fake_chunk(self, directory, prefix, start, end, kwargs):
+        self.chunks.append((start, end))
+        time.sleep(self.chunk_delay)
+        self.disk_peaks.append(len(os.listdir(directory)))
+        frames = []
+        for frame in range(start, end + 1):
+            path = os.path.join(directory, f"{prefix}.{frame:04d}.png")
+            with open(path, "wb") as handle:
+                handle.write(bytes([frame % 256]) * FRAME_BYTES)
+            frames.append(path)
+        return frames
+
+    def test_streams_every_frame_in_order(self):
+        output = os.path.join(self.tmp, "shot.mp4")
+        result = self.exporter.stream_encode(
+            output, start=1, end=10, fps=24, directory=os.path.join(self.tmp, "f")
+        )
+        self.assertEqual(result, ptk.format_path(output))
+        self.assertEqual(self.chunks, [(1, 4), (5, 8), (9, 10)])
+        with open(output, "rb") as handle:
+            data = handle.read()
+        self.assertEqual(len(data), 10 * FRAME_BYTES)
+        self.assertEqual(data[::FRAME_BYTES], bytes(range(1, 11)))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "f")))
+
+    def test_backpressure_bounds_frames_on_disk(self):
+        self.delay = "0.002"  # slow encoder: the buffer fills and capture waits
+        output = os.path.join(self.tmp, "slow.mp4")
+        self.exporter.stream_encode(output, start=1, end=24, fps=24)
+        stats = self.exporter.last_stream_stats
+        bound = (
+            self.exporter.STREAM_BUFFER_FRAMES + self.exporter.STREAM_CHUNK_FRAMES + 1
+        )
+        self.assertLessEqual(stats.peak_temp_frames, bound)
+        self.assertLessEqual(stats.peak_temp_bytes, bound * FRAME_BYTES)
+        self.assertTrue(all(n <= bound for n in self.disk_peaks), self.disk_peaks)
+        self.assertEqual(stats.frames, 24)
+        self.assertEqual(stats.chunks, 6)
+        self.assertGreater(stats.stall_time, 0.0)
+
+    def test_encoder_failure_is_reported_with_its_stderr(self):
+        self.encoder_script = _FAIL
+        self.chunk_delay = 0.05
+        with self.assertRaises(RuntimeError) as ctx:
+            self.exporter.stream_encode(
+                os.path.join(self.tmp, "bad.mp4"), start=1, end=40, fps=24
+            )
+        self.assertIn("bad option", str(ctx.exception))
+        # Capture stops once no encoder is left to feed.
+        self.assertLess(len(self.chunks), 10)
+
+    def test_capture_failure_kills_encoder_and_removes_partial_output(self):
+        output = os.path.join(self.tmp, "partial.mp4")
+        frames_dir = os.path.join(self.tmp, "frames")
+
+        def flaky(directory, prefix, start, end, kwargs):
+            if start > 4:
+                raise RuntimeError("viewport exploded")
+            return self._fake_chunk(directory, prefix, start, end, kwargs)
+
+        self.exporter._capture_chunk = flaky
+        with self.assertRaises(RuntimeError):
+            self.exporter.stream_encode(
+                output, start=1, end=12, fps=24, directory=frames_dir
+            )
+        self.assertFalse(os.path.exists(output))
+        self.assertFalse(os.path.exists(frames_dir))
+
+    def test_export_stream_reports_timing_and_footprint(self):
+        results = self.exporter.export(
+            self.tmp, name="clip", targets=["mp4", "mov"], start=1, end=6, stream=True
+        )
+        self.assertTrue(all(r.ok for r in results), [r.error for r in results])
+        for result in results:
+            self.assertGreater(result.elapsed, 0.0)
+            self.assertGreater(result.peak_temp_bytes, 0)
+            with open(result.output, "rb") as handle:
+                self.assertEqual(len(handle.read()), 6 * FRAME_BYTES)
+        self.assertEqual(self.chunks, [(1, 4), (5, 6)], "one capture feeds both")
+        stats = self.exporter.last_export_stats
+        self.assertEqual(stats["mode"], "stream")
+        self.assertEqual(stats["frames"], 6)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "clip_stream_tmp")))
+
+    def test_export_stream_falls_back_when_frames_are_kept(self):
+        captured = []
+
+        def fake_capture(directory, prefix=None, start=None, end=None, **kwargs):
+            captured.append(directory)
+            raise RuntimeError("two-pass capture")
+
+        self.exporter.capture_sequence = fake_capture
+        results = self.exporter.export(
+            self.tmp, name="kept", targets="mp4", start=1, end=2,
+            stream=True, keep_frames=True,
+        )
+        self.assertEqual(len(captured), 1)
+        self.assertFalse(self.chunks)
+        self.assertIn("two-pass capture", results[0].error)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestEncoderCommand(unittest.TestCase):
+    """The streamed argv encodes like ``VidUtils.compress_video``.
+
+    Added: 2026-10-18
+    """
+
+    def compress_video_command(self, **kwargs):
+        """The argv ``compress_video`` runs, with ffmpeg itself patched out."""
+        popen = MagicMock()
+        process = popen.return_value.__enter__.return_value
+        process.stdout, process.returncode = [], 0
+        with (
+            patch.object(ptk.VidUtils, "resolve_ffmpeg", return_value="ffmpeg"),
+            patch("pythontk.vid_utils._vid_utils.subprocess.Popen", popen),
+        ):
+            ptk.VidUtils.compress_video(**kwargs)
+        return popen.call_args.args[0]
+
+    @staticmethod
+    def after_video_input(command, source):
+        return command[command.index(source) + 1 :]
+
+    def test_output_options_match_compress_video(self):
+        options = {"crf": 20, "preset": "fast", "tune": "film"}
+        for audio, offset in ((None, 0.0), ("take.wav", 0.5), ("take.wav", -1.0)):
+            with self.subTest(audio=audio, offset=offset):
+                two_pass = self.compress_video_command(
+                    input_filepath="shot.%04d.png",
+                    output_filepath="shot.mp4",
+                    frame_rate=30.0,
+                    start_number=1,
+                    audio_filepath=audio,
+                    audio_offset=offset,
+                    **options,
+                )
+                streamed = PlayblastExporter._stream_command(
+                    "ffmpeg", "shot.mp4", 30.0, audio, offset, options
+                )
+                self.assertEqual(
+                    self.after_video_input(streamed, "-"),
+                    self.after_video_input(two_pass, "shot.%04d.png"),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for KeyRetimer's array retiming and its batched write-back.
+
+``maya.api.OpenMaya``/``OpenMayaAnim`` are replaced by fakes that read key
+times from a dict of curves. ``cmds.getAttr``/``setAttr`` on the
+``keyTimeValue`` span write back into the same dict, so retiming, commits and
+``SegmentKeys.execute_stagger`` run without Maya. Real curves are covered by
+``TestKeyRetimer`` in ``test/test_segment_keys.py``.
+"""
+
+import re
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.anim_utils import retime_keys
+from mayatk.anim_utils.retime_keys import KeyRetimer
+from mayatk.anim_utils.segment_keys import SegmentKeys
+from mayatk.anim_utils._anim_utils import AnimUtils
+
+_SPAN = re.compile(r"^(.+)\.ktv\[(\d+):(\d+)\]$")
+
+
+class _FakeScene:
+    """Curves as ``name -> {"times", "values", "unitless"}`` plus the calls made."""
+
+    def __init__(self, **curves):
+        self.curves = {
+            name: {"times": list(t), "values": [float(i) for i in range(len(t))]}
+            for name, t in curves.items()
+        }
+        self.writes = []
+        self.warnings = []
+        self.locked = set()
+
+    def om(self):
+        scene = self
+
+        class SelectionList:
+            def __init__(self):
+                self.items = []
+
+            def clear(self):
+                self.items = []
+
+            def add(self, name):
+                if name not in scene.curves:
+                    raise RuntimeError(name)
+                self.items.append(name)
+
+            def getDependNode(self, index):
+                return self.items[index]
+
+        return SimpleNamespace(
+            MSelectionList=SelectionList,
+            MTime=SimpleNamespace(uiUnit=lambda: "film"),
+        )
+
+    def oma(self):
+        scene = self
+
+        def anim_curve(name):
+            curve = scene.curves[name]
+            return SimpleNamespace(
+                isUnitlessInput=curve.get("unitless", False),
+                numKeys=len(curve["times"]),
+                input=lambda i: SimpleNamespace(asUnits=lambda unit: curve["times"][i]),
+            )
+
+        return SimpleNamespace(MFnAnimCurve=anim_curve)
+
+    def cmds(self):
+        scene = self
+
+        def get_attr(span):
+            name, first, last = _SPAN.match(span).groups()
+            curve = scene.curves[name]
+            rows = range(int(first), int(last) + 1)
+            return [(curve["times"][i], curve["values"][i]) for i in rows]
+
+        def set_attr(span, *flat):
+            name, first, last = _SPAN.match(span).groups()
+            if name in scene.locked:
+                raise RuntimeError(f"{name} is locked")
+            scene.writes.append(span)
+            curve = scene.curves[name]
+            for n, i in enumerate(range(int(first), int(last) + 1)):
+                curve["times"][i], curve["values"][i] = flat[2 * n], flat[2 * n + 1]
+
+        return SimpleNamespace(
+            getAttr=get_attr, setAttr=set_attr, warning=scene.warnings.append
+        )
+
+
+class _RetimerCase(unittest.TestCase):
+    curves = {}
+
+    def setUp(self):
+        self.scene = _FakeScene(**self.curves)
+        for name, fake in (
+            ("om", self.scene.om()),
+            ("oma", self.scene.oma()),
+            ("cmds", self.scene.cmds()),
+        ):
+            patcher = patch.object(retime_keys, name, fake, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def times(self, name):
+        return self.scene.curves[name]["times"]
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestKeyRetimerArrays(_RetimerCase):
+    curves = {"tx": [0, 10, 20, 30], "ty": [5, 15], "drv": [0, 1]}
+
+    def setUp(self):
+        super().setUp()
+        self.scene.curves["drv"]["unitless"] = True
+        self.retimer = KeyRetimer()
+
+    def test_read_skips_missing_and_unitless_curves(self):
+        self.assertEqual(self.retimer.read(["tx", "missing", "drv", "tx"]), 1)
+        self.assertEqual(self.retimer.times("drv").size, 0)
+        self.assertEqual(self.retimer.shift(["drv", "missing"], 5), 0)
+        self.assertEqual(self.retimer.stats["keys"], 4)
+        self.assertEqual(self.retimer.pending(), [])
+
+    def test_steps_match_keys_at_their_retimed_times(self):
+        # The first shift carries 0-10 onto 20-30; the second range sees it.
+        self.assertEqual(self.retimer.shift(["tx"], 20, (0, 10)), 2)
+        self.assertEqual(self.retimer.shift(["tx"], 100, (20, 30)), 4)
+        self.assertEqual(self.retimer.times("tx").tolist(), [120, 130, 120, 130])
+
+        self.assertEqual(self.retimer.scale(["ty"], 5, 2.0), 2)
+        self.assertEqual(self.retimer.times("ty").tolist(), [5, 25])
+        self.assertEqual(self.retimer.key_range(["tx", "ty"]), (5.0, 130.0))
+        self.assertIsNone(self.retimer.key_range(["drv"]))
+
+    def test_move_retimes_the_nearest_key(self):
+        moved = self.retimer.move(
+            "tx", [(10.0005, 12), (20, 20.00001), (25, 40), (30, 31)]
+        )
+        # 20 stays within tolerance and nothing is keyed at 25.
+        self.assertEqual(moved, 2)
+        self.assertEqual(self.retimer.times("tx").tolist(), [0, 12, 20, 31])
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestKeyRetimerCommit(_RetimerCase):
+    curves = {"tx": [0, 10, 20, 30], "ty": [0, 10], "tz": [0, 10]}
+
+    def test_one_span_write_per_changed_curve(self):
+        retimer = KeyRetimer()
+        retimer.read(["tx", "ty", "tz"])
+        retimer.shift(["tx"], 5, (10, 20))
+        retimer.shift(["ty"], 0.00001)
+        self.assertEqual(retimer.commit(), 2)
+        self.assertEqual(self.scene.writes, ["tx.ktv[1:2]"])
+        self.assertEqual(self.times("tx"), [0, 15, 25, 30])
+        self.assertEqual(self.scene.curves["tx"]["values"], [0, 1, 2, 3])
+        self.assertEqual(retimer.stats["moved"], 2)
+
+        # Committed times are forgotten and read again on next use.
+        self.assertEqual(retimer.times("tx").tolist(), [0, 15, 25, 30])
+
+    def test_reordering_curves_use_the_key_mover(self):
+        retimer = KeyRetimer()
+        retimer.shift(["tx"], 15, (0, 10))  # 10 -> 25 passes 20
+        with patch.object(AnimUtils, "_move_curve_keys", return_value=2) as mover:
+            self.assertEqual(retimer.commit(allow_merge=True), 2)
+        mover.assert_called_once_with(
+            "tx", [(0.0, 15.0), (10.0, 25.0)], allow_merge=True
+        )
+        self.assertEqual(self.scene.writes, [])
+        self.assertEqual(retimer.stats["fallback"], 1)
+
+    def test_failed_write_warns_and_continues(self):
+        self.scene.locked.add("ty")
+        retimer = KeyRetimer()
+        retimer.shift(["ty", "tz"], 5)
+        self.assertEqual(retimer.commit(), 2)
+        self.assertEqual(self.scene.writes, ["tz.ktv[0:1]"])
+        self.assertEqual(len(self.scene.warnings), 1)
+        self.assertIn("ty", self.scene.warnings[0])
+        self.assertEqual(retimer.stats["failed"], 1)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestSegmentKeysRetime(_RetimerCase):
+    curves = {"a_tx": [0, 20], "b_tx": [0, 20], "c_tx": [0, 20]}
+
+    def group(self, curve):
+        return {"start": 0.0, "end": 20.0, "duration": 20.0, "curves": [curve]}
+
+    def test_execute_stagger_writes_each_curve_once(self):
+        groups = [self.group("a_tx"), self.group("b_tx"), self.group("c_tx")]
+        SegmentKeys.execute_stagger(groups, start_frame=0, spacing=5)
+        self.assertEqual(self.times("b_tx"), [25, 45])
+        self.assertEqual(self.times("c_tx"), [50, 70])
+        self.assertEqual(self.scene.writes, ["b_tx.ktv[0:1]", "c_tx.ktv[0:1]"])
+
+    def test_execute_stagger_leaves_a_shared_retimer_uncommitted(self):
+        retimer = KeyRetimer()
+        groups = [self.group("a_tx"), self.group("b_tx")]
+        SegmentKeys.execute_stagger(groups, start_frame=10, retimer=retimer)
+        self.assertEqual(self.scene.writes, [])
+        self.assertEqual(retimer.key_range(["b_tx"]), (30.0, 50.0))
+
+    def test_shift_curves_in_range(self):
+        SegmentKeys.shift_curves(["a_tx", "b_tx"], -5, time_range=(20, 20))
+        self.assertEqual(self.times("a_tx"), [0, 15])
+        self.assertEqual(self.times("b_tx"), [0, 15])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,8 @@ Covers:
 - teardown clears everything
 - Singleton reset
 - Dispatch error isolation
+- Coalescing policies (idle / debounce / throttle), OM payload delivery
+- Per-callback timing stats in status()
 """
 import sys
 import unittest
@@ -452,6 +454,197 @@ class TestTeardown(ScriptJobManagerTestCase):
         self.assertEqual(kill_calls[0].kwargs["kill"], 42)
 
 
+class CoalescingTestCase(ScriptJobManagerTestCase):
+    """Captures deferred / timed calls instead of handing them to Maya or Qt."""
+
+    def setUp(self):
+        super().setUp()
+        self.deferred = []
+        self.timers = []
+        self.now = 0.0
+        self.mgr._defer = self.deferred.append
+        self.mgr._start_timer = lambda delay, fn: self.timers.append((delay, fn))
+        self.mgr._clock = lambda: self.now
+
+    def run_deferred(self):
+        pending, self.deferred[:] = list(self.deferred), []
+        for fn in pending:
+            fn()
+
+    def run_timers(self):
+        pending, self.timers[:] = list(self.timers), []
+        for _, fn in pending:
+            fn()
+
+
+class TestCoalescingPolicies(CoalescingTestCase):
+    """policy= collapses event bursts into fewer callback runs."""
+
+    def test_unknown_policy_raises(self):
+        with self.assertRaises(ValueError):
+            self.mgr.subscribe("SelectionChanged", lambda: None, policy="sometimes")
+
+    def test_timed_policy_needs_interval(self):
+        with self.assertRaises(ValueError):
+            self.mgr.subscribe("timeChanged", lambda: None, policy="throttle")
+
+    def test_idle_runs_once_per_burst(self):
+        cb = MagicMock()
+        self.mgr.subscribe("DagObjectCreated", cb, policy="idle")
+        for _ in range(200):
+            self.mgr._dispatch("DagObjectCreated")
+        cb.assert_not_called()
+        self.assertEqual(len(self.deferred), 1)
+        self.run_deferred()
+        cb.assert_called_once()
+        # A new burst schedules again.
+        self.mgr._dispatch("DagObjectCreated")
+        self.run_deferred()
+        self.assertEqual(cb.call_count, 2)
+
+    def test_immediate_subscriber_unaffected_by_neighbour_policy(self):
+        fast, slow = MagicMock(), MagicMock()
+        self.mgr.subscribe("SelectionChanged", fast)
+        self.mgr.subscribe("SelectionChanged", slow, policy="idle")
+        self.mgr._dispatch("SelectionChanged")
+        self.mgr._dispatch("SelectionChanged")
+        self.assertEqual(fast.call_count, 2)
+        slow.assert_not_called()
+
+    def test_debounce_only_last_timer_fires(self):
+        cb = MagicMock()
+        self.mgr.subscribe("DagObjectCreated", cb, policy="debounce", interval=0.25)
+        for _ in range(5):
+            self.mgr._dispatch("DagObjectCreated")
+        self.assertEqual([d for d, _ in self.timers], [0.25] * 5)
+        self.run_timers()
+        cb.assert_called_once()
+
+    def test_throttle_leading_then_one_trailing(self):
+        cb = MagicMock()
+        self.mgr.subscribe("timeChanged", cb, policy="throttle", interval=0.1)
+        self.mgr._dispatch("timeChanged")  # leading edge: runs now
+        cb.assert_called_once()
+        self.now = 0.03
+        for _ in range(10):
+            self.mgr._dispatch("timeChanged")
+        self.assertEqual(len(self.timers), 1)
+        self.assertAlmostEqual(self.timers[0][0], 0.07)
+        self.now = 0.1
+        self.run_timers()
+        self.assertEqual(cb.call_count, 2)
+        # Quiet long enough: the next event runs immediately again.
+        self.now = 1.0
+        self.mgr._dispatch("timeChanged")
+        self.assertEqual(cb.call_count, 3)
+
+    def test_unsubscribed_before_flush_is_noop(self):
+        cb = MagicMock()
+        token = self.mgr.subscribe("SelectionChanged", cb, policy="idle")
+        self.mgr._dispatch("SelectionChanged")
+        self.mgr.unsubscribe(token)
+        self.run_deferred()
+        cb.assert_not_called()
+
+    def test_suppressed_at_flush_time_is_skipped(self):
+        cb = MagicMock()
+        token = self.mgr.subscribe("SelectionChanged", cb, policy="idle")
+        self.mgr._dispatch("SelectionChanged")
+        self.mgr.suppress(token)
+        self.run_deferred()
+        cb.assert_not_called()
+
+
+class TestOMCoalescing(CoalescingTestCase):
+    """add_om_callback wraps the callback: timing always, policy on request."""
+
+    def _register(self, **kwargs):
+        register_fn = MagicMock(return_value=77)
+        cb = MagicMock()
+        token = self.mgr.add_om_callback(register_fn, "node", cb, **kwargs)
+        wrapper = register_fn.call_args.args[1]
+        self.assertEqual(register_fn.call_args.args[0], "node")
+        return token, cb, wrapper
+
+    def test_immediate_forwards_payload(self):
+        _, cb, wrapper = self._register()
+        wrapper("plugA", "plugB", True)
+        cb.assert_called_once_with("plugA", "plugB", True)
+
+    def test_immediate_errors_still_propagate(self):
+        token, cb, wrapper = self._register()
+        cb.side_effect = RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            wrapper("x")
+        stats = self.mgr.status()["om_callbacks"][0]["stats"]
+        self.assertEqual(stats["errors"], 1)
+
+    def test_batch_delivery_accumulates_payloads(self):
+        _, cb, wrapper = self._register(
+            policy="debounce", interval=0.25, delivery="batch"
+        )
+        for i in range(3):
+            wrapper(f"node{i}", None)
+        self.run_timers()
+        cb.assert_called_once_with([("node0", None), ("node1", None), ("node2", None)])
+
+    def test_latest_delivery_keeps_last_payload(self):
+        _, cb, wrapper = self._register(policy="idle")
+        for i in range(3):
+            wrapper(f"node{i}", None)
+        self.run_deferred()
+        cb.assert_called_once_with("node2", None)
+
+    def test_unknown_delivery_raises(self):
+        with self.assertRaises(ValueError):
+            self.mgr.add_om_callback(MagicMock(), lambda: None, delivery="all")
+
+
+class TestCallbackStats(CoalescingTestCase):
+    """Per-callback timing reaches status() and print_status()."""
+
+    def test_stats_count_events_calls_and_time(self):
+        def slow():
+            self.now += 0.02
+
+        self.mgr.subscribe("SelectionChanged", slow, policy="idle")
+        for _ in range(4):
+            self.mgr._dispatch("SelectionChanged")
+        self.run_deferred()
+        sub = self.mgr.status()["subscriptions"][0]
+        self.assertEqual(sub["policy"], "idle")
+        self.assertIn("slow", sub["callback"])
+        stats = sub["stats"]
+        self.assertEqual((stats["events"], stats["calls"], stats["coalesced"]), (4, 1, 3))
+        self.assertAlmostEqual(stats["total_ms"], 20.0)
+        self.assertAlmostEqual(stats["max_ms"], 20.0)
+
+    def test_errors_are_counted(self):
+        self.mgr.subscribe("SceneOpened", MagicMock(side_effect=RuntimeError("x")))
+        with self.assertLogs("mayatk.core_utils.script_job_manager", "WARNING"):
+            self.mgr._dispatch("SceneOpened")
+        self.assertEqual(self.mgr.status()["subscriptions"][0]["stats"]["errors"], 1)
+
+    def test_reset_stats(self):
+        self.mgr.subscribe("SceneOpened", lambda: None)
+        self.mgr._dispatch("SceneOpened")
+        self.mgr.reset_stats()
+        stats = self.mgr.status()["subscriptions"][0]["stats"]
+        self.assertEqual((stats["events"], stats["calls"]), (0, 0))
+
+    def test_print_status_lists_slowest(self):
+        def slow():
+            self.now += 0.5
+
+        self.mgr.subscribe("timeChanged", slow)
+        self.mgr._dispatch("timeChanged")
+        with patch("builtins.print") as mock_print:
+            self.mgr.print_status()
+        text = "\n".join(str(c.args[0]) for c in mock_print.call_args_list)
+        self.assertIn("slowest callbacks", text)
+        self.assertIn("500.0 ms", text)
+
+
 # ===========================================================================
 # Adoption tests — MayaScenePersistence
 # ===========================================================================
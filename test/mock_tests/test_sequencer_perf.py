@@ -2,55 +2,29 @@
 # coding=utf-8
 """Performance regression tests for the shot sequencer.
 
-Simulates the scale of the C130H scene (74 shots, ~100 objects,
-~389 segments) using fully-mocked Maya to ensure that the controller
-and widget can rebuild in acceptable time.
-
-These tests do NOT require a running Maya instance.
-
-IMPORTANT: This file reuses the mock objects from test_sequencer_controller
-to avoid cross-file sys.modules pollution when pytest collects both files.
+Simulates the scale of the C130H scene (74 shots, 100 objects, two
+curves each) with a mocked Maya layer: ``cmds`` answers from an in-memory
+key table and ``SegmentKeys.collect_segments`` is a counting stand-in, so
+the real controller, ``ShotSequencer``, ``SegmentCollector`` and
+``CurveSegmentCache`` rebuild end to end. Besides the time budgets, the
+tests count how many objects each rebuild actually re-collects -- a single
+key edit must cost one object, not the scene.
+
+The widget is a ``MagicMock`` that records the tracks and clips it is
+given: the budgets guard the controller's rebuild, not Qt painting, and
+repeatedly repopulating a real ``SequencerWidget`` under offscreen PySide6
+aborts the interpreter regardless of what drives it.
+
+These tests do NOT require a running Maya instance; the real segment
+collection is covered by ``TestSequencerMaya`` in ``test/test_sequencer.py``.
 """
 import sys
 import time
 import unittest
 from unittest.mock import MagicMock, patch
 
-import pytest
-
-# Suite mocks the legacy pymel-style call surface (pm.UndoChunk,
-# pm.playbackOptions). Production now uses cmds.* directly, so these
-# expectations no longer match. Marked module-skip until rewritten.
-pytestmark = pytest.mark.skip(
-    reason="Stale mock suite — pre-cmds-migration; needs rewrite."
-)
-
-# Mock-only suite — designed for pytest where conftest replaces maya.cmds
-# with MagicMocks. Under run_tests.py / mayapy the real Maya runtime is
-# already loaded; importing conftest there clobbers sys.modules["maya.cmds"]
-# and breaks production code. Detect the real-Maya path BEFORE conftest.
-_existing_cmds = sys.modules.get("maya.cmds")
-_REAL_MAYA_PRELOADED = _existing_cmds is not None and not isinstance(
-    _existing_cmds, MagicMock
-)
-
-if _REAL_MAYA_PRELOADED:
-    mock_cmds = MagicMock()
-    mock_undo_chunk = MagicMock()
-    _CONFTEST_LOADED = False
-else:
-    try:
-        from conftest import mock_cmds, mock_undo_chunk  # noqa: E402
-        _CONFTEST_LOADED = True
-    except ImportError:
-        mock_cmds = MagicMock()
-        mock_undo_chunk = MagicMock()
-        _CONFTEST_LOADED = False
-
-import maya.cmds as cmds
-
-_mock_cmds = mock_cmds
-_undo_chunk = mock_undo_chunk
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
 
 from qtpy import QtWidgets
 
@@ -58,9 +32,14 @@ _app = QtWidgets.QApplication.instance()
 if _app is None:
     _app = QtWidgets.QApplication(sys.argv)
 
-from uitk.widgets.sequencer._sequencer import SequencerWidget
-from mayatk.anim_utils.shots._shots import ShotBlock, ShotStore
+from mayatk.anim_utils.segment_keys import SegmentKeys
+from mayatk.anim_utils.shots._shots import ShotStore
+from mayatk.anim_utils.shots.shot_sequencer import segment_cache
 from mayatk.anim_utils.shots.shot_sequencer._shot_sequencer import ShotSequencer
+from mayatk.anim_utils.shots.shot_sequencer.segment_cache import CurveSegmentCache
+from mayatk.anim_utils.shots.shot_sequencer.segment_collector import (
+    SegmentCollector,
+)
 from mayatk.anim_utils.shots.shot_sequencer.shot_sequencer_slots import (
     ShotSequencerController,
 )
@@ -75,8 +54,7 @@ from mayatk.anim_utils.shots.shot_sequencer.shot_sequencer_slots import (
 
 
 def _generate_c130h_shots(n_shots=74, n_objects_per_shot=5, total_objects=100):
-    """Generate shot definitions and segment data at C130H scale."""
-    # Generate unique object names
+    """Generate shot definitions at C130H scale."""
     all_objects = [f"xform_{i:03d}" for i in range(total_objects)]
 
     shot_defs = []
@@ -88,61 +66,100 @@ def _generate_c130h_shots(n_shots=74, n_objects_per_shot=5, total_objects=100):
         end = start + duration
         # Each shot references a rotating subset of objects
         offset = (i * 3) % total_objects
-        objs = [all_objects[(offset + j) % total_objects] for j in range(n_objects_per_shot)]
+        objs = [
+            all_objects[(offset + j) % total_objects]
+            for j in range(n_objects_per_shot)
+        ]
         shot_defs.append((f"Shot_{i:02d}", start, end, objs))
         current_frame = end + gap
 
     return shot_defs, all_objects
 
 
-def _generate_segments_for_shot(shot_def, n_segments_per_obj=2):
-    """Generate segment dicts for a shot definition."""
-    name, start, end, objects = shot_def
-    segments = []
-    for obj in objects:
-        seg_duration = (end - start) / (n_segments_per_obj + 1)
-        for s in range(n_segments_per_obj):
-            seg_start = start + s * seg_duration
-            seg_end = seg_start + seg_duration * 0.8
-            segments.append({
-                "obj": obj,
-                "start": seg_start,
-                "end": seg_end,
-                "duration": seg_end - seg_start,
-                "is_stepped": s % 3 == 2,
-                "curves": [f"{obj}_tx", f"{obj}_ty"],
-                "attr": None,
-            })
-    return segments
+class FakeScene:
+    """Key table backing the mocked ``cmds`` and the ``SegmentKeys`` stand-in.
 
+    Every object gets ``<obj>_tx`` / ``<obj>_ty`` curves keyed every 10
+    frames across the whole timeline; :meth:`collect` reports the objects it
+    was asked to scan so tests can see what a rebuild re-collected.
+    """
 
-from test_sequencer_controller import FakeSlotsInstance  # noqa: E402
+    def __init__(self, objects, last_frame):
+        self.curves = {}
+        for obj in objects:
+            for attr in ("tx", "ty"):
+                times = [float(t) for t in range(1, int(last_frame) + 10, 10)]
+                self.curves[f"{obj}_{attr}"] = (obj, times)
+        self.collected = []
+        self.queries = 0
+
+    def curves_of(self, obj):
+        return [c for c, (o, _) in self.curves.items() if o == obj]
+
+    def collect(self, nodes, time_range=None, **_kwargs):
+        self.collected.extend(nodes)
+        start, end = time_range
+        segments = []
+        for obj in nodes:
+            for crv in self.curves_of(obj):
+                keys = [t for t in self.curves[crv][1] if start <= t <= end]
+                if len(keys) < 2:
+                    continue
+                segments.append(
+                    {
+                        "obj": obj,
+                        "curves": [crv],
+                        "keyframes": keys,
+                        "start": keys[0],
+                        "end": keys[-1],
+                        "duration": keys[-1] - keys[0],
+                        "segment_range": (keys[0], keys[-1]),
+                    }
+                )
+        return segments
 
+    def ls(self, names, **_kwargs):
+        return list(names) if isinstance(names, (list, tuple)) else [names]
 
-# ---------------------------------------------------------------------------
-# Performance tests
-# ---------------------------------------------------------------------------
+    def keyframe(self, target=None, **kwargs):
+        self.queries += 1
+        if target in self.curves:
+            times = self.curves[target][1]
+            if kwargs.get("valueChange"):
+                return [t * 0.5 for t in times]
+            return list(times)
+        return []
 
+    def key_tangent(self, target=None, **kwargs):
+        self.queries += 1
+        times = self.curves.get(target, (None, []))[1]
+        if kwargs.get("outTangentType"):
+            return ["spline"] * len(times)
+        return [0.0] * len(times)
 
-_RUNNING_UNDER_MAYAPY = _REAL_MAYA_PRELOADED or not _CONFTEST_LOADED
+    def list_connections(self, node=None, **kwargs):
+        if node in self.curves and kwargs.get("d"):
+            return [f"|root|{self.curves[node][0]}"]
+        return []
 
 
-def setUpModule():
-    """Skip the entire mock-only suite when the real Maya runtime is loaded.
+class FakeSlotsInstance:
+    """Minimal stand-in for the slots object the controller is built from."""
 
-    ``unittest.skipIf`` decorators on a class do not propagate to subclasses,
-    and even on a single class are easy to bypass — this guards every test
-    in the module by raising ``SkipTest`` from ``setUpModule``.
-    """
-    if _RUNNING_UNDER_MAYAPY:
-        raise unittest.SkipTest(
-            "Mock-based test suite — runs under pytest only, not run_tests.py/mayapy"
-        )
+    def __init__(self, widget):
+        self.sb = MagicMock()
+        self.ui = MagicMock()
+        self.ui.sequencer_widget = widget
+        self.ui.cmb_shot = QtWidgets.QComboBox()
 
 
-@unittest.skipIf(
-    _RUNNING_UNDER_MAYAPY,
-    "Mock-based test suite — runs under pytest only, not run_tests.py/mayapy",
+# ---------------------------------------------------------------------------
+# Performance tests
+# ---------------------------------------------------------------------------
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
 )
 class TestSequencerPerf(unittest.TestCase):
     """Performance regression tests at C130H scene scale.
@@ -153,318 +170,294 @@ class TestSequencerPerf(unittest.TestCase):
     """
 
     # Generous budgets (seconds) — real performance should be much faster
-    SYNC_BUDGET = 2.0       # Full _sync_to_widget
-    DECOR_BUDGET = 0.5      # _rebuild_decoration only
-    CONTENT_BUDGET = 1.5    # _rebuild_content only
-    SUBROWS_BUDGET = 0.3    # sub_row_provider for one track
+    SYNC_BUDGET = 2.0  # Full _sync_to_widget
 
     @classmethod
     def setUpClass(cls):
         cls.shot_defs, cls.all_objects = _generate_c130h_shots()
-        cls.segments_by_shot_id = {}
-
-    def _make_controller(self, shot_defs=None, initial_idx=0):
-        """Build a fully-wired controller from shot definitions."""
-        if shot_defs is None:
-            shot_defs = self.shot_defs
-
-        _mock_cmds.reset_mock()
-        _mock_cmds.objExists.return_value = True
-        _mock_cmds.playbackOptions.return_value = 0.0
-        _mock_cmds.currentTime.return_value = 1.0
-        _mock_cmds.scriptJob.return_value = 999
-        _mock_cmds.scriptJob.side_effect = lambda **kw: 999 if "event" in kw else True
-        _mock_cmds.UndoChunk.return_value = _undo_chunk
-        _mock_cmds.currentTime.return_value = 1.0
-        _mock_cmds.playbackOptions.return_value = 0.0
-        _mock_cmds.objExists.return_value = True
-        _mock_cmds.ls.return_value = []
-        _mock_cmds.listConnections.return_value = []
-        _mock_cmds.listRelatives.return_value = []
-        _mock_cmds.keyframe.return_value = []
-        _mock_cmds.keyTangent.return_value = []
-
-        store = ShotStore()
-        for name, start, end, objs in shot_defs:
-            store.define_shot(name=name, start=start, end=end, objects=objs)
-        ShotStore._active = None
+        cls.widget = MagicMock()
+        with patch.object(
+            ShotSequencerController, "_bind_store_listener", lambda self: None
+        ):
+            cls.ctrl = ShotSequencerController(FakeSlotsInstance(cls.widget))
+        cls.ctrl._try_load_maya_icons = staticmethod(lambda: None)
 
-        sequencer = ShotSequencer(store=store)
-        widget = SequencerWidget()
-        slots = FakeSlotsInstance(widget)
+    @classmethod
+    def tearDownClass(cls):
+        cls.ctrl.remove_callbacks()
+        ShotStore._active = None
 
-        with patch.object(ShotSequencerController, "_register_maya_undo_callbacks"):
-            with patch.object(ShotSequencerController, "_register_time_change_job"):
-                with patch.object(ShotSequencerController, "_bind_store_listener"):
-                    ctrl = ShotSequencerController(slots)
+    def setUp(self):
+        last_frame = self.shot_defs[-1][2]
+        self.scene = FakeScene(self.all_objects, last_frame)
+        patches = [
+            patch.object(
+                SegmentKeys,
+                "collect_segments",
+                side_effect=self.scene.collect,
+            ),
+            patch.object(mock_cmds, "ls", side_effect=self.scene.ls),
+            patch.object(mock_cmds, "keyframe", side_effect=self.scene.keyframe),
+            patch.object(
+                mock_cmds, "keyTangent", side_effect=self.scene.key_tangent
+            ),
+            patch.object(mock_cmds, "getAttr", return_value=False),
+            patch.object(
+                mock_cmds,
+                "listConnections",
+                side_effect=self.scene.list_connections,
+            ),
+            patch.object(
+                ShotSequencerController,
+                "_auto_add_keyed_objects",
+                lambda self, shot_id: False,
+            ),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _make_controller(self, initial_idx=0):
+        """Point the shared controller at a fresh C130H shot list."""
+        sequencer = ShotSequencer(store=ShotStore())
+        for name, start, end, objs in self.shot_defs:
+            sequencer.define_shot(name=name, start=start, end=end, objects=objs)
+
+        ctrl = self.ctrl
+        self.widget.reset_mock()
         ctrl.sequencer = sequencer
+        ctrl._segment_cache.clear()
+        ctrl._sub_row_cache.clear()
+        ctrl._curve_cache.clear()
+        ctrl._last_visible_key = None
+        ctrl._reconcile_needed = False
+        ctrl._shot_display_mode = "current"
         ctrl._sync_combobox()
-
-        cmb = slots.ui.cmb_shot
+        cmb = ctrl.ui.cmb_shot
         if initial_idx < cmb.count():
             cmb.setCurrentIndex(initial_idx)
+        return ctrl, self.widget
 
-        # Pre-compute segments for all shots
-        seg_cache = {}
-        for name, start, end, objs in shot_defs:
-            shot_obj = next(
-                (s for s in sequencer.sorted_shots() if s.name == name), None
-            )
-            if shot_obj:
-                seg_cache[shot_obj.shot_id] = _generate_segments_for_shot(
-                    (name, start, end, objs)
-                )
-
-        sequencer.collect_object_segments = lambda sid, **kw: list(
-            seg_cache.get(sid, [])
-        )
-        ctrl._try_load_maya_icons = staticmethod(lambda: None)
-
-        return ctrl, widget, sequencer, seg_cache
-
-    def test_full_sync_all_mode(self):
-        """Full _sync_to_widget in 'all' mode must complete within budget.
-
-        'All' mode renders every shot — worst-case for track/clip count.
-        C130H: 74 shots, ~5 objects each, ~10 segments/shot = ~740 clips.
-        """
-        ctrl, widget, seq, _ = self._make_controller()
-        ctrl._shot_display_mode = "all"
-
+    def _timed_sync(self, ctrl):
         t0 = time.perf_counter()
         ctrl._sync_to_widget()
-        dt = time.perf_counter() - t0
+        return time.perf_counter() - t0
 
+    def test_full_sync_all_mode(self):
+        """'All' mode renders every shot — worst case for track/clip count."""
+        ctrl, widget = self._make_controller()
+        ctrl._shot_display_mode = "all"
+        dt = self._timed_sync(ctrl)
         self.assertLess(
-            dt, self.SYNC_BUDGET,
+            dt,
+            self.SYNC_BUDGET,
             f"Full sync (all mode) took {dt:.3f}s, budget={self.SYNC_BUDGET}s",
         )
-        # Verify clips were actually created
-        self.assertGreater(len(widget.clips()), 0, "Must produce clips")
-        widget.close()
-        widget.deleteLater()
-
-    def test_full_sync_current_mode(self):
-        """Full _sync_to_widget in 'current' mode (single shot visible)."""
-        ctrl, widget, seq, _ = self._make_controller()
-        ctrl._shot_display_mode = "current"
-
-        t0 = time.perf_counter()
-        ctrl._sync_to_widget()
-        dt = time.perf_counter() - t0
-
-        self.assertLess(
-            dt, self.SYNC_BUDGET,
-            f"Full sync (current mode) took {dt:.3f}s, budget={self.SYNC_BUDGET}s",
-        )
-        widget.close()
-        widget.deleteLater()
+        self.assertGreater(widget.add_clip.call_count, 0, "Must produce clips")
+        self.assertLessEqual(widget.add_track.call_count, len(self.all_objects))
 
     def test_full_sync_adjacent_mode(self):
-        """Full _sync_to_widget in 'adjacent' mode (3 shots visible)."""
-        ctrl, widget, seq, _ = self._make_controller(initial_idx=37)
+        ctrl, widget = self._make_controller(initial_idx=37)
         ctrl._shot_display_mode = "adjacent"
-
-        t0 = time.perf_counter()
-        ctrl._sync_to_widget()
-        dt = time.perf_counter() - t0
-
+        dt = self._timed_sync(ctrl)
         self.assertLess(
-            dt, self.SYNC_BUDGET,
+            dt,
+            self.SYNC_BUDGET,
             f"Full sync (adjacent mode) took {dt:.3f}s, budget={self.SYNC_BUDGET}s",
         )
-        widget.close()
-        widget.deleteLater()
 
-    def test_decoration_only(self):
-        """_sync_decoration (overlays only) should be faster than full sync."""
-        ctrl, widget, seq, _ = self._make_controller()
+    def test_unchanged_rebuild_collects_nothing(self):
+        """A rebuild with no curve edits is served entirely from the cache."""
+        ctrl, widget = self._make_controller()
         ctrl._shot_display_mode = "all"
-        ctrl._sync_to_widget()  # Warm up
+        ctrl._sync_to_widget()
+        first = len(self.scene.collected)
+        self.assertGreater(first, 0)
+
+        clips = widget.add_clip.call_count
+
+        self.scene.collected.clear()
+        widget.reset_mock()
+        ctrl._on_keyframe_debounce_fire()  # drops every shot-level entry
+        self.assertEqual(self.scene.collected, [])
+        self.assertEqual(widget.add_clip.call_count, clips)
 
+    def test_single_curve_edit_recollects_only_its_object(self):
+        ctrl, widget = self._make_controller()
+        ctrl._shot_display_mode = "all"
+        ctrl._sync_to_widget()
+        self.scene.collected.clear()
+
+        ctrl._curve_cache.invalidate_curves(["xform_042_tx"])
         t0 = time.perf_counter()
-        ctrl._sync_decoration()
+        ctrl._on_keyframe_debounce_fire()
         dt = time.perf_counter() - t0
 
-        self.assertLess(
-            dt, self.DECOR_BUDGET,
-            f"Decoration rebuild took {dt:.3f}s, budget={self.DECOR_BUDGET}s",
-        )
-        widget.close()
-        widget.deleteLater()
+        # Once per shot the object appears in (ranges differ), nothing else.
+        self.assertEqual(set(self.scene.collected), {"xform_042"})
+        shots_with_obj = sum(1 for d in self.shot_defs if "xform_042" in d[3])
+        self.assertEqual(len(self.scene.collected), shots_with_obj)
+        self.assertLess(dt, self.SYNC_BUDGET)
 
-    def test_gap_overlay_count_at_scale(self):
-        """All 73 gaps between 74 shots should generate overlays."""
-        ctrl, widget, seq, _ = self._make_controller()
-        ctrl._shot_display_mode = "current"
+    def test_new_curve_invalidates_its_destination(self):
+        """A curve the cache never saw is traced to the node it drives."""
+        ctrl, widget = self._make_controller()
         ctrl._sync_to_widget()
+        obj = self.shot_defs[0][3][0]
+        self.scene.curves[f"{obj}_rz"] = (obj, [1.0, 30.0])
+        self.scene.collected.clear()
 
-        # With 74 shots and gaps between each consecutive pair, we expect 73
-        n_overlays = len(widget._gap_overlays)
-        self.assertEqual(
-            n_overlays, len(self.shot_defs) - 1,
-            f"Expected {len(self.shot_defs)-1} gap overlays, got {n_overlays}",
-        )
-        widget.close()
-        widget.deleteLater()
+        ctrl._curve_cache.invalidate_curves([f"{obj}_rz"])
+        ctrl._on_keyframe_debounce_fire()
+        self.assertEqual(self.scene.collected, [obj])
 
     def test_repeated_sync_stability(self):
-        """Multiple rapid syncs should not degrade over time.
-
-        Verifies no resource leak: 10 full rebuilds should each stay
-        within the time budget.
-        """
-        ctrl, widget, seq, _ = self._make_controller()
+        """10 full rebuilds each stay within budget and don't degrade."""
+        ctrl, widget = self._make_controller()
         ctrl._shot_display_mode = "all"
-
         times = []
         for _ in range(10):
-            t0 = time.perf_counter()
-            ctrl._sync_to_widget()
-            times.append(time.perf_counter() - t0)
+            ctrl._segment_cache.clear()
+            times.append(self._timed_sync(ctrl))
 
         avg = sum(times) / len(times)
         worst = max(times)
         self.assertLess(
-            worst, self.SYNC_BUDGET * 1.5,
+            worst,
+            self.SYNC_BUDGET * 1.5,
             f"Worst of 10 syncs: {worst:.3f}s (avg={avg:.3f}s)",
         )
-        # Check no significant degradation (last 3 vs first 3)
         early = sum(times[:3]) / 3
         late = sum(times[-3:]) / 3
-        ratio = late / max(early, 0.001)
         self.assertLess(
-            ratio, 2.0,
+            late / max(early, 0.001),
+            2.0,
             f"Performance degraded: early avg={early:.3f}s, late avg={late:.3f}s",
         )
-        widget.close()
-        widget.deleteLater()
-
-    def test_track_count_at_scale(self):
-        """Correct number of tracks created for C130H-size scene."""
-        ctrl, widget, seq, seg_cache = self._make_controller()
-        ctrl._shot_display_mode = "all"
-        ctrl._sync_to_widget()
 
-        # Count unique objects across all visible segments
-        all_seg_objs = set()
-        for segs in seg_cache.values():
-            all_seg_objs.update(s["obj"] for s in segs)
-        # Also objects from shot definitions
-        for s in seq.sorted_shots():
-            all_seg_objs.update(s.objects)
-
-        n_tracks = len(list(widget.tracks()))
-        self.assertGreater(
-            n_tracks, 0,
-            "Must create tracks for animated objects",
-        )
-        self.assertLessEqual(
-            n_tracks, len(all_seg_objs) + 10,
-            "Track count shouldn't wildly exceed unique objects",
-        )
-        widget.close()
-        widget.deleteLater()
+    def test_shot_switching_speed(self):
+        """Clicking through shots rebuilds quickly."""
+        ctrl, widget = self._make_controller()
+        cmb = ctrl.ui.cmb_shot
+        times = []
+        for i in range(min(10, cmb.count())):
+            cmb.setCurrentIndex(i)
+            times.append(self._timed_sync(ctrl))
+        worst = max(times)
+        self.assertLess(worst, self.SYNC_BUDGET, f"Worst shot switch: {worst:.3f}s")
+
+    def test_curve_previews_read_each_curve_once(self):
+        """Sub-row previews reuse curve data until the curve is edited."""
+        cache = CurveSegmentCache()
+        curves = [f"xform_{i:03d}_tx" for i in range(50)]
+        for start, end in ((1.0, 100.0), (50.0, 150.0), (1.0, 500.0)):
+            for crv in curves:
+                preview = SegmentCollector.build_curve_preview(
+                    crv, start, end, cache=cache
+                )
+                self.assertTrue(preview["segments"])
+        reads = self.scene.queries
+        self.assertEqual(reads, len(curves) * 5)  # 2 keyframe + 3 keyTangent
+
+        cache.invalidate_curves(curves[:1])
+        self.scene.queries = 0
+        for crv in curves:
+            SegmentCollector.build_curve_preview(crv, 1.0, 100.0, cache=cache)
+        self.assertEqual(self.scene.queries, 5)
+
+    def test_cached_preview_matches_uncached(self):
+        cache = CurveSegmentCache()
+        for span in ((1.0, 100.0), (40.0, 45.0), (700.0, 800.0)):
+            self.assertEqual(
+                SegmentCollector.build_curve_preview("xform_001_ty", *span),
+                SegmentCollector.build_curve_preview(
+                    "xform_001_ty", *span, cache=cache
+                ),
+            )
 
-    def test_sub_row_provider_at_scale(self):
-        """Sub-row provider for attribute expansion should be fast.
 
-        Mocks the cmds calls and verifies the provider returns quickly
-        for a single track even with many curves.
-        """
-        ctrl, widget, seq, seg_cache = self._make_controller()
-        ctrl._shot_display_mode = "current"
-        ctrl._sync_to_widget()
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestSequencerCallbackPolicies(unittest.TestCase):
+    """The controller's bursty OpenMaya callbacks coalesce in ScriptJobManager.
 
-        # Find a track to expand
-        tracks = list(widget.tracks())
-        if not tracks:
-            self.skipTest("No tracks created")
-
-        track = tracks[0]
-        obj_name = track.name
-
-        # Mock attribute curves for this object
-        fake_attrs = {
-            f"{obj_name}.translateX": [f"{obj_name}_tx"],
-            f"{obj_name}.translateY": [f"{obj_name}_ty"],
-            f"{obj_name}.translateZ": [f"{obj_name}_tz"],
-            f"{obj_name}.rotateX": [f"{obj_name}_rx"],
-            f"{obj_name}.rotateY": [f"{obj_name}_ry"],
-            f"{obj_name}.rotateZ": [f"{obj_name}_rz"],
-            f"{obj_name}.scaleX": [f"{obj_name}_sx"],
-            f"{obj_name}.scaleY": [f"{obj_name}_sy"],
-            f"{obj_name}.scaleZ": [f"{obj_name}_sz"],
-        }
+    Added: 2026-10-18
+    """
 
-        def _list_conns(node=None, **kw):
-            if kw.get("type") == "animCurve" and kw.get("s"):
-                return list(fake_attrs.get(node, []))
-            if kw.get("plugs") and kw.get("d"):
-                for attr, curves in fake_attrs.items():
-                    if node in curves:
-                        return [attr]
-                return []
-            return []
-
-        _mock_cmds.listConnections.side_effect = _list_conns
-        _mock_cmds.objExists.return_value = True
-        _mock_cmds.keyframe.return_value = [1.0, 10.0, 20.0, 30.0]
-        _mock_cmds.keyTangent.return_value = ["spline", "spline", "step", "spline"]
+    def setUp(self):
+        with patch.object(
+            ShotSequencerController, "_bind_store_listener", lambda self: None
+        ):
+            self.ctrl = ShotSequencerController(FakeSlotsInstance(MagicMock()))
+        self.addCleanup(self.ctrl.remove_callbacks)
 
-        t0 = time.perf_counter()
-        sub_rows = ctrl._provide_sub_rows(track.track_id, track.name)
-        dt = time.perf_counter() - t0
+    def _policies(self):
+        from mayatk.core_utils.script_job_manager import ScriptJobManager
 
-        self.assertLess(
-            dt, self.SUBROWS_BUDGET,
-            f"Sub-row provider took {dt:.3f}s for {obj_name}, budget={self.SUBROWS_BUDGET}s",
-        )
-        widget.close()
-        widget.deleteLater()
+        status = ScriptJobManager.instance().status()
+        return {
+            cb["callback"].rsplit(".", 1)[-1]: cb["policy"]
+            for cb in status["om_callbacks"]
+            if cb["owner"] == repr(self.ctrl)
+        }
 
-    def test_shot_switching_speed(self):
-        """Switching between shots should rebuild quickly.
+    def test_keyframe_and_time_callbacks_are_coalesced(self):
+        self.assertIsNotNone(self.ctrl._keyframe_cb)
+        self.assertIsNotNone(self.ctrl._time_change_cb)
+        policies = self._policies()
+        self.assertEqual(policies["_on_keyframe_edited"], "idle")
+        self.assertEqual(policies["_on_time_changed"], "throttle")
 
-        Simulates user clicking through shots in the combo box.
-        """
-        ctrl, widget, seq, _ = self._make_controller()
-        ctrl._shot_display_mode = "current"
-        ctrl._sync_to_widget()
+    def test_remove_callbacks_drops_the_subscriptions(self):
+        self.ctrl.remove_callbacks()
+        self.assertEqual(self._policies(), {})
 
-        # Switch through 10 shots
-        cmb = ctrl.ui.cmb_shot
-        times = []
-        for i in range(0, min(10, cmb.count())):
-            cmb.setCurrentIndex(i)
-            t0 = time.perf_counter()
-            ctrl._sync_to_widget()
-            times.append(time.perf_counter() - t0)
 
-        avg = sum(times) / len(times)
-        worst = max(times)
-        self.assertLess(
-            worst, self.SYNC_BUDGET,
-            f"Worst shot switch: {worst:.3f}s (avg={avg:.3f}s)",
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestCurveSegmentCache(unittest.TestCase):
+    """Index bookkeeping of ``CurveSegmentCache`` without any scene."""
+
+    ARGS = (1.0, 50.0, None, 1e-3, True)
+
+    def _seg(self, obj, *curves):
+        return {"obj": obj, "curves": list(curves), "start": 1.0, "end": 9.0}
+
+    def test_curve_edit_drops_every_range_of_its_objects(self):
+        cache = CurveSegmentCache()
+        other = (60.0, 90.0, None, 1e-3, True)
+        cache.put_segments("a", self.ARGS, [self._seg("a", "a_tx")])
+        cache.put_segments("a", other, [self._seg("a", "a_tx")])
+        cache.put_segments("b", self.ARGS, [self._seg("b", "b_tx")])
+
+        self.assertEqual(cache.invalidate_curves(["a_tx"], resolve=False), {"a"})
+        self.assertIsNone(cache.get_segments("a", self.ARGS))
+        self.assertIsNone(cache.get_segments("a", other))
+        self.assertIsNotNone(cache.get_segments("b", self.ARGS))
+        self.assertEqual(cache.stats()["objects"], 1)
+
+    def test_entries_are_bounded(self):
+        cache = CurveSegmentCache(max_entries=3)
+        for i in range(5):
+            cache.put_segments(f"o{i}", self.ARGS, [self._seg(f"o{i}", f"c{i}")])
+        self.assertEqual(cache.stats()["entries"], 3)
+        self.assertIsNone(cache.get_segments("o0", self.ARGS))
+        # Evicted objects leave nothing behind in the reverse index.
+        self.assertEqual(cache.invalidate_curves(["c0"], resolve=False), set())
+        self.assertEqual(cache.curves_of("o4"), {"c4"})
+
+    def test_edit_callback_resolves_curve_names(self):
+        cache = CurveSegmentCache()
+        cache.put_segments("a", self.ARGS, [self._seg("a", "a_tx")])
+        fake_om2 = MagicMock()
+        fake_om2.MFnDependencyNode.side_effect = lambda obj: MagicMock(
+            name=obj, **{"name.return_value": obj}
         )
-        widget.close()
-        widget.deleteLater()
-
-
-# unittest.makeSuite does not invoke setUpModule; apply the skip post hoc
-# to every TestCase in this module so ad-hoc loaders honour it.
-if _RUNNING_UNDER_MAYAPY:
-    _skip = unittest.skipIf(
-        True,
-        "Mock-based test suite — runs under pytest only, not run_tests.py/mayapy",
-    )
-    for _name, _obj in list(globals().items()):
-        if (
-            isinstance(_obj, type)
-            and issubclass(_obj, unittest.TestCase)
-            and _obj is not unittest.TestCase
-        ):
-            globals()[_name] = _skip(_obj)
+        with patch.object(segment_cache, "om2", fake_om2):
+            cache._on_curves_edited(["a_tx"], None)
+        self.assertIsNone(cache.get_segments("a", self.ARGS))
 
 
 if __name__ == "__main__":
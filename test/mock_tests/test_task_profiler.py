@@ -0,0 +1,174 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the export pipeline's per-task profiler.
+
+OpenMaya is the conftest mock, so the command callback is driven by hand
+through ``TaskProfiler._on_command``; the task manager runs stub tasks, not
+Maya ones. The report written by a real export is covered by
+``TestSceneExporter`` in ``test/test_scene_exporter.py``.
+"""
+import os
+import sys
+import json
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.env_utils.scene_exporter import task_profiler
+from mayatk.env_utils.scene_exporter.task_profiler import TaskProfiler
+from mayatk.env_utils.scene_exporter.task_manager import TaskManager
+
+
+class _Clock:
+    """A perf_counter that advances only when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTaskProfiler(unittest.TestCase):
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = patch.object(task_profiler.time, "perf_counter", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.profiler = TaskProfiler(slow_threshold=2.0)
+
+    def test_entries_are_timed_counted_and_flagged(self):
+        with self.profiler.session():
+            with self.profiler.measure("set_linear_unit"):
+                self.clock.now += 0.5
+                for _ in range(3):
+                    self.profiler._on_command("polyCube")
+            with self.profiler.measure("check_uv_sets"):
+                self.clock.now += 3.0
+        fast, slow = self.profiler.entries
+        self.assertEqual((fast.kind, fast.wall_time, fast.slow), ("task", 0.5, False))
+        self.assertEqual(fast.commands, 3)
+        self.assertEqual((slow.kind, slow.wall_time, slow.slow), ("check", 3.0, True))
+        self.assertEqual(slow.commands, 0)
+        self.assertEqual(self.profiler.slow_entries, [slow])
+        self.assertEqual(self.profiler.total_time, 3.5)
+
+    def test_commands_are_none_without_a_callback(self):
+        self.profiler.count_commands = False
+        with self.profiler.session():
+            with self.profiler.measure("fbx_write", kind="export"):
+                self.profiler._on_command("file")
+        self.assertIsNone(self.profiler.entries[0].commands)
+        self.assertEqual(self.profiler.entries[0].kind, "export")
+
+    def test_failed_entries_are_recorded(self):
+        with self.profiler.session():
+            with self.assertRaises(RuntimeError):
+                with self.profiler.measure("convert_textures"):
+                    raise RuntimeError("boom")
+        self.assertFalse(self.profiler.entries[0].ok)
+
+    def test_nested_sessions_share_one_report(self):
+        self.profiler.start()
+        with self.profiler.measure("outer"):
+            pass
+        with self.profiler.session():  # what run_tasks opens inside an export
+            with self.profiler.measure("inner"):
+                pass
+        self.assertTrue(self.profiler.active)
+        self.profiler.stop()
+        self.assertFalse(self.profiler.active)
+        self.assertEqual([e.name for e in self.profiler.entries], ["outer", "inner"])
+        self.profiler.start()  # the next run starts clean
+        self.assertEqual(self.profiler.entries, [])
+        self.profiler.stop()
+
+    def test_callback_lives_only_while_a_session_is_open(self):
+        om2 = task_profiler.om2
+        om2.MCommandMessage.addCommandCallback.reset_mock()
+        om2.MMessage.removeCallback.reset_mock()
+        with self.profiler.session():
+            with self.profiler.session():
+                pass
+            om2.MMessage.removeCallback.assert_not_called()
+        om2.MCommandMessage.addCommandCallback.assert_called_once()
+        om2.MMessage.removeCallback.assert_called_once()
+
+    def test_zero_threshold_flags_nothing(self):
+        self.profiler.slow_threshold = 0
+        with self.profiler.session():
+            with self.profiler.measure("smart_bake"):
+                self.clock.now += 100.0
+        self.assertEqual(self.profiler.slow_entries, [])
+
+    def test_json_report(self):
+        with self.profiler.session():
+            with self.profiler.measure("check_hierarchy"):
+                self.clock.now += 2.5
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scene.profile.json")
+            self.profiler.write_json(path, export_path="scene.fbx", succeeded=True)
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+        self.assertEqual(report["version"], TaskProfiler.REPORT_VERSION)
+        self.assertEqual(report["export_path"], "scene.fbx")
+        self.assertTrue(report["succeeded"])
+        self.assertEqual(report["slow"], ["check_hierarchy"])
+        self.assertEqual(report["entries"][0]["name"], "check_hierarchy")
+        self.assertEqual(report["entries"][0]["wall_time"], 2.5)
+
+    def test_summary_lists_the_slowest_first(self):
+        with self.profiler.session():
+            for name, seconds in (("a", 0.1), ("b", 4.0), ("c", 1.0)):
+                with self.profiler.measure(name):
+                    self.clock.now += seconds
+        lines = self.profiler.summary_lines(top=2)
+        self.assertIn("3 entries", lines[0])
+        self.assertTrue(lines[1].startswith("b:") and lines[1].endswith("[SLOW]"))
+        self.assertTrue(lines[2].startswith("c:"))
+        self.assertEqual(len(lines), 3)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTaskManagerProfiling(unittest.TestCase):
+    def setUp(self):
+        self.manager = TaskManager(TaskProfiler().logger)
+        self.manager.objects = []
+        self.calls = []
+
+        def stub(name):
+            def method(value=None):
+                self.calls.append(name)
+                return True
+
+            method.__name__ = name
+            return method
+
+        for name in ("set_linear_unit", "check_uv_sets"):
+            self.manager._method_cache[name] = stub(name)
+
+    def test_run_tasks_profiles_every_dispatched_entry(self):
+        self.manager.run_tasks({"set_linear_unit": "cm", "check_uv_sets": True})
+        self.assertEqual(self.calls, ["set_linear_unit", "check_uv_sets"])
+        self.assertEqual(
+            [(e.name, e.kind) for e in self.manager.profiler.entries],
+            [("set_linear_unit", "task"), ("check_uv_sets", "check")],
+        )
+        self.assertFalse(self.manager.profiler.active)
+
+    def test_profiling_can_be_disabled(self):
+        self.manager.profiler = None
+        self.assertTrue(self.manager.run_tasks({"set_linear_unit": "cm"}))
+        self.assertEqual(self.calls, ["set_linear_unit"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for the Resolve Missing stem index.
+
+Runs on a temporary folder tree: the incremental refresh (which folders are
+re-listed), and that the trigram-narrowed lookups return what
+``FuzzyMatcher`` returns scoring every stem. Nothing here touches Maya; the
+slot wiring is covered by ``TestStrategiesForModes`` in
+``test/test_texture_path_editor.py``.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from pythontk.str_utils.fuzzy_matcher import FuzzyMatcher
+from mayatk.mat_utils.texture_index import TextureStemIndex, TrigramIndex
+
+_STEMS = [
+    "crate_diffuse",
+    "crate_normal",
+    "crate_ao",
+    "barrel_old_diffuse",
+    "barrel_old_normal",
+    "wall_brick_01_basecolor",
+    "wall_brick_02_basecolor",
+    "ab",
+    "metal_plate_roughness",
+    "door_handle_metallic",
+]
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTextureStemIndex(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        for i, stem in enumerate(_STEMS):
+            self.touch(os.path.join(f"set_{i % 3}", stem + ".png"))
+        self.index = TextureStemIndex(self.root)
+
+    def touch(self, relative):
+        path = os.path.join(self.root, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+        return path
+
+    def bump(self, folder):
+        """Force a new mtime (coarse filesystem clocks may not tick)."""
+        path = os.path.join(self.root, folder)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def test_refresh_relists_only_changed_folders(self):
+        stats = self.index.refresh()
+        self.assertEqual((stats["files"], stats["folders"]), (10, 4))
+        self.assertEqual(stats["rescanned"], 4)
+        self.assertEqual(self.index.refresh()["rescanned"], 0)
+
+        added = self.touch(os.path.join("set_1", "crate_spec.png"))
+        os.remove(os.path.join(self.root, "set_0", "crate_diffuse.png"))
+        self.bump("set_1")
+        self.bump("set_0")
+        self.assertEqual(self.index.refresh()["rescanned"], 2)
+        self.assertEqual(self.index.paths("crate_spec"), [added])
+        self.assertEqual(self.index.paths("crate_diffuse"), [])
+        self.assertNotIn("crate_diffuse", self.index.stems)
+
+        shutil.rmtree(os.path.join(self.root, "set_2"))
+        self.bump("")
+        self.assertEqual(self.index.refresh()["folders"], 3)
+        self.assertNotIn("crate_ao", self.index.stems)
+
+    def test_duplicate_stems_keep_every_path(self):
+        self.touch(os.path.join("set_2", "crate_normal.tga"))
+        self.index.refresh()
+        self.assertEqual(len(self.index.paths("crate_normal")), 2)
+        self.assertEqual(self.index.stems.count("crate_normal"), 1)
+
+    def test_narrowed_lookups_match_full_scoring(self):
+        self.index.refresh()
+        stems = self.index.stems
+        targets = ["crate", "crate_normal", "barrel_old", "brick", "ab", "x", "zzz"]
+        for strategies in (["exact"], ["exact", "substring"]):
+            for target in targets:
+                expected = FuzzyMatcher.find_with_fallbacks(
+                    target, stems, strategies, score_threshold=0.3
+                )
+                result = self.index.find_with_fallbacks(
+                    target, strategies, score_threshold=0.3
+                )
+                self.assertEqual(result[1:], expected[1:], (target, strategies))
+                if expected[2] == "unique":
+                    self.assertEqual(result[0], expected[0])
+        # A ratio hit with no shared substring still surfaces.
+        match, _score, status, tier = self.index.find_with_fallbacks(
+            "crate_normol", ["exact", "substring", "ratio"], score_threshold=0.6
+        )
+        self.assertEqual((match, status, tier), ("crate_normal", "unique", "ratio"))
+        self.assertEqual(len(self.index.stats["lookups"]), len(targets) * 2 + 1)
+        self.assertIn("lookups", self.index.report())
+
+    def test_same_map_candidates_follow_refresh(self):
+        self.index.refresh()
+        stems, bases = self.index.same_map_candidates("Normal", "crate_old")
+        # Every Normal whose base shares a trigram ("barrel_old" shares "old").
+        self.assertEqual(stems, ["crate_normal", "barrel_old_normal"])
+        self.assertEqual(bases, ["crate", "barrel_old"])
+        self.assertEqual(self.index.same_map_candidates("Normal", "door")[0], [])
+        self.touch(os.path.join("set_1", "door_normal.png"))
+        self.bump("set_1")
+        self.index.refresh()
+        self.assertEqual(
+            self.index.same_map_candidates("Normal", "door")[0], ["door_normal"]
+        )
+
+    def test_registry_shares_one_index_per_root(self):
+        self.assertIs(
+            TextureStemIndex.for_root(self.root),
+            TextureStemIndex.for_root(os.path.join(self.root, ".")),
+        )
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestTrigramIndex(unittest.TestCase):
+    def test_containing_is_a_superset_of_substring_matches(self):
+        keys = _STEMS + ["a", "rat", "crater"]
+        index = TrigramIndex(keys)
+        for target in ("crate", "rate", "ab", "brick_01", "wall_brick_01_basecolor"):
+            found = set(index.containing(target))
+            for key in keys:
+                if key in target or target in key:
+                    self.assertIn(key, found, (target, key))
+
+    def test_discard_and_similar_length_window(self):
+        index = TrigramIndex(["abcdef", "abcdefghijklmnop", "xyz"])
+        index.discard("xyz")
+        self.assertEqual(index.keys(), ["abcdef", "abcdefghijklmnop"])
+        self.assertEqual(index.similar("abcdeg", 0.6, 10), ["abcdef"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for WorldMatrixScan's vectorized skew and its shear cache.
+
+The skew is checked against ``ptk.MathUtils.max_axis_skew`` on random and
+degenerate matrices. ``maya.api.OpenMaya`` is replaced by a fake with DAG
+paths that hand back fixed matrices, so the cache rules run without Maya.
+Real hierarchies are covered by ``TestTransformDiagnosticsInheritedShear``
+in ``test/test_diagnostics.py``.
+"""
+
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+import pythontk as ptk
+from mayatk.core_utils.diagnostics import transform_scan
+from mayatk.core_utils.diagnostics.transform_scan import WorldMatrixScan
+
+_IDENTITY = tuple(np.eye(4).ravel())
+
+
+class _Handle:
+    def __init__(self, node):
+        self.node = node
+
+    def hashCode(self):
+        return id(self.node)
+
+    def __eq__(self, other):
+        return self.node is other.node
+
+    def isAlive(self):
+        return self.node.alive
+
+
+def _fake_om(nodes, reads):
+    """A stand-in ``om`` resolving names through *nodes* (name -> SimpleNamespace)."""
+
+    class SelectionList:
+        def __init__(self):
+            self.items = []
+
+        def clear(self):
+            self.items = []
+
+        def add(self, name):
+            if name not in nodes:
+                raise RuntimeError(name)
+            self.items.append(nodes[name])
+
+        def getDagPath(self, index):
+            node = self.items[index]
+            return SimpleNamespace(
+                node=lambda: node,
+                inclusiveMatrix=lambda: node.world,
+                exclusiveMatrix=lambda: node.parent,
+            )
+
+    def transform(path):
+        reads.append(path.node())
+        return SimpleNamespace(shear=lambda space: list(path.node().shear))
+
+    return SimpleNamespace(
+        MSelectionList=SelectionList,
+        MObjectHandle=_Handle,
+        MFnTransform=transform,
+        MFn=SimpleNamespace(kTransform=1),
+        MSpace=SimpleNamespace(kTransform=1),
+    )
+
+
+def _node(world=_IDENTITY, parent=_IDENTITY, shear=(0.0, 0.0, 0.0), transform=True):
+    return SimpleNamespace(
+        world=world,
+        parent=parent,
+        shear=shear,
+        alive=True,
+        hasFn=lambda fn: transform,
+    )
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestAxisSkew(unittest.TestCase):
+    def test_matches_max_axis_skew(self):
+        rng = np.random.default_rng(7)
+        world = rng.normal(size=(200, 16))
+        world[0] = np.eye(4).ravel()
+        world[1, 4:7] = 0.0  # degenerate Y axis
+        skew = WorldMatrixScan.axis_skew(world)
+        for row, value in zip(world, skew):
+            expected = ptk.MathUtils.max_axis_skew((row[0:3], row[4:7], row[8:11]))
+            self.assertAlmostEqual(value, expected, places=12)
+        self.assertEqual((skew[0], skew[1]), (0.0, 0.0))
+
+    def test_empty_input(self):
+        self.assertEqual(WorldMatrixScan.axis_skew(np.zeros((0, 16))).shape, (0,))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestWorldMatrixScanCache(unittest.TestCase):
+    def setUp(self):
+        sheared = np.eye(4)
+        sheared[1, 0] = 0.5
+        self.nodes = {
+            "a": _node(),
+            "b": _node(world=tuple(sheared.ravel())),
+            "c": _node(shear=(0.25, 0.0, 0.0)),
+            "shape": _node(transform=False),
+        }
+        self.reads = []
+        patcher = patch.object(
+            transform_scan, "om", _fake_om(self.nodes, self.reads), create=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scan = WorldMatrixScan()
+
+    def test_measure_keeps_order_and_flags(self):
+        result = self.scan.measure(["c", "missing", "shape", "a", "b", "a"])
+        self.assertEqual(result.nodes, ["c", "a", "b", "a"])
+        self.assertEqual(list(result.flagged(1e-6)), [0, 2])
+        self.assertAlmostEqual(result.shear[0][0], 0.25)
+        self.assertEqual(result.world.shape, (4, 16))
+
+    def test_shear_is_reread_only_when_a_row_changes(self):
+        self.scan.measure(["a", "b", "c"])
+        self.assertEqual(self.scan.stats["shear_reads"], 3)
+        self.reads.clear()
+        self.scan.measure(["a", "b", "c"])
+        self.assertEqual(self.reads, [])
+
+        moved = np.eye(4)
+        moved[0, 0] = 2.0
+        self.nodes["a"].world = tuple(moved.ravel())  # own transform
+        self.nodes["c"].parent = tuple(moved.ravel())  # an ancestor
+        self.nodes["c"].shear = (0.0, 0.0, 0.0)
+        result = self.scan.measure(["a", "b", "c"])
+        self.assertEqual(self.reads, [self.nodes["a"], self.nodes["c"]])
+        self.assertEqual(list(result.flagged(1e-6)), [1])
+
+    def test_prune_drops_deleted_nodes(self):
+        self.scan.measure(["a", "b"])
+        self.nodes["a"].alive = False
+        self.assertEqual(self.scan.prune(), 1)
+        self.scan.clear()
+        self.scan.measure(["b"])
+        self.assertEqual(self.scan.stats["shear_reads"], 1)
+
+    def test_measure_sweeps_deleted_nodes_as_the_cache_grows(self):
+        """Added: 2026-10-18"""
+        self.scan.measure(["a", "b"])
+        self.nodes["a"].alive = False
+        self.scan._prune_at = 2  # as if PRUNE_MIN were 2
+        self.scan.measure(["c"])
+        self.assertEqual(self.scan.stats["pruned"], 1)
+        self.assertEqual(len(self.scan._cache), 2)
+        self.scan.measure(["b", "c"])
+        self.assertEqual(self.scan.stats["pruned"], 0, "Below PRUNE_MIN again")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for UvSetAnalyzer's array metrics and per-shape reads.
+
+Area, bounds and the overlap search are pure NumPy. The overlap search is
+checked against an all-pairs reference, and ``MFnMesh`` is replaced by a
+small fake so the per-set read runs without Maya. Real meshes and
+``polyUVOverlap`` parity are covered by ``TestUvAnalysis`` in
+``test/test_uv_diagnostics.py``.
+"""
+
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.core_utils.diagnostics.uv_metrics import UvSetAnalyzer
+
+
+def _grid(n):
+    """An n x n grid of quads covering the unit square."""
+    ticks = np.linspace(0, 1, n + 1)
+    u, v = np.meshgrid(ticks, ticks)
+    ids = []
+    for j in range(n):
+        for i in range(n):
+            a = j * (n + 1) + i
+            ids += [a, a + 1, a + n + 2, a + n + 1]
+    return u.ravel(), v.ravel(), np.full(n * n, 4), np.array(ids)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestUvSetMetrics(unittest.TestCase):
+    def test_grid_metrics(self):
+        metrics = UvSetAnalyzer.set_metrics(*_grid(4))
+        self.assertEqual(set(metrics), set(UvSetAnalyzer.empty_metrics()))
+        self.assertEqual(metrics["uv_count"], 25)
+        self.assertAlmostEqual(metrics["area"], 1.0)
+        self.assertAlmostEqual(metrics["fill_rate"], 1.0)
+        self.assertEqual(metrics["bounds"], (0.0, 0.0, 1.0, 1.0))
+        self.assertEqual(metrics["overlap_count"], 0)  # shared edges only
+        self.assertTrue(metrics["is_valid"])
+
+    def test_area_outside_and_unmapped_faces(self):
+        u, v, counts, ids = _grid(2)
+        counts[1] = 0  # second face unmapped: its ids drop out
+        ids = np.delete(ids, range(4, 8))
+        metrics = UvSetAnalyzer.set_metrics(u * 2, v, counts, ids)
+        self.assertAlmostEqual(metrics["area"], 1.5)
+        self.assertAlmostEqual(metrics["area_outside"], 1.0)
+
+    def test_overlapping_faces_are_counted_once(self):
+        u, v, counts, ids = _grid(4)
+        # One more quad straddling faces 0 and 1, and an exact copy of face 5.
+        extra_u = [0.1, 0.3, 0.3, 0.1]
+        extra_v = [0.1, 0.1, 0.2, 0.2]
+        k = len(u)
+        u = np.concatenate([u, extra_u])
+        v = np.concatenate([v, extra_v])
+        counts = np.append(counts, [4, 4])
+        ids = np.concatenate([ids, [k, k + 1, k + 2, k + 3], ids[20:24]])
+        faces = UvSetAnalyzer.overlapping_faces(u, v, counts, ids)
+        self.assertEqual(faces.tolist(), [0, 1, 5, 16, 17])
+
+    def test_matches_all_pairs_reference(self):
+        rng = np.random.default_rng(5)
+        count = 300
+        centers = np.repeat(rng.random((count, 2)), 3, axis=0)
+        sizes = np.repeat(rng.random((count, 1)) * 0.05 + 0.01, 3, axis=0)
+        points = rng.random((count * 3, 2)) * sizes + centers
+        points[:3] = [(-1, -1), (3, -1), (-1, 3)]  # one oversized triangle
+        found = UvSetAnalyzer.overlapping_faces(
+            points[:, 0], points[:, 1], np.full(count, 3), np.arange(count * 3)
+        )
+        tris = points.reshape(count, 3, 2)
+        i, j = np.triu_indices(count, 1)
+        hit = UvSetAnalyzer.triangles_overlap(tris[i], tris[j])
+        expected = np.unique(np.concatenate([i[hit], j[hit]]))
+        self.assertEqual(found.tolist(), expected.tolist())
+
+    def test_stacked_islands(self):
+        counts = np.full(500, 4)
+        u = np.tile([0.0, 1.0, 1.0, 0.0], 500)
+        v = np.tile([0.0, 0.0, 1.0, 1.0], 500)
+        faces = UvSetAnalyzer.overlapping_faces(u, v, counts, np.arange(2000))
+        self.assertEqual(len(faces), 500)
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestUvSetAnalyzerReads(unittest.TestCase):
+    def setUp(self):
+        u, v, counts, ids = _grid(2)
+        sets = {"map1": (u, v, counts, ids), "empty": ([], [], [0] * 4, [])}
+
+        def read(name, index):
+            if name not in sets:
+                raise RuntimeError(f"no set {name}")
+            return sets[name][index]
+
+        self.fn = SimpleNamespace(
+            getUVSetNames=lambda: ["map1", "empty", "ghost"],
+            getUVs=lambda name: (read(name, 0), read(name, 1)),
+            getAssignedUVs=lambda name: (read(name, 2), read(name, 3)),
+            numUVs=lambda name: len(read(name, 0)),
+            getVertices=lambda: (counts, ids),
+            getTriangles=lambda: (
+                [2] * 4,
+                [ids[f * 4 + k] for f in range(4) for k in (0, 1, 2, 0, 2, 3)],
+            ),
+        )
+        patcher = patch.object(UvSetAnalyzer, "_mesh_fn", return_value=self.fn)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_every_set_in_one_pass(self):
+        metrics = UvSetAnalyzer.analyze_shape("|cube|cubeShape")
+        self.assertEqual(list(metrics), ["map1", "empty", "ghost"])
+        self.assertEqual(metrics["map1"]["uv_count"], 9)
+        self.assertEqual(metrics["empty"], UvSetAnalyzer.empty_metrics())
+        self.assertEqual(metrics["ghost"], UvSetAnalyzer.empty_metrics())
+
+    def test_uv_counts(self):
+        self.assertEqual(
+            UvSetAnalyzer.uv_counts("|cube|cubeShape"),
+            {"map1": 9, "empty": 0, "ghost": None},
+        )
+
+    def test_table_rows(self):
+        with patch(
+            "mayatk.core_utils.diagnostics.uv_metrics.cmds.ls",
+            return_value=["|a|aShape", "|b|bShape"],
+        ):
+            rows = UvSetAnalyzer.table(["a", "b"], uv_sets=["map1"])
+        self.assertEqual(
+            [(r["shape"], r["uv_set"]) for r in rows],
+            [("|a|aShape", "map1"), ("|b|bShape", "map1")],
+        )
+        self.assertTrue(all(r["seconds"] >= 0 for r in rows))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestConcaveUvFaces(unittest.TestCase):
+    """Overlaps follow the mesh's triangles, not a fan.
+
+    Added: 2026-10-18
+    """
+
+    # An L-shaped hexagon whose fan from corner 0 covers the notch at
+    # (1..2, 1..2), and a small quad sitting in that notch or in the L.
+    L_SHAPE = [(2, 0), (2, 1), (1, 1), (1, 2), (0, 2), (0, 0)]
+    NOTCH = [(1.1, 1.1), (1.3, 1.1), (1.3, 1.3), (1.1, 1.3)]
+    INSIDE = [(0.2, 0.2), (0.4, 0.2), (0.4, 0.4), (0.2, 0.4)]
+
+    def mesh(self, quad):
+        u, v = np.array(self.L_SHAPE + quad, dtype=float).T
+        # Mesh vertex ids differ from the face-vertex positions and UV ids.
+        vertices = [15, 14, 13, 12, 11, 10, 20, 21, 22, 23]
+        ears = [(0, 1, 2), (0, 2, 5), (2, 3, 4), (2, 4, 5), (6, 7, 8), (6, 8, 9)]
+        return SimpleNamespace(
+            getUVSetNames=lambda: ["map1"],
+            getUVs=lambda name: (u, v),
+            getAssignedUVs=lambda name: ([6, 4], list(range(10))),
+            getVertices=lambda: ([6, 4], vertices),
+            getTriangles=lambda: ([4, 2], [vertices[i] for ear in ears for i in ear]),
+        )
+
+    def overlaps(self, quad):
+        with patch.object(UvSetAnalyzer, "_mesh_fn", return_value=self.mesh(quad)):
+            return UvSetAnalyzer.analyze_shape("|l|lShape")["map1"]["overlap_count"]
+
+    def test_read_triangles_maps_to_face_corners(self):
+        corners, faces = UvSetAnalyzer.read_triangles(self.mesh(self.NOTCH))
+        self.assertEqual(corners[:2].tolist(), [[0, 1, 2], [0, 2, 5]])
+        self.assertEqual(corners[4:].tolist(), [[0, 1, 2], [0, 2, 3]])
+        self.assertEqual(faces.tolist(), [0, 0, 0, 0, 1, 1])
+
+    def test_quad_in_the_notch_does_not_overlap(self):
+        u, v = np.array(self.L_SHAPE + self.NOTCH, dtype=float).T
+        fan = UvSetAnalyzer.overlapping_faces(u, v, [6, 4], np.arange(10))
+        self.assertEqual(fan.tolist(), [0, 1], "The fan covers the notch")
+        self.assertEqual(self.overlaps(self.NOTCH), 0)
+
+    def test_quad_inside_the_l_overlaps(self):
+        self.assertEqual(self.overlaps(self.INSIDE), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for WaveformCache — vectorized decode, byte-bounded LRU, disk tier.
+
+Synthetic WAV files are written to a temp directory, so everything runs
+without Maya. The reference for every envelope is ``pythontk``'s
+``compute_waveform_envelope``, which the cache must reproduce bin for bin.
+"""
+import os
+import sys
+import math
+import shutil
+import struct
+import tempfile
+import unittest
+import wave
+from unittest.mock import MagicMock, patch
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from pythontk.audio_utils._audio_utils import AudioUtils as _PtkAudioUtils
+from mayatk.audio_utils.waveform_cache import WaveformCache
+
+
+def _write_wav(path, frames=5000, channels=1, width=2, rate=22050, phase=0.0):
+    peak = {1: 127, 2: 32767, 3: 8388607}[width]
+    data = bytearray()
+    for i in range(frames):
+        for c in range(channels):
+            ramp = 0.3 + 0.7 * (i % 97) / 97
+            v = int(peak * math.sin(phase + i * 0.013 * (c + 1)) * ramp)
+            if width == 1:
+                data += struct.pack("<B", v + 128)
+            elif width == 2:
+                data += struct.pack("<h", v)
+            else:
+                data += struct.pack("<i", v)[:3]
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(width)
+        wf.setframerate(rate)
+        wf.writeframes(bytes(data))
+    return path
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestWaveformCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp(prefix="waveform_cache_")
+        self.store = os.path.join(self.tmp, "store")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _wav(self, name, **kw):
+        return _write_wav(os.path.join(self.tmp, name), **kw)
+
+    def _assertEnvelopesEqual(self, got, expected):
+        self.assertEqual(len(got), len(expected))
+        for (a, b), (c, d) in zip(got, expected):
+            self.assertAlmostEqual(a, c, places=12)
+            self.assertAlmostEqual(b, d, places=12)
+
+    def test_decode_matches_pythontk_bin_for_bin(self):
+        for width in (1, 2, 3):
+            for channels in (1, 2):
+                name = f"w{width}c{channels}.wav"
+                path = self._wav(name, width=width, channels=channels)
+                for bins in (1, 7, 64, 512, 9000):
+                    _, levels = WaveformCache.decode_levels(path, [bins])
+                    expected = _PtkAudioUtils.compute_waveform_envelope(path, bins)
+                    self._assertEnvelopesEqual(
+                        WaveformCache._as_envelope(levels.get(bins)), expected
+                    )
+
+    def test_unreadable_files_give_an_empty_envelope(self):
+        cache = WaveformCache(cache_dir=self.store)
+        self.assertEqual(cache.get(os.path.join(self.tmp, "missing.wav")), [])
+        bogus = os.path.join(self.tmp, "bogus.wav")
+        with open(bogus, "wb") as f:
+            f.write(b"not a wav")
+        self.assertEqual(cache.get(bogus), [])
+
+    def test_memory_hits_and_byte_bounded_eviction(self):
+        one = WaveformCache._envelope_nbytes([(0.0, 0.0)] * 512)
+        cache = WaveformCache(max_bytes=int(one * 2.5), persist=False)
+        paths = [self._wav(f"c{i}.wav", phase=i) for i in range(3)]
+        cache.get(paths[0])
+        cache.get(paths[1])
+        cache.get(paths[0])  # paths[1] is now least recent
+        cache.get(paths[2])
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 3))
+        self.assertEqual((stats["entries"], stats["evictions"]), (2, 1))
+        self.assertLessEqual(stats["bytes"], cache.max_bytes)
+        cache.get(paths[0])
+        self.assertEqual(cache.stats()["hits"], 2)
+        cache.get(paths[1])
+        self.assertEqual(cache.stats()["misses"], 4)
+
+    def test_a_new_session_loads_from_disk_without_decoding(self):
+        path = self._wav("clip.wav")
+        first = WaveformCache(cache_dir=self.store).get(path)
+
+        later = WaveformCache(cache_dir=self.store)
+        with patch.object(
+            WaveformCache, "decode_levels", side_effect=AssertionError("decoded")
+        ):
+            self.assertEqual(later.get(path), first)
+            # Finer zoom levels were written by the same decode.
+            self.assertEqual(len(later.get(path, 2048)), 2048)
+        self.assertEqual(later.stats()["disk_hits"], 2)
+
+        # Same content under another path: still no decode.
+        copy = os.path.join(self.tmp, "renamed.wav")
+        shutil.copyfile(path, copy)
+        with patch.object(
+            WaveformCache, "decode_levels", side_effect=AssertionError("decoded")
+        ):
+            self.assertEqual(later.get(copy), first)
+
+    def test_an_edited_file_is_decoded_again(self):
+        path = self._wav("clip.wav")
+        cache = WaveformCache(cache_dir=self.store)
+        before = cache.get(path)
+        _write_wav(path, frames=3000, phase=1.0)
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        after = cache.get(path)
+        self.assertNotEqual(after, before)
+        self._assertEnvelopesEqual(
+            after, _PtkAudioUtils.compute_waveform_envelope(path)
+        )
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_clear_and_prune_the_disk_tier(self):
+        cache = WaveformCache(cache_dir=self.store)
+        for i in range(3):
+            cache.get(self._wav(f"p{i}.wav", phase=i))
+        self.assertEqual(len(list(cache._disk_files())), 3)
+        self.assertEqual(cache.prune_disk(max_disk_bytes=0), 3)
+        cache.get(self._wav("p0.wav"))
+        cache.clear(disk=True)
+        self.assertEqual(list(cache._disk_files()), [])
+        self.assertEqual(cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,195 @@
+# !/usr/bin/python
+# coding=utf-8
+"""Tests for WorkspaceIndex — the SQLite scene index behind the workspace panels.
+
+Runs on real temp directories; nothing here needs Maya. The panels' use of the
+index (``USE_WORKSPACE_INDEX``) is covered by ``test/test_workspace.py``.
+"""
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+mock_cmds = sys.modules.get("maya.cmds")
+_CMDS_IS_MOCKED = isinstance(mock_cmds, MagicMock)
+
+from mayatk.env_utils.workspace_index import WorkspaceIndex
+
+
+def _touch(path, data=b"x"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _bump_mtime(path):
+    """Force a directory mtime change (coarse-mtime filesystems)."""
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+
+
+@unittest.skipUnless(
+    _CMDS_IS_MOCKED, "Mock-based test — run via pytest, not run_tests.py"
+)
+class TestWorkspaceIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self._tmp.name, "projects").replace("\\", "/")
+        # Two marked workspaces (one empty) plus an unmarked folder with a scene.
+        _touch(f"{self.root}/shotA/workspace.mel", b"")
+        _touch(f"{self.root}/shotA/scenes/a_model.ma")
+        _touch(f"{self.root}/shotA/scenes/a_anim.mb", b"xyz")
+        _touch(f"{self.root}/shotA/scenes/a_anim.0001.ma")
+        _touch(f"{self.root}/shotA/scenes/sub/a_fx.fbx")
+        _touch(f"{self.root}/shotB/workspace.mel", b"")
+        os.makedirs(f"{self.root}/shotB/scenes")
+        _touch(f"{self.root}/loose/stray.ma")
+        self.index = WorkspaceIndex(
+            self.root, db_path=os.path.join(self._tmp.name, "index.sqlite")
+        )
+
+    def tearDown(self):
+        self.index.wait()
+        self.index.close()
+        self._tmp.cleanup()
+
+    def test_first_refresh_populates(self):
+        self.assertFalse(self.index.is_populated)
+        stats = self.index.refresh()
+        self.assertTrue(self.index.is_populated)
+        self.assertEqual(stats["files"], 5)
+        self.assertGreater(stats["changed"], 0)
+
+    def test_scenes_filters(self):
+        self.index.refresh()
+        ws = f"{self.root}/shotA"
+        self.assertEqual(
+            [os.path.basename(p) for p in self.index.scenes(ws)],
+            ["a_anim.mb", "a_model.ma", "a_fx.fbx"],
+        )
+        self.assertEqual(len(self.index.scenes(ws, omit_autosave=False)), 4)
+        self.assertEqual(
+            [os.path.basename(p) for p in self.index.scenes(ws, file_types=["*.ma"])],
+            ["a_model.ma"],
+        )
+        self.assertEqual(
+            [os.path.basename(p) for p in self.index.scenes(ws, file_types={".fbx"})],
+            ["a_fx.fbx"],
+        )
+        self.assertEqual(
+            [os.path.basename(p) for p in self.index.scenes(ws, suffix="_anim")],
+            ["a_anim.mb"],
+        )
+        self.assertEqual(len(self.index.scenes(ws, prefix="a_")), 3)
+        self.assertEqual(
+            [os.path.basename(p) for p in self.index.scenes(ws, subfolder="scenes/sub")],
+            ["a_fx.fbx"],
+        )
+
+    def test_prefix_range_does_not_leak_into_siblings(self):
+        _touch(f"{self.root}/shotA_v2/scenes/other.ma")
+        self.index.refresh()
+        names = [os.path.basename(p) for p in self.index.scenes(f"{self.root}/shotA")]
+        self.assertNotIn("other.ma", names)
+
+    def test_workspaces_match_find_workspaces_rules(self):
+        self.index.refresh()
+        self.assertEqual(
+            self.index.workspaces(file_types=("*.ma", "*.mb")),
+            [("shotA", f"{self.root}/shotA")],
+        )
+        self.assertEqual(
+            [name for name, _ in self.index.workspaces(ignore_empty=False)],
+            ["shotA", "shotB"],
+        )
+        _touch(f"{self.root}/deep/nested/workspace.mel", b"")
+        _touch(f"{self.root}/deep/nested/scenes/n.ma")
+        self.index.refresh()
+        self.assertIn("nested", [n for n, _ in self.index.workspaces()])
+        self.assertNotIn(
+            "nested", [n for n, _ in self.index.workspaces(recursive=False)]
+        )
+
+    def test_incremental_refresh_skips_unchanged_dirs(self):
+        self.index.refresh()
+        stats = self.index.refresh()
+        self.assertEqual(stats["dirs_scanned"], 0)
+        self.assertEqual(stats["changed"], 0)
+        self.assertGreater(stats["dirs_skipped"], 0)
+
+    def test_incremental_refresh_sees_add_and_remove(self):
+        self.index.refresh()
+        scenes = f"{self.root}/shotA/scenes"
+        _touch(f"{scenes}/a_light.ma")
+        os.remove(f"{scenes}/a_model.ma")
+        _bump_mtime(scenes)
+        stats = self.index.refresh()
+        self.assertEqual(stats["dirs_scanned"], 1)
+        self.assertEqual(stats["changed"], 1)
+        names = [os.path.basename(p) for p in self.index.scenes(scenes)]
+        self.assertIn("a_light.ma", names)
+        self.assertNotIn("a_model.ma", names)
+
+    def test_removed_directory_is_dropped(self):
+        self.index.refresh()
+        sub = f"{self.root}/shotA/scenes/sub"
+        os.remove(f"{sub}/a_fx.fbx")
+        os.rmdir(sub)
+        _bump_mtime(f"{self.root}/shotA/scenes")
+        self.index.refresh()
+        self.assertEqual(self.index.scenes(sub), [])
+
+    def test_full_refresh_picks_up_in_place_resave(self):
+        self.index.refresh()
+        path = f"{self.root}/shotA/scenes/a_model.ma"
+        scenes_mtime = os.stat(os.path.dirname(path)).st_mtime
+        with open(path, "wb") as f:
+            f.write(b"resaved scene")
+        os.utime(os.path.dirname(path), (scenes_mtime, scenes_mtime))
+        self.index.refresh()
+        self.assertEqual(self.index.stat(path)[0], 1)
+        self.index.refresh(full=True)
+        self.assertEqual(self.index.stat(path)[0], len(b"resaved scene"))
+
+    def test_workspace_stats(self):
+        self.index.refresh()
+        stats = self.index.workspace_stats(
+            f"{self.root}/shotA", file_types=("*.ma", "*.mb")
+        )
+        self.assertEqual(stats["scene_count"], 2)
+        self.assertEqual(stats["size"], 4)
+        self.assertEqual(len(stats["recent_files"]), 2)
+
+    def test_refresh_async_reports_and_reads_while_running(self):
+        self.index.refresh()
+        _touch(f"{self.root}/shotB/scenes/b.ma")
+        _bump_mtime(f"{self.root}/shotB/scenes")
+        done = threading.Event()
+        results = []
+
+        def on_complete(index, stats):
+            results.append(stats)
+            done.set()
+
+        self.index.refresh_async(on_complete=on_complete)
+        # Reads on this thread stay usable while the worker writes.
+        self.index.workspaces()
+        self.assertTrue(done.wait(10))
+        self.assertTrue(self.index.wait(10))
+        self.assertEqual(results[0]["changed"], 1)
+        self.assertEqual(len(self.index.scenes(f"{self.root}/shotB")), 1)
+
+    def test_index_persists_across_instances(self):
+        self.index.refresh()
+        again = WorkspaceIndex(self.root, db_path=self.index.db_path)
+        try:
+            self.assertTrue(again.is_populated)
+            self.assertEqual(len(again.scenes()), 4)
+        finally:
+            again.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -239,6 +239,32 @@ class TestBuildTableData(MayaTkTestCase):
         tx_row = [r for r in rows if r[0] == "translateX"][0]
         self.assertEqual(tx_row[3], "*")
 
+    def test_live_values_reread_only_changed_plugs(self):
+        """Repeat reads come from the snapshot; a setAttr is picked up.
+
+        Added: 2026-10-18
+        """
+        snapshot = Channels.attribute_snapshot()
+        Channels.build_table_data([self.cube], {"keyable": True})
+        names = ["translateX", "rotateY", "visibility"]
+        before = snapshot.reads
+        data = Channels.collect_value_strings([self.cube], names)
+        self.assertEqual(snapshot.reads, before, "Unchanged plugs are cached")
+        self.assertEqual(data["translateX"], ("0", "none"))
+
+        cmds.setAttr(f"{self.cube}.translateX", 2.5)
+        cmds.setAttr(f"{self.cube}.visibility", lock=True)
+        data = Channels.collect_value_strings([self.cube], names)
+        self.assertEqual(data["translateX"], ("2.5", "none"))
+        self.assertTrue(
+            snapshot.read_node(self.cube, ["visibility"])["visibility"].locked
+        )
+
+        cmds.setKeyframe(f"{self.cube}.rotateY", value=30, time=1)
+        data = Channels.collect_value_strings([self.cube], names)
+        self.assertIn(data["rotateY"][1], ("keyframe", "keyframe_active"))
+        snapshot.release()
+
 
 class TestResetToDefault(MayaTkTestCase):
     """Tests for reset_to_default."""
@@ -331,6 +331,45 @@ class TestTransformDiagnosticsInheritedShear(MayaTkTestCase):
         self.assertEqual(result, [child])
         self.assertAlmostEqual(cmds.getAttr(f"{child}.rotateZ"), before, places=6)
 
+    def test_matrix_scan_matches_per_node_reads(self):
+        """The batched scan agrees with worldMatrix/shear read node by node.
+
+        Added: 2026-10-18
+        """
+        grp, child = self._sheared_hierarchy("td_scan")
+        own = cmds.polyCube(name="td_scan_own")[0]
+        cmds.setAttr(f"{own}.shearXY", 0.4)
+        nodes = [grp, child, own]
+
+        scan = TransformDiagnostics.matrix_scan().measure(nodes)
+
+        self.assertEqual(scan.nodes, nodes)
+        for i, node in enumerate(nodes):
+            world = cmds.getAttr(f"{node}.worldMatrix")
+            self.assertAlmostEqual(
+                scan.skew[i], TransformDiagnostics._matrix_skew(world), places=9
+            )
+            for a, b in zip(scan.shear[i], cmds.getAttr(f"{node}.shear")[0]):
+                self.assertAlmostEqual(a, b, places=9)
+        whole = TransformDiagnostics.matrix_scan().measure()
+        self.assertIn(child, whole.nodes)
+
+    def test_matrix_scan_rereads_after_ancestor_change(self):
+        """Cached shear is reused until the node or an ancestor moves.
+
+        Added: 2026-10-18
+        """
+        grp, child = self._sheared_hierarchy("td_scan_cache")
+        scan = TransformDiagnostics.matrix_scan()
+        scan.measure([grp, child])
+        scan.measure([grp, child])
+        self.assertEqual(scan.stats["shear_reads"], 0)
+
+        cmds.setAttr(f"{grp}.scaleX", 1.0)
+        result = scan.measure([grp, child])
+        self.assertEqual(scan.stats["shear_reads"], 2)
+        self.assertEqual(len(result.flagged(TransformDiagnostics.SHEAR_TOLERANCE)), 0)
+
 
 class TestTransformDiagnosticsConnections(MayaTkTestCase):
     """Connection-aware fix behavior.
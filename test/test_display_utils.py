@@ -640,6 +640,89 @@ class TestColorIdSlotsChannelScope(MayaTkTestCase):
         self.assertFalse(cmds.polyColorSet(self.shape, query=True, allColorSets=True))
 
 
+class TestColorIndex(MayaTkTestCase):
+    """ColorIndex answers Select By Color the same as the per-object scan."""
+
+    RED = (0.8, 0.1, 0.1)
+    BLUE = (0.1, 0.2, 0.9)
+    CHECKS = dict(
+        check_material_color=True,
+        check_vertex_color=True,
+        check_wireframe_color=True,
+        check_outliner_color=True,
+        check_set=True,
+    )
+
+    def setUp(self):
+        super().setUp()
+        from mayatk.display_utils.color_id import ColorId, ColorIndex, ColorUtils
+
+        self.ColorId = ColorId
+        # A private index per test: the shared one may be watching another scene.
+        previous = ColorUtils._color_index
+        ColorUtils._color_index = ColorIndex()
+        self.addCleanup(setattr, ColorUtils, "_color_index", previous)
+        self.index = ColorUtils._color_index
+        self.cubes = [cmds.polyCube(name=f"cidx_{i}")[0] for i in range(6)]
+
+    def _names(self, found):
+        return sorted(n.split("|")[-1] for n in found)
+
+    def _both(self, color, **checks):
+        scan = self.ColorId.get_objects_by_color(color, **checks)
+        indexed = self.ColorId.get_objects_by_color(color, use_index=True, **checks)
+        self.assertEqual(self._names(indexed), self._names(scan))
+        return self._names(indexed)
+
+    def test_every_channel_matches_the_scan(self):
+        a, b, c, d, e, f = self.cubes
+        self.ColorId.apply_color([a], self.RED, apply_to_wireframe=True)
+        self.ColorId.apply_color([b], self.RED, apply_to_outliner=True)
+        self.ColorId.apply_color([c], self.RED, apply_to_material=True)
+        self.ColorId.apply_color([d], self.RED, apply_to_vertex=True)
+        self.ColorId.apply_color([e], self.RED, set_per_color=True)
+        self.ColorId.apply_color([f], self.BLUE, apply_to_wireframe=True)
+        for channel in self.CHECKS:
+            self._both(self.RED, **{channel: True})
+        self.assertEqual(
+            self._both(self.RED, **self.CHECKS),
+            ["cidx_0", "cidx_1", "cidx_2", "cidx_3", "cidx_4"],
+        )
+        self.assertEqual(self._both(self.BLUE, **self.CHECKS), ["cidx_5"])
+
+    def test_tolerance_spans_bucket_edges(self):
+        near = (self.RED[0] - 0.04, self.RED[1] + 0.03, self.RED[2])
+        self.ColorId.apply_color([self.cubes[0]], near, apply_to_wireframe=True)
+        self.assertEqual(
+            self._both(self.RED, check_wireframe_color=True, threshold=0.05),
+            ["cidx_0"],
+        )
+        self.assertEqual(
+            self._both(self.RED, check_wireframe_color=True, threshold=0.01), []
+        )
+
+    def test_writers_invalidate_only_what_they_touch(self):
+        self.ColorId.apply_color(self.cubes[:2], self.RED, apply_to_wireframe=True)
+        self._both(self.RED, check_wireframe_color=True)
+        self.assertTrue(self.index.is_built)
+        self.ColorId.apply_color([self.cubes[0]], self.BLUE, apply_to_wireframe=True)
+        self.assertEqual(len(self.index._dirty), 1)
+        self.assertEqual(self._both(self.RED, check_wireframe_color=True), ["cidx_1"])
+        self.ColorId.reset_colors([self.cubes[1]])
+        self.assertEqual(self._both(self.RED, check_wireframe_color=True), [])
+
+    def test_renamed_and_deleted_nodes(self):
+        self.ColorId.apply_color(self.cubes[:2], self.RED, apply_to_wireframe=True)
+        self._both(self.RED, check_wireframe_color=True)
+        cmds.rename(self.cubes[0], "cidx_renamed")
+        cmds.delete(self.cubes[1])
+        # Keyed by UUID: a rename keeps its entry, a deleted node drops out.
+        found = self.ColorId.get_objects_by_color(
+            self.RED, check_wireframe_color=True, use_index=True
+        )
+        self.assertEqual(self._names(found), ["cidx_renamed"])
+
+
 class TestHiddenInOutliner(MayaTkTestCase):
     """DisplayUtils.set_hidden_in_outliner — the Outliner-row display flag."""
 
@@ -700,6 +700,8 @@ class TestEditUtils(MayaTkTestCase):
         combined = cmds.polyUnite(self.cube, cube2, ch=False)[0]
         overlaps = EditUtils.get_overlapping_vertices(combined)
         self.assertTrue(len(overlaps) > 0)
+        (indices,) = overlaps.values()
+        self.assertEqual(indices.tolist(), list(range(16)))
 
     def test_get_overlapping_faces(self):
         """Test finding overlapping faces."""
@@ -707,6 +709,8 @@ class TestEditUtils(MayaTkTestCase):
         combined = cmds.polyUnite(self.cube, cube2, ch=False)[0]
         overlaps = EditUtils.get_overlapping_faces(combined)
         self.assertTrue(len(overlaps) > 0)
+        (indices,) = overlaps.values()
+        self.assertEqual(indices.tolist(), list(range(6, 12)), "First copy is kept")
 
     # -------------------------------------------------------------------------
     # Topology & Similarity
@@ -719,6 +723,25 @@ class TestEditUtils(MayaTkTestCase):
         similar = EditUtils.get_similar_mesh(self.cube)
         self.assertIn(dup, similar)
 
+    def test_get_similar_mesh_reuses_the_metric_index(self):
+        """A repeated query re-evaluates nothing; an edited mesh is re-read.
+
+        Added: 2026-10-18
+        """
+        dup = cmds.duplicate(self.cube)[0]
+        cmds.move(10, 0, 0, dup)
+        index = EditUtils.mesh_metric_index()
+        index.invalidate()
+        self.assertIn(dup, EditUtils.get_similar_mesh(self.cube))
+
+        before = index.evaluations
+        self.assertIn(dup, EditUtils.get_similar_mesh(self.cube))
+        self.assertEqual(index.evaluations, before, "Unchanged scene: all cached")
+
+        cmds.polySmooth(dup)
+        self.assertNotIn(dup, EditUtils.get_similar_mesh(self.cube))
+        self.assertEqual(index.evaluations, before + 1, "Only the edit is re-read")
+
     def test_get_similar_mesh_tolerance_and_unchecked_flags(self):
         """Regression: flags passed as False made polyEvaluate return the full
         stats dict (flag=False == flag absent), which then hit exact
@@ -1087,6 +1110,23 @@ class TestEditUtils(MayaTkTestCase):
         EditUtils.dissolve_coplanar([sphere], angle_tolerance=0.5)
         self.assertEqual(cmds.polyEvaluate(sphere, face=True), before)
 
+    def test_mesh_reducer_reports_per_mesh_results(self):
+        """One dissolve over several meshes reports each mesh's faces and time.
+
+        Added: 2026-10-18
+        """
+        from mayatk.edit_utils.mesh_reduce import MeshReducer
+
+        cube = cmds.polyCube(sx=4, sy=4, sz=4, ch=False)[0]
+        sphere = cmds.polySphere(subdivisionsX=12, subdivisionsY=12, ch=False)[0]
+        results = MeshReducer.dissolve({cube: None, sphere: None}, angle_tolerance=1.0)
+        self.assertEqual([r.mesh for r in results], [cube, sphere])
+        self.assertEqual((results[0].faces_before, results[0].faces_after), (96, 6))
+        self.assertGreater(results[0].edges, 0)
+        self.assertEqual((results[1].edges, results[1].removed), (0, 0))
+        self.assertTrue(all(r.duration >= 0.0 for r in results))
+        self.assertNotIn("polyDelEdge", str(cmds.listHistory(cube) or []))
+
     # ---- component-scoped decimate / dissolve ---------------------------------
 
     @staticmethod
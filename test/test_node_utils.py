@@ -1000,6 +1000,33 @@ class TestNodeUtils(MayaTkTestCase):
             len(cmds.listRelatives(shape, allParents=True, fullPath=True) or []), 1
         )
 
+    def test_replace_with_instances_exact_duplicates_skip_the_matcher(self):
+        """A scatter of plain duplicates is placed by its world matrices alone
+        — the object-space points already agree, so the PCA registration is
+        never needed and must not be paid for per target."""
+        from unittest.mock import patch
+        from mayatk.core_utils.auto_instancer.geometry_matcher import (
+            GeometryMatcher,
+        )
+
+        src = cmds.polyCube(name="src", width=4, height=2, depth=1)[0]
+        targets = []
+        for i in range(5):
+            tgt = cmds.duplicate(src)[0]
+            cmds.xform(tgt, translation=(10 * i, 0, 0), rotation=(0, 30 * i, 0))
+            targets.append(tgt)
+        want = [cmds.exactWorldBoundingBox(t) for t in targets]
+
+        with patch.object(
+            GeometryMatcher, "are_meshes_identical", side_effect=AssertionError
+        ):
+            instances = mtk.NodeUtils.replace_with_instances([src] + targets)
+
+        self.assertEqual(len(instances), 5)
+        for inst, bbox in zip(instances, want):
+            for g, w in zip(cmds.exactWorldBoundingBox(inst), bbox):
+                self.assertAlmostEqual(g, w, places=4)
+
     def test_replace_with_instances_center_pivot_without_freeze(self):
         """center_pivot must act even when freeze_transforms is False —
         passing translate=False into freeze_transforms is an explicit
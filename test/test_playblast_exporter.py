@@ -367,6 +367,32 @@ class TestPlayblastExporter(MayaTkTestCase):
             cap.release()
             self.assertEqual(frame_count, 5)
 
+    def test_export_mp4_streamed_matches_two_pass(self):
+        """stream=True must encode the same frames as the two-pass path, with
+        less intermediate disk at peak."""
+        if not (FFMPEG_AVAILABLE and CV2_AVAILABLE):
+            self.skipTest("ffmpeg/cv2 not available")
+        cmds.playbackOptions(min=1, max=24)
+        exporter = PlayblastExporter(width=320, height=240)
+        exporter.STREAM_CHUNK_FRAMES = 4
+        exporter.STREAM_BUFFER_FRAMES = 4
+        two_pass = exporter.export(self.tmp, name="twopass", targets="mp4")[0]
+        if not two_pass.ok:
+            self._skip_if_batch_capture_failed(RuntimeError(two_pass.error))
+        streamed = exporter.export(
+            self.tmp, name="streamed", targets="mp4", stream=True
+        )[0]
+        self.assertTrue(streamed.ok, streamed.error)
+        self.assertEqual(exporter.last_export_stats["mode"], "stream")
+        self.assertLess(streamed.peak_temp_bytes, two_pass.peak_temp_bytes)
+        counts = []
+        for path in (two_pass.output, streamed.output):
+            cap = cv2.VideoCapture(path)
+            counts.append(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+            cap.release()
+        self.assertEqual(counts, [24, 24])
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "streamed_stream_tmp")))
+
     def test_export_mp4_honors_scene_fps(self):
         if not (FFMPEG_AVAILABLE and CV2_AVAILABLE):
             self.skipTest("ffmpeg/cv2 not available")
@@ -556,6 +556,49 @@ class LastDiffTest(unittest.TestCase):
             self.assertEqual(SceneDataSidecar.read_data(export), {"k": 1})
 
 
+class ExportRecordTest(unittest.TestCase):
+    """The incremental-export record rides the sidecar; other writes drop it."""
+
+    RECORD = {
+        "fingerprint": "abc",
+        "components": {"geometry": "g", "settings": "s"},
+        "outputs": ["shot_v003.fbx"],
+        "version": 1,
+    }
+
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as d:
+            export = os.path.join(d, "shot.fbx")
+            SceneDataSidecar.write_manifest(export, {"A"}, export=self.RECORD)
+            self.assertEqual(SceneDataSidecar.read_export(export), self.RECORD)
+            # The hierarchy baseline is unaffected by the record.
+            self.assertEqual(SceneDataSidecar.read_manifest(export), {"A"})
+
+    def test_non_incremental_write_drops_record(self):
+        with tempfile.TemporaryDirectory() as d:
+            export = os.path.join(d, "shot.fbx")
+            SceneDataSidecar.write_manifest(export, {"A"}, export=self.RECORD)
+            SceneDataSidecar.write_manifest(export, {"A"})
+            self.assertIsNone(SceneDataSidecar.read_export(export))
+
+    def test_base_stem_shares_record_across_versions(self):
+        with tempfile.TemporaryDirectory() as d:
+            v3 = os.path.join(d, "shot_v003.fbx")
+            v4 = os.path.join(d, "shot_v004.fbx")
+            SceneDataSidecar.write_manifest(
+                v3, {"A"}, export=self.RECORD, base_stem=True
+            )
+            self.assertEqual(
+                SceneDataSidecar.read_export(v4, base_stem=True), self.RECORD
+            )
+
+    def test_read_export_none_without_manifest(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.assertIsNone(
+                SceneDataSidecar.read_export(os.path.join(d, "shot.fbx"))
+            )
+
+
 class HiddenAttributeTest(unittest.TestCase):
     """On Windows the manifest carries FILE_ATTRIBUTE_HIDDEN through rewrites.
 
@@ -12,6 +12,7 @@ Tests for SceneExporter class functionality including:
 - Removed-task verification
 """
 import os
+import json
 import base64
 import shutil
 import unittest
@@ -234,6 +235,160 @@ class TestSceneExporter(MayaTkTestCase):
             "FBX should be written next to the scene file when no dir is given",
         )
 
+    def test_perform_export_writes_profile_report(self):
+        """profile_report=True writes <name>.profile.json beside the FBX,
+        with one entry per dispatched task and one for the FBX write.
+
+        Added: 2026-10-18
+        """
+        try:
+            if not cmds.pluginInfo("fbxmaya", q=True, loaded=True):
+                cmds.loadPlugin("fbxmaya")
+        except Exception:
+            self.skipTest("FBX plugin not available")
+
+        result = self.exporter.perform_export(
+            export_dir=self.temp_dir,
+            objects=[self.cube],
+            output_name="profiled",
+            file_format="FBX export",
+            tasks={"set_linear_unit": "cm"},
+            profile_report=True,
+            slow_task_threshold=0,
+        )
+        self.assertTrue(result)
+        path = os.path.join(self.temp_dir, "profiled.profile.json")
+        self.assertTrue(os.path.exists(path), "Profile report should be written")
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        names = [e["name"] for e in report["entries"]]
+        self.assertIn("set_linear_unit", names)
+        self.assertIn("fbx_write", names)
+        self.assertTrue(report["succeeded"])
+        self.assertEqual(report["slow"], [])
+        self.assertFalse(self.exporter.task_manager.profiler.active)
+
+    def test_incremental_export_skips_unchanged_units(self):
+        """incremental=True skips an unchanged re-export and rebuilds after an edit.
+
+        Added: 2026-10-18
+        """
+        try:
+            if not cmds.pluginInfo("fbxmaya", q=True, loaded=True):
+                cmds.loadPlugin("fbxmaya")
+        except Exception:
+            self.skipTest("FBX plugin not available")
+
+        def export(**kwargs):
+            return self.exporter.perform_export(
+                export_dir=self.temp_dir,
+                objects=[self.cube],
+                output_name="incremental",
+                file_format="FBX export",
+                incremental=True,
+                **kwargs,
+            )
+
+        fbx = os.path.join(self.temp_dir, "incremental.fbx")
+        self.assertTrue(export())
+        self.assertTrue(os.path.exists(fbx))
+        mtime = os.stat(fbx).st_mtime_ns
+
+        self.assertTrue(export())
+        self.assertEqual(os.stat(fbx).st_mtime_ns, mtime, "Unchanged: not rewritten")
+
+        cmds.move(0, 1, 0, f"{self.cube}.vtx[0]", relative=True)
+        self.assertTrue(export())
+        self.assertTrue(export(force_rebuild=True))
+
+        results = self.exporter.incremental_results
+        self.assertEqual(
+            [u["status"] for u in results],
+            ["rebuilt", "skipped", "rebuilt", "rebuilt"],
+        )
+        self.assertEqual(results[2]["changed"], ["geometry"])
+        self.assertEqual(results[3]["changed"], ["forced"])
+        summary = self.exporter.incremental_summary(reset=True)
+        self.assertEqual(len(summary["rebuilt"]), 3)
+        self.assertEqual(summary["skipped"], ["incremental.fbx"])
+
+    def test_fingerprint_sees_edits_that_leave_the_points(self):
+        """Normals, edge hardness, vertex colors, skin weights at the bind pose
+        and a blend shape target at weight 0 all change the geometry digest.
+
+        Added: 2026-10-18
+        """
+        from mayatk.env_utils.scene_exporter.export_fingerprint import (
+            ExportFingerprint,
+        )
+
+        shape = cmds.listRelatives(self.cube, shapes=True, fullPath=True)[0]
+        target = cmds.duplicate(self.cube, name="fp_target")[0]
+
+        def geometry():
+            return ExportFingerprint.compute([self.cube])["components"]["geometry"]
+
+        def assert_changes(edit):
+            before = geometry()
+            edit()
+            self.assertNotEqual(geometry(), before)
+
+        # Shading edits first, while the mesh has no deformer history.
+        assert_changes(
+            lambda: cmds.polySoftEdge(f"{self.cube}.e[0]", angle=0, ch=False)
+        )
+        assert_changes(
+            lambda: cmds.polyColorPerVertex(
+                f"{self.cube}.vtx[0]", rgb=(1, 0, 0), colorDisplayOption=True
+            )
+        )
+        assert_changes(
+            lambda: cmds.polyNormalPerVertex(f"{self.cube}.vtx[3]", xyz=(0, 1, 0))
+        )
+
+        cmds.select(clear=True)
+        joints = [cmds.joint(p=(0, 0, 0)), cmds.joint(p=(0, 1, 0))]
+        skin = cmds.skinCluster(joints, self.cube, toSelectedBones=True)[0]
+        blend = cmds.blendShape(target, self.cube, frontOfChain=True)[0]
+        assert_changes(
+            lambda: cmds.skinPercent(
+                skin, f"{shape}.vtx[1]", transformValue=[(joints[1], 1.0)]
+            )
+        )
+        assert_changes(lambda: cmds.move(0, 2, 0, f"{target}.vtx[2]", relative=True))
+        self.assertEqual(cmds.getAttr(f"{blend}.weight[0]"), 0.0)
+
+    def test_batch_export_runs_scenes_in_mayapy_workers(self):
+        """BatchExporter exports saved scenes in headless workers and streams
+        each result back; a missing scene fails alone.
+
+        Added: 2026-10-18
+        """
+        from mayatk.env_utils.scene_exporter.batch_export import (
+            BatchExporter,
+            MayapyExportLauncher,
+        )
+
+        try:
+            MayapyExportLauncher().resolve_mayapy()
+        except FileNotFoundError:
+            self.skipTest("mayapy not available")
+
+        scenes = []
+        for name in ("batch_a", "batch_b"):
+            path = os.path.join(self.temp_dir, f"{name}.ma").replace("\\", "/")
+            cmds.file(path, exportAll=True, type="mayaAscii", force=True)
+            scenes.append(path)
+        scenes.append(os.path.join(self.temp_dir, "missing.ma"))
+
+        farm = BatchExporter(workers=2, retries=0)
+        jobs = farm.run(scenes, export_dir=self.temp_dir, export_mode="all")
+        self.assertEqual([j.status for j in jobs], ["done", "done", "failed"])
+        for job, name in zip(jobs, ("batch_a", "batch_b")):
+            self.assertTrue(os.path.exists(job.export_path), job.error)
+            self.assertIn(name, os.path.basename(job.export_path))
+        self.assertEqual(jobs[2].attempts, 1, "Reported failures are not retried")
+
     def test_perform_export_no_dir_unsaved_scene_aborts(self):
         """No export_dir + unsaved scene → abort (no directory to fall back to).
 
@@ -1001,6 +1156,30 @@ class TestSceneExporter(MayaTkTestCase):
         self.assertEqual(tm.check_texture_file_size(None), (True, []))
         self.assertEqual(tm.check_texture_file_size(0), (True, []))
 
+    def test_texture_checks_agree_when_scheduled(self):
+        """Split checks give the same verdict run together as called directly.
+
+        run_tasks hands the disk half of the texture checks to the check
+        scheduler's thread pool; a direct call runs them inline.
+        Added: 2026-10-18
+        """
+        tex_path = os.path.join(self.temp_dir, "big_scheduled.png")
+        with open(tex_path, "wb") as f:
+            f.write(b"\0" * (2 * 1024 * 1024))  # 2 MB
+
+        self._assign_texture(self.cube, tex_path)
+        tm = self.exporter.task_manager
+        tm.objects = [cmds.ls(str(self.cube), l=True)[0]]
+        direct = (tm.check_texture_file_size(1), tm.check_valid_paths())
+
+        passed = tm.run_tasks({"check_texture_file_size": 1, "check_valid_paths": True})
+
+        self.assertFalse(direct[0][0])
+        self.assertTrue(direct[1][0])
+        self.assertFalse(passed)
+        self.assertEqual(tm._last_failed_checks, ["check_texture_file_size"])
+        self.assertFalse(tm.check_scheduler.launched("check_valid_paths"))
+
     def test_check_texture_file_size_fails_on_oversized(self):
         """A texture larger than the limit fails the check.
 
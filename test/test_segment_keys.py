@@ -1170,5 +1170,60 @@ class TestAuditRegressionFixes(MayaTkTestCase if _HAS_MAYA else unittest.TestCas
         self.assertEqual(min(t2), 30.0)
 
 
+
+class TestKeyRetimer(MayaTkTestCase if _HAS_MAYA else unittest.TestCase):
+    """Batched retiming through KeyRetimer, as shift_curves/execute_stagger use it."""
+
+    def _keyed(self, name, keys):
+        cube = cmds.polyCube(name=name)[0]
+        for t, v in keys:
+            cmds.setKeyframe(cube, t=t, v=v, at="tx")
+        return cube, cmds.listConnections(f"{cube}.tx", type="animCurve")[0]
+
+    def test_stagger_is_one_undo_step(self):
+        """Staggered keys keep their values and one undo restores every curve.
+
+        Added: 2026-10-18
+        """
+        groups = []
+        for i in range(3):
+            cube, curve = self._keyed(f"retime_undo_{i}", [(0, 1), (20, 5)])
+            groups.append(
+                {
+                    "obj": cube,
+                    "start": 0.0,
+                    "end": 20.0,
+                    "duration": 20.0,
+                    "curves": [curve],
+                }
+            )
+        cmds.undoInfo(state=True)
+        cmds.flushUndo()
+
+        SegmentKeys.execute_stagger(groups, start_frame=0, spacing=5)
+        last = groups[2]["curves"][0]
+        self.assertEqual(cmds.keyframe(last, q=True, tc=True), [50.0, 70.0])
+        self.assertEqual(cmds.keyframe(last, q=True, vc=True), [1.0, 5.0])
+
+        cmds.undo()
+        for group in groups:
+            times = cmds.keyframe(group["curves"][0], q=True, tc=True)
+            self.assertEqual(times, [0.0, 20.0])
+
+    def test_keys_passing_held_keys_use_the_key_mover(self):
+        """A shift that carries keys past others still lands every key.
+
+        Added: 2026-10-18
+        """
+        from mayatk.anim_utils.retime_keys import KeyRetimer
+
+        _cube, curve = self._keyed("retime_pass", [(0, 0), (10, 1), (20, 2)])
+        retimer = KeyRetimer()
+        retimer.shift([curve], 15, (0, 10))
+        self.assertEqual(retimer.commit(), 2)
+        self.assertEqual(retimer.stats["fallback"], 1)
+        self.assertEqual(cmds.keyframe(curve, q=True, tc=True), [15.0, 20.0, 25.0])
+        self.assertEqual(cmds.keyframe(curve, q=True, vc=True), [0.0, 2.0, 1.0])
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
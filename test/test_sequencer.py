@@ -366,6 +366,30 @@ class TestSequencerMaya(unittest.TestCase):
             f"expected a segment for {animated}, got {[s['obj'] for s in segs]}",
         )
 
+    def test_collect_object_segments_cache_follows_curve_edits(self):
+        """Cached collection matches a fresh one after a curve is edited and
+        invalidated, re-collecting only the edited object."""
+        from mayatk.anim_utils.shots.shot_sequencer.segment_cache import (
+            CurveSegmentCache,
+        )
+
+        a = self._create_animated_cube("cache_a", {0: 0, 10: 5})
+        b = self._create_animated_cube("cache_b", {0: 0, 10: 5})
+        seq = ShotSequencer([ShotBlock(0, "S", 0, 30, [a, b])])
+        cache = CurveSegmentCache()
+        self.assertEqual(
+            seq.collect_object_segments(0, cache=cache),
+            seq.collect_object_segments(0),
+        )
+        self.assertEqual(cache.stats()["objects"], 2)
+
+        cmds.setKeyframe(a, attribute="translateX", time=25, value=-5)
+        dropped = cache.invalidate_curves(cmds.keyframe(a, q=True, name=True))
+        self.assertEqual(dropped, {a})
+        cached = seq.collect_object_segments(0, cache=cache)
+        self.assertEqual(cached, seq.collect_object_segments(0))
+        self.assertEqual(max(s["end"] for s in cached if s["obj"] == a), 25)
+
     def test_move_object_keys_shifts(self):
         """move_object_keys offsets keys within the given range."""
         cube = self._create_animated_cube("mv", {10: 0, 20: 5})
@@ -1837,6 +1837,177 @@ class TestInheritedVisibilityBake(unittest.TestCase):
         )
 
 
+class TestDistributedBake(unittest.TestCase):
+    """DistributedBake: chunked worker sampling merged back as keys.
+
+    Uses an in-process fake launcher (samples the live scene at the job's
+    frames, in internal units) so the merge, layer wiring and restore path
+    are exercised without spawning mayapy.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        try:
+            from maya import standalone
+
+            try:
+                standalone.initialize(name="python")
+            except (RuntimeError, TypeError):
+                pass
+            cls.maya_available = True
+        except ImportError:
+            cls.maya_available = False
+
+    def setUp(self):
+        if not self.maya_available:
+            self.skipTest("Maya not available")
+        from maya import cmds
+
+        cmds.file(new=True, force=True)
+        cmds.playbackOptions(minTime=1, maxTime=48)
+        self.jobs = []
+
+    def tearDown(self):
+        if self.maya_available:
+            from maya import cmds
+
+            cmds.file(new=True, force=True)
+
+    def _fake_launcher(self, job):
+        """Local stand-in for a mayapy worker: same output format, this session."""
+        import maya.api.OpenMaya as om2
+        import maya.api.OpenMayaAnim as oma2
+        from mayatk.anim_utils.smart_bake.distributed_bake import write_samples
+
+        self.jobs.append(job)
+        sel = om2.MSelectionList()
+        for plug in job["plugs"]:
+            sel.add(plug)
+        plugs = [sel.getPlug(i) for i in range(sel.length())]
+        values = []
+        for frame in job["frames"]:
+            oma2.MAnimControl.setCurrentTime(om2.MTime(frame, om2.MTime.uiUnit()))
+            values.extend(p.asDouble() for p in plugs)
+        write_samples(job["output"], values)
+
+    def _scene(self):
+        from maya import cmds
+
+        cube = cmds.polyCube(name="dist_cube")[0]
+        loc = cmds.spaceLocator(name="dist_loc")[0]
+        cmds.setKeyframe(loc, attribute="translateX", time=1, value=0)
+        cmds.setKeyframe(loc, attribute="translateX", time=48, value=12)
+        cmds.setKeyframe(loc, attribute="rotateY", time=1, value=0)
+        cmds.setKeyframe(loc, attribute="rotateY", time=48, value=270)
+        cmds.parentConstraint(loc, cube)
+        return cube, loc
+
+    def test_layer_bake_matches_driver_across_chunks(self):
+        from maya import cmds
+        from mayatk.anim_utils.smart_bake.distributed_bake import DistributedBake
+
+        cube, loc = self._scene()
+        baker = DistributedBake(
+            objects=[cube], workers=4, min_chunk_frames=8, launcher=self._fake_launcher
+        )
+        result = baker.execute()
+        self.assertTrue(result.success)
+        self.assertEqual(len(self.jobs), 4)
+        self.assertFalse(any(c.error for c in baker.chunks))
+        # Chunks tile the range exactly once.
+        frames = [f for job in self.jobs for f in job["frames"]]
+        self.assertEqual(sorted(frames), [float(f) for f in range(1, 49)])
+
+        for frame in (1, 13, 25, 37, 48):
+            cmds.currentTime(frame)
+            self.assertAlmostEqual(
+                cmds.getAttr(f"{cube}.tx"), cmds.getAttr(f"{loc}.tx"), places=3
+            )
+            self.assertAlmostEqual(
+                cmds.getAttr(f"{cube}.ry"), cmds.getAttr(f"{loc}.ry"), places=3
+            )
+
+    def test_restore_reverses_distributed_bake(self):
+        from maya import cmds
+        from mayatk.anim_utils.smart_bake._smart_bake import SmartBake
+        from mayatk.anim_utils.smart_bake.distributed_bake import DistributedBake
+
+        cube, _ = self._scene()
+        result = DistributedBake(
+            objects=[cube], workers=2, launcher=self._fake_launcher
+        ).execute()
+        self.assertTrue(result.session_id)
+        restored = SmartBake.restore(result.session_id)
+        self.assertTrue(restored.success)
+        self.assertFalse(cmds.objExists(result.override_layer))
+
+    def test_base_layer_round_trip(self):
+        from maya import cmds
+        from mayatk.anim_utils.smart_bake._smart_bake import SmartBake
+        from mayatk.anim_utils.smart_bake.distributed_bake import DistributedBake
+
+        cube, loc = self._scene()
+        result = DistributedBake(
+            objects=[cube],
+            workers=2,
+            use_override_layer=False,
+            launcher=self._fake_launcher,
+        ).execute()
+        self.assertTrue(result.success)
+        self.assertFalse(cmds.listConnections(f"{cube}.tx", type="constraint"))
+        cmds.currentTime(30)
+        self.assertAlmostEqual(
+            cmds.getAttr(f"{cube}.tx"), cmds.getAttr(f"{loc}.tx"), places=3
+        )
+
+        SmartBake.restore(result.session_id)
+        self.assertTrue(cmds.listConnections(f"{cube}.tx", type="constraint"))
+
+    def test_base_layer_keeps_keys_outside_the_range(self):
+        """Base-layer merge keys the existing curve instead of replacing it."""
+        from maya import cmds
+        from mayatk.anim_utils.smart_bake.distributed_bake import DistributedBake
+
+        cube, loc = self._scene()
+        cmds.setKeyframe(cube, attribute="translateX", time=-10, value=-5)
+        cmds.setKeyframe(cube, attribute="translateX", time=60, value=99)
+        result = DistributedBake(
+            objects=[cube],
+            workers=2,
+            use_override_layer=False,
+            launcher=self._fake_launcher,
+        ).execute()
+        self.assertTrue(result.success)
+        times = cmds.keyframe(f"{cube}.tx", q=True, tc=True)
+        self.assertIn(-10.0, times)
+        self.assertIn(60.0, times)
+        cmds.currentTime(60)
+        self.assertAlmostEqual(cmds.getAttr(f"{cube}.tx"), 99.0, places=3)
+        cmds.currentTime(-10)
+        self.assertAlmostEqual(cmds.getAttr(f"{cube}.tx"), -5.0, places=3)
+        cmds.currentTime(30)
+        self.assertAlmostEqual(
+            cmds.getAttr(f"{cube}.tx"), cmds.getAttr(f"{loc}.tx"), places=3
+        )
+
+    def test_failed_chunk_falls_back_to_in_session_bake(self):
+        from maya import cmds
+        from mayatk.anim_utils.smart_bake.distributed_bake import DistributedBake
+
+        def broken(job):
+            raise RuntimeError("worker crashed")
+
+        cube, loc = self._scene()
+        baker = DistributedBake(objects=[cube], workers=2, launcher=broken)
+        result = baker.execute()
+        self.assertTrue(result.success)
+        self.assertTrue(all(c.error for c in baker.chunks))
+        cmds.currentTime(20)
+        self.assertAlmostEqual(
+            cmds.getAttr(f"{cube}.tx"), cmds.getAttr(f"{loc}.tx"), places=3
+        )
+
+
 # -----------------------------------------------------------------------------
 
 if __name__ == "__main__":
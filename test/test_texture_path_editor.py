@@ -160,6 +160,50 @@ class TestStrategiesForModes(unittest.TestCase):
         )
         self.assertEqual(result, ["exact", "substring", "ratio"])
 
+    def test_texture_strategy_stays_within_the_map_type(self):
+        """The texture tier reads map type and base from the stem index.
+
+        Added: 2026-10-18
+        """
+        texture = self.slot._strategies_for_modes(
+            ["texture"], index_stems=["crate_diffuse", "crate_normal", "barrel_ao"]
+        )[1]
+        match, _score, status = texture("crate_old_normal", [])
+        self.assertEqual((match, status), ("crate_normal", "unique"))
+        self.assertEqual(texture("crate_old_ao", [])[2], "no_match")
+
+
+class TestTableRowDiff(unittest.TestCase):
+    """Pure-logic tests for the incremental table refresh plan.
+
+    Added: 2026-10-18
+    """
+
+    diff = staticmethod(TexturePathEditorSlots._diff_rows)
+
+    def test_unchanged_scene_plans_no_edits(self):
+        current = [(("m1", "f1"), "a.png"), (("m2", "f2"), "b.png")]
+        rows = [("m1", "a.png", "f1"), ("m2", "b.png", "f2")]
+        self.assertEqual(self.diff(current, rows), ([], {}, []))
+
+    def test_removed_added_and_repathed_rows(self):
+        current = [
+            (("m1", "f1"), "a.png"),
+            (("m2", "f2"), "b.png"),
+            (("m3", "f3"), "c.png"),
+        ]
+        rows = [("m3", "c2.png", "f3"), ("m1", "a.png", "f1"), ("m4", "d.png", "f4")]
+        removed, updated, added = self.diff(current, rows)
+        self.assertEqual(removed, [1])
+        # f3 moves up to row 1 once f2's row is gone.
+        self.assertEqual(updated, {1: "c2.png"})
+        self.assertEqual(added, [("m4", "d.png", "f4")])
+
+    def test_placeholder_and_duplicate_rows_are_removed(self):
+        current = [(None, ""), (("m1", "f1"), "a.png"), (("m1", "f1"), "a.png")]
+        removed, updated, added = self.diff(current, [("m1", "a.png", "f1")])
+        self.assertEqual((removed, updated, added), ([2, 0], {}, []))
+
 
 class TestResolveMissingValidation(MayaTkTestCase):
     """Input validation contract of _resolve_missing_textures."""
@@ -43,6 +43,36 @@ class TestUvAnalysis(MayaTkTestCase):
         self.assertEqual(metrics["area"], 0.0, "Should have no area")
         self.assertFalse(metrics["is_valid"], "Empty set should not be valid")
 
+    def test_analysis_leaves_the_current_set(self):
+        """Sets are read by name through the API, never made current.
+
+        Added: 2026-10-18
+        """
+        cmds.polyUVSet(self.shape, create=True, uvSet="second")
+        UvDiagnostics._analyze_uv_set(self.shape, "second")
+        current = cmds.polyUVSet(self.shape, query=True, currentUVSet=True)
+        self.assertEqual(current, ["map1"])
+
+    def test_overlaps_match_poly_uv_overlap(self):
+        """A planar projection stacks the cube's front and back faces.
+
+        Added: 2026-10-18
+        """
+        from mayatk.core_utils.diagnostics.uv_metrics import UvSetAnalyzer
+
+        self.assertEqual(
+            UvDiagnostics._analyze_uv_set(self.shape, "map1")["overlap_count"], 0
+        )
+        cmds.polyProjection(self.shape + ".f[*]", type="Planar", md="z")
+        overlapping = cmds.polyUVOverlap(self.shape + ".f[*]", oc=True) or []
+        expected = len(cmds.ls(overlapping, flatten=True))
+        metrics = UvSetAnalyzer.analyze_shape(self.shape)["map1"]
+        self.assertEqual(metrics["overlap_count"], expected)
+        area = cmds.polyEvaluate(self.shape, uvArea=True)
+        if isinstance(area, (list, tuple)):
+            area = area[0]
+        self.assertAlmostEqual(metrics["area"], area, places=4)
+
 
 class TestPrimarySelection(MayaTkTestCase):
     """Test _find_primary_uv_set() selection logic."""
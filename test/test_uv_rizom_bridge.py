@@ -398,6 +398,39 @@ class TestRizomBridgeLogic(MayaTkTestCase):
         with self.assertRaisesRegex(ValueError, "select_objects"):
             self.bridge.process_with_rizomuv([cube], uv_script=script)
 
+    def test_process_in_batches_bisects_around_a_bad_object(self):
+        cubes = [cmds.polyCube(name=f"batchCube{i}")[0] for i in range(5)]
+        sessions = []
+
+        def fake_process(objects, **kwargs):
+            sessions.append(list(objects))
+            self.assertFalse(kwargs["skip_instances"])
+            if any("batchCube3" in o for o in objects):
+                raise RuntimeError("RizomUV exited without saving")
+
+        with mock.patch.object(self.bridge, "process_with_rizomuv", fake_process):
+            result = self.bridge.process_in_batches(
+                cubes, batch_size=4, uv_script="-- batch test"
+            )
+
+        self.assertEqual(
+            [n.split("|")[-1] for n in result.succeeded],
+            ["batchCube0", "batchCube1", "batchCube2", "batchCube4"],
+        )
+        self.assertEqual(len(result.failed), 1)
+        self.assertIn("batchCube3", result.failed[0][0])
+        self.assertIn("without saving", result.failed[0][1])
+        # [0-3] fails -> [0,1] + [2,3] -> [2] + [3]; [4] runs on its own.
+        self.assertEqual(result.sessions, 6)
+        self.assertEqual(len(sessions[0]), 4)
+        self.assertEqual(set(result.timings), set(result.succeeded) | {result.failed[0][0]})
+
+    def test_process_in_batches_refuses_selection_presets(self):
+        cube = cmds.polyCube(name="batchSelCube")[0]
+        script = "ZomSelect({Names=__PACK_SELECT_NAMES__, Select=true})\n"  # noqa: P103
+        with self.assertRaisesRegex(ValueError, "sub-selection"):
+            self.bridge.process_in_batches([cube], uv_script=script)
+
     def test_expand_includes_expands_directive_not_comment(self):
         """__PACK_BLOCK__ expands only as a standalone directive line -- an
         in-comment mention stays literal (the expander is a blind replace
@@ -2311,6 +2311,48 @@ class TestAutoUnwrap(MayaTkTestCase):
         self.assertEqual(len(result.succeeded) + len(result.failed), 1)
         self.assertTrue(received)
 
+    def test_batch_shares_one_session_and_matches_per_mesh_run(self):
+        sphere = cmds.polySphere(name="unwrap_sphere_batch", sx=8, sy=6)[0]
+        self._stub_engine(handler=self._split_uvs)
+        single = UvUtils.auto_unwrap([self.cube, sphere], method="hard", pack=False)
+        expected = {n: self._uvs_per_face(n) for n in (self.cube, sphere)}
+        cmds.undo()
+
+        self._stub_engine(handler=self._split_uvs)
+        batched = UvUtils.auto_unwrap(
+            [self.cube, sphere], method="hard", pack=False, batch_size=None
+        )
+
+        self.assertEqual(single.sessions, 2)
+        self.assertEqual(batched.sessions, 1)
+        self.assertEqual(batched.succeeded, single.succeeded)
+        self.assertEqual(set(batched.timings), set(batched.succeeded))
+        for node in (self.cube, sphere):
+            self.assertEqual(self._uvs_per_face(node), expected[node])
+
+    def test_batch_isolates_a_failing_mesh(self):
+        doomed = cmds.polySphere(name="unwrap_sphere_doomed", sx=8, sy=6)[0]
+
+        def flaky(obj_in, obj_out):
+            verts = sum(
+                1 for line in open(obj_in, encoding="utf-8") if line.startswith("v ")
+            )
+            if verts != 8:  # anything carrying the sphere
+                raise RuntimeError("engine exploded")
+            self._offset_uvs(obj_in, obj_out)
+
+        self._stub_engine(handler=flaky)
+        before_doomed = self._uvs_per_face(doomed)
+        result = UvUtils.auto_unwrap(
+            [self.cube, doomed], method="hard", pack=False, batch_size=None
+        )
+
+        self.assertEqual(len(result.succeeded), 1)
+        self.assertIn("unwrap_sphere_doomed", result.failed[0][0])
+        self.assertEqual(result.sessions, 3)  # the pair, then each alone
+        self.assertEqual(self._uvs_per_face(doomed), before_doomed)
+        self.assertFalse(cmds.namespace(exists="UvUnwrapImport"))
+
 
 class TestUvSnapshotSideEffects(MayaTkTestCase):
     """snapshot_uv_sets must not change which UV set is active.
@@ -17,6 +17,7 @@ import maya.cmds as cmds
 import pythontk as ptk
 
 from mayatk.env_utils._env_utils import EnvUtils
+from mayatk.env_utils.workspace_index import WorkspaceIndex
 from mayatk.env_utils.workspace_manager import WorkspaceManager
 from mayatk.env_utils.workspace_map import WorkspaceMap
 
@@ -507,6 +508,87 @@ class TestWorkspaceMap(MayaTkTestCase):
         self.assertEqual(ws.rules["scene"], ".")  # describes the flat layout
 
 
+class TestWorkspaceIndexBacking(MayaTkTestCase):
+    """``USE_WORKSPACE_INDEX`` — the panels read the SQLite index, and it must
+    answer exactly what the synchronous scan answers."""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp = tempfile.mkdtemp(prefix="ws_index_")
+        self._env = os.environ.get("MAYATK_WORKSPACE_INDEX_DIR")
+        os.environ["MAYATK_WORKSPACE_INDEX_DIR"] = os.path.join(self.tmp, "_index")
+        self.root = os.path.join(self.tmp, "projects")
+        self.ws_a = _make_workspace_dir(self.root, "ws_a")
+        self.ws_b = _make_workspace_dir(self.root, "ws_b")
+        _make_workspace_dir(self.root, "ws_empty")
+        _make_scene_file(self.ws_a)
+        _make_scene_file(self.ws_a, "scene1.0001.ma")  # autosave
+        _make_scene_file(self.ws_b, "shot.mb")
+
+    def tearDown(self):
+        if self._env is None:
+            os.environ.pop("MAYATK_WORKSPACE_INDEX_DIR", None)
+        else:
+            os.environ["MAYATK_WORKSPACE_INDEX_DIR"] = self._env
+        shutil.rmtree(self.tmp, ignore_errors=True)
+        super().tearDown()
+
+    def _managers(self, cls=WorkspaceManager, warm=True):
+        scan, indexed = cls(), cls()
+        indexed.USE_WORKSPACE_INDEX = True
+        scan.current_working_dir = indexed.current_working_dir = self.root
+        if warm:
+            indexed.workspace_index()  # cold: queues the initial build
+            self.assertTrue(WorkspaceIndex.for_root(self.root).wait(10))
+            indexed.invalidate_workspace_files()
+        return scan, indexed
+
+    def test_cold_root_falls_back_to_the_scan(self):
+        """An unindexed root answers from the scan and builds in the background.
+
+        Added: 2026-10-18
+        """
+        scan, indexed = self._managers(warm=False)
+        self.assertIsNone(indexed.workspace_index())
+        self.assertEqual(
+            indexed.find_available_workspaces(), scan.find_available_workspaces()
+        )
+        index = WorkspaceIndex.for_root(self.root)
+        self.assertTrue(index.wait(10))
+        self.assertTrue(index.is_populated)
+        self.assertIs(indexed.workspace_index(refresh=False), index)
+
+    def test_indexed_results_match_the_scan(self):
+        scan, indexed = self._managers()
+        self.assertEqual(
+            indexed.find_available_workspaces(), scan.find_available_workspaces()
+        )
+        self.assertEqual(indexed.workspace_files, scan.workspace_files)
+
+    def test_indexed_workspace_map_analysis_matches(self):
+        scan, indexed = self._managers(WorkspaceMap)
+        for path, info in scan.workspace_data.items():
+            other = indexed.workspace_data[path]
+            for key in ("scene_count", "recent_files", "subdirectories"):
+                self.assertEqual(other[key], info[key], key)
+            self.assertAlmostEqual(other["size_mb"], info["size_mb"], places=9)
+
+    def test_background_refresh_reports_new_scene(self):
+        _, indexed = self._managers()
+        new_scene = _make_scene_file(self.ws_b, "shot_v2.ma")
+        scenes_dir = os.path.dirname(new_scene)
+        st = os.stat(scenes_dir)
+        os.utime(scenes_dir, (st.st_atime, st.st_mtime + 5))
+
+        index = indexed.workspace_index()  # warm: queues the refresh
+        self.assertTrue(index.wait(10))
+        indexed.invalidate_workspace_files()
+        self.assertIn(
+            ptk.format_path(new_scene),
+            indexed.workspace_files[ptk.format_path(self.ws_b)],
+        )
+
+
 class _FakeItem:
     """Minimal QTreeWidgetItem stand-in (no Qt needed to pin tree shaping)."""
 
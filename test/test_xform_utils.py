@@ -2470,5 +2470,59 @@ class TestPivotOpsOnInstances(MayaTkTestCase):
         self.assertEqual(self._bbox(sib), before)
 
 
+class TestBulkBounds(MayaTkTestCase):
+    """BulkBounds must report exactly what exactWorldBoundingBox does."""
+
+    def setUp(self):
+        super().setUp()
+        self.plain = cmds.polyCube(name="bb_plain", w=2, h=3, d=4)[0]
+        cmds.xform(self.plain, t=(3, 1, -2), s=(1, -2, 1))
+        self.rotated = cmds.polyCube(name="bb_rotated")[0]
+        cmds.xform(self.rotated, t=(-4, 0, 0), ro=(30, 45, 10), s=(1, 2, 1))
+        self.curve = cmds.circle(name="bb_curve")[0]
+        self.grp = cmds.group(self.rotated, name="bb_grp")
+        cmds.xform(self.grp, ro=(0, 0, 25))
+
+    def _assertBoxesEqual(self, got, expected):
+        for a, b in zip(got, expected):
+            self.assertAlmostEqual(a, b, places=4)
+
+    def test_rows_match_exact_world_bounding_box(self):
+        objs = [self.plain, self.rotated, self.grp, self.curve, f"{self.plain}.f[0]"]
+        boxes = mtk.BulkBounds.world_bounds(objs)
+        self.assertEqual(boxes.shape, (len(objs), 6))
+        for obj, row in zip(objs, boxes):
+            self._assertBoxesEqual(row, cmds.exactWorldBoundingBox(obj))
+
+    def test_get_bounding_box_matches_the_combined_query(self):
+        objs = [self.plain, self.grp, f"{self.curve}.cv[0:2]"]
+        self._assertBoxesEqual(
+            XformUtils.get_bounding_box(objs, "xmin|ymin|zmin|xmax|ymax|zmax"),
+            cmds.exactWorldBoundingBox(objs),
+        )
+
+    def test_cache_reuses_boxes_until_the_object_moves(self):
+        with mtk.BulkBounds.cached() as cache:
+            first = mtk.BulkBounds.world_bounds([self.plain, self.rotated])
+            mtk.BulkBounds.world_bounds([self.plain, self.rotated])
+            self.assertEqual(cache.hits, 2)
+            cmds.move(0, 10, 0, self.plain, relative=True)
+            cmds.polyMoveVertex(f"{self.rotated}.vtx[0]", t=(0, 0, 5))
+            moved = mtk.BulkBounds.world_bounds([self.plain, self.rotated])
+            self.assertEqual(cache.hits, 2)
+        self.assertAlmostEqual(moved[0][1], first[0][1] + 10, places=4)
+        self._assertBoxesEqual(moved[1], cmds.exactWorldBoundingBox(self.rotated))
+
+    def test_sort_and_order_use_per_object_boxes(self):
+        objs = [self.plain, self.rotated, self.curve]
+        volumes = {o: XformUtils.get_bounding_box(o, "volume") for o in objs}
+        self.assertEqual(
+            XformUtils.sort_by_bounding_box_value(objs),
+            sorted(objs, key=volumes.get, reverse=True),
+        )
+        ordered = XformUtils.order_by_distance(objs, reference_point=(3, 1, -2))
+        self.assertEqual(cmds.ls(ordered[0])[0], cmds.ls(self.plain)[0])
+
+
 if __name__ == "__main__":
     unittest.main()